@@ -39,7 +39,7 @@ from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarType
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import OrderSide
-from nautilus_trader.model.greeks import GreeksData
+from nautilus_trader.model.greeks import OptionChainGreeks
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Price
@@ -222,7 +222,7 @@ strategies = [
 streaming = StreamingConfig(
     catalog_path=catalog.path,
     fs_protocol="file",
-    include_types=[GreeksData],
+    include_types=[OptionChainGreeks],
 )
 
 logging = LoggingConfig(
@@ -262,10 +262,10 @@ data = [
 if load_greeks:
     data.append(
         BacktestDataConfig(
-            data_cls=GreeksData.fully_qualified_name(),
+            data_cls=OptionChainGreeks.fully_qualified_name(),
             catalog_path=catalog.path,
             client_id="GreeksDataProvider",
-            metadata={"instrument_id": "ES"},
+            metadata={"underlying": "ES"},
         ),
     )
 
@@ -298,7 +298,7 @@ if stream_data:
     # 'overwrite_or_ignore' keeps existing data intact, 'delete_matching' overwrites everything, see in pyarrow/dataset.py
     catalog.convert_stream_to_data(
         results[0].instance_id,
-        GreeksData,
+        OptionChainGreeks,
         basename_template="part-{i}.parquet",
         partitioning=["date"],
         existing_data_behavior="overwrite_or_ignore",
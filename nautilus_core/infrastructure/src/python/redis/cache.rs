@@ -65,6 +65,27 @@ impl RedisCacheDatabase {
         }
     }
 
+    #[pyo3(name = "read_bulk", signature = (keys, starts = None))]
+    fn py_read_bulk(
+        &mut self,
+        py: Python,
+        keys: Vec<String>,
+        starts: Option<Vec<isize>>,
+    ) -> PyResult<Vec<Vec<PyObject>>> {
+        match self.read_bulk(&keys, starts.as_deref()) {
+            Ok(results) => Ok(results
+                .into_iter()
+                .map(|result| {
+                    result
+                        .into_iter()
+                        .map(|r| PyBytes::new(py, r.as_ref()).into())
+                        .collect::<Vec<PyObject>>()
+                })
+                .collect()),
+            Err(e) => Err(to_pyruntime_err(e)),
+        }
+    }
+
     #[pyo3(name = "insert")]
     fn py_insert(&mut self, key: String, payload: Vec<Vec<u8>>) -> PyResult<()> {
         let payload: Vec<Bytes> = payload.into_iter().map(Bytes::from).collect();
@@ -67,6 +67,7 @@ const POSITIONS: &str = "positions";
 const ACTORS: &str = "actors";
 const STRATEGIES: &str = "strategies";
 const SNAPSHOTS: &str = "snapshots";
+const STATES: &str = "states";
 const HEALTH: &str = "health";
 
 // Index keys
@@ -215,10 +216,72 @@ impl RedisCacheDatabase {
             POSITIONS => read_list(&mut self.con, &key),
             ACTORS => read_string(&mut self.con, &key),
             STRATEGIES => read_string(&mut self.con, &key),
+            STATES => read_string(&mut self.con, &key),
             _ => anyhow::bail!("Unsupported operation: `read` for collection '{collection}'"),
         }
     }
 
+    /// Reads the values for all of the given `keys` in a single pipelined round trip.
+    ///
+    /// The results are returned in the same order as the `keys`, with an empty
+    /// vector for any key which does not exist. For list collections the
+    /// optional `starts` gives the index of the first element to read for
+    /// each key (e.g. to read only the events after a state snapshot).
+    pub fn read_bulk(
+        &mut self,
+        keys: &[String],
+        starts: Option<&[isize]>,
+    ) -> anyhow::Result<Vec<Vec<Bytes>>> {
+        if let Some(starts) = starts {
+            anyhow::ensure!(
+                starts.len() == keys.len(),
+                "`starts` length {} did not match `keys` length {}",
+                starts.len(),
+                keys.len()
+            );
+        }
+
+        let mut pipe = redis::pipe();
+        let mut is_list = Vec::with_capacity(keys.len());
+
+        for (i, key) in keys.iter().enumerate() {
+            let collection = get_collection_key(key)?;
+            let key = format!("{}{REDIS_DELIMITER}{}", self.trader_key, key);
+
+            match collection {
+                ACCOUNTS | ORDERS | POSITIONS => {
+                    let start = starts.map_or(0, |starts| starts[i]);
+                    pipe.lrange(key, start, -1);
+                    is_list.push(true);
+                }
+                GENERAL | CURRENCIES | INSTRUMENTS | SYNTHETICS | ACTORS | STRATEGIES | STATES => {
+                    pipe.get(key);
+                    is_list.push(false);
+                }
+                _ => {
+                    anyhow::bail!("Unsupported operation: `read_bulk` for collection '{collection}'")
+                }
+            }
+        }
+
+        let values: Vec<redis::Value> = pipe.query(&mut self.con)?;
+        let mut results = Vec::with_capacity(values.len());
+
+        for (value, is_list) in values.iter().zip(is_list) {
+            let result = if is_list {
+                redis::from_redis_value::<Vec<Bytes>>(value)?
+            } else {
+                match redis::from_redis_value::<Option<Vec<u8>>>(value)? {
+                    Some(data) if !data.is_empty() => vec![Bytes::from(data)],
+                    _ => vec![],
+                }
+            };
+            results.push(result);
+        }
+
+        Ok(results)
+    }
+
     pub fn insert(&mut self, key: String, payload: Option<Vec<Bytes>>) -> anyhow::Result<()> {
         let op = DatabaseCommand::new(DatabaseOperation::Insert, key, payload);
         match self.tx.send(op) {
@@ -433,6 +496,10 @@ fn insert(
             insert_list(pipe, key, value[0].as_ref());
             Ok(())
         }
+        STATES => {
+            insert_string(pipe, key, value[0].as_ref());
+            Ok(())
+        }
         HEALTH => {
             insert_string(pipe, key, value[0].as_ref());
             Ok(())
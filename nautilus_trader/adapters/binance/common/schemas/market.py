@@ -338,10 +338,14 @@ class BinanceTickerBook(msgspec.Struct, frozen=True):
 class BinanceDataMsgWrapper(msgspec.Struct):
     """
     Provides a wrapper for data WebSocket messages from Binance.
+
+    The `data` payload is kept raw, to be decoded once by the handler for the stream
+    (a raw ``null`` when the message has no payload).
     """
 
     stream: str | None = None
     id: int | None = None
+    data: msgspec.Raw = msgspec.Raw(b"null")
 
 
 class BinanceOrderBookDelta(msgspec.Struct, array_like=True):
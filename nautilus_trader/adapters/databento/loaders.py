@@ -26,6 +26,7 @@ from nautilus_trader.model.data import capsule_to_list
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.instruments import instruments_from_pyo3
+from nautilus_trader.persistence.ingest import IngestLoader
 
 
 class DatabentoDataLoader:
@@ -288,3 +289,40 @@ class DatabentoDataLoader:
                 return self._pyo3_loader.load_statistics(str(path), pyo3_instrument_id)
             case _:
                 raise RuntimeError(f"Loading schema {schema} not currently supported")
+
+
+class DatabentoIngestLoader(IngestLoader):
+    """
+    Provides a loader of Databento DBN files for a `CatalogIngester`.
+
+    The DBN decoder loads whole files, so each file is held in memory while it is
+    ingested (it is still encoded and written in chunks).
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId, optional
+        The Nautilus instrument ID to override in the data. This should only be used
+        if all records of every file are for the same instrument.
+
+    """
+
+    pattern = "*.dbn*"
+
+    def __init__(self, instrument_id: InstrumentId | None = None) -> None:
+        self._instrument_id = instrument_id.value if instrument_id is not None else None
+
+    @property
+    def single_instrument(self) -> bool:
+        return self._instrument_id is not None
+
+    def load(self, path: str) -> list[Data]:
+        loader = DatabentoDataLoader()
+        return loader.from_dbn_file(
+            path,
+            instrument_id=(
+                InstrumentId.from_str(self._instrument_id)
+                if self._instrument_id is not None
+                else None
+            ),
+            as_legacy_cython=False,
+        )
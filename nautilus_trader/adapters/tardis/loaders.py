@@ -13,6 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import gzip
+import os
+import tempfile
+from collections.abc import Iterator
 from os import PathLike
 from pathlib import Path
 
@@ -24,6 +28,16 @@ from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.data import capsule_to_list
 from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.persistence.ingest import IngestLoader
+
+
+_TARDIS_INGEST_DATA_TYPES = (
+    "incremental_book_L2",
+    "book_snapshot_5",
+    "book_snapshot_25",
+    "quotes",
+    "trades",
+)
 
 
 class TardisCSVDataLoader:
@@ -315,3 +329,110 @@ class TardisCSVDataLoader:
             instrument_id=self._instrument_id,
             limit=limit,
         )
+
+
+class TardisIngestLoader(IngestLoader):
+    """
+    Provides a loader of Tardis CSV files for a `CatalogIngester`.
+
+    Parameters
+    ----------
+    data_type : str
+        The Tardis data type of the files, one of 'incremental_book_L2', 'book_snapshot_5',
+        'book_snapshot_25', 'quotes' or 'trades'.
+    price_precision : int
+        The price precision for parsing.
+    size_precision : int
+        The size precision for parsing.
+    instrument_id : InstrumentId, optional
+        The instrument ID to override in the data. This should only be used if every
+        file only contains data for the same instrument.
+
+    Raises
+    ------
+    ValueError
+        If `data_type` is not a supported Tardis data type.
+
+    References
+    ----------
+    https://docs.tardis.dev/downloadable-csv-files
+
+    """
+
+    pattern = "*.csv*"
+
+    def __init__(
+        self,
+        data_type: str,
+        price_precision: int,
+        size_precision: int,
+        instrument_id: InstrumentId | None = None,
+    ) -> None:
+        if data_type not in _TARDIS_INGEST_DATA_TYPES:
+            raise ValueError(
+                f"Unsupported Tardis data type, was '{data_type}' "
+                f"(supported: {', '.join(_TARDIS_INGEST_DATA_TYPES)})",
+            )
+        self._data_type = data_type
+        self._price_precision = price_precision
+        self._size_precision = size_precision
+        self._instrument_id = instrument_id.value if instrument_id is not None else None
+
+    @property
+    def single_instrument(self) -> bool:
+        return self._instrument_id is not None
+
+    def load(self, path: str) -> list:
+        loader = TardisCSVDataLoader(
+            price_precision=self._price_precision,
+            size_precision=self._size_precision,
+            instrument_id=(
+                InstrumentId.from_str(self._instrument_id)
+                if self._instrument_id is not None
+                else None
+            ),
+        )
+        match self._data_type:
+            case "incremental_book_L2":
+                return loader.load_deltas(path, as_legacy_cython=False)
+            case "book_snapshot_5":
+                return loader.load_depth10(path, levels=5, as_legacy_cython=False)
+            case "book_snapshot_25":
+                return loader.load_depth10(path, levels=25, as_legacy_cython=False)
+            case "quotes":
+                return loader.load_quotes(path, as_legacy_cython=False)
+            case "trades":
+                return loader.load_trades(path, as_legacy_cython=False)
+            case _:  # pragma: no cover (validated on construction)
+                raise RuntimeError(f"Unsupported Tardis data type, was '{self._data_type}'")
+
+    def load_chunks(self, path: str, chunk_size: int) -> Iterator[list]:
+        # The CSV loaders parse whole files, so the file is streamed into temporary
+        # chunk files which are only split where the timestamp changes (the last
+        # delta of each timestamp is flagged `F_LAST`)
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", newline="") as f, tempfile.TemporaryDirectory() as tmp_dir:
+            header = f.readline()
+            if not header:
+                return
+            ts_index = header.rstrip("\r\n").split(",").index("timestamp")
+            chunk_path = os.path.join(tmp_dir, "chunk.csv")
+
+            lines: list[str] = []
+            last_ts: str | None = None
+            for line in f:
+                ts = line.split(",", ts_index + 1)[ts_index]
+                if len(lines) >= chunk_size and ts != last_ts:
+                    yield self._load_lines(chunk_path, header, lines)
+                    lines = []
+                lines.append(line)
+                last_ts = ts
+
+            if lines:
+                yield self._load_lines(chunk_path, header, lines)
+
+    def _load_lines(self, chunk_path: str, header: str, lines: list[str]) -> list:
+        with open(chunk_path, "w", newline="") as f:
+            f.write(header)
+            f.writelines(lines)
+        return self.load(chunk_path)
@@ -13,38 +13,98 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import copy
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
 import pandas as pd
 from numpy import float64
 
 from nautilus_trader.accounting.accounts.base import Account
 from nautilus_trader.analysis.statistic import PortfolioStatistic
 from nautilus_trader.core.correctness import PyCondition
-from nautilus_trader.core.datetime import unix_nanos_to_dt
 from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.objects import Currency
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.position import Position
 
 
+_INITIAL_CAPACITY = 1_024
+
+
+def _reserve(array: np.ndarray, size: int) -> np.ndarray:
+    # Grow the buffer geometrically so appends are amortized O(1)
+    if size <= len(array):
+        return array
+
+    grown = np.empty(max(size, 2 * len(array)), dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+def _local_nanos(timestamps: np.ndarray, tz: Any) -> np.ndarray:
+    # Wall clock nanoseconds in the returns timezone, so that online daily bins
+    # align with the bins from resampling the returns series
+    if tz is None or str(tz) == "UTC":
+        return timestamps
+
+    index = pd.to_datetime(timestamps, utc=True).tz_convert(tz).tz_localize(None)
+    return index.asi8
+
+
 class PortfolioAnalyzer:
     """
     Provides a portfolio performance analyzer for tracking and generating performance
     metrics and statistics.
+
+    Trades and returns are buffered in columnar arrays, with the pandas objects
+    built once on first access after new data is added.
+
+    In incremental mode, newly added data also updates the online accumulators of
+    statistics which support it, so querying the performance statistics is O(1)
+    rather than a recalculation over the full history. Statistics without
+    incremental support are still calculated from the buffered data.
+
+    Parameters
+    ----------
+    incremental : bool, default False
+        If statistics are maintained incrementally as data is added.
+
     """
 
-    def __init__(self) -> None:
+    def __init__(self, incremental: bool = False) -> None:
+        self.incremental = incremental
         self._statistics: dict[str, PortfolioStatistic] = {}
 
         # Data
         self._account_balances_starting: dict[Currency, Money] = {}
         self._account_balances: dict[Currency, Money] = {}
         self._positions: list[Position] = []
+        self._reset_buffers()
+
+    def _reset_buffers(self) -> None:
+        # Realized PnL buffers per currency
+        self._pnl_ids: dict[Currency, np.ndarray] = {}
+        self._pnl_values: dict[Currency, np.ndarray] = {}
+        self._pnl_counts: dict[Currency, int] = {}
         self._realized_pnls: dict[Currency, pd.Series] = {}
-        self._returns: pd.Series = pd.Series(dtype=float64)
+
+        # Returns buffers
+        self._returns_ts = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        self._returns_values = np.empty(_INITIAL_CAPACITY, dtype=float64)
+        self._returns_count = 0
+        self._returns_tz: Any = None
+        self._returns: pd.Series | None = None
+        self._daily_returns: pd.Series | None = None
+
+        # Online statistics state (rebuilt from the buffers when stale)
+        self._pnl_position_ids: dict[Currency, set[str]] = {}
+        self._position_closes: dict[PositionId, set[TradeId]] = {}
+        self._returns_last_ts: int | None = None
+        self._statistics_stale = True
 
     def register_statistic(self, statistic: PortfolioStatistic) -> None:
         """
@@ -59,6 +119,7 @@ class PortfolioAnalyzer:
         PyCondition.not_none(statistic, "statistic")
 
         self._statistics[statistic.name] = statistic
+        self._statistics_stale = True  # Accumulators of the new statistic are empty
 
     def deregister_statistic(self, statistic: PortfolioStatistic) -> None:
         """
@@ -81,8 +142,7 @@ class PortfolioAnalyzer:
         """
         self._account_balances_starting = {}
         self._account_balances = {}
-        self._realized_pnls = {}
-        self._returns = pd.Series(dtype=float64)
+        self._reset_buffers()
 
     def _get_max_length_name(self) -> int:
         max_length = 0
@@ -123,12 +183,16 @@ class PortfolioAnalyzer:
         pd.Series
 
         """
+        if self._returns is None:
+            self._returns = self._build_returns()
         return self._returns
 
     def calculate_statistics(self, account: Account, positions: list[Position]) -> None:
         """
         Calculate performance metrics from the given data.
 
+        All previously added trades and returns are replaced.
+
         Parameters
         ----------
         account : Account
@@ -139,11 +203,58 @@ class PortfolioAnalyzer:
         """
         self._account_balances_starting = account.starting_balances()
         self._account_balances = account.balances_total()
-        self._realized_pnls = {}
-        self._returns = pd.Series(dtype=float64)
+        self._reset_buffers()
 
         self.add_positions(positions)
-        self._returns.sort_index()
+
+    def update_statistics(self, account: Account, position: Position) -> None:
+        """
+        Update performance metrics with the given closed position.
+
+        Each close is added once, keyed by the position ID and its closing fill. A
+        position ID reused when a netting position reopens adds each closed cycle as
+        a separate trade, matching the position snapshots of the bulk calculation
+        (the realized PnL of a position is reset when it reopens from flat).
+
+        When the analyzer is `incremental` this is O(1) in the number of positions
+        already analyzed, making it suitable for updating on each `PositionClosed`
+        event.
+
+        Parameters
+        ----------
+        account : Account
+            The account for the calculations.
+        position : Position
+            The closed position to add.
+
+        """
+        self._account_balances_starting = account.starting_balances()
+        self._account_balances = account.balances_total()
+
+        closing_trade_id = position.last_trade_id
+        closes = self._position_closes.setdefault(position.id, set())
+        if closing_trade_id in closes:
+            return  # Close already added
+
+        trade_id = position.id.value
+        if closes:
+            trade_id = f"{trade_id}-{closing_trade_id.value}"
+        closes.add(closing_trade_id)
+
+        # Copy the state of this cycle, as a reopened position is updated in place
+        position = copy.deepcopy(position)
+        self._positions.append(position)
+        if self._is_updating_statistics():
+            for stat in self._statistics.values():
+                stat.update_from_position(position)
+
+        realized_pnl = position.realized_pnl
+        self._append_trades(realized_pnl.currency, [trade_id], [realized_pnl.as_double()])
+        self._append_returns(
+            np.array([position.ts_closed], dtype=np.int64),
+            np.array([position.realized_return], dtype=float64),
+            "UTC",
+        )
 
     def add_positions(self, positions: list[Position]) -> None:
         """
@@ -156,9 +267,29 @@ class PortfolioAnalyzer:
 
         """
         self._positions += positions
-        for position in positions:
-            self.add_trade(position.id, position.realized_pnl)
-            self.add_return(unix_nanos_to_dt(position.ts_closed), position.realized_return)
+        if not positions:
+            return
+
+        if self._is_updating_statistics():
+            for position in positions:
+                for stat in self._statistics.values():
+                    stat.update_from_position(position)
+
+        pnls: dict[Currency, tuple[list[str], list[float]]] = {}
+        ts_closed = np.empty(len(positions), dtype=np.int64)
+        returns = np.empty(len(positions), dtype=float64)
+        for i, position in enumerate(positions):
+            realized_pnl = position.realized_pnl
+            ids, values = pnls.setdefault(realized_pnl.currency, ([], []))
+            ids.append(position.id.value)
+            values.append(realized_pnl.as_double())
+            ts_closed[i] = position.ts_closed
+            returns[i] = position.realized_return
+
+        for currency, (ids, values) in pnls.items():
+            self._append_trades(currency, ids, values)
+
+        self._append_returns(ts_closed, returns, "UTC")
 
     def add_trade(self, position_id: PositionId, realized_pnl: Money) -> None:
         """
@@ -172,10 +303,11 @@ class PortfolioAnalyzer:
             The realized PnL for the trade.
 
         """
-        currency = realized_pnl.currency
-        realized_pnls = self._realized_pnls.get(currency, pd.Series(dtype=float64))
-        realized_pnls.loc[position_id.value] = realized_pnl.as_double()
-        self._realized_pnls[currency] = realized_pnls
+        self._append_trades(
+            realized_pnl.currency,
+            [position_id.value],
+            [realized_pnl.as_double()],
+        )
 
     def add_return(self, timestamp: datetime, value: float) -> None:
         """
@@ -189,9 +321,166 @@ class PortfolioAnalyzer:
             The return value to add.
 
         """
-        if timestamp not in self._returns:
-            self._returns.loc[timestamp] = 0.0
-        self._returns.loc[timestamp] += float(value)
+        timestamp = pd.Timestamp(timestamp)
+        self._append_returns(
+            np.array([timestamp.value], dtype=np.int64),
+            np.array([float(value)], dtype=float64),
+            timestamp.tz,
+        )
+
+    def _append_trades(self, currency: Currency, ids: list[str], values: list[float]) -> None:
+        count = self._pnl_counts.get(currency, 0)
+        size = count + len(ids)
+
+        pnl_ids = self._pnl_ids.get(currency)
+        pnl_values = self._pnl_values.get(currency)
+        if pnl_ids is None or pnl_values is None:
+            pnl_ids = np.empty(_INITIAL_CAPACITY, dtype=object)
+            pnl_values = np.empty(_INITIAL_CAPACITY, dtype=float64)
+
+        pnl_ids = _reserve(pnl_ids, size)
+        pnl_values = _reserve(pnl_values, size)
+        pnl_ids[count:size] = ids
+        pnl_values[count:size] = values
+
+        self._pnl_ids[currency] = pnl_ids
+        self._pnl_values[currency] = pnl_values
+        self._pnl_counts[currency] = size
+        self._realized_pnls.pop(currency, None)  # Invalidate
+
+        if self._is_updating_statistics():
+            self._update_statistics_pnls(currency, ids, values)
+
+    def _append_returns(self, timestamps: np.ndarray, values: np.ndarray, tz: Any) -> None:
+        if self._returns_count == 0:
+            self._returns_tz = tz
+
+        count = self._returns_count
+        size = count + len(timestamps)
+
+        self._returns_ts = _reserve(self._returns_ts, size)
+        self._returns_values = _reserve(self._returns_values, size)
+        self._returns_ts[count:size] = timestamps
+        self._returns_values[count:size] = values
+
+        self._returns_count = size
+        self._returns = None  # Invalidate
+        self._daily_returns = None
+
+        if self._is_updating_statistics():
+            self._update_statistics_returns(_local_nanos(timestamps, self._returns_tz), values)
+
+    def _is_updating_statistics(self) -> bool:
+        # Data added outside incremental mode leaves the accumulators out of date
+        if not self.incremental:
+            self._statistics_stale = True
+
+        return not self._statistics_stale
+
+    def _update_statistics_pnls(self, currency: Currency, ids: list[str], values: list[float]) -> None:
+        position_ids = self._pnl_position_ids.setdefault(currency, set())
+        statistics = self._statistics.values()
+        for position_id, value in zip(ids, values):
+            if position_id in position_ids:
+                # Overwrites an earlier trade, which accumulators cannot remove
+                self._statistics_stale = True
+                return
+
+            position_ids.add(position_id)
+            for stat in statistics:
+                stat.update_from_realized_pnl(currency, value)
+
+    def _update_statistics_returns(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        statistics = self._statistics.values()
+        last_ts = self._returns_last_ts
+        for ts, value in zip(timestamps.tolist(), values.tolist()):
+            if last_ts is not None and ts <= last_ts:
+                # Out of order or summed with an earlier return
+                self._statistics_stale = True
+                return
+
+            last_ts = ts
+            for stat in statistics:
+                stat.update_from_return(ts, value)
+
+        self._returns_last_ts = last_ts
+
+    def _check_statistics(self) -> bool:
+        # Whether statistic values can be taken from the online accumulators
+        if not self.incremental:
+            return False
+
+        if self._statistics_stale:
+            self._rebuild_statistics()
+
+        return True
+
+    def _rebuild_statistics(self) -> None:
+        # Replay the buffered data through the accumulators in O(n)
+        for stat in self._statistics.values():
+            stat.reset()
+
+        self._statistics_stale = False
+        self._pnl_position_ids = {}
+        self._returns_last_ts = None
+
+        for currency in self._pnl_counts:
+            realized_pnls = self.realized_pnls(currency)
+            self._update_statistics_pnls(
+                currency,
+                realized_pnls.index.tolist(),
+                realized_pnls.tolist(),
+            )
+
+        returns = self.returns()
+        if not returns.empty:
+            self._update_statistics_returns(
+                _local_nanos(returns.index.asi8, self._returns_tz),
+                returns.to_numpy(),
+            )
+
+        for position in self._positions:
+            for stat in self._statistics.values():
+                stat.update_from_position(position)
+
+    def _build_realized_pnls(self, currency: Currency) -> pd.Series:
+        count = self._pnl_counts[currency]
+        realized_pnls = pd.Series(
+            self._pnl_values[currency][:count].copy(),
+            index=pd.Index(self._pnl_ids[currency][:count].copy()),
+            dtype=float64,
+        )
+        if not realized_pnls.index.is_unique:
+            # Later trades for the same position overwrite earlier ones
+            realized_pnls = realized_pnls.groupby(level=0, sort=False).last()
+
+        return realized_pnls
+
+    def _get_daily_returns(self) -> pd.Series:
+        # Downsampled once for all statistics calculated from daily returns
+        if self._daily_returns is None:
+            returns = self.returns()
+            self._daily_returns = returns if returns.empty else returns.dropna().resample("1D").sum()
+        return self._daily_returns
+
+    def _build_returns(self) -> pd.Series:
+        count = self._returns_count
+        if count == 0:
+            return pd.Series(dtype=float64)
+
+        tz = self._returns_tz
+        index = pd.to_datetime(self._returns_ts[:count], utc=tz is not None)
+        if tz is not None:
+            index = index.tz_convert(tz)
+
+        returns = pd.Series(self._returns_values[:count].copy(), index=index, dtype=float64)
+        if not index.is_unique:
+            # Returns with the same timestamp are summed
+            returns = returns.groupby(level=0).sum()
+        elif not index.is_monotonic_increasing:
+            returns = returns.sort_index()
+
+        return returns
 
     def realized_pnls(self, currency: Currency | None = None) -> pd.Series | None:
         """
@@ -214,14 +503,22 @@ class PortfolioAnalyzer:
             If `currency` is ``None`` when analyzing multi-currency portfolios.
 
         """
-        if not self._realized_pnls:
+        if not self._pnl_counts:
             return None
         if currency is None:
             if len(self._account_balances) > 1:
                 raise ValueError("`currency` was `None` for multi-currency portfolio")
             currency = next(iter(self._account_balances.keys()))
 
-        return self._realized_pnls.get(currency)
+        if currency not in self._pnl_counts:
+            return None
+
+        realized_pnls = self._realized_pnls.get(currency)
+        if realized_pnls is None:
+            realized_pnls = self._build_realized_pnls(currency)
+            self._realized_pnls[currency] = realized_pnls
+
+        return realized_pnls
 
     def total_pnl(
         self,
@@ -358,7 +655,11 @@ class PortfolioAnalyzer:
         dict[str, Any]
 
         """
-        realized_pnls = self.realized_pnls(currency)
+        incremental = self._check_statistics()
+        if incremental and currency is None and self._account_balances:
+            if len(self._account_balances) > 1:
+                raise ValueError("`currency` was `None` for multi-currency portfolio")
+            currency = next(iter(self._account_balances.keys()))
 
         output: dict[str, Any] = {
             "PnL (total)": self.total_pnl(currency, unrealized_pnl),
@@ -366,7 +667,10 @@ class PortfolioAnalyzer:
         }
 
         for name, stat in self._statistics.items():
-            value = stat.calculate_from_realized_pnls(realized_pnls)
+            if incremental and stat.supports_incremental:
+                value = stat.value_from_realized_pnls(currency)
+            else:
+                value = stat.calculate_from_realized_pnls(self.realized_pnls(currency))
             if value is None:
                 continue  # Not implemented
             if not isinstance(value, int | float | str | bool):
@@ -384,9 +688,16 @@ class PortfolioAnalyzer:
         dict[str, Any]
 
         """
+        incremental = self._check_statistics()
+
         output = {}
         for name, stat in self._statistics.items():
-            value = stat.calculate_from_returns(self._returns)
+            if incremental and stat.supports_incremental:
+                value = stat.value_from_returns()
+            elif stat.uses_daily_returns:
+                value = stat.calculate_from_daily_returns(self._get_daily_returns())
+            else:
+                value = stat.calculate_from_returns(self.returns())
             if value is None:
                 continue  # Not implemented
             if not isinstance(value, int | float | str | bool):
@@ -406,8 +717,13 @@ class PortfolioAnalyzer:
         """
         output = {}
 
+        incremental = self._check_statistics()
+
         for name, stat in self._statistics.items():
-            value = stat.calculate_from_positions(self._positions)
+            if incremental and stat.supports_incremental:
+                value = stat.value_from_positions()
+            else:
+                value = stat.calculate_from_positions(self._positions)
             if value is None:
                 continue  # Not implemented
             if not isinstance(value, int | float | str | bool):
@@ -13,19 +13,215 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from collections.abc import Callable
+from typing import Any
+
 import pandas as pd
+import pyarrow as pa
 
 from nautilus_trader.accounting.accounts.base import Account
-from nautilus_trader.core.datetime import unix_nanos_to_dt
 from nautilus_trader.model.events import AccountState
 from nautilus_trader.model.events import OrderFilled
+from nautilus_trader.model.functions import contingency_type_to_str
+from nautilus_trader.model.functions import liquidity_side_to_str
+from nautilus_trader.model.functions import order_side_to_str
+from nautilus_trader.model.functions import order_type_to_str
+from nautilus_trader.model.functions import position_side_to_str
+from nautilus_trader.model.functions import time_in_force_to_str
+from nautilus_trader.model.functions import trailing_offset_type_to_str
+from nautilus_trader.model.functions import trigger_type_to_str
 from nautilus_trader.model.orders import Order
 from nautilus_trader.model.position import Position
 
 
+def _nanos_to_datetimes(values: pd.Series | pd.Index) -> pd.Series | pd.DatetimeIndex:
+    # Vectorized conversion of UNIX nanoseconds, with missing values as `NaT`
+    return pd.to_datetime(values, unit="ns", utc=True)
+
+
+def _str_or_none(value: Any) -> str | None:
+    return str(value) if value is not None else None
+
+
+def _value_or_none(identifier: Any) -> str | None:
+    return identifier.value if identifier is not None else None
+
+
+def _positive_or_none(value: int) -> int | None:
+    return value if value > 0 else None
+
+
+def _add_optional_column(
+    columns: dict[str, list],
+    objs: list[Any],
+    name: str,
+    fmt: Callable[[Any], Any],
+) -> None:
+    # Columns for attributes of only some order types, ``None`` for the others
+    if not any(hasattr(obj, name) for obj in objs):
+        return
+
+    values = [getattr(obj, name, None) for obj in objs]
+    columns[name] = [fmt(value) if value is not None else None for value in values]
+
+
+def _to_table(
+    columns: dict[str, list],
+    sort_by: list[str],
+    timestamps: tuple[str, ...] = (),
+) -> pa.Table:
+    table = pa.Table.from_pydict(columns)
+    for key in timestamps:
+        index = table.schema.get_field_index(key)
+        column = table.column(index).cast(pa.int64()).cast(pa.timestamp("ns", tz="UTC"))
+        table = table.set_column(index, key, column)
+
+    return table.sort_by([(key, "ascending") for key in sort_by])
+
+
+def _to_frame(table: pa.Table, index: str) -> pd.DataFrame:
+    # The DataFrame reports are converted from the Arrow tables, so both share the
+    # same columns, sort order and timestamp conversion
+    report = table.to_pandas()
+    for field in table.schema:
+        if pa.types.is_list(field.type):
+            report[field.name] = table.column(field.name).to_pylist()  # Lists, not arrays
+
+    return report.set_index(index)
+
+
+_ORDER_TIMESTAMPS = ("ts_init", "ts_last")
+_FILL_TIMESTAMPS = ("ts_event", "ts_init")
+_POSITION_TIMESTAMPS = ("ts_opened", "ts_closed")
+_POSITION_SORT = ["ts_opened", "ts_closed", "position_id"]
+
+
+def _order_columns(orders: list[Order]) -> dict[str, list]:
+    # The columns of `Order.to_dict` for every order type, built from the order fields
+    filled = [o.filled_qty.as_double() > 0.0 for o in orders]
+
+    columns: dict[str, list] = {
+        "trader_id": [o.trader_id.value for o in orders],
+        "strategy_id": [o.strategy_id.value for o in orders],
+        "instrument_id": [o.instrument_id.value for o in orders],
+        "client_order_id": [o.client_order_id.value for o in orders],
+        "venue_order_id": [_value_or_none(o.venue_order_id) for o in orders],
+        "position_id": [_value_or_none(o.position_id) for o in orders],
+        "account_id": [_value_or_none(o.account_id) for o in orders],
+        "last_trade_id": [_value_or_none(o.last_trade_id) for o in orders],
+        "type": [order_type_to_str(o.order_type) for o in orders],
+        "side": [order_side_to_str(o.side) for o in orders],
+        "quantity": [str(o.quantity) for o in orders],
+    }
+    _add_optional_column(columns, orders, "price", str)
+    _add_optional_column(columns, orders, "trigger_price", str)
+    _add_optional_column(columns, orders, "trigger_type", trigger_type_to_str)
+    _add_optional_column(columns, orders, "limit_offset", str)
+    _add_optional_column(columns, orders, "trailing_offset", str)
+    _add_optional_column(columns, orders, "trailing_offset_type", trailing_offset_type_to_str)
+    columns["time_in_force"] = [time_in_force_to_str(o.time_in_force) for o in orders]
+    _add_optional_column(columns, orders, "expire_time_ns", _positive_or_none)
+    columns.update(
+        {
+            "filled_qty": [str(o.filled_qty) for o in orders],
+            "liquidity_side": [liquidity_side_to_str(o.liquidity_side) for o in orders],
+            "avg_px": [str(o.avg_px) if f else None for o, f in zip(orders, filled, strict=True)],
+            "slippage": [
+                str(o.slippage) if f else None for o, f in zip(orders, filled, strict=True)
+            ],
+            "commissions": [[str(c) for c in o.commissions()] or None for o in orders],
+            "status": [o.status_string() for o in orders],
+            "is_post_only": [o.is_post_only for o in orders],
+            "is_reduce_only": [o.is_reduce_only for o in orders],
+            "is_quote_quantity": [o.is_quote_quantity for o in orders],
+        },
+    )
+    _add_optional_column(columns, orders, "display_qty", str)
+    columns.update(
+        {
+            "emulation_trigger": [trigger_type_to_str(o.emulation_trigger) for o in orders],
+            "trigger_instrument_id": [_value_or_none(o.trigger_instrument_id) for o in orders],
+            "contingency_type": [contingency_type_to_str(o.contingency_type) for o in orders],
+            "order_list_id": [_value_or_none(o.order_list_id) for o in orders],
+            "linked_order_ids": [
+                [x.value for x in o.linked_order_ids] if o.linked_order_ids is not None else None
+                for o in orders
+            ],
+            "parent_order_id": [_value_or_none(o.parent_order_id) for o in orders],
+            "exec_algorithm_id": [_value_or_none(o.exec_algorithm_id) for o in orders],
+            "exec_algorithm_params": [_str_or_none(o.exec_algorithm_params) for o in orders],
+            "exec_spawn_id": [_value_or_none(o.exec_spawn_id) for o in orders],
+            "tags": [o.tags for o in orders],
+            "init_id": [o.init_id.value for o in orders],
+            "ts_init": [o.ts_init for o in orders],
+            "ts_last": [o.ts_last for o in orders],
+        },
+    )
+
+    return columns
+
+
+def _fill_columns(fills: list[OrderFilled]) -> dict[str, list]:
+    # The columns of `OrderFilled.to_dict` (without the type), built from the event fields
+    return {
+        "trader_id": [e.trader_id.value for e in fills],
+        "strategy_id": [e.strategy_id.value for e in fills],
+        "instrument_id": [e.instrument_id.value for e in fills],
+        "client_order_id": [e.client_order_id.value for e in fills],
+        "venue_order_id": [e.venue_order_id.value for e in fills],
+        "account_id": [e.account_id.value for e in fills],
+        "trade_id": [e.trade_id.value for e in fills],
+        "position_id": [_value_or_none(e.position_id) for e in fills],
+        "order_side": [order_side_to_str(e.order_side) for e in fills],
+        "order_type": [order_type_to_str(e.order_type) for e in fills],
+        "last_qty": [str(e.last_qty) for e in fills],
+        "last_px": [str(e.last_px) for e in fills],
+        "currency": [e.currency.code for e in fills],
+        "commission": [str(e.commission) for e in fills],
+        "liquidity_side": [liquidity_side_to_str(e.liquidity_side) for e in fills],
+        "event_id": [e.id.value for e in fills],
+        "ts_event": [e.ts_event for e in fills],
+        "ts_init": [e.ts_init for e in fills],
+        "info": [_str_or_none(e.info) for e in fills],
+        "reconciliation": [e.reconciliation for e in fills],
+    }
+
+
+def _position_columns(positions: list[Position]) -> dict[str, list]:
+    # The columns of `Position.to_dict` (without the signed quantity and currencies),
+    # built from the position fields
+    return {
+        "position_id": [p.id.value for p in positions],
+        "trader_id": [p.trader_id.value for p in positions],
+        "strategy_id": [p.strategy_id.value for p in positions],
+        "instrument_id": [p.instrument_id.value for p in positions],
+        "account_id": [p.account_id.value for p in positions],
+        "opening_order_id": [p.opening_order_id.value for p in positions],
+        "closing_order_id": [_value_or_none(p.closing_order_id) for p in positions],
+        "entry": [order_side_to_str(p.entry) for p in positions],
+        "side": [position_side_to_str(p.side) for p in positions],
+        "quantity": [str(p.quantity) for p in positions],
+        "peak_qty": [str(p.peak_qty) for p in positions],
+        "ts_init": [p.ts_init for p in positions],
+        "ts_opened": [p.ts_opened for p in positions],
+        "ts_last": [p.ts_last for p in positions],
+        "ts_closed": [_positive_or_none(p.ts_closed) for p in positions],
+        "duration_ns": [_positive_or_none(p.duration_ns) for p in positions],
+        "avg_px_open": [p.avg_px_open for p in positions],
+        "avg_px_close": [p.avg_px_close if p.avg_px_close > 0 else None for p in positions],
+        "commissions": [sorted(str(c) for c in p.commissions()) for p in positions],
+        "realized_return": [round(p.realized_return, 5) for p in positions],
+        "realized_pnl": [str(p.realized_pnl) for p in positions],
+    }
+
+
 class ReportProvider:
     """
     Provides various portfolio analysis reports.
+
+    Reports are built column-wise as Arrow tables, which can be written straight
+    to parquet with `pyarrow.parquet.write_table`, with the pandas DataFrame
+    reports converted from the same tables (indexed by the ID column).
     """
 
     @staticmethod
@@ -46,9 +242,7 @@ class ReportProvider:
         if not orders:
             return pd.DataFrame()
 
-        orders_all = [o.to_dict() for o in orders]
-
-        return pd.DataFrame(data=orders_all).set_index("client_order_id").sort_index()
+        return _to_frame(ReportProvider.generate_orders_table(orders), "client_order_id")
 
     @staticmethod
     def generate_order_fills_report(orders: list[Order]) -> pd.DataFrame:
@@ -67,18 +261,11 @@ class ReportProvider:
         pd.DataFrame
 
         """
-        if not orders:
-            return pd.DataFrame()
-
-        filled_orders = [o.to_dict() for o in orders if o.filled_qty > 0]
+        filled_orders = [o for o in orders if o.filled_qty > 0]
         if not filled_orders:
             return pd.DataFrame()
 
-        report = pd.DataFrame(data=filled_orders).set_index("client_order_id").sort_index()
-        report["ts_last"] = [unix_nanos_to_dt(ts_last or 0) for ts_last in report["ts_last"]]
-        report["ts_init"] = [unix_nanos_to_dt(ts_init) for ts_init in report["ts_init"]]
-
-        return report
+        return _to_frame(ReportProvider.generate_orders_table(filled_orders), "client_order_id")
 
     @staticmethod
     def generate_fills_report(orders: list[Order]) -> pd.DataFrame:
@@ -97,21 +284,11 @@ class ReportProvider:
         pd.DataFrame
 
         """
-        if not orders:
-            return pd.DataFrame()
-
-        fills = [
-            OrderFilled.to_dict(e) for o in orders for e in o.events if isinstance(e, OrderFilled)
-        ]
-        if not fills:
+        table = ReportProvider.generate_fills_table(orders)
+        if table.num_rows == 0:
             return pd.DataFrame()
 
-        report = pd.DataFrame(data=fills).set_index("client_order_id").sort_index()
-        report["ts_event"] = [unix_nanos_to_dt(ts_last or 0) for ts_last in report["ts_event"]]
-        report["ts_init"] = [unix_nanos_to_dt(ts_init) for ts_init in report["ts_init"]]
-        del report["type"]
-
-        return report
+        return _to_frame(table, "client_order_id")
 
     @staticmethod
     def generate_positions_report(positions: list[Position]) -> pd.DataFrame:
@@ -131,23 +308,82 @@ class ReportProvider:
         if not positions:
             return pd.DataFrame()
 
-        positions = [p.to_dict() for p in positions]
-        if not positions:
-            return pd.DataFrame()
+        return _to_frame(ReportProvider.generate_positions_table(positions), "position_id")
 
-        sort = ["ts_opened", "ts_closed", "position_id"]
-        report = pd.DataFrame(data=positions).set_index("position_id").sort_values(sort)
-        del report["signed_qty"]
-        del report["quote_currency"]
-        del report["base_currency"]
-        del report["settlement_currency"]
-        report["ts_opened"] = [unix_nanos_to_dt(ts_opened) for ts_opened in report["ts_opened"]]
-        report["ts_closed"] = [
-            unix_nanos_to_dt(ts_closed) if not pd.isna(ts_closed) else pd.NA
-            for ts_closed in report["ts_closed"]
-        ]
+    @staticmethod
+    def generate_orders_table(orders: list[Order]) -> pa.Table:
+        """
+        Generate an orders report as an Arrow table.
 
-        return report
+        Parameters
+        ----------
+        orders : list[Order]
+            The orders for the report.
+
+        Returns
+        -------
+        pa.Table
+
+        """
+        if not orders:
+            return pa.table({})
+
+        return _to_table(
+            _order_columns(orders),
+            sort_by=["client_order_id"],
+            timestamps=_ORDER_TIMESTAMPS,
+        )
+
+    @staticmethod
+    def generate_fills_table(orders: list[Order]) -> pa.Table:
+        """
+        Generate a fills report as an Arrow table.
+
+        This report provides a row per individual fill event.
+
+        Parameters
+        ----------
+        orders : list[Order]
+            The orders for the report.
+
+        Returns
+        -------
+        pa.Table
+
+        """
+        fills = [e for o in orders for e in o.events if isinstance(e, OrderFilled)]
+        if not fills:
+            return pa.table({})
+
+        return _to_table(
+            _fill_columns(fills),
+            sort_by=["client_order_id"],
+            timestamps=_FILL_TIMESTAMPS,
+        )
+
+    @staticmethod
+    def generate_positions_table(positions: list[Position]) -> pa.Table:
+        """
+        Generate a positions report as an Arrow table.
+
+        Parameters
+        ----------
+        positions : list[Position]
+            The positions for the report.
+
+        Returns
+        -------
+        pa.Table
+
+        """
+        if not positions:
+            return pa.table({})
+
+        return _to_table(
+            _position_columns(positions),
+            sort_by=_POSITION_SORT,
+            timestamps=_POSITION_TIMESTAMPS,
+        )
 
     @staticmethod
     def generate_account_report(account: Account) -> pd.DataFrame:
@@ -180,7 +416,7 @@ class ReportProvider:
             return pd.DataFrame()
 
         report = pd.DataFrame(data=balances).set_index("ts_event").sort_index()
-        report.index = [unix_nanos_to_dt(ts_event) for ts_event in report.index]
+        report.index = _nanos_to_datetimes(report.index.to_numpy())
         del report["ts_init"]
         del report["type"]
         del report["event_id"]
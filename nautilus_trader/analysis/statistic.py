@@ -13,15 +13,20 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import math
 import re
-from typing import Any
+from typing import Any, ClassVar
 
 import pandas as pd
 
+from nautilus_trader.model.objects import Currency
 from nautilus_trader.model.orders import Order
 from nautilus_trader.model.position import Position
 
 
+_NANOSECONDS_IN_DAY = 86_400_000_000_000
+
+
 class PortfolioStatistic:
     """
     The base class for all portfolio performance statistics.
@@ -30,8 +35,19 @@ class PortfolioStatistic:
     -----
     The return value should be a JSON serializable primitive.
 
+    Statistics which set `supports_incremental` also maintain online accumulators
+    through the `update_from_*` methods, so their current value can be queried
+    in O(1) with the `value_from_*` methods.
+
+    Statistics which set `uses_daily_returns` are calculated from returns downsampled
+    into daily bins, which the `PortfolioAnalyzer` downsamples once and passes to
+    `calculate_from_daily_returns` for every such statistic.
+
     """
 
+    supports_incremental: ClassVar[bool] = False
+    uses_daily_returns: ClassVar[bool] = False
+
     @classmethod
     def fully_qualified_name(cls) -> str:
         """
@@ -79,6 +95,23 @@ class PortfolioStatistic:
         """
         # Override in implementation
 
+    def calculate_from_daily_returns(self, daily_returns: pd.Series) -> Any | None:
+        """
+        Calculate the statistic value from the given returns downsampled into daily bins.
+
+        Parameters
+        ----------
+        daily_returns : pd.Series
+            The daily returns to use for the calculation (must not be modified).
+
+        Returns
+        -------
+        Any or ``None``
+            A JSON serializable primitive.
+
+        """
+        # Override in implementation
+
     def calculate_from_realized_pnls(self, realized_pnls: pd.Series) -> Any | None:
         """
         Calculate the statistic value from the given raw realized PnLs.
@@ -130,6 +163,95 @@ class PortfolioStatistic:
         """
         # Override in implementation
 
+    def reset(self) -> None:
+        """
+        Reset the statistics online accumulators.
+        """
+        # Override in implementation
+
+    def update_from_return(self, timestamp_ns: int, value: float) -> None:
+        """
+        Update the online accumulators with the given return.
+
+        Returns are expected in strictly ascending timestamp order.
+
+        Parameters
+        ----------
+        timestamp_ns : int
+            UNIX timestamp (nanoseconds) of the return in its local timezone.
+        value : float
+            The return value.
+
+        """
+        # Override in implementation
+
+    def update_from_realized_pnl(self, currency: Currency, realized_pnl: float) -> None:
+        """
+        Update the online accumulators with the given realized PnL.
+
+        Parameters
+        ----------
+        currency : Currency
+            The currency of the realized PnL.
+        realized_pnl : float
+            The realized PnL for the trade.
+
+        """
+        # Override in implementation
+
+    def update_from_position(self, position: Position) -> None:
+        """
+        Update the online accumulators with the given position.
+
+        Parameters
+        ----------
+        position : Position
+            The position to update with.
+
+        """
+        # Override in implementation
+
+    def value_from_returns(self) -> Any | None:
+        """
+        Return the statistic value from the returns accumulated so far.
+
+        Returns
+        -------
+        Any or ``None``
+            A JSON serializable primitive.
+
+        """
+        # Override in implementation
+
+    def value_from_realized_pnls(self, currency: Currency) -> Any | None:
+        """
+        Return the statistic value from the realized PnLs accumulated so far.
+
+        Parameters
+        ----------
+        currency : Currency
+            The currency for the value.
+
+        Returns
+        -------
+        Any or ``None``
+            A JSON serializable primitive.
+
+        """
+        # Override in implementation
+
+    def value_from_positions(self) -> Any | None:
+        """
+        Return the statistic value from the positions accumulated so far.
+
+        Returns
+        -------
+        Any or ``None``
+            A JSON serializable primitive.
+
+        """
+        # Override in implementation
+
     def _check_valid_returns(self, returns: pd.Series) -> bool:
         if returns is None or returns.empty or returns.isna().all():
             return False
@@ -138,3 +260,81 @@ class PortfolioStatistic:
 
     def _downsample_to_daily_bins(self, returns: pd.Series) -> pd.Series:
         return returns.dropna().resample("1D").sum()
+
+
+class _RunningMoments:
+    # Welford accumulator for the count, mean and variance of a stream of values
+
+    __slots__ = ("count", "m2", "mean")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def update_zeros(self, count: int) -> None:
+        # Merge a block of `count` zero values in O(1)
+        total = self.count + count
+        delta = -self.mean
+        self.m2 += delta * delta * self.count * count / total
+        self.mean += delta * count / total
+        self.count = total
+
+    def std(self) -> float:
+        if self.count < 2:
+            return math.nan
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+class _DailyReturns:
+    # Online equivalent of downsampling returns into daily bins, including the
+    # zero bins for days without returns, as `_downsample_to_daily_bins` does
+
+    __slots__ = ("_day", "_day_sum", "_downside_sq", "_moments")
+
+    def __init__(self) -> None:
+        self._moments = _RunningMoments()
+        self._downside_sq = 0.0
+        self._day: int | None = None
+        self._day_sum = 0.0
+
+    def update(self, timestamp_ns: int, value: float) -> None:
+        if math.isnan(value):
+            return
+
+        day = timestamp_ns // _NANOSECONDS_IN_DAY
+        if self._day is None:
+            self._day = day
+        elif day != self._day:
+            # Close the current bin and fill any days in between with zeros
+            self._moments.update(self._day_sum)
+            if self._day_sum < 0.0:
+                self._downside_sq += self._day_sum * self._day_sum
+            if day - self._day > 1:
+                self._moments.update_zeros(day - self._day - 1)
+            self._day = day
+            self._day_sum = 0.0
+
+        self._day_sum += value
+
+    def moments(self) -> tuple[_RunningMoments, float]:
+        # The moments and downside sum of squares including the open bin
+        if self._day is None:
+            return self._moments, self._downside_sq
+
+        moments = _RunningMoments()
+        moments.count = self._moments.count
+        moments.mean = self._moments.mean
+        moments.m2 = self._moments.m2
+        moments.update(self._day_sum)
+        downside_sq = self._downside_sq
+        if self._day_sum < 0.0:
+            downside_sq += self._day_sum * self._day_sum
+
+        return moments, downside_sq
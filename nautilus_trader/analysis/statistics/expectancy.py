@@ -20,6 +20,7 @@ import pandas as pd
 from nautilus_trader.analysis.statistic import PortfolioStatistic
 from nautilus_trader.analysis.statistics.loser_avg import AvgLoser
 from nautilus_trader.analysis.statistics.winner_avg import AvgWinner
+from nautilus_trader.model.objects import Currency
 
 
 class Expectancy(PortfolioStatistic):
@@ -27,6 +28,11 @@ class Expectancy(PortfolioStatistic):
     Calculates the expectancy from a realized PnLs series.
     """
 
+    supports_incremental = True
+
+    def __init__(self) -> None:
+        self.reset()
+
     def calculate_from_realized_pnls(self, realized_pnls: pd.Series) -> Any | None:
         # Preconditions
         if realized_pnls is None or realized_pnls.empty:
@@ -45,3 +51,30 @@ class Expectancy(PortfolioStatistic):
         loss_rate = 1.0 - win_rate
 
         return (avg_winner * win_rate) + (avg_loser * loss_rate)
+
+    def reset(self) -> None:
+        # [winners sum, winners count, losers sum, losers count] per currency
+        self._totals: dict[Currency, list] = {}
+
+    def update_from_realized_pnl(self, currency: Currency, realized_pnl: float) -> None:
+        totals = self._totals.setdefault(currency, [0.0, 0, 0.0, 0])
+        if realized_pnl > 0.0:
+            totals[0] += realized_pnl
+            totals[1] += 1
+        else:
+            totals[2] += realized_pnl
+            totals[3] += 1
+
+    def value_from_realized_pnls(self, currency: Currency) -> Any | None:
+        totals = self._totals.get(currency)
+        if totals is None:
+            return 0.0
+
+        winners_sum, winners_count, losers_sum, losers_count = totals
+        avg_winner = winners_sum / winners_count if winners_count else 0.0
+        avg_loser = losers_sum / losers_count if losers_count else 0.0
+
+        win_rate = winners_count / float(max(1, (winners_count + losers_count)))
+        loss_rate = 1.0 - win_rate
+
+        return (avg_winner * win_rate) + (avg_loser * loss_rate)
@@ -31,8 +31,11 @@ class LongRatio(PortfolioStatistic):
 
     """
 
+    supports_incremental = True
+
     def __init__(self, precision: int = 2):
         self.precision = precision
+        self.reset()
 
     def calculate_from_positions(self, positions: list[Position]) -> Any | None:
         # Preconditions
@@ -44,3 +47,20 @@ class LongRatio(PortfolioStatistic):
         value = len(longs) / len(positions)
 
         return f"{value:.{self.precision}f}"
+
+    def reset(self) -> None:
+        self._longs = 0
+        self._count = 0
+
+    def update_from_position(self, position: Position) -> None:
+        if position.entry == OrderSide.BUY:
+            self._longs += 1
+        self._count += 1
+
+    def value_from_positions(self) -> Any | None:
+        if self._count == 0:
+            return None
+
+        value = self._longs / self._count
+
+        return f"{value:.{self.precision}f}"
@@ -18,6 +18,7 @@ from typing import Any
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
+from nautilus_trader.model.objects import Currency
 
 
 class AvgLoser(PortfolioStatistic):
@@ -25,6 +26,11 @@ class AvgLoser(PortfolioStatistic):
     Calculates the average loser from a series of PnLs.
     """
 
+    supports_incremental = True
+
+    def __init__(self) -> None:
+        self.reset()
+
     def calculate_from_realized_pnls(self, realized_pnls: pd.Series) -> Any | None:
         # Preconditions
         if realized_pnls is None or realized_pnls.empty:
@@ -37,3 +43,19 @@ class AvgLoser(PortfolioStatistic):
             return 0.0
 
         return losers.mean()
+
+    def reset(self) -> None:
+        self._losers: dict[Currency, list] = {}  # [sum, count] per currency
+
+    def update_from_realized_pnl(self, currency: Currency, realized_pnl: float) -> None:
+        if realized_pnl <= 0.0:
+            losers = self._losers.setdefault(currency, [0.0, 0])
+            losers[0] += realized_pnl
+            losers[1] += 1
+
+    def value_from_realized_pnls(self, currency: Currency) -> Any | None:
+        losers = self._losers.get(currency)
+        if losers is None:
+            return 0.0
+
+        return losers[0] / losers[1]
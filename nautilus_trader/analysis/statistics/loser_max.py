@@ -19,6 +19,7 @@ import numpy as np
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
+from nautilus_trader.model.objects import Currency
 
 
 class MaxLoser(PortfolioStatistic):
@@ -26,6 +27,11 @@ class MaxLoser(PortfolioStatistic):
     Calculates the maximum loser from a series of PnLs.
     """
 
+    supports_incremental = True
+
+    def __init__(self) -> None:
+        self.reset()
+
     def calculate_from_realized_pnls(self, realized_pnls: pd.Series) -> Any | None:
         # Preconditions
         if realized_pnls is None or realized_pnls.empty:
@@ -37,3 +43,16 @@ class MaxLoser(PortfolioStatistic):
             return 0.0
 
         return min(np.asarray(losers, dtype=np.float64))
+
+    def reset(self) -> None:
+        self._max_losers: dict[Currency, float] = {}
+
+    def update_from_realized_pnl(self, currency: Currency, realized_pnl: float) -> None:
+        if realized_pnl < 0.0:
+            self._max_losers[currency] = min(
+                self._max_losers.get(currency, realized_pnl),
+                realized_pnl,
+            )
+
+    def value_from_realized_pnls(self, currency: Currency) -> Any | None:
+        return self._max_losers.get(currency, 0.0)
@@ -26,6 +26,11 @@ class ProfitFactor(PortfolioStatistic):
     Calculates the annualized profit factor or ratio (wins/loss).
     """
 
+    supports_incremental = True
+
+    def __init__(self) -> None:
+        self.reset()
+
     def calculate_from_returns(self, returns: pd.Series) -> Any | None:
         # Preconditions
         if not self._check_valid_returns(returns):
@@ -38,3 +43,24 @@ class ProfitFactor(PortfolioStatistic):
             return np.nan
         else:
             return abs(positive_returns_sum / negative_returns_sum)
+
+    def reset(self) -> None:
+        self._count = 0
+        self._positive_returns_sum = 0.0
+        self._negative_returns_sum = 0.0
+
+    def update_from_return(self, timestamp_ns: int, value: float) -> None:
+        if np.isnan(value):
+            return
+
+        self._count += 1
+        if value >= 0:
+            self._positive_returns_sum += value
+        else:
+            self._negative_returns_sum += value
+
+    def value_from_returns(self) -> Any | None:
+        if self._count == 0 or self._negative_returns_sum == 0:
+            return np.nan
+
+        return abs(self._positive_returns_sum / self._negative_returns_sum)
@@ -26,6 +26,11 @@ class ReturnsAverage(PortfolioStatistic):
     Calculates the average return.
     """
 
+    supports_incremental = True
+
+    def __init__(self) -> None:
+        self.reset()
+
     @property
     def name(self) -> str:
         return "Average (Return)"
@@ -36,3 +41,18 @@ class ReturnsAverage(PortfolioStatistic):
             return np.nan
 
         return returns[returns != 0].dropna().mean()
+
+    def reset(self) -> None:
+        self._count = 0
+        self._sum = 0.0
+
+    def update_from_return(self, timestamp_ns: int, value: float) -> None:
+        if value != 0 and not np.isnan(value):
+            self._count += 1
+            self._sum += value
+
+    def value_from_returns(self) -> Any | None:
+        if self._count == 0:
+            return np.nan
+
+        return self._sum / self._count
@@ -19,6 +19,7 @@ import numpy as np
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
+from nautilus_trader.analysis.statistic import _DailyReturns
 
 
 class ReturnsVolatility(PortfolioStatistic):
@@ -34,8 +35,12 @@ class ReturnsVolatility(PortfolioStatistic):
 
     """
 
+    supports_incremental = True
+    uses_daily_returns = True
+
     def __init__(self, period: int = 252):
         self.period = period
+        self._daily_returns = _DailyReturns()
 
     @property
     def name(self) -> str:
@@ -46,6 +51,24 @@ class ReturnsVolatility(PortfolioStatistic):
         if not self._check_valid_returns(returns):
             return np.nan
 
-        returns = self._downsample_to_daily_bins(returns)
+        return self.calculate_from_daily_returns(self._downsample_to_daily_bins(returns))
+
+    def calculate_from_daily_returns(self, daily_returns: pd.Series) -> Any | None:
+        # Preconditions
+        if not self._check_valid_returns(daily_returns):
+            return np.nan
+
+        return daily_returns.std() * np.sqrt(self.period)
+
+    def reset(self) -> None:
+        self._daily_returns = _DailyReturns()
+
+    def update_from_return(self, timestamp_ns: int, value: float) -> None:
+        self._daily_returns.update(timestamp_ns, value)
+
+    def value_from_returns(self) -> Any | None:
+        moments, _ = self._daily_returns.moments()
+        if moments.count == 0:
+            return np.nan
 
-        return returns.std() * np.sqrt(self.period)
+        return moments.std() * np.sqrt(self.period)
@@ -19,6 +19,7 @@ import numpy as np
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
+from nautilus_trader.analysis.statistic import _RunningMoments
 
 
 class RiskReturnRatio(PortfolioStatistic):
@@ -26,9 +27,28 @@ class RiskReturnRatio(PortfolioStatistic):
     Calculates the return on risk ratio.
     """
 
+    supports_incremental = True
+
+    def __init__(self) -> None:
+        self._moments = _RunningMoments()
+
     def calculate_from_returns(self, returns: pd.Series) -> Any | None:
         # Preconditions
         if not self._check_valid_returns(returns):
             return np.nan
 
         return returns.mean() / returns.std()
+
+    def reset(self) -> None:
+        self._moments = _RunningMoments()
+
+    def update_from_return(self, timestamp_ns: int, value: float) -> None:
+        if not np.isnan(value):
+            self._moments.update(value)
+
+    def value_from_returns(self) -> Any | None:
+        if self._moments.count == 0:
+            return np.nan
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.float64(self._moments.mean) / self._moments.std()
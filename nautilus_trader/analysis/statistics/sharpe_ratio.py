@@ -19,6 +19,7 @@ import numpy as np
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
+from nautilus_trader.analysis.statistic import _DailyReturns
 
 
 class SharpeRatio(PortfolioStatistic):
@@ -34,8 +35,12 @@ class SharpeRatio(PortfolioStatistic):
 
     """
 
+    supports_incremental = True
+    uses_daily_returns = True
+
     def __init__(self, period: int = 252):
         self.period = period
+        self._daily_returns = _DailyReturns()
 
     @property
     def name(self) -> str:
@@ -46,9 +51,30 @@ class SharpeRatio(PortfolioStatistic):
         if not self._check_valid_returns(returns):
             return np.nan
 
-        returns = self._downsample_to_daily_bins(returns)
+        return self.calculate_from_daily_returns(self._downsample_to_daily_bins(returns))
+
+    def calculate_from_daily_returns(self, daily_returns: pd.Series) -> Any | None:
+        # Preconditions
+        if not self._check_valid_returns(daily_returns):
+            return np.nan
+
+        divisor = daily_returns.std(ddof=1)
+        res = daily_returns.mean() / divisor
+
+        return res * np.sqrt(self.period)
+
+    def reset(self) -> None:
+        self._daily_returns = _DailyReturns()
+
+    def update_from_return(self, timestamp_ns: int, value: float) -> None:
+        self._daily_returns.update(timestamp_ns, value)
+
+    def value_from_returns(self) -> Any | None:
+        moments, _ = self._daily_returns.moments()
+        if moments.count == 0:
+            return np.nan
 
-        divisor = returns.std(ddof=1)
-        res = returns.mean() / divisor
+        with np.errstate(divide="ignore", invalid="ignore"):
+            res = np.float64(moments.mean) / moments.std()
 
         return res * np.sqrt(self.period)
@@ -19,6 +19,7 @@ import numpy as np
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
+from nautilus_trader.analysis.statistic import _DailyReturns
 
 
 class SortinoRatio(PortfolioStatistic):
@@ -34,8 +35,12 @@ class SortinoRatio(PortfolioStatistic):
 
     """
 
+    supports_incremental = True
+    uses_daily_returns = True
+
     def __init__(self, period: int = 252):
         self.period = period
+        self._daily_returns = _DailyReturns()
 
     @property
     def name(self) -> str:
@@ -46,12 +51,35 @@ class SortinoRatio(PortfolioStatistic):
         if not self._check_valid_returns(returns):
             return np.nan
 
-        returns = self._downsample_to_daily_bins(returns)
+        return self.calculate_from_daily_returns(self._downsample_to_daily_bins(returns))
+
+    def calculate_from_daily_returns(self, daily_returns: pd.Series) -> Any | None:
+        # Preconditions
+        if not self._check_valid_returns(daily_returns):
+            return np.nan
 
-        downside = np.sqrt((returns[returns < 0] ** 2).sum() / len(returns))
+        downside = np.sqrt((daily_returns[daily_returns < 0] ** 2).sum() / len(daily_returns))
         if downside == 0:
             return np.nan
 
-        res = returns.mean() / downside
+        res = daily_returns.mean() / downside
+
+        return res * np.sqrt(self.period)
+
+    def reset(self) -> None:
+        self._daily_returns = _DailyReturns()
+
+    def update_from_return(self, timestamp_ns: int, value: float) -> None:
+        self._daily_returns.update(timestamp_ns, value)
+
+    def value_from_returns(self) -> Any | None:
+        moments, downside_sq = self._daily_returns.moments()
+        if moments.count == 0:
+            return np.nan
+
+        downside = np.sqrt(downside_sq / moments.count)
+        if downside == 0:
+            return np.nan
 
+        res = moments.mean / downside
         return res * np.sqrt(self.period)
@@ -18,6 +18,7 @@ from typing import Any
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
+from nautilus_trader.model.objects import Currency
 
 
 class WinRate(PortfolioStatistic):
@@ -25,6 +26,11 @@ class WinRate(PortfolioStatistic):
     Calculates the win rate from a realized PnLs series.
     """
 
+    supports_incremental = True
+
+    def __init__(self) -> None:
+        self.reset()
+
     def calculate_from_realized_pnls(self, realized_pnls: pd.Series) -> Any | None:
         # Preconditions
         if realized_pnls is None or realized_pnls.empty:
@@ -35,3 +41,19 @@ class WinRate(PortfolioStatistic):
         losers = [x for x in realized_pnls if x <= 0.0]
 
         return len(winners) / float(max(1, (len(winners) + len(losers))))
+
+    def reset(self) -> None:
+        self._counts: dict[Currency, list] = {}  # [winners, total] per currency
+
+    def update_from_realized_pnl(self, currency: Currency, realized_pnl: float) -> None:
+        counts = self._counts.setdefault(currency, [0, 0])
+        if realized_pnl > 0.0:
+            counts[0] += 1
+        counts[1] += 1
+
+    def value_from_realized_pnls(self, currency: Currency) -> Any | None:
+        counts = self._counts.get(currency)
+        if counts is None:
+            return 0.0
+
+        return counts[0] / float(max(1, counts[1]))
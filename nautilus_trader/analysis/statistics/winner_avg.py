@@ -18,6 +18,7 @@ from typing import Any
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
+from nautilus_trader.model.objects import Currency
 
 
 class AvgWinner(PortfolioStatistic):
@@ -25,6 +26,11 @@ class AvgWinner(PortfolioStatistic):
     Calculates the average winner from a series of PnLs.
     """
 
+    supports_incremental = True
+
+    def __init__(self) -> None:
+        self.reset()
+
     def calculate_from_realized_pnls(self, realized_pnls: pd.Series) -> Any | None:
         # Preconditions
         if realized_pnls is None or realized_pnls.empty:
@@ -37,3 +43,19 @@ class AvgWinner(PortfolioStatistic):
             return 0.0
         else:
             return winners.mean()
+
+    def reset(self) -> None:
+        self._winners: dict[Currency, list] = {}  # [sum, count] per currency
+
+    def update_from_realized_pnl(self, currency: Currency, realized_pnl: float) -> None:
+        if realized_pnl > 0.0:
+            winners = self._winners.setdefault(currency, [0.0, 0])
+            winners[0] += realized_pnl
+            winners[1] += 1
+
+    def value_from_realized_pnls(self, currency: Currency) -> Any | None:
+        winners = self._winners.get(currency)
+        if winners is None:
+            return 0.0
+
+        return winners[0] / winners[1]
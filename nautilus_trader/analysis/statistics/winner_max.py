@@ -18,6 +18,7 @@ from typing import Any
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
+from nautilus_trader.model.objects import Currency
 
 
 class MaxWinner(PortfolioStatistic):
@@ -25,6 +26,11 @@ class MaxWinner(PortfolioStatistic):
     Calculates the maximum winner from a series of PnLs.
     """
 
+    supports_incremental = True
+
+    def __init__(self) -> None:
+        self.reset()
+
     def calculate_from_realized_pnls(self, realized_pnls: pd.Series) -> Any | None:
         # Preconditions
         if realized_pnls is None or realized_pnls.empty:
@@ -32,3 +38,12 @@ class MaxWinner(PortfolioStatistic):
 
         # Calculate statistic
         return max(realized_pnls)
+
+    def reset(self) -> None:
+        self._max_pnls: dict[Currency, float] = {}
+
+    def update_from_realized_pnl(self, currency: Currency, realized_pnl: float) -> None:
+        self._max_pnls[currency] = max(self._max_pnls.get(currency, realized_pnl), realized_pnl)
+
+    def value_from_realized_pnls(self, currency: Currency) -> Any | None:
+        return self._max_pnls.get(currency, 0.0)
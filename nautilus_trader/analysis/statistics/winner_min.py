@@ -19,6 +19,7 @@ import numpy as np
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
+from nautilus_trader.model.objects import Currency
 
 
 class MinWinner(PortfolioStatistic):
@@ -26,6 +27,11 @@ class MinWinner(PortfolioStatistic):
     Calculates the minimum winner from a series of PnLs.
     """
 
+    supports_incremental = True
+
+    def __init__(self) -> None:
+        self.reset()
+
     def calculate_from_realized_pnls(self, realized_pnls: pd.Series) -> Any | None:
         # Preconditions
         if realized_pnls is None or realized_pnls.empty:
@@ -37,3 +43,16 @@ class MinWinner(PortfolioStatistic):
             return 0.0
 
         return min(np.asarray(winners, dtype=np.float64))
+
+    def reset(self) -> None:
+        self._min_winners: dict[Currency, float] = {}
+
+    def update_from_realized_pnl(self, currency: Currency, realized_pnl: float) -> None:
+        if realized_pnl > 0.0:
+            self._min_winners[currency] = min(
+                self._min_winners.get(currency, realized_pnl),
+                realized_pnl,
+            )
+
+    def value_from_realized_pnls(self, currency: Currency) -> Any | None:
+        return self._min_winners.get(currency, 0.0)
@@ -270,6 +270,8 @@ class BacktestEngineConfig(NautilusKernelConfig, frozen=True):
         The live risk engine configuration.
     exec_engine : ExecEngineConfig, optional
         The live execution engine configuration.
+    portfolio : PortfolioConfig, optional
+        The portfolio configuration.
     streaming : StreamingConfig, optional
         The configuration for streaming to feather files.
     strategies : list[ImportableStrategyConfig]
@@ -19,11 +19,26 @@ from libc.stdint cimport uint64_t
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.common.component cimport Clock
 from nautilus_trader.common.component cimport Logger
+from nautilus_trader.common.component cimport TestClockScheduler
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.rust.backtest cimport TimeEventAccumulatorAPI
 from nautilus_trader.core.rust.core cimport CVec
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.engine cimport DataEngine
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cdef class BacktestDataIterator:
+    cdef dict[str, int] _stream_ids
+    cdef list _sources
+    cdef list _chunks
+    cdef list _positions
+    cdef list _heap
+
+    cdef void _push_stream(self, int stream_id)
+    cdef list _next_chunk(self, int stream_id)
+    cdef Data next(self)
+    cdef uint64_t next_ts_init(self)
 
 
 cdef class BacktestEngine:
@@ -31,6 +46,7 @@ cdef class BacktestEngine:
     cdef Clock _clock
     cdef Logger _log
     cdef TimeEventAccumulatorAPI _accumulator
+    cdef TestClockScheduler _scheduler
 
     cdef object _kernel
     cdef UUID4 _instance_id
@@ -43,14 +59,21 @@ cdef class BacktestEngine:
     cdef datetime _backtest_end
 
     cdef dict[Venue, SimulatedExchange] _venues
+    cdef list[SimulatedExchange] _exchanges
+    cdef dict[InstrumentId, SimulatedExchange] _instrument_exchanges
+    cdef dict[type, int] _dispatch_kinds
     cdef set[InstrumentId] _has_data
     cdef set[InstrumentId] _has_book_data
     cdef list[Data] _data
+    cdef BacktestDataIterator _data_iterator
     cdef uint64_t _data_len
     cdef uint64_t _index
     cdef uint64_t _iteration
 
-    cdef Data _next(self)
+    cdef Data _next(self, uint64_t end_ns)
+    cdef int _dispatch_kind(self, Data data)
+    cdef SimulatedExchange _exchange_for(self, InstrumentId instrument_id)
+    cdef void _process_exchanges(self, uint64_t ts_now)
     cdef CVec _advance_time(self, uint64_t ts_now)
     cdef void _process_raw_time_event_handlers(
         self,
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
 import pickle
 from decimal import Decimal
 
@@ -36,6 +37,7 @@ from nautilus_trader.trading.trader import Trader
 
 from cpython.datetime cimport datetime
 from cpython.object cimport PyObject
+from libc.stdint cimport UINT64_MAX
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
@@ -54,7 +56,7 @@ from nautilus_trader.common.component cimport Logger
 from nautilus_trader.common.component cimport TestClock
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.common.component cimport TimeEventHandler
-from nautilus_trader.common.component cimport get_component_clocks
+from nautilus_trader.common.component cimport get_component_clock_scheduler
 from nautilus_trader.common.component cimport log_level_from_str
 from nautilus_trader.common.component cimport log_sysinfo
 from nautilus_trader.common.component cimport set_logging_clock_realtime_mode
@@ -100,6 +102,268 @@ from nautilus_trader.portfolio.base cimport PortfolioFacade
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+cdef str _DATA_STREAM_NAME = "backtest_data"
+
+
+cdef enum DataDispatchKind:
+    DISPATCH_NONE = 0
+    DISPATCH_QUOTE_TICK = 1
+    DISPATCH_TRADE_TICK = 2
+    DISPATCH_ORDER_BOOK_DELTA = 3
+    DISPATCH_ORDER_BOOK_DELTAS = 4
+    DISPATCH_BAR = 5
+    DISPATCH_INSTRUMENT_CLOSE = 6
+    DISPATCH_INSTRUMENT_STATUS = 7
+
+
+cdef class BacktestDataIterator:
+    """
+    Provides a k-way merge over multiple named data streams, yielding data in
+    `ts_init` order.
+
+    Each stream is either an in-memory list, or an iterator which lazily yields
+    data elements or chunks (lists) of data elements, such as catalog files,
+    `DataBackendSession` query results or generators. Only the current chunk
+    of each stream is held by the iterator, so memory stays bounded by the
+    chunk sizes rather than the total size of the data.
+
+    Warnings
+    --------
+    Each stream must yield data in non-decreasing `ts_init` order. Data with equal
+    `ts_init` across streams is yielded in the order the streams were added.
+
+    """
+
+    def __init__(self) -> None:
+        self._stream_ids: dict[str, int] = {}
+        self._sources: list = []
+        self._chunks: list = []
+        self._positions: list = []
+        self._heap: list = []
+
+    @property
+    def stream_names(self) -> list[str]:
+        """
+        Return the names of the streams added to the iterator.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        return list(self._stream_ids.keys())
+
+    def add_data(self, str name, list data, Py_ssize_t start_index = 0) -> None:
+        """
+        Add the given `data` list as a stream (the list is not copied).
+
+        If a stream with the same `name` already exists then it is replaced.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stream.
+        data : list[Data]
+            The data for the stream, sorted by `ts_init`.
+        start_index : int, default 0
+            The index in `data` to start the stream from.
+
+        """
+        Condition.not_none(data, "data")
+
+        self._add(name, None, data, start_index)
+
+    def add_stream(self, str name, stream) -> None:
+        """
+        Add the given `stream` iterator.
+
+        The stream may yield either single `Data` elements, or lists (chunks) of
+        `Data` elements. The first chunk is read on add.
+
+        If a stream with the same `name` already exists then it is replaced.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stream.
+        stream : Iterable[Data | list[Data]]
+            The stream of data, sorted by `ts_init`.
+
+        """
+        Condition.not_none(stream, "stream")
+
+        self._add(name, iter(stream), None, 0)
+
+    def remove_stream(self, str name) -> None:
+        """
+        Remove the stream with the given `name` (if found).
+
+        Parameters
+        ----------
+        name : str
+            The name of the stream to remove.
+
+        """
+        cdef int stream_id = self._stream_ids.pop(name, -1)
+        if stream_id == -1:
+            return  # Stream not found
+
+        self._sources[stream_id] = None
+        self._chunks[stream_id] = None
+        self._heap = [entry for entry in self._heap if entry[1] != stream_id]
+        heapq.heapify(self._heap)
+
+    def peek(self):
+        """
+        Return the next data element without consuming it (if any).
+
+        Returns
+        -------
+        Data or ``None``
+
+        """
+        if not self._heap:
+            return None
+
+        cdef int stream_id = self._heap[0][1]
+        return self._chunks[stream_id][self._positions[stream_id]]
+
+    def peek_stream(self, str name):
+        """
+        Return the next data element of the stream with the given `name` without
+        consuming it (if any).
+
+        Parameters
+        ----------
+        name : str
+            The name of the stream.
+
+        Returns
+        -------
+        Data or ``None``
+
+        """
+        cdef int stream_id = self._stream_ids.get(name, -1)
+        if stream_id == -1:
+            return None
+
+        cdef list chunk = self._chunks[stream_id]
+        cdef Py_ssize_t position = self._positions[stream_id]
+        if chunk is None or position >= len(chunk):
+            return None
+
+        return chunk[position]
+
+    def is_empty(self) -> bool:
+        """
+        Return whether all streams are exhausted.
+
+        Returns
+        -------
+        bool
+
+        """
+        return not self._heap
+
+    def clear(self) -> None:
+        """
+        Clear all streams from the iterator.
+
+        """
+        self._stream_ids.clear()
+        self._sources.clear()
+        self._chunks.clear()
+        self._positions.clear()
+        self._heap.clear()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef Data data = self.next()
+        if data is None:
+            raise StopIteration
+        return data
+
+    def _add(self, str name, source, list chunk, Py_ssize_t position):
+        Condition.valid_string(name, "name")
+
+        self.remove_stream(name)
+
+        cdef int stream_id = len(self._sources)
+        self._stream_ids[name] = stream_id
+        self._sources.append(source)
+        self._chunks.append(chunk)
+        self._positions.append(position)
+
+        if source is not None:
+            self._chunks[stream_id] = self._next_chunk(stream_id)
+
+        self._push_stream(stream_id)
+
+    cdef void _push_stream(self, int stream_id):
+        cdef list chunk = self._chunks[stream_id]
+        cdef Py_ssize_t position = self._positions[stream_id]
+        if chunk is None or position >= len(chunk):
+            return  # Stream exhausted
+
+        heapq.heappush(self._heap, (chunk[position].ts_init, stream_id))
+
+    cdef list _next_chunk(self, int stream_id):
+        self._positions[stream_id] = 0
+
+        source = self._sources[stream_id]
+        if source is None:
+            return None  # In-memory list exhausted
+
+        for item in source:
+            if isinstance(item, list):
+                if item:
+                    return item
+            else:
+                return [item]
+
+        return None  # Source exhausted
+
+    cdef Data next(self):
+        """
+        Return the next data element in `ts_init` order (``None`` when exhausted).
+        """
+        if not self._heap:
+            return None
+
+        cdef int stream_id = self._heap[0][1]
+        cdef list chunk = self._chunks[stream_id]
+        cdef Py_ssize_t position = self._positions[stream_id]
+        cdef Data data = chunk[position]
+
+        position += 1
+        if position < len(chunk):
+            self._positions[stream_id] = position
+        else:
+            chunk = self._next_chunk(stream_id)
+            self._chunks[stream_id] = chunk
+
+        if chunk is None:
+            heapq.heappop(self._heap)
+        else:
+            heapq.heapreplace(
+                self._heap,
+                (chunk[self._positions[stream_id]].ts_init, stream_id),
+            )
+
+        return data
+
+    cdef uint64_t next_ts_init(self):
+        """
+        Return the `ts_init` of the next data element (zero when exhausted).
+        """
+        if not self._heap:
+            return 0
+
+        return self._heap[0][0]
+
+
 cdef class BacktestEngine:
     """
     Provides a backtest engine to run a portfolio of strategies over historical
@@ -132,9 +396,13 @@ cdef class BacktestEngine:
 
         # Venues and data
         self._venues: dict[Venue, SimulatedExchange] = {}
+        self._exchanges: list[SimulatedExchange] = []
+        self._instrument_exchanges: dict[InstrumentId, SimulatedExchange] = {}
+        self._dispatch_kinds: dict[type, int] = {}
         self._has_data: set[InstrumentId] = set()
         self._has_book_data: set[InstrumentId] = set()
         self._data: list[Data] = []
+        self._data_iterator = BacktestDataIterator()
         self._data_len: uint64_t = 0
         self._index: uint64_t = 0
         self._iteration: uint64_t = 0
@@ -148,6 +416,7 @@ cdef class BacktestEngine:
         # Build core system kernel
         self._kernel = NautilusKernel(name=type(self).__name__, config=config)
         self._instance_id = self._kernel.instance_id
+        self._scheduler = get_component_clock_scheduler(self._instance_id)
         self._log = Logger(type(self).__name__)
 
         self._data_engine: DataEngine = self._kernel.data_engine
@@ -489,6 +758,7 @@ cdef class BacktestEngine:
         )
 
         self._venues[venue] = exchange
+        self._exchanges.append(exchange)
 
         # Create execution client for exchange
         exec_client = BacktestExecClient(
@@ -631,40 +901,7 @@ cdef class BacktestEngine:
         cdef str data_added_str = "data"
 
         if validate:
-            first = data[0]
-            if hasattr(first, "instrument_id"):
-                Condition.is_true(
-                    first.instrument_id in self.kernel.cache.instrument_ids(),
-                    f"`Instrument` {first.instrument_id} for the given data not found in the cache. "
-                    "Add the instrument through `add_instrument()` prior to adding related data.",
-                )
-                # Check client has been registered
-                self._add_market_data_client_if_not_exists(first.instrument_id.venue)
-                self._has_data.add(first.instrument_id)
-                data_added_str = f"{first.instrument_id} {type(first).__name__}"
-            elif isinstance(first, Bar):
-                Condition.is_true(
-                    first.bar_type.instrument_id in self.kernel.cache.instrument_ids(),
-                    f"`Instrument` {first.bar_type.instrument_id} for the given data not found in the cache. "
-                    "Add the instrument through `add_instrument()` prior to adding related data.",
-                )
-                Condition.equal(
-                    first.bar_type.aggregation_source,
-                    AggregationSource.EXTERNAL,
-                    "bar_type.aggregation_source",
-                    "required source",
-                )
-                self._has_data.add(first.bar_type.instrument_id)
-                data_added_str = f"{first.bar_type} {type(first).__name__}"
-            else:
-                Condition.not_none(client_id, "client_id")
-                # Check client has been registered
-                self._add_data_client_if_not_exists(client_id)
-                if isinstance(first, CustomData):
-                    data_added_str = f"{type(first.data).__name__} "
-
-            if type(first) in BOOK_DATA_TYPES:
-                self._has_book_data.add(first.instrument_id)
+            data_added_str = self._validate_data(data[0], client_id)
 
         # Add data
         self._data.extend(data)
@@ -677,6 +914,99 @@ cdef class BacktestEngine:
             f"Added {len(data):_} {data_added_str} element{'' if len(data) == 1 else 's'}",
         )
 
+    def add_data_iterator(
+        self,
+        str data_name,
+        generator,
+        ClientId client_id = None,
+        bint validate = True,
+    ) -> None:
+        """
+        Add the given data `generator` as a lazily consumed stream for the backtest engine.
+
+        The stream is merged with all other data in `ts_init` order during a run,
+        without being materialized in memory. The generator may yield single
+        `Data` elements, or lists (chunks) of `Data` elements, for example from
+        a `DataBackendSession` query result or a catalog file reader.
+
+        Parameters
+        ----------
+        data_name : str
+            The unique name for the data stream (replaces any stream with the same name).
+        generator : Iterable[Data | list[Data]]
+            The data stream, which must yield data in non-decreasing `ts_init` order.
+        client_id : ClientId, optional
+            The client ID to associate with the data.
+        validate : bool, default True
+            If the first element of the stream should be validated.
+
+        Raises
+        ------
+        ValueError
+            If `data_name` is not a valid string.
+        ValueError
+            If `instrument_id` for the data is not found in the cache.
+        ValueError
+            If the data elements do not have an `instrument_id` and `client_id` is ``None``.
+
+        Warnings
+        --------
+        Assumes all data elements of the stream are of the same type.
+
+        A stream is consumed as the backtest runs, and so can only be run through once.
+
+        """
+        Condition.valid_string(data_name, "data_name")
+        Condition.not_none(generator, "generator")
+
+        self._data_iterator.add_stream(data_name, generator)
+
+        cdef str data_added_str = data_name
+        first = self._data_iterator.peek_stream(data_name)
+        if validate and first is not None:
+            data_added_str = self._validate_data(first, client_id)
+
+        self._log.info(f"Added {data_added_str} data stream '{data_name}'")
+
+    def _validate_data(self, first, ClientId client_id) -> str:
+        cdef str data_added_str = "data"
+
+        if hasattr(first, "instrument_id"):
+            Condition.is_true(
+                first.instrument_id in self.kernel.cache.instrument_ids(),
+                f"`Instrument` {first.instrument_id} for the given data not found in the cache. "
+                "Add the instrument through `add_instrument()` prior to adding related data.",
+            )
+            # Check client has been registered
+            self._add_market_data_client_if_not_exists(first.instrument_id.venue)
+            self._has_data.add(first.instrument_id)
+            data_added_str = f"{first.instrument_id} {type(first).__name__}"
+        elif isinstance(first, Bar):
+            Condition.is_true(
+                first.bar_type.instrument_id in self.kernel.cache.instrument_ids(),
+                f"`Instrument` {first.bar_type.instrument_id} for the given data not found in the cache. "
+                "Add the instrument through `add_instrument()` prior to adding related data.",
+            )
+            Condition.equal(
+                first.bar_type.aggregation_source,
+                AggregationSource.EXTERNAL,
+                "bar_type.aggregation_source",
+                "required source",
+            )
+            self._has_data.add(first.bar_type.instrument_id)
+            data_added_str = f"{first.bar_type} {type(first).__name__}"
+        else:
+            Condition.not_none(client_id, "client_id")
+            # Check client has been registered
+            self._add_data_client_if_not_exists(client_id)
+            if isinstance(first, CustomData):
+                data_added_str = f"{type(first.data).__name__} "
+
+        if type(first) in BOOK_DATA_TYPES:
+            self._has_book_data.add(first.instrument_id)
+
+        return data_added_str
+
     def dump_pickled_data(self) -> bytes:
         """
         Return the internal data stream pickled.
@@ -856,6 +1186,7 @@ cdef class BacktestEngine:
         self._has_data.clear()
         self._has_book_data.clear()
         self._data.clear()
+        self._data_iterator.clear()
         self._data_len = 0
         self._index = 0
 
@@ -1031,17 +1362,26 @@ cdef class BacktestEngine:
                         "Set the venue `book_type` to 'L1_MBP' (for top-of-book data like quotes, trades, and bars) or provide order book data for this instrument."
                     )
 
+        # Merge the in-memory data with any added data streams
+        if self._data:
+            self._data_iterator.add_data(_DATA_STREAM_NAME, self._data)
+        cdef bint has_streams = len(self._data_iterator.stream_names) > (1 if self._data else 0)
+        Condition.is_false(self._data_iterator.is_empty(), "no data has been added to the engine")
+
         cdef uint64_t start_ns
         cdef uint64_t end_ns
         # Time range check and set
         if start is None:
             # Set `start` to start of data
-            start_ns = self._data[0].ts_init
+            start_ns = self._data_iterator.next_ts_init()
             start = unix_nanos_to_dt(start_ns)
         else:
             start = pd.to_datetime(start, utc=True)
             start_ns = start.value
-        if end is None:
+        if end is None and has_streams:
+            # Run to the end of the data streams (end not known in advance)
+            end_ns = UINT64_MAX
+        elif end is None:
             # Set `end` to end of data
             end_ns = self._data[-1].ts_init
             end = unix_nanos_to_dt(end_ns)
@@ -1049,12 +1389,9 @@ cdef class BacktestEngine:
             end = pd.to_datetime(end, utc=True)
             end_ns = end.value
         Condition.is_true(start_ns < end_ns, "start was >= end")
-        Condition.not_empty(self._data, "data")
 
         # Set clocks
-        cdef TestClock clock
-        for clock in get_component_clocks(self._instance_id):
-            clock.set_time(start_ns)
+        self._scheduler.set_time(start_ns)
 
         if self._iteration == 0:
             # Initialize run
@@ -1100,53 +1437,58 @@ cdef class BacktestEngine:
                 self._index = i
                 break
 
+        if self._data:
+            self._data_iterator.add_data(_DATA_STREAM_NAME, self._data, self._index)
+
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef bint force_stop = False
         cdef uint64_t last_ns = 0
         cdef uint64_t raw_handlers_count = 0
-        cdef Data data = self._next()
+        cdef Data data = self._next(end_ns)
         cdef CVec raw_handlers
+        cdef int kind
+
+        # Skip any streamed data prior to the start
+        while data is not None and data.ts_init < start_ns:
+            data = self._next(end_ns)
         try:
             while data is not None:
-                if data.ts_init > end_ns:
-                    # End of backtest
-                    break
                 if data.ts_init > last_ns:
                     # Advance clocks to the next data time
                     raw_handlers = self._advance_time(data.ts_init)
                     raw_handlers_count = raw_handlers.len
 
                 # Process data through exchange
-                if isinstance(data, OrderBookDelta):
-                    exchange = self._venues[data.instrument_id.venue]
-                    exchange.process_order_book_delta(data)
-                elif isinstance(data, OrderBookDeltas):
-                    exchange = self._venues[data.instrument_id.venue]
-                    exchange.process_order_book_deltas(data)
-                elif isinstance(data, QuoteTick):
-                    exchange = self._venues[data.instrument_id.venue]
+                kind = self._dispatch_kind(data)
+                if kind == DISPATCH_QUOTE_TICK:
+                    exchange = self._exchange_for(data.instrument_id)
                     exchange.process_quote_tick(data)
-                elif isinstance(data, TradeTick):
-                    exchange = self._venues[data.instrument_id.venue]
+                elif kind == DISPATCH_TRADE_TICK:
+                    exchange = self._exchange_for(data.instrument_id)
                     exchange.process_trade_tick(data)
-                elif isinstance(data, Bar):
-                    exchange = self._venues[data.bar_type.instrument_id.venue]
+                elif kind == DISPATCH_ORDER_BOOK_DELTA:
+                    exchange = self._exchange_for(data.instrument_id)
+                    exchange.process_order_book_delta(data)
+                elif kind == DISPATCH_ORDER_BOOK_DELTAS:
+                    exchange = self._exchange_for(data.instrument_id)
+                    exchange.process_order_book_deltas(data)
+                elif kind == DISPATCH_BAR:
+                    exchange = self._exchange_for(data.bar_type.instrument_id)
                     exchange.process_bar(data)
-                elif isinstance(data, InstrumentClose):
-                    exchange = self._venues[data.instrument_id.venue]
+                elif kind == DISPATCH_INSTRUMENT_CLOSE:
+                    exchange = self._exchange_for(data.instrument_id)
                     exchange.process_instrument_close(data)
-                elif isinstance(data, InstrumentStatus):
-                    exchange = self._venues[data.instrument_id.venue]
+                elif kind == DISPATCH_INSTRUMENT_STATUS:
+                    exchange = self._exchange_for(data.instrument_id)
                     exchange.process_instrument_status(data)
 
                 self._data_engine.process(data)
 
-                # Process all exchange messages
-                for exchange in self._venues.values():
-                    exchange.process(data.ts_init)
+                # Process exchange messages (only for venues with pending work)
+                self._process_exchanges(data.ts_init)
 
                 last_ns = data.ts_init
-                data = self._next()
+                data = self._next(end_ns)
                 if data is None or data.ts_init > last_ns:
                     # Finally process the time events
                     self._process_raw_time_event_handlers(
@@ -1181,17 +1523,59 @@ cdef class BacktestEngine:
             )
             vec_time_event_handlers_drop(raw_handlers)
 
-    cdef Data _next(self):
-        cdef uint64_t cursor = self._index
+    cdef Data _next(self, uint64_t end_ns):
+        # Data after the end is left in the iterator for the next run
+        if not self._data_iterator._heap or self._data_iterator.next_ts_init() > end_ns:
+            return None
+
         self._index += 1
-        if cursor < self._data_len:
-            return self._data[cursor]
+        return self._data_iterator.next()
+
+    cdef int _dispatch_kind(self, Data data):
+        cdef type data_type = type(data)
+        kind = self._dispatch_kinds.get(data_type)
+        if kind is not None:
+            return kind
+
+        # First time this type is seen: resolve (respecting subclasses) and cache
+        if isinstance(data, QuoteTick):
+            kind = DISPATCH_QUOTE_TICK
+        elif isinstance(data, TradeTick):
+            kind = DISPATCH_TRADE_TICK
+        elif isinstance(data, OrderBookDelta):
+            kind = DISPATCH_ORDER_BOOK_DELTA
+        elif isinstance(data, OrderBookDeltas):
+            kind = DISPATCH_ORDER_BOOK_DELTAS
+        elif isinstance(data, Bar):
+            kind = DISPATCH_BAR
+        elif isinstance(data, InstrumentClose):
+            kind = DISPATCH_INSTRUMENT_CLOSE
+        elif isinstance(data, InstrumentStatus):
+            kind = DISPATCH_INSTRUMENT_STATUS
+        else:
+            kind = DISPATCH_NONE
 
-    cdef CVec _advance_time(self, uint64_t ts_now):
-        cdef list[TestClock] clocks = get_component_clocks(self._instance_id)
+        self._dispatch_kinds[data_type] = kind
+        return kind
+
+    cdef SimulatedExchange _exchange_for(self, InstrumentId instrument_id):
+        cdef SimulatedExchange exchange = self._instrument_exchanges.get(instrument_id)
+        if exchange is None:
+            exchange = self._venues[instrument_id.venue]
+            self._instrument_exchanges[instrument_id] = exchange
+        return exchange
 
+    cdef void _process_exchanges(self, uint64_t ts_now):
+        # Exchanges without modules only need processing when commands are due
+        cdef SimulatedExchange exchange
+        for exchange in self._exchanges:
+            if exchange.modules or exchange.has_pending_commands(ts_now):
+                exchange.process(ts_now)
+
+    cdef CVec _advance_time(self, uint64_t ts_now):
+        # Only clocks with a timer due up to `ts_now` need advancing
         cdef TestClock clock
-        for clock in clocks:
+        for clock in self._scheduler.due_clocks(ts_now):
             time_event_accumulator_advance_clock(
                 &self._accumulator,
                 &clock._mem,
@@ -1210,8 +1594,7 @@ cdef class BacktestEngine:
 
         # Set all clocks to now
         set_logging_clock_static_time(ts_now)
-        for clock in clocks:
-            clock.set_time(ts_now)
+        self._scheduler.set_time(ts_now)
 
         # Return all remaining events to be handled (at `ts_now`)
         return raw_handlers
@@ -1229,7 +1612,6 @@ cdef class BacktestEngine:
             uint64_t ts_last_init = 0
             TimeEventHandler_t raw_handler
             TimeEvent event
-            TestClock clock
             PyObject *raw_callback
             object callback
             SimulatedExchange exchange
@@ -1241,8 +1623,7 @@ cdef class BacktestEngine:
 
             # Set all clocks to event timestamp
             set_logging_clock_static_time(ts_event_init)
-            for clock in get_component_clocks(self._instance_id):
-                clock.set_time(ts_event_init)
+            self._scheduler.set_time(ts_event_init)
 
             event = TimeEvent.from_mem_c(raw_handler.event)
 
@@ -1254,8 +1635,7 @@ cdef class BacktestEngine:
             if ts_event_init != ts_last_init:
                 # Process exchange messages
                 ts_last_init = ts_event_init
-                for exchange in self._venues.values():
-                    exchange.process(ts_event_init)
+                self._process_exchanges(ts_event_init)
 
     def _get_log_color_code(self):
         return "\033[36m" if logging_is_colored() else ""
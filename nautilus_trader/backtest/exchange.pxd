@@ -140,6 +140,7 @@ cdef class SimulatedExchange:
     cpdef void process_bar(self, Bar bar)
     cpdef void process_instrument_close(self, InstrumentClose close)
     cpdef void process_instrument_status(self, InstrumentStatus data)
+    cpdef bint has_pending_commands(self, uint64_t ts_now)
     cpdef void process(self, uint64_t ts_now)
     cpdef void reset(self)
 
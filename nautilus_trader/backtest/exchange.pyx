@@ -835,6 +835,27 @@ cdef class SimulatedExchange:
 
         matching_engine.process_instrument_close(close)
 
+    cpdef bint has_pending_commands(self, uint64_t ts_now):
+        """
+        Return whether the exchange has trading commands to process at the given time.
+
+        This includes any queued commands, and in-flight commands due at or before `ts_now`.
+
+        Parameters
+        ----------
+        ts_now : uint64_t
+            The current UNIX timestamp (nanoseconds).
+
+        Returns
+        -------
+        bool
+
+        """
+        if self._message_queue:
+            return True
+
+        return bool(self._inflight_queue) and self._inflight_queue[0][0][0] <= ts_now
+
     cpdef void process(self, uint64_t ts_now):
         """
         Process the exchange to the given time.
@@ -2322,6 +2322,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Price level of the order may have changed
+        self._core.update_order(order)
+
     cdef void _generate_order_canceled(self, Order order, VenueOrderId venue_order_id):
         # Generate event
         cdef uint64_t ts_now = self._clock.timestamp_ns()
@@ -2354,6 +2357,9 @@ cdef class OrderMatchingEngine:
         )
         self.msgbus.send(endpoint="ExecEngine.process", msg=event)
 
+        # Triggered orders are matched at their limit price
+        self._core.update_order(order)
+
     cdef void _generate_order_expired(self, Order order):
         # Generate event
         cdef uint64_t ts_now = self._clock.timestamp_ns()
@@ -13,9 +13,22 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import heapq
+import itertools
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+from collections.abc import Generator
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
 from decimal import Decimal
 
 import pandas as pd
+import pyarrow as pa
 
 from nautilus_trader.backtest.config import BacktestDataConfig
 from nautilus_trader.backtest.config import BacktestRunConfig
@@ -31,12 +44,13 @@ from nautilus_trader.common.config import ActorFactory
 from nautilus_trader.common.config import InvalidConfiguration
 from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
 from nautilus_trader.core.datetime import dt_to_unix_nanos
 from nautilus_trader.core.inspect import is_nautilus_class
-from nautilus_trader.core.nautilus_pyo3 import DataBackendSession
 from nautilus_trader.model import BOOK_DATA_TYPES
 from nautilus_trader.model.data import Bar
-from nautilus_trader.model.data import capsule_to_list
+from nautilus_trader.model.data import CustomData
+from nautilus_trader.model.data import DataType
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import BookType
 from nautilus_trader.model.enums import OmsType
@@ -177,6 +191,159 @@ class BacktestNode:
 
         return results
 
+    def run_parallel(  # noqa: C901
+        self,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        max_worker_memory: int | None = None,
+        max_tasks_per_worker: int | None = None,
+        shared_data_dir: str | None = None,
+        raise_exception: bool = False,
+    ) -> Generator[BacktestResult, None, None]:
+        """
+        Run the backtest node by executing the loaded backtest run configs across a
+        pool of worker processes.
+
+        Each distinct data config is read from its catalog *once* and staged as an
+        uncompressed Arrow IPC (feather) file, which every worker then memory maps
+        read-only, so the data slice is shared between processes through the page
+        cache rather than being re-read per run.
+
+        Results are yielded as each run completes (not in config order).
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of worker processes. If ``None`` then will use the
+            number of CPUs available.
+        max_pending : int, optional
+            The maximum number of submitted runs not yet completed (bounds the
+            parent side queue). If ``None`` then will be twice `max_workers`.
+        max_worker_memory : int, optional
+            The maximum virtual address space (bytes) per worker process, applied as
+            `RLIMIT_AS`. Allocations beyond the limit fail with a `MemoryError`, but
+            as this does not bound resident memory (and memory mapped files count
+            towards it) it is a safeguard, not a guaranteed memory cap.
+            Only supported on POSIX platforms.
+        max_tasks_per_worker : int, optional
+            The maximum number of runs a worker process will execute before being
+            replaced with a fresh process. If ``None`` then workers live for the
+            duration of the pool.
+        shared_data_dir : str, optional
+            The directory for staging the shared data files. If ``None`` then a
+            temporary directory is created (and removed on completion).
+        raise_exception : bool, default False
+            If True, an exception raised from a backtest will be re-raised and halt the node.
+            If False, exceptions raised from backtest(s) will be logged.
+
+        Yields
+        ------
+        BacktestResult
+
+        Raises
+        ------
+        ValueError
+            If `max_workers` is not positive.
+        ValueError
+            If `max_pending` is not positive.
+
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        max_pending = max_pending or max_workers * 2
+        PyCondition.positive_int(max_workers, "max_workers")
+        PyCondition.positive_int(max_pending, "max_pending")
+
+        if not is_logging_initialized():
+            init_logging()
+        log = Logger(type(self).__name__)
+
+        cleanup_dir = shared_data_dir is None
+        shared_data_dir = shared_data_dir or tempfile.mkdtemp(prefix="nautilus-backtest-")
+        os.makedirs(shared_data_dir, exist_ok=True)
+
+        try:
+            shared_data = self._stage_shared_data(shared_data_dir)
+            log.info(f"Staged {len(shared_data)} shared data slice(s) in {shared_data_dir}")
+
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_parallel_worker,
+                initargs=(max_worker_memory,),
+                max_tasks_per_child=max_tasks_per_worker,
+            )
+            with executor:
+                configs = iter(self._configs)
+                pending: dict[Future, BacktestRunConfig] = {}
+                while True:
+                    for config in configs:
+                        future = executor.submit(
+                            _run_parallel_worker,
+                            config.json(),
+                            shared_data,
+                        )
+                        pending[future] = config
+                        if len(pending) >= max_pending:
+                            break
+
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        config = pending.pop(future)
+                        try:
+                            yield future.result()
+                        except Exception as e:
+                            log.error(f"Error running backtest: {e}")
+                            log.info(f"Config: {config}")
+
+                            if raise_exception:
+                                for other in pending:
+                                    other.cancel()
+                                raise e
+        finally:
+            if cleanup_dir:
+                shutil.rmtree(shared_data_dir, ignore_errors=True)
+
+    def _stage_shared_data(self, directory: str) -> dict[str, list[str]]:
+        # Write each distinct (non-streaming) data config query once to Arrow IPC
+        # files which worker processes can memory map, keyed by config ID. Files
+        # are written per group of identical schema metadata (instrument ID and
+        # precisions), which the decoders read from the schema.
+        shared_data: dict[str, list[str]] = {}
+        for config in self._configs:
+            if config.chunk_size is not None:
+                continue  # Streaming runs read chunks directly from the catalog
+
+            for data_config in config.data:
+                key = data_config.id
+                if key in shared_data:
+                    continue
+
+                query = data_config.query
+                tables = self.load_catalog(data_config).query_table_groups(
+                    data_cls=query["data_cls"],
+                    instrument_ids=query["instrument_ids"],
+                    start=query["start"],
+                    end=query["end"],
+                    filter_expr=query["filter_expr"],
+                )
+                if not tables:
+                    continue  # No data for config
+
+                paths: list[str] = []
+                for i, table in enumerate(tables):
+                    path = os.path.join(directory, f"{key}-{i}.arrow")
+                    with pa.OSFile(path, "wb") as sink:
+                        with pa.ipc.new_file(sink, table.schema) as writer:
+                            writer.write_table(table)
+                    paths.append(path)
+
+                shared_data[key] = paths
+
+        return shared_data
+
     def _validate_configs(self, configs: list[BacktestRunConfig]) -> None:  # noqa: C901
         venue_ids: list[Venue] = []
         for config in configs:
@@ -303,6 +470,7 @@ class BacktestNode:
         data_configs: list[BacktestDataConfig],
         chunk_size: int | None,
         dispose_on_completion: bool,
+        shared_data: dict[str, list[str]] | None = None,
     ) -> BacktestResult:
         engine: BacktestEngine = self._create_engine(
             run_config_id=run_config_id,
@@ -324,6 +492,7 @@ class BacktestNode:
                 run_config_id=run_config_id,
                 engine=engine,
                 data_configs=data_configs,
+                shared_data=shared_data,
             )
 
         if dispose_on_completion:
@@ -342,51 +511,54 @@ class BacktestNode:
         data_configs: list[BacktestDataConfig],
         chunk_size: int,
     ) -> None:
-        # Create session for entire stream
-        session = DataBackendSession(chunk_size=chunk_size)
-
-        # Add query for all data configs
-        for config in data_configs:
+        # Add a lazily consumed stream of chunks per data config, the engine merges
+        # the streams in `ts_init` order, bounding memory to one chunk per stream.
+        has_data = False
+        for i, config in enumerate(data_configs):
             catalog = self.load_catalog(config)
             if config.data_type == Bar:
                 # TODO: Temporary hack - improve bars config and decide implementation with `filter_expr`
                 assert config.instrument_id, "No `instrument_id` for Bar data config"
                 assert config.bar_spec, "No `bar_spec` for Bar data config"
-                bar_type = f"{config.instrument_id}-{config.bar_spec}-EXTERNAL"
+                bar_types = [f"{config.instrument_id}-{config.bar_spec}-EXTERNAL"]
             else:
-                bar_type = None
-
-            session = catalog.backend_session(
-                data_cls=config.data_type,
-                instrument_ids=(
-                    [config.instrument_id] if config.instrument_id and not bar_type else []
-                ),
-                bar_types=[bar_type] if bar_type else [],
-                start=config.start_time,
-                end=config.end_time,
-                session=session,
-            )
+                bar_types = None
 
-        # Stream data
-        for chunk in session.to_query_result():
-            engine.add_data(
-                data=capsule_to_list(chunk),
-                validate=False,  # Cannot validate mixed type stream
-                sort=True,  # Already sorted from backend
+            client_id = ClientId(config.client_id) if config.client_id else None
+            if not is_nautilus_class(config.data_type) and client_id is None:
+                raise ValueError(
+                    f"Data type {config.data_type} not setup for loading into `BacktestEngine`",
+                )
+
+            chunks = catalog.query_chunks(
+                bar_types=bar_types,
+                chunk_size=chunk_size,
+                **config.query,
             )
-            engine.run(
-                run_config_id=run_config_id,
-                streaming=True,
+            first_chunk = next(chunks, None)
+            if first_chunk is None:
+                engine.logger.warning(f"No data found for {config}")
+                continue
+
+            engine.add_data_iterator(
+                data_name=f"{config.data_type.__name__}-{i}",
+                generator=itertools.chain([first_chunk], chunks),
+                client_id=client_id,
             )
-            engine.clear_data()
+            has_data = True
 
-        engine.end()
+        if not has_data:
+            engine.end()
+            return
+
+        engine.run(run_config_id=run_config_id)
 
     def _run_oneshot(
         self,
         run_config_id: str,
         engine: BacktestEngine,
         data_configs: list[BacktestDataConfig],
+        shared_data: dict[str, list[str]] | None = None,
     ) -> None:
         # Load data
         for config in data_configs:
@@ -394,7 +566,11 @@ class BacktestNode:
             engine.logger.info(
                 f"Reading {config.data_type} data for instrument={config.instrument_id}.",
             )
-            result: CatalogDataResult = self.load_data_config(config)
+            result: CatalogDataResult
+            if shared_data is not None:
+                result = self.load_shared_data_config(config, shared_data.get(config.id))
+            else:
+                result = self.load_data_config(config)
             if config.instrument_id and result.instrument is None:
                 engine.logger.warning(
                     f"Requested instrument_id={result.instrument} from data_config not found in catalog",
@@ -441,7 +617,93 @@ class BacktestNode:
             client_id=ClientId(config.client_id) if config.client_id else None,
         )
 
+    @classmethod
+    def load_shared_data_config(
+        cls,
+        config: BacktestDataConfig,
+        paths: list[str] | None,
+    ) -> CatalogDataResult:
+        """
+        Load the data for the given `config` from the staged Arrow IPC files at `paths`.
+
+        The files are memory mapped, so the underlying buffers are shared read-only
+        between all processes loading the same files. Each file is decoded separately
+        (with its own schema metadata), then merged in `ts_init` order.
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data configuration the files were staged for.
+        paths : list[str], optional
+            The paths to the staged files (``None`` if no data was found for the config).
+
+        Returns
+        -------
+        CatalogDataResult
+
+        """
+        catalog: ParquetDataCatalog = cls.load_catalog(config)
+
+        instruments = (
+            catalog.instruments(instrument_ids=[config.instrument_id])
+            if config.instrument_id
+            else None
+        )
+        if not paths or (config.instrument_id and not instruments):
+            return CatalogDataResult(data_cls=config.data_type, data=[])
+
+        decoded: list[list[Data]] = []
+        for path in paths:
+            with pa.memory_map(path, "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+            data = ParquetDataCatalog._handle_table_nautilus(table, data_cls=config.data_type)
+            decoded.append(data)
+
+        if len(decoded) == 1:
+            data = decoded[0]
+        else:
+            data = list(heapq.merge(*decoded, key=lambda x: x.ts_init))
+
+        if not is_nautilus_class(config.data_type):
+            data_type = DataType(config.data_type, metadata=config.metadata)
+            data = [CustomData(data_type=data_type, data=d) for d in data]
+
+        return CatalogDataResult(
+            data_cls=config.data_type,
+            data=data,
+            instrument=instruments[0] if instruments else None,
+            client_id=ClientId(config.client_id) if config.client_id else None,
+        )
+
     def dispose(self):
         for engine in self.get_engines():
             if not engine.trader.is_disposed:
                 engine.dispose()
+
+
+def _init_parallel_worker(max_memory: int | None) -> None:
+    # Apply the per-worker address space limit (RLIMIT_AS), which bounds virtual
+    # rather than resident memory, so is a safeguard against runaway allocations.
+    if max_memory is None or sys.platform == "win32":
+        return
+
+    import resource
+
+    resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+
+def _run_parallel_worker(raw_config: bytes, shared_data: dict[str, list[str]]) -> BacktestResult:
+    config: BacktestRunConfig = BacktestRunConfig.parse(raw_config)
+    node = BacktestNode(configs=[config])
+    try:
+        return node._run(
+            run_config_id=config.id,
+            engine_config=config.engine,
+            venue_configs=config.venues,
+            data_configs=config.data,
+            chunk_size=config.chunk_size,
+            dispose_on_completion=config.dispose_on_completion,
+            shared_data=shared_data,
+        )
+    finally:
+        node.dispose()
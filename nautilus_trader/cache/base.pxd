@@ -14,6 +14,9 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.accounting.accounts.base cimport Account
+from nautilus_trader.cache.buffers cimport BarBuffer
+from nautilus_trader.cache.buffers cimport QuoteTickBuffer
+from nautilus_trader.cache.buffers cimport TradeTickBuffer
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport PositionSide
 from nautilus_trader.core.rust.model cimport PriceType
@@ -67,6 +70,9 @@ cdef class CacheFacade:
     cpdef bint has_quote_ticks(self, InstrumentId instrument_id)
     cpdef bint has_trade_ticks(self, InstrumentId instrument_id)
     cpdef bint has_bars(self, BarType bar_type)
+    cpdef QuoteTickBuffer quote_tick_buffer(self, InstrumentId instrument_id)
+    cpdef TradeTickBuffer trade_tick_buffer(self, InstrumentId instrument_id)
+    cpdef BarBuffer bar_buffer(self, BarType bar_type)
 
     cpdef double get_xrate(
         self,
@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.cache.buffers cimport BarBuffer
+from nautilus_trader.cache.buffers cimport QuoteTickBuffer
+from nautilus_trader.cache.buffers cimport TradeTickBuffer
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarType
@@ -115,6 +118,18 @@ cdef class CacheFacade:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `has_bars` must be implemented in the subclass")  # pragma: no cover
 
+    cpdef QuoteTickBuffer quote_tick_buffer(self, InstrumentId instrument_id):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `quote_tick_buffer` must be implemented in the subclass")  # pragma: no cover
+
+    cpdef TradeTickBuffer trade_tick_buffer(self, InstrumentId instrument_id):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `trade_tick_buffer` must be implemented in the subclass")  # pragma: no cover
+
+    cpdef BarBuffer bar_buffer(self, BarType bar_type):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `bar_buffer` must be implemented in the subclass")  # pragma: no cover
+
     cpdef double get_xrate(
         self,
         Venue venue,
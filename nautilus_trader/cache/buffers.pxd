@@ -0,0 +1,114 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.rust.model cimport TradeId_t
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport BarType
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cdef class RingBuffer:
+    cdef int _pos
+
+    cdef readonly int capacity
+    """The maximum number of entries held by the buffer.\n\n:returns: `int`"""
+    cdef readonly int count
+    """The current number of entries held by the buffer.\n\n:returns: `int`"""
+
+    cdef int _advance(self)
+    cdef int _slot(self, int index)
+    cdef object _view(self, object array)
+    cpdef void clear(self)
+
+
+cdef class QuoteTickBuffer(RingBuffer):
+    cdef object _bid_price_arr
+    cdef object _ask_price_arr
+    cdef object _bid_size_arr
+    cdef object _ask_size_arr
+    cdef object _ts_event_arr
+    cdef object _ts_init_arr
+    cdef int64_t[:] _bid_price
+    cdef int64_t[:] _ask_price
+    cdef uint64_t[:] _bid_size
+    cdef uint64_t[:] _ask_size
+    cdef uint8_t[:] _bid_price_prec
+    cdef uint8_t[:] _ask_price_prec
+    cdef uint8_t[:] _bid_size_prec
+    cdef uint8_t[:] _ask_size_prec
+    cdef uint64_t[:] _ts_event
+    cdef uint64_t[:] _ts_init
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the buffer.\n\n:returns: `InstrumentId`"""
+
+    cdef void _write(self, int pos, QuoteTick tick)
+    cpdef void appendleft(self, QuoteTick tick)
+    cpdef QuoteTick get(self, int index=*)
+
+
+cdef class TradeTickBuffer(RingBuffer):
+    cdef TradeId_t *_trade_ids
+    cdef object _price_arr
+    cdef object _size_arr
+    cdef object _aggressor_side_arr
+    cdef object _ts_event_arr
+    cdef object _ts_init_arr
+    cdef int64_t[:] _price
+    cdef uint64_t[:] _size
+    cdef uint8_t[:] _price_prec
+    cdef uint8_t[:] _size_prec
+    cdef uint8_t[:] _aggressor_side
+    cdef uint64_t[:] _ts_event
+    cdef uint64_t[:] _ts_init
+
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the buffer.\n\n:returns: `InstrumentId`"""
+
+    cdef void _write(self, int pos, TradeTick tick)
+    cpdef void appendleft(self, TradeTick tick)
+    cpdef TradeTick get(self, int index=*)
+
+
+cdef class BarBuffer(RingBuffer):
+    cdef object _open_arr
+    cdef object _high_arr
+    cdef object _low_arr
+    cdef object _close_arr
+    cdef object _volume_arr
+    cdef object _ts_event_arr
+    cdef object _ts_init_arr
+    cdef int64_t[:] _open
+    cdef int64_t[:] _high
+    cdef int64_t[:] _low
+    cdef int64_t[:] _close
+    cdef uint64_t[:] _volume
+    cdef uint8_t[:] _price_prec
+    cdef uint8_t[:] _size_prec
+    cdef uint64_t[:] _ts_event
+    cdef uint64_t[:] _ts_init
+
+    cdef readonly BarType bar_type
+    """The bar type for the buffer.\n\n:returns: `BarType`"""
+
+    cdef void _write(self, int pos, Bar bar)
+    cpdef void appendleft(self, Bar bar)
+    cpdef Bar get(self, int index=*)
@@ -0,0 +1,660 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from cpython.mem cimport PyMem_Free
+from cpython.mem cimport PyMem_Malloc
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport AggressorSide
+from nautilus_trader.core.rust.model cimport TradeId_t
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport BarType
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport TradeId
+
+
+cdef class RingBuffer:
+    """
+    The base class for fixed capacity columnar ring buffers of market data.
+
+    Each field is held in a preallocated NumPy array of twice the capacity, with
+    every entry written to both halves. The most recent `count` entries are then
+    always contiguous in memory, so the field properties can return zero-copy
+    views in chronological order (oldest first).
+
+    Indexing follows the `deque.appendleft` semantics of the cache, so the most
+    recent entry is at index 0 and objects are only materialized on access.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of entries to hold.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    Warnings
+    --------
+    This class should not be used directly, but through a concrete subclass.
+    Field views are only valid until the next entry is added.
+
+    """
+
+    def __init__(self, int capacity) -> None:
+        Condition.positive_int(capacity, "capacity")
+
+        self.capacity = capacity
+        self.count = 0
+        self._pos = capacity - 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, int index):
+        cdef object item = self.get(index)
+        if item is None:
+            raise IndexError("buffer index out of range")
+        return item
+
+    def __iter__(self):
+        cdef int i
+        for i in range(self.count):
+            yield self.get(i)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(capacity={self.capacity}, count={self.count})"
+
+    cdef int _advance(self):
+        self._pos = (self._pos + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        return self._pos
+
+    cdef int _slot(self, int index):
+        if index < 0:
+            index += self.count
+        if index < 0 or index >= self.count:
+            return -1
+        return self._pos + self.capacity - index
+
+    cdef object _view(self, object array):
+        cdef int end = self._pos + self.capacity + 1
+        cdef object view = array[end - self.count:end]
+        view.flags.writeable = False
+        return view
+
+    cpdef void clear(self):
+        """
+        Clear all entries from the buffer (the preallocated arrays are retained).
+
+        """
+        self.count = 0
+        self._pos = self.capacity - 1
+
+
+cdef class QuoteTickBuffer(RingBuffer):
+    """
+    Provides a columnar ring buffer of quote ticks for a single instrument.
+
+    Prices and sizes are held as raw fixed-point integers (scaled by
+    `FIXED_SCALAR`), with their precisions held per entry.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the buffer.
+    capacity : int
+        The maximum number of ticks to hold.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, InstrumentId instrument_id not None, int capacity) -> None:
+        super().__init__(capacity)
+
+        cdef int length = capacity * 2
+        self.instrument_id = instrument_id
+        self._bid_price_arr = np.zeros(length, dtype=np.int64)
+        self._ask_price_arr = np.zeros(length, dtype=np.int64)
+        self._bid_size_arr = np.zeros(length, dtype=np.uint64)
+        self._ask_size_arr = np.zeros(length, dtype=np.uint64)
+        self._ts_event_arr = np.zeros(length, dtype=np.uint64)
+        self._ts_init_arr = np.zeros(length, dtype=np.uint64)
+        self._bid_price = self._bid_price_arr
+        self._ask_price = self._ask_price_arr
+        self._bid_size = self._bid_size_arr
+        self._ask_size = self._ask_size_arr
+        self._bid_price_prec = np.zeros(length, dtype=np.uint8)
+        self._ask_price_prec = np.zeros(length, dtype=np.uint8)
+        self._bid_size_prec = np.zeros(length, dtype=np.uint8)
+        self._ask_size_prec = np.zeros(length, dtype=np.uint8)
+        self._ts_event = self._ts_event_arr
+        self._ts_init = self._ts_init_arr
+
+    @property
+    def bid_price_raw(self):
+        """
+        Return a read-only view of the raw bid prices (oldest first).
+
+        Returns
+        -------
+        np.ndarray[int64]
+
+        """
+        return self._view(self._bid_price_arr)
+
+    @property
+    def ask_price_raw(self):
+        """
+        Return a read-only view of the raw ask prices (oldest first).
+
+        Returns
+        -------
+        np.ndarray[int64]
+
+        """
+        return self._view(self._ask_price_arr)
+
+    @property
+    def bid_size_raw(self):
+        """
+        Return a read-only view of the raw bid sizes (oldest first).
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._view(self._bid_size_arr)
+
+    @property
+    def ask_size_raw(self):
+        """
+        Return a read-only view of the raw ask sizes (oldest first).
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._view(self._ask_size_arr)
+
+    @property
+    def ts_event(self):
+        """
+        Return a read-only view of the event timestamps (oldest first).
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._view(self._ts_event_arr)
+
+    @property
+    def ts_init(self):
+        """
+        Return a read-only view of the initialization timestamps (oldest first).
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._view(self._ts_init_arr)
+
+    cpdef void appendleft(self, QuoteTick tick):
+        """
+        Add the given tick as the most recent entry, overwriting the oldest
+        entry when the buffer is full.
+
+        Parameters
+        ----------
+        tick : QuoteTick
+            The tick to add.
+
+        """
+        self._write(self._advance(), tick)
+
+    def __setitem__(self, int index, QuoteTick tick not None) -> None:
+        cdef int slot = self._slot(index)
+        if slot == -1:
+            raise IndexError("buffer index out of range")
+        self._write(slot % self.capacity, tick)
+
+    cdef void _write(self, int pos, QuoteTick tick):
+        cdef int slot
+        for slot in range(pos, pos + 2 * self.capacity, self.capacity):
+            self._bid_price[slot] = tick._mem.bid_price.raw
+            self._ask_price[slot] = tick._mem.ask_price.raw
+            self._bid_size[slot] = tick._mem.bid_size.raw
+            self._ask_size[slot] = tick._mem.ask_size.raw
+            self._bid_price_prec[slot] = tick._mem.bid_price.precision
+            self._ask_price_prec[slot] = tick._mem.ask_price.precision
+            self._bid_size_prec[slot] = tick._mem.bid_size.precision
+            self._ask_size_prec[slot] = tick._mem.ask_size.precision
+            self._ts_event[slot] = tick._mem.ts_event
+            self._ts_init[slot] = tick._mem.ts_init
+
+    cpdef QuoteTick get(self, int index=0):
+        """
+        Return the tick at the given index, materialized from the buffer.
+
+        Parameters
+        ----------
+        index : int, default 0
+            The index for the tick (most recent tick at index 0).
+
+        Returns
+        -------
+        QuoteTick or ``None``
+            If no tick at index then returns ``None``.
+
+        """
+        cdef int slot = self._slot(index)
+        if slot == -1:
+            return None
+
+        return QuoteTick.from_raw_c(
+            self.instrument_id,
+            self._bid_price[slot],
+            self._ask_price[slot],
+            self._bid_price_prec[slot],
+            self._ask_price_prec[slot],
+            self._bid_size[slot],
+            self._ask_size[slot],
+            self._bid_size_prec[slot],
+            self._ask_size_prec[slot],
+            self._ts_event[slot],
+            self._ts_init[slot],
+        )
+
+
+cdef class TradeTickBuffer(RingBuffer):
+    """
+    Provides a columnar ring buffer of trade ticks for a single instrument.
+
+    Prices and sizes are held as raw fixed-point integers (scaled by
+    `FIXED_SCALAR`), with their precisions held per entry. Trade IDs are held
+    as fixed-length C strings.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the buffer.
+    capacity : int
+        The maximum number of ticks to hold.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __cinit__(self, InstrumentId instrument_id not None, int capacity) -> None:
+        self._trade_ids = NULL
+        if capacity > 0:
+            self._trade_ids = <TradeId_t *>PyMem_Malloc(capacity * 2 * sizeof(TradeId_t))
+            if self._trade_ids == NULL:
+                raise MemoryError()
+
+    def __dealloc__(self) -> None:
+        PyMem_Free(self._trade_ids)
+
+    def __init__(self, InstrumentId instrument_id not None, int capacity) -> None:
+        super().__init__(capacity)
+
+        cdef int length = capacity * 2
+        self.instrument_id = instrument_id
+        self._price_arr = np.zeros(length, dtype=np.int64)
+        self._size_arr = np.zeros(length, dtype=np.uint64)
+        self._aggressor_side_arr = np.zeros(length, dtype=np.uint8)
+        self._ts_event_arr = np.zeros(length, dtype=np.uint64)
+        self._ts_init_arr = np.zeros(length, dtype=np.uint64)
+        self._price = self._price_arr
+        self._size = self._size_arr
+        self._price_prec = np.zeros(length, dtype=np.uint8)
+        self._size_prec = np.zeros(length, dtype=np.uint8)
+        self._aggressor_side = self._aggressor_side_arr
+        self._ts_event = self._ts_event_arr
+        self._ts_init = self._ts_init_arr
+
+    @property
+    def price_raw(self):
+        """
+        Return a read-only view of the raw trade prices (oldest first).
+
+        Returns
+        -------
+        np.ndarray[int64]
+
+        """
+        return self._view(self._price_arr)
+
+    @property
+    def size_raw(self):
+        """
+        Return a read-only view of the raw trade sizes (oldest first).
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._view(self._size_arr)
+
+    @property
+    def aggressor_side(self):
+        """
+        Return a read-only view of the aggressor sides (oldest first).
+
+        Returns
+        -------
+        np.ndarray[uint8]
+
+        """
+        return self._view(self._aggressor_side_arr)
+
+    @property
+    def ts_event(self):
+        """
+        Return a read-only view of the event timestamps (oldest first).
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._view(self._ts_event_arr)
+
+    @property
+    def ts_init(self):
+        """
+        Return a read-only view of the initialization timestamps (oldest first).
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._view(self._ts_init_arr)
+
+    cpdef void appendleft(self, TradeTick tick):
+        """
+        Add the given tick as the most recent entry, overwriting the oldest
+        entry when the buffer is full.
+
+        Parameters
+        ----------
+        tick : TradeTick
+            The tick to add.
+
+        """
+        self._write(self._advance(), tick)
+
+    def __setitem__(self, int index, TradeTick tick not None) -> None:
+        cdef int slot = self._slot(index)
+        if slot == -1:
+            raise IndexError("buffer index out of range")
+        self._write(slot % self.capacity, tick)
+
+    cdef void _write(self, int pos, TradeTick tick):
+        cdef int slot
+        for slot in range(pos, pos + 2 * self.capacity, self.capacity):
+            self._price[slot] = tick._mem.price.raw
+            self._size[slot] = tick._mem.size.raw
+            self._price_prec[slot] = tick._mem.price.precision
+            self._size_prec[slot] = tick._mem.size.precision
+            self._aggressor_side[slot] = tick._mem.aggressor_side
+            self._trade_ids[slot] = tick._mem.trade_id
+            self._ts_event[slot] = tick._mem.ts_event
+            self._ts_init[slot] = tick._mem.ts_init
+
+    cpdef TradeTick get(self, int index=0):
+        """
+        Return the tick at the given index, materialized from the buffer.
+
+        Parameters
+        ----------
+        index : int, default 0
+            The index for the tick (most recent tick at index 0).
+
+        Returns
+        -------
+        TradeTick or ``None``
+            If no tick at index then returns ``None``.
+
+        """
+        cdef int slot = self._slot(index)
+        if slot == -1:
+            return None
+
+        return TradeTick.from_raw_c(
+            self.instrument_id,
+            self._price[slot],
+            self._price_prec[slot],
+            self._size[slot],
+            self._size_prec[slot],
+            <AggressorSide>self._aggressor_side[slot],
+            TradeId.from_mem_c(self._trade_ids[slot]),
+            self._ts_event[slot],
+            self._ts_init[slot],
+        )
+
+
+cdef class BarBuffer(RingBuffer):
+    """
+    Provides a columnar ring buffer of bars for a single bar type.
+
+    Prices and volumes are held as raw fixed-point integers (scaled by
+    `FIXED_SCALAR`), with their precisions held per entry.
+
+    Parameters
+    ----------
+    bar_type : BarType
+        The bar type for the buffer.
+    capacity : int
+        The maximum number of bars to hold.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, BarType bar_type not None, int capacity) -> None:
+        super().__init__(capacity)
+
+        cdef int length = capacity * 2
+        self.bar_type = bar_type
+        self._open_arr = np.zeros(length, dtype=np.int64)
+        self._high_arr = np.zeros(length, dtype=np.int64)
+        self._low_arr = np.zeros(length, dtype=np.int64)
+        self._close_arr = np.zeros(length, dtype=np.int64)
+        self._volume_arr = np.zeros(length, dtype=np.uint64)
+        self._ts_event_arr = np.zeros(length, dtype=np.uint64)
+        self._ts_init_arr = np.zeros(length, dtype=np.uint64)
+        self._open = self._open_arr
+        self._high = self._high_arr
+        self._low = self._low_arr
+        self._close = self._close_arr
+        self._volume = self._volume_arr
+        self._price_prec = np.zeros(length, dtype=np.uint8)
+        self._size_prec = np.zeros(length, dtype=np.uint8)
+        self._ts_event = self._ts_event_arr
+        self._ts_init = self._ts_init_arr
+
+    @property
+    def open_raw(self):
+        """
+        Return a read-only view of the raw open prices (oldest first).
+
+        Returns
+        -------
+        np.ndarray[int64]
+
+        """
+        return self._view(self._open_arr)
+
+    @property
+    def high_raw(self):
+        """
+        Return a read-only view of the raw high prices (oldest first).
+
+        Returns
+        -------
+        np.ndarray[int64]
+
+        """
+        return self._view(self._high_arr)
+
+    @property
+    def low_raw(self):
+        """
+        Return a read-only view of the raw low prices (oldest first).
+
+        Returns
+        -------
+        np.ndarray[int64]
+
+        """
+        return self._view(self._low_arr)
+
+    @property
+    def close_raw(self):
+        """
+        Return a read-only view of the raw close prices (oldest first).
+
+        Returns
+        -------
+        np.ndarray[int64]
+
+        """
+        return self._view(self._close_arr)
+
+    @property
+    def volume_raw(self):
+        """
+        Return a read-only view of the raw volumes (oldest first).
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._view(self._volume_arr)
+
+    @property
+    def ts_event(self):
+        """
+        Return a read-only view of the event timestamps (oldest first).
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._view(self._ts_event_arr)
+
+    @property
+    def ts_init(self):
+        """
+        Return a read-only view of the initialization timestamps (oldest first).
+
+        Returns
+        -------
+        np.ndarray[uint64]
+
+        """
+        return self._view(self._ts_init_arr)
+
+    cpdef void appendleft(self, Bar bar):
+        """
+        Add the given bar as the most recent entry, overwriting the oldest
+        entry when the buffer is full.
+
+        Parameters
+        ----------
+        bar : Bar
+            The bar to add.
+
+        """
+        self._write(self._advance(), bar)
+
+    def __setitem__(self, int index, Bar bar not None) -> None:
+        cdef int slot = self._slot(index)
+        if slot == -1:
+            raise IndexError("buffer index out of range")
+        self._write(slot % self.capacity, bar)
+
+    cdef void _write(self, int pos, Bar bar):
+        cdef int slot
+        for slot in range(pos, pos + 2 * self.capacity, self.capacity):
+            self._open[slot] = bar._mem.open.raw
+            self._high[slot] = bar._mem.high.raw
+            self._low[slot] = bar._mem.low.raw
+            self._close[slot] = bar._mem.close.raw
+            self._volume[slot] = bar._mem.volume.raw
+            self._price_prec[slot] = bar._mem.close.precision
+            self._size_prec[slot] = bar._mem.volume.precision
+            self._ts_event[slot] = bar._mem.ts_event
+            self._ts_init[slot] = bar._mem.ts_init
+
+    cpdef Bar get(self, int index=0):
+        """
+        Return the bar at the given index, materialized from the buffer.
+
+        Parameters
+        ----------
+        index : int, default 0
+            The index for the bar (most recent bar at index 0).
+
+        Returns
+        -------
+        Bar or ``None``
+            If no bar at index then returns ``None``.
+
+        """
+        cdef int slot = self._slot(index)
+        if slot == -1:
+            return None
+
+        return Bar.from_raw_c(
+            self.bar_type,
+            self._open[slot],
+            self._high[slot],
+            self._low[slot],
+            self._close[slot],
+            self._price_prec[slot],
+            self._volume[slot],
+            self._size_prec[slot],
+            self._ts_event[slot],
+            self._ts_init[slot],
+        )
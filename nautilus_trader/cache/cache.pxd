@@ -18,7 +18,6 @@ from cpython.datetime cimport timedelta
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
 from nautilus_trader.common.actor cimport Actor
@@ -47,6 +46,7 @@ from nautilus_trader.model.instruments.base cimport Instrument
 from nautilus_trader.model.instruments.synthetic cimport SyntheticInstrument
 from nautilus_trader.model.objects cimport Currency
 from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.orders.list cimport OrderList
@@ -57,10 +57,13 @@ from nautilus_trader.trading.strategy cimport Strategy
 cdef class Cache(CacheFacade):
     cdef Logger _log
     cdef CacheDatabaseFacade _database
-    cdef ExchangeRateCalculator _xrate_calculator
 
     cdef dict _general
     cdef dict _xrate_symbols
+    cdef dict _xrate_quotes
+    cdef dict _xrate_graphs
+    cdef dict _xrate_paths
+    cdef set _xrate_dirty
     cdef dict _quote_ticks
     cdef dict _trade_ticks
     cdef dict _order_books
@@ -104,7 +107,9 @@ cdef class Cache(CacheFacade):
     cdef set _index_actors
     cdef set _index_strategies
     cdef set _index_exec_algorithms
+    cdef dict _index_underlying_instruments
     cdef bint _drop_instruments_on_reset
+    cdef bint _columnar_storage
 
     cdef readonly bint has_backing
     """If the cache has a database backing.\n\n:returns: `bool`"""
@@ -113,6 +118,10 @@ cdef class Cache(CacheFacade):
     cdef readonly int bar_capacity
     """The caches bar capacity.\n\n:returns: `int`"""
 
+    cdef object _create_quote_tick_store(self, InstrumentId instrument_id)
+    cdef object _create_trade_tick_store(self, InstrumentId instrument_id)
+    cdef object _create_bar_store(self, BarType bar_type)
+
     cpdef void cache_general(self)
     cpdef void cache_currencies(self)
     cpdef void cache_instruments(self)
@@ -130,6 +139,12 @@ cdef class Cache(CacheFacade):
     cpdef void flush_db(self)
 
     cdef tuple _build_quote_table(self, Venue venue)
+    cdef void _update_xrate(self, InstrumentId instrument_id, Price bid_price, Price ask_price)
+    cdef void _add_xrate_edge(self, Venue venue, str symbol)
+    cdef void _rebuild_xrate_graph(self, Venue venue)
+    cdef tuple _xrate_path(self, Venue venue, str from_code, str to_code)
+    cdef void _index_instrument(self, Instrument instrument)
+    cdef void _build_index_underlying_instruments(self)
     cdef void _build_index_venue_account(self)
     cdef void _cache_venue_account_id(self, AccountId account_id)
     cdef void _build_indexes_from_orders(self)
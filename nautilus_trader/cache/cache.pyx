@@ -29,7 +29,9 @@ from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
+from nautilus_trader.cache.buffers cimport BarBuffer
+from nautilus_trader.cache.buffers cimport QuoteTickBuffer
+from nautilus_trader.cache.buffers cimport TradeTickBuffer
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
 from nautilus_trader.common.component cimport LogColor
 from nautilus_trader.common.component cimport Logger
@@ -101,10 +103,10 @@ cdef class Cache(CacheFacade):
 
         self._database = database
         self._log = Logger(name=type(self).__name__)
-        self._xrate_calculator = ExchangeRateCalculator()
 
         # Configuration
         self._drop_instruments_on_reset = config.drop_instruments_on_reset
+        self._columnar_storage = config.columnar_storage
         self.has_backing = database is not None
         self.tick_capacity = config.tick_capacity
         self.bar_capacity = config.bar_capacity
@@ -112,10 +114,14 @@ cdef class Cache(CacheFacade):
         # Caches
         self._general: dict[str, bytes] = {}
         self._xrate_symbols: dict[InstrumentId, str] = {}
-        self._quote_ticks: dict[InstrumentId, deque[QuoteTick]] = {}
-        self._trade_ticks: dict[InstrumentId, deque[TradeTick]] = {}
+        self._xrate_quotes: dict[Venue, dict[str, tuple[float, float]]] = {}
+        self._xrate_graphs: dict[Venue, dict[str, dict[str, tuple[str, bool]]]] = {}
+        self._xrate_paths: dict[Venue, dict[tuple[str, str], tuple]] = {}
+        self._xrate_dirty: set[Venue] = set()
+        self._quote_ticks: dict[InstrumentId, deque[QuoteTick] | QuoteTickBuffer] = {}
+        self._trade_ticks: dict[InstrumentId, deque[TradeTick] | TradeTickBuffer] = {}
         self._order_books: dict[InstrumentId, OrderBook] = {}
-        self._bars: dict[BarType, deque[Bar]] = {}
+        self._bars: dict[BarType, deque[Bar] | BarBuffer] = {}
         self._bars_bid: dict[InstrumentId, Bar] = {}
         self._bars_ask: dict[InstrumentId, Bar] = {}
         self._currencies: dict[str, Currency] = {}
@@ -156,6 +162,7 @@ cdef class Cache(CacheFacade):
         self._index_actors: set[ComponentId] = set()
         self._index_strategies: set[StrategyId] = set()
         self._index_exec_algorithms: set[ExecAlgorithmId] = set()
+        self._index_underlying_instruments: dict[str, dict[InstrumentId, Instrument]] = {}
 
         self._log.info("READY")
 
@@ -214,6 +221,8 @@ cdef class Cache(CacheFacade):
         else:
             self._instruments = {}
 
+        self._build_index_underlying_instruments()
+
         cdef int count = len(self._instruments)
         self._log.info(
             f"Cached {count} instrument{'' if count == 1 else 's'} from database",
@@ -726,6 +735,10 @@ cdef class Cache(CacheFacade):
 
         self._general.clear()
         self._xrate_symbols.clear()
+        self._xrate_quotes.clear()
+        self._xrate_graphs.clear()
+        self._xrate_paths.clear()
+        self._xrate_dirty.clear()
         self._quote_ticks.clear()
         self._trade_ticks.clear()
         self._order_books.clear()
@@ -743,6 +756,7 @@ cdef class Cache(CacheFacade):
 
         if self._drop_instruments_on_reset:
             self._instruments.clear()
+            self._index_underlying_instruments.clear()
 
         self._log.info(f"Reset")
 
@@ -770,6 +784,27 @@ cdef class Cache(CacheFacade):
 
         self._log.info("Cache database flushed")
 
+    cdef void _index_instrument(self, Instrument instrument):
+        # Index derivatives (such as options and futures) by their underlying,
+        # so option chains are available without scanning all instruments.
+        underlying = getattr(instrument, "underlying", None)
+        if not isinstance(underlying, str):
+            return  # Not a derivative of a named underlying (such as crypto futures by currency)
+
+        cdef dict instruments = self._index_underlying_instruments.get(underlying)
+        if instruments is None:
+            instruments = {}
+            self._index_underlying_instruments[underlying] = instruments
+
+        instruments[instrument.id] = instrument
+
+    cdef void _build_index_underlying_instruments(self):
+        self._index_underlying_instruments.clear()
+
+        cdef Instrument instrument
+        for instrument in self._instruments.values():
+            self._index_instrument(instrument)
+
     cdef void _build_index_venue_account(self):
         cdef AccountId account_id
         for account_id in self._accounts.keys():
@@ -1000,6 +1035,7 @@ cdef class Cache(CacheFacade):
             instrument = self._database.load_instrument(instrument_id)
             if instrument is not None:
                 self._instruments[instrument.id] = instrument
+                self._index_instrument(instrument)
 
         return instrument
 
@@ -1125,6 +1161,21 @@ cdef class Cache(CacheFacade):
 
         self._order_books[order_book.instrument_id] = order_book
 
+    cdef object _create_quote_tick_store(self, InstrumentId instrument_id):
+        if self._columnar_storage:
+            return QuoteTickBuffer(instrument_id, self.tick_capacity)
+        return deque(maxlen=self.tick_capacity)
+
+    cdef object _create_trade_tick_store(self, InstrumentId instrument_id):
+        if self._columnar_storage:
+            return TradeTickBuffer(instrument_id, self.tick_capacity)
+        return deque(maxlen=self.tick_capacity)
+
+    cdef object _create_bar_store(self, BarType bar_type):
+        if self._columnar_storage:
+            return BarBuffer(bar_type, self.bar_capacity)
+        return deque(maxlen=self.bar_capacity)
+
     cpdef void add_quote_tick(self, QuoteTick tick):
         """
         Add the given quote tick to the cache.
@@ -1142,11 +1193,14 @@ cdef class Cache(CacheFacade):
 
         if not ticks:
             # The instrument_id was not registered
-            ticks = deque(maxlen=self.tick_capacity)
+            ticks = self._create_quote_tick_store(instrument_id)
             self._quote_ticks[instrument_id] = ticks
 
         ticks.appendleft(tick)
 
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate(instrument_id, tick.bid_price, tick.ask_price)
+
     cpdef void add_trade_tick(self, TradeTick tick):
         """
         Add the given trade tick to the cache.
@@ -1164,7 +1218,7 @@ cdef class Cache(CacheFacade):
 
         if not ticks:
             # The instrument_id was not registered
-            ticks = deque(maxlen=self.tick_capacity)
+            ticks = self._create_trade_tick_store(instrument_id)
             self._trade_ticks[instrument_id] = ticks
 
         ticks.appendleft(tick)
@@ -1185,16 +1239,27 @@ cdef class Cache(CacheFacade):
 
         if not bars:
             # The bar type was not registered
-            bars = deque(maxlen=self.bar_capacity)
+            bars = self._create_bar_store(bar.bar_type)
             self._bars[bar.bar_type] = bars
 
         bars.appendleft(bar)
 
+        cdef InstrumentId instrument_id = bar.bar_type.instrument_id
         cdef PriceType price_type = bar.bar_type.spec.price_type
         if price_type == PriceType.BID:
-            self._bars_bid[bar.bar_type.instrument_id] = bar
+            self._bars_bid[instrument_id] = bar
         elif price_type == PriceType.ASK:
-            self._bars_ask[bar.bar_type.instrument_id] = bar
+            self._bars_ask[instrument_id] = bar
+        else:
+            return
+
+        if instrument_id not in self._xrate_symbols or self._quote_ticks.get(instrument_id):
+            return  # Not a conversion instrument, or quotes take precedence
+
+        cdef Bar bid_bar = self._bars_bid.get(instrument_id)
+        cdef Bar ask_bar = self._bars_ask.get(instrument_id)
+        if bid_bar is not None and ask_bar is not None:
+            self._update_xrate(instrument_id, bid_bar.close, ask_bar.close)
 
     cpdef void add_quote_ticks(self, list ticks):
         """
@@ -1221,7 +1286,7 @@ cdef class Cache(CacheFacade):
 
         if not cached_ticks:
             # The instrument_id was not registered
-            cached_ticks = deque(maxlen=self.tick_capacity)
+            cached_ticks = self._create_quote_tick_store(instrument_id)
             self._quote_ticks[instrument_id] = cached_ticks
         elif len(cached_ticks) > 0:
             # Currently the simple solution for multiple consumers requesting
@@ -1233,6 +1298,9 @@ cdef class Cache(CacheFacade):
         for tick in ticks:
             cached_ticks.appendleft(tick)
 
+        if instrument_id in self._xrate_symbols:
+            self._xrate_dirty.add(instrument_id.venue)
+
     cpdef void add_trade_ticks(self, list ticks):
         """
         Add the given trade ticks to the cache.
@@ -1258,7 +1326,7 @@ cdef class Cache(CacheFacade):
 
         if not cached_ticks:
             # The instrument_id was not registered
-            cached_ticks = deque(maxlen=self.tick_capacity)
+            cached_ticks = self._create_trade_tick_store(instrument_id)
             self._trade_ticks[instrument_id] = cached_ticks
         elif len(cached_ticks) > 0:
             # Currently the simple solution for multiple consumers requesting
@@ -1295,7 +1363,7 @@ cdef class Cache(CacheFacade):
 
         if not cached_bars:
             # The instrument_id was not registered
-            cached_bars = deque(maxlen=self.bar_capacity)
+            cached_bars = self._create_bar_store(bar_type)
             self._bars[bar_type] = cached_bars
         elif len(cached_bars) > 0:
             # Currently the simple solution for multiple consumers requesting
@@ -1314,6 +1382,9 @@ cdef class Cache(CacheFacade):
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
 
+        if bar.bar_type.instrument_id in self._xrate_symbols:
+            self._xrate_dirty.add(bar.bar_type.instrument_id.venue)
+
     cpdef void add_currency(self, Currency currency):
         """
         Add the given currency to the cache.
@@ -1346,11 +1417,13 @@ cdef class Cache(CacheFacade):
 
         """
         self._instruments[instrument.id] = instrument
+        self._index_instrument(instrument)
 
         if isinstance(instrument, (CurrencyPair, CryptoPerpetual)):
             self._xrate_symbols[instrument.id] = (
                 f"{instrument.base_currency}/{instrument.quote_currency}"
             )
+            self._xrate_dirty.add(instrument.id.venue)
 
         self._log.debug(f"Added instrument {instrument.id}")
 
@@ -2364,6 +2437,72 @@ cdef class Cache(CacheFacade):
 
         return self.bar_count(bar_type) > 0
 
+    cpdef QuoteTickBuffer quote_tick_buffer(self, InstrumentId instrument_id):
+        """
+        Return the columnar quote tick buffer for the given instrument ID.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the buffer.
+
+        Returns
+        -------
+        QuoteTickBuffer or ``None``
+            If no ticks or `columnar_storage` is not enabled then returns ``None``.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        if not self._columnar_storage:
+            return None
+
+        return self._quote_ticks.get(instrument_id)
+
+    cpdef TradeTickBuffer trade_tick_buffer(self, InstrumentId instrument_id):
+        """
+        Return the columnar trade tick buffer for the given instrument ID.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the buffer.
+
+        Returns
+        -------
+        TradeTickBuffer or ``None``
+            If no ticks or `columnar_storage` is not enabled then returns ``None``.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+
+        if not self._columnar_storage:
+            return None
+
+        return self._trade_ticks.get(instrument_id)
+
+    cpdef BarBuffer bar_buffer(self, BarType bar_type):
+        """
+        Return the columnar bar buffer for the given bar type.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for the buffer.
+
+        Returns
+        -------
+        BarBuffer or ``None``
+            If no bars or `columnar_storage` is not enabled then returns ``None``.
+
+        """
+        Condition.not_none(bar_type, "bar_type")
+
+        if not self._columnar_storage:
+            return None
+
+        return self._bars.get(bar_type)
+
     cpdef double get_xrate(
         self,
         Venue venue,
@@ -2401,15 +2540,125 @@ cdef class Cache(CacheFacade):
         if from_currency == to_currency:
             return Decimal(1)  # No conversion necessary
 
-        cdef tuple quotes = self._build_quote_table(venue)
+        Condition.is_true(price_type != PriceType.LAST, "price_type was invalid (LAST)")
+
+        if venue in self._xrate_dirty:
+            self._rebuild_xrate_graph(venue)
+
+        cdef tuple path = self._xrate_path(venue, from_currency.code, to_currency.code)
+        if not path:
+            return 0.0  # Insufficient data
+
+        cdef dict quotes = self._xrate_quotes[venue]
+        cdef double xrate = 1.0
+        cdef double price
+        cdef tuple prices
+        cdef str symbol
+        cdef bint inverse
+        for symbol, inverse in path:
+            prices = quotes[symbol]
+            if price_type == PriceType.BID:
+                price = prices[0]
+            elif price_type == PriceType.ASK:
+                price = prices[1]
+            else:
+                price = (prices[0] + prices[1]) / 2.0
 
-        return self._xrate_calculator.get_rate(
-            from_currency=from_currency,
-            to_currency=to_currency,
-            price_type=price_type,
-            bid_quotes=quotes[0],  # Bid
-            ask_quotes=quotes[1],  # Ask
-        )
+            if inverse:
+                xrate /= price
+            else:
+                xrate *= price
+
+        return xrate
+
+    cdef void _update_xrate(self, InstrumentId instrument_id, Price bid_price, Price ask_price):
+        cdef str symbol = self._xrate_symbols[instrument_id]
+        cdef Venue venue = instrument_id.venue
+
+        cdef dict quotes = self._xrate_quotes.get(venue)
+        if quotes is None:
+            quotes = {}
+            self._xrate_quotes[venue] = quotes
+
+        if symbol not in quotes:
+            self._add_xrate_edge(venue, symbol)
+
+        quotes[symbol] = (bid_price.as_f64_c(), ask_price.as_f64_c())
+
+    cdef void _add_xrate_edge(self, Venue venue, str symbol):
+        cdef dict graph = self._xrate_graphs.get(venue)
+        if graph is None:
+            graph = {}
+            self._xrate_graphs[venue] = graph
+
+        cdef tuple pieces = symbol.partition("/")
+        cdef str code_lhs = pieces[0]
+        cdef str code_rhs = pieces[2]
+
+        # Direct quotes take precedence over inverted quotes
+        graph.setdefault(code_lhs, {})[code_rhs] = (symbol, False)
+        graph.setdefault(code_rhs, {}).setdefault(code_lhs, (symbol, True))
+
+        # The set of available conversions changed
+        self._xrate_paths.pop(venue, None)
+
+    cdef void _rebuild_xrate_graph(self, Venue venue):
+        cdef tuple quote_table = self._build_quote_table(venue)
+        cdef dict bid_quotes = quote_table[0]
+        cdef dict ask_quotes = quote_table[1]
+
+        cdef dict quotes = {}
+        self._xrate_quotes[venue] = quotes
+        self._xrate_graphs.pop(venue, None)
+        self._xrate_paths.pop(venue, None)
+
+        cdef str symbol
+        for symbol in bid_quotes:
+            self._add_xrate_edge(venue, symbol)
+            quotes[symbol] = (bid_quotes[symbol], ask_quotes[symbol])
+
+        self._xrate_dirty.discard(venue)
+
+    cdef tuple _xrate_path(self, Venue venue, str from_code, str to_code):
+        cdef dict paths = self._xrate_paths.get(venue)
+        if paths is None:
+            paths = {}
+            self._xrate_paths[venue] = paths
+
+        cdef tuple key = (from_code, to_code)
+        cdef tuple path = paths.get(key)
+        if path is not None:
+            return path
+
+        # Breadth first search for the conversion path with the fewest legs
+        cdef dict graph = self._xrate_graphs.get(venue, {})
+        cdef dict previous = {from_code: None}
+        cdef list frontier = [from_code]
+        cdef list next_frontier
+        cdef list legs = []
+        cdef str code
+        cdef str adjacent
+        cdef tuple leg
+        while frontier and to_code not in previous:
+            next_frontier = []
+            for code in frontier:
+                for adjacent, leg in graph.get(code, {}).items():
+                    if adjacent in previous:
+                        continue
+                    previous[adjacent] = (code, leg)
+                    next_frontier.append(adjacent)
+            frontier = next_frontier
+
+        if to_code in previous:
+            code = to_code
+            while previous[code] is not None:
+                code, leg = previous[code]
+                legs.append(leg)
+            legs.reverse()
+
+        path = tuple(legs)  # Empty when no conversion path exists
+        paths[key] = path
+        return path
 
     cdef tuple _build_quote_table(self, Venue venue):
         cdef dict bid_quotes = {}
@@ -2498,11 +2747,13 @@ cdef class Cache(CacheFacade):
 
         """
         cdef Instrument x
-        return [
-            x for x in self._instruments.values()
-            if (venue is None or venue == x.id.venue) and
-            (underlying is None or (hasattr(x, "underlying") and underlying == x.underlying))
-        ]
+        if underlying is not None:
+            return [
+                x for x in self._index_underlying_instruments.get(underlying, {}).values()
+                if venue is None or venue == x.id.venue
+            ]
+
+        return [x for x in self._instruments.values() if venue is None or venue == x.id.venue]
 
     cdef timedelta _get_timedelta(self, BarType bar_type):
         # Helper method to get the timedelta from a BarType
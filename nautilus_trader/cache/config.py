@@ -49,6 +49,11 @@ class CacheConfig(NautilusConfig, frozen=True):
         The maximum length for internal tick dequeues.
     bar_capacity : PositiveInt, default 10_000
         The maximum length for internal bar dequeues.
+    columnar_storage : bool, default False
+        If ticks and bars should be held in preallocated columnar ring buffers
+        (NumPy arrays per field) instead of dequeues of objects. Objects are then
+        materialized on access, and zero-copy array views are available through
+        the `quote_tick_buffer`, `trade_tick_buffer` and `bar_buffer` methods.
 
     """
 
@@ -62,3 +67,4 @@ class CacheConfig(NautilusConfig, frozen=True):
     drop_instruments_on_reset: bool = True
     tick_capacity: PositiveInt = 10_000
     bar_capacity: PositiveInt = 10_000
+    columnar_storage: bool = False
@@ -13,10 +13,26 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport Serializer
 
 
 cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
     cdef Serializer _serializer
     cdef object _backing
+    cdef dict _position_event_counts
+
+    cdef list _read_bulk(self, list keys, list starts=*)
+    cdef list _read_states(self, str collection, list ids)
+    cdef Account _account_from_events(self, list result)
+    cdef Order _order_from_events(self, list result)
+    cdef Order _order_from_state(self, dict state, list result)
+    cdef Order _replay_order_events(self, Order order, list result, set seen_events, bint is_first)
+    cdef Position _position_from_events(self, list result, dict instruments)
+    cdef Position _position_from_state(self, dict state, list result, dict instruments)
+    cdef Position _position_from_fills(self, list fills, dict instruments)
+    cdef void _write_order_state(self, Order order)
+    cdef void _write_position_state(self, Position position, int event_count)
@@ -93,8 +93,16 @@ cdef str _INDEX_POSITIONS_CLOSED = "index:positions_closed"
 
 cdef str _SNAPSHOTS_ORDERS = "snapshots:orders"
 cdef str _SNAPSHOTS_POSITIONS = "snapshots:positions"
+cdef str _STATES_ORDERS = "states:orders"
+cdef str _STATES_POSITIONS = "states:positions"
 cdef str _HEARTBEAT = "health:heartbeat"
 
+# Maximum number of keys read per pipelined round trip when bulk loading
+cdef int _BULK_READ_BATCH_SIZE = 1_000
+
+# Number of events between state snapshots of orders and positions which remain open
+cdef int _STATE_SNAPSHOT_INTERVAL = 100
+
 
 cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
     """
@@ -156,6 +164,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         self._log.info(f"{config.use_instance_id=}", LogColor.BLUE)
 
         self._serializer = serializer
+        self._position_event_counts: dict[PositionId, int] = {}
 
         self._backing = nautilus_pyo3.RedisCacheDatabase(
             trader_id=nautilus_pyo3.TraderId(trader_id.value),
@@ -181,6 +190,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         self._log.debug("Flushing cache database")
         self._backing.flushdb()
+        self._position_event_counts.clear()
         self._log.info("Flushed cache database", LogColor.BLUE)
 
     cpdef list[str] keys(self, str pattern = "*"):
@@ -341,14 +351,14 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not account_keys:
             return accounts
 
+        cdef list keys = [f"{_ACCOUNTS}:{key.rsplit(':', maxsplit=1)[1]}" for key in account_keys]
+        cdef list results = self._read_bulk(keys)
+
         cdef:
-            str key
-            str account_str
-            AccountId account_id
+            list result
             Account account
-        for key in account_keys:
-            account_id = AccountId(key.rsplit(':', maxsplit=1)[1])
-            account = self.load_account(account_id)
+        for result in results:
+            account = self._account_from_events(result)
 
             if account is not None:
                 accounts[account.id] = account
@@ -370,13 +380,19 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not order_keys:
             return orders
 
+        cdef list order_ids = [key.rsplit(':', maxsplit=1)[1] for key in order_keys]
+        cdef list states = self._read_states(_STATES_ORDERS, order_ids)
+        cdef list results = self._read_bulk([f"{_ORDERS}:{order_id}" for order_id in order_ids])
+
         cdef:
-            str key
-            ClientOrderId client_order_id
+            dict state
+            list result
             Order order
-        for key in order_keys:
-            client_order_id = ClientOrderId(key.rsplit(':', maxsplit=1)[1])
-            order = self.load_order(client_order_id)
+        for state, result in zip(states, results):
+            if state is not None:
+                order = self._order_from_state(state, result)
+            else:
+                order = self._order_from_events(result)
 
             if order is not None:
                 orders[order.client_order_id] = order
@@ -398,16 +414,29 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not position_keys:
             return positions
 
+        cdef list position_ids = [key.rsplit(':', maxsplit=1)[1] for key in position_keys]
+        cdef list states = self._read_states(_STATES_POSITIONS, position_ids)
+
+        # Read only the events after each state snapshot
+        cdef list keys = [f"{_POSITIONS}:{position_id}" for position_id in position_ids]
+        cdef list starts = [state["event_count"] if state is not None else 0 for state in states]
+        cdef list results = self._read_bulk(keys, starts)
+        cdef dict instruments = {}  # Instruments loaded once for all positions
+
         cdef:
-            str key
-            PositionId position_id
+            dict state
+            list result
+            int start
             Position position
-        for key in position_keys:
-            position_id = PositionId(key.rsplit(':', maxsplit=1)[1])
-            position = self.load_position(position_id)
+        for state, result, start in zip(states, results, starts):
+            if state is not None:
+                position = self._position_from_state(state, result, instruments)
+            else:
+                position = self._position_from_events(result, instruments)
 
             if position is not None:
                 positions[position.id] = position
+                self._position_event_counts[position.id] = start + len(result)
 
         return positions
 
@@ -550,18 +579,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         Condition.not_none(account_id, "account_id")
 
         cdef str key = f"{_ACCOUNTS}:{account_id.to_str()}"
-        cdef list result = self._backing.read(key)
-        if not result:
-            return None
-
-        cdef bytes initial_event = result.pop(0)
-        cdef Account account = AccountFactory.create_c(self._serializer.deserialize(initial_event))
-
-        cdef bytes event
-        for event in result:
-            account.apply(event=self._serializer.deserialize(event))
-
-        return account
+        return self._account_from_events(self._backing.read(key))
 
     cpdef Order load_order(self, ClientOrderId client_order_id):
         """
@@ -579,27 +597,129 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
-        cdef str key = f"{_ORDERS}:{client_order_id.to_str()}"
-        cdef list result = self._backing.read(key)
+        cdef str client_order_id_str = client_order_id.to_str()
+        cdef dict state = self._read_states(_STATES_ORDERS, [client_order_id_str])[0]
+        cdef list result = self._backing.read(f"{_ORDERS}:{client_order_id_str}")
+        if state is None:
+            return self._order_from_events(result)
+
+        return self._order_from_state(state, result)
 
-        # Check there is at least one event to pop
+    cpdef Position load_position(self, PositionId position_id):
+        """
+        Load the position associated with the given ID (if found).
+
+        Parameters
+        ----------
+        position_id : PositionId
+            The position ID to load.
+
+        Returns
+        -------
+        Position or ``None``
+
+        """
+        Condition.not_none(position_id, "position_id")
+
+        cdef str position_id_str = position_id.to_str()
+        cdef dict state = self._read_states(_STATES_POSITIONS, [position_id_str])[0]
+        cdef int start = state["event_count"] if state is not None else 0
+
+        # Read only the events after the state snapshot (if any)
+        cdef list result = self._read_bulk([f"{_POSITIONS}:{position_id_str}"], [start])[0]
+        cdef Position position
+        if state is not None:
+            position = self._position_from_state(state, result, None)
+        else:
+            position = self._position_from_events(result, None)
+
+        if position is not None:
+            self._position_event_counts[position.id] = start + len(result)
+
+        return position
+
+    cdef list _read_bulk(self, list keys, list starts = None):
+        # Read the keys in pipelined batches rather than a round trip per key,
+        # from the given start index of each list (if specified)
+        cdef list results = []
+        cdef int i
+        for i in range(0, len(keys), _BULK_READ_BATCH_SIZE):
+            results.extend(
+                self._backing.read_bulk(
+                    keys[i:i + _BULK_READ_BATCH_SIZE],
+                    starts[i:i + _BULK_READ_BATCH_SIZE] if starts is not None else None,
+                ),
+            )
+
+        return results
+
+    cdef list _read_states(self, str collection, list ids):
+        # Read the latest state snapshot for each ID (``None`` if no snapshot)
+        cdef list results = self._read_bulk([f"{collection}:{id_str}" for id_str in ids])
+        return [msgspec.msgpack.decode(result[0]) if result else None for result in results]
+
+    cdef Account _account_from_events(self, list result):
         if not result:
             return None
 
-        cdef OrderInitialized init = self._serializer.deserialize(result.pop(0))
+        cdef Account account = AccountFactory.create_c(self._serializer.deserialize(result[0]))
+
+        cdef bytes event_bytes
+        for event_bytes in result[1:]:
+            account.apply(event=self._serializer.deserialize(event_bytes))
+
+        return account
+
+    cdef Order _order_from_events(self, list result):
+        # Check there is at least one event
+        if not result:
+            return None
+
+        cdef OrderInitialized init = self._serializer.deserialize(result[0])
         cdef Order order = OrderUnpacker.from_init_c(init)
 
-        cdef int event_count = 0
+        return self._replay_order_events(order, result[1:], {init}, True)
+
+    cdef Order _order_from_state(self, dict state, list result):
+        # The events up to the state snapshot are restored to the order without
+        # being re-applied, so the full event history is retained
+        cdef int event_count = state["event_count"]
+        if len(result) < event_count:
+            return self._order_from_events(result)  # Snapshot ahead of the events
+
+        cdef bytes event_bytes
+        cdef list events = [self._serializer.deserialize(event_bytes) for event_bytes in result[:event_count]]
+
+        # Check event integrity
+        cdef set seen_events = set(events)
+        if len(seen_events) != len(events):
+            raise RuntimeError(f"Corrupt cache with duplicate event for order {events[0]}")
+
+        cdef Order order = OrderUnpacker.from_init_c(events[0])
+        order.restore_state_c(state["state"], events)
+
+        # Apply only the events written after the state snapshot
+        return self._replay_order_events(order, result[event_count:], seen_events, False)
+
+    cdef Order _replay_order_events(self, Order order, list result, set seen_events, bint is_first):
+        cdef list pending = []  # Events applied in bulk up to the next transformation
+
         cdef bytes event_bytes
         cdef OrderEvent event
         for event_bytes in result:
             event = self._serializer.deserialize(event_bytes)
 
             # Check event integrity
-            if event in order._events:
+            if event in seen_events:
                 raise RuntimeError(f"Corrupt cache with duplicate event for order {event}")
+            seen_events.add(event)
+
+            if order.has_event_c(event.id):
+                continue  # Already applied as of the state snapshot
 
-            if event_count > 0 and isinstance(event, OrderInitialized):
+            if not is_first and isinstance(event, OrderInitialized):
+                order.apply_events(pending)
+                pending = []
                 if event.order_type == OrderType.MARKET:
                     order = MarketOrder.transform(order, event.ts_init)
                 elif event.order_type == OrderType.LIMIT:
@@ -610,56 +730,68 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
                         f"Cannot transform order to {order_type_to_str(event.order_type)}",  # pragma: no cover (design-time error)
                     )
             else:
-                order.apply(event)
-            event_count += 1
+                pending.append(event)
+            is_first = False
 
-        return order
+        order.apply_events(pending)
 
-    cpdef Position load_position(self, PositionId position_id):
-        """
-        Load the position associated with the given ID (if found).
+        return order
 
-        Parameters
-        ----------
-        position_id : PositionId
-            The position ID to load.
+    cdef Position _position_from_events(self, list result, dict instruments):
+        cdef bytes event_bytes
+        return self._position_from_fills(
+            [self._serializer.deserialize(event_bytes) for event_bytes in result],
+            instruments,
+        )
 
-        Returns
-        -------
-        Position or ``None``
+    cdef Position _position_from_state(self, dict state, list result, dict instruments):
+        # The snapshot holds the fills since the position was last opened, which
+        # determine its state, so earlier (closed) cycles are not replayed
+        cdef bytes event_bytes
+        cdef list fills = [self._serializer.deserialize(event_bytes) for event_bytes in state["events"]]
+        cdef set snapshot_fills = set(fills)
 
-        """
-        Condition.not_none(position_id, "position_id")
+        # Replay only the events written after the state snapshot
+        cdef OrderFilled fill
+        for event_bytes in result:
+            fill = self._serializer.deserialize(event_bytes)
+            if fill not in snapshot_fills:
+                fills.append(fill)
 
-        cdef str key = f"{_POSITIONS}:{position_id.to_str()}"
-        cdef list result = self._backing.read(key)
+        return self._position_from_fills(fills, instruments)
 
-        # Check there is at least one event to pop
-        if not result:
+    cdef Position _position_from_fills(self, list fills, dict instruments):
+        # Check there is at least one event
+        if not fills:
             return None
 
-        cdef OrderFilled initial_fill = self._serializer.deserialize(result.pop(0))
-        cdef Instrument instrument = self.load_instrument(initial_fill.instrument_id)
+        cdef OrderFilled initial_fill = fills[0]
+
+        cdef Instrument instrument = None
+        if instruments is not None:
+            instrument = instruments.get(initial_fill.instrument_id)
         if instrument is None:
-            self._log.error(
-                f"Cannot load position: "
-                f"no instrument found for {initial_fill.instrument_id}",
-            )
-            return
+            instrument = self.load_instrument(initial_fill.instrument_id)
+            if instrument is None:
+                self._log.error(
+                    f"Cannot load position: "
+                    f"no instrument found for {initial_fill.instrument_id}",
+                )
+                return None
+            if instruments is not None:
+                instruments[instrument.id] = instrument
 
         cdef Position position = Position(instrument, initial_fill)
+        cdef set seen_events = {initial_fill}
 
-        cdef:
-            bytes event_bytes
-            OrderFilled fill
-        for event_bytes in result:
-            event = self._serializer.deserialize(event_bytes)
-
+        cdef OrderFilled fill
+        for fill in fills[1:]:
             # Check event integrity
-            if event in position._events:
-                raise RuntimeError(f"Corrupt cache with duplicate event for position {event}")
+            if fill in seen_events:
+                raise RuntimeError(f"Corrupt cache with duplicate event for position {fill}")
+            seen_events.add(fill)
 
-            position.apply(event)
+            position.apply(fill)
 
         return position
 
@@ -897,6 +1029,7 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         cdef bytes position_id_bytes = position_id_str.encode()
         self._backing.insert(_INDEX_POSITIONS, [position_id_bytes])
         self._backing.insert(_INDEX_POSITIONS_OPEN, [position_id_bytes])
+        self._position_event_counts[position.id] = 1
 
         self._log.debug(f"Added {position}")
 
@@ -1040,6 +1173,9 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         else:
             self._backing.insert(_INDEX_ORDERS_EMULATED, payload)
 
+        if order.is_closed_c() or order.event_count_c() % _STATE_SNAPSHOT_INTERVAL == 0:
+            self._write_order_state(order)
+
         self._log.debug(f"Updated {order}")
 
     cpdef void update_position(self, Position position):
@@ -1066,8 +1202,41 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
             self._backing.insert(_INDEX_POSITIONS_CLOSED, payload)
             self._backing.delete(_INDEX_POSITIONS_OPEN, payload)
 
+        # The event count is only known for positions added or loaded by this adapter
+        cdef int event_count = self._position_event_counts.get(position.id, 0)
+        if event_count > 0:
+            event_count += 1
+            self._position_event_counts[position.id] = event_count
+            if position.is_closed_c() or event_count % _STATE_SNAPSHOT_INTERVAL == 0:
+                self._write_position_state(position, event_count)
+
         self._log.debug(f"Updated {position}")
 
+    cdef void _write_order_state(self, Order order):
+        # Write the latest state snapshot for the order so that loading
+        # need only apply the events after it
+        cdef OrderInitialized init = order.init_event_c()
+        if order.order_type != init.order_type:
+            return  # Transformed orders are always replayed in full
+
+        cdef dict state = {
+            "event_count": order.event_count_c(),
+            "state": order.state_c(),
+        }
+        cdef str key = f"{_STATES_ORDERS}:{order.client_order_id.to_str()}"
+        self._backing.insert(key, [msgspec.msgpack.encode(state)])
+
+    cdef void _write_position_state(self, Position position, int event_count):
+        # Write the latest state snapshot for the position so that loading
+        # need only replay the fills since it was last opened, and any after it
+        cdef OrderFilled fill
+        cdef dict state = {
+            "event_count": event_count,
+            "events": [self._serializer.serialize(fill) for fill in position._events],
+        }
+        cdef str key = f"{_STATES_POSITIONS}:{position.id.to_str()}"
+        self._backing.insert(key, [msgspec.msgpack.encode(state)])
+
     cpdef void snapshot_order_state(self, Order order):
         """
         Snapshot the state of the given `order`.
@@ -55,6 +55,7 @@ cdef class Actor(Component):
     cdef dict[UUID4, object] _pending_requests
     cdef set[type] _pyo3_conversion_types
     cdef dict[InstrumentId, list[GreeksData]] _future_greeks
+    cdef dict[str, tuple] _option_chain_greeks_decoded
     cdef dict[str, type] _signal_classes
     cdef list[Indicator] _indicators
     cdef dict[InstrumentId, list[Indicator]] _indicators_for_quotes
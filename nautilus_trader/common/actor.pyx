@@ -35,6 +35,7 @@ from nautilus_trader.common.executor import ActorExecutor
 from nautilus_trader.common.executor import TaskId
 from nautilus_trader.common.signal import generate_signal_class
 from nautilus_trader.model.greeks import GreeksData
+from nautilus_trader.model.greeks import OptionChainGreeks
 from nautilus_trader.model.greeks import PortfolioGreeks
 
 from cpython.datetime cimport datetime
@@ -120,6 +121,7 @@ cdef class Actor(Component):
         self._pending_requests: dict[UUID4, Callable[[UUID4], None] | None] = {}
         self._pyo3_conversion_types = set()
         self._future_greeks: dict[InstrumentId, list[GreeksData]] = {}
+        self._option_chain_greeks_decoded: dict[str, tuple[bytes, OptionChainGreeks]] = {}
         self._signal_classes: dict[str, type] = {}
 
         # Indicators
@@ -2854,27 +2856,33 @@ cdef class Actor(Component):
                 self.handle_historical_data(data)
         else:
             self.handle_historical_data(response.data)
-        self._finish_response(response.correlation_id)
+        if response.is_final:
+            self._finish_response(response.correlation_id)
 
     cpdef void _handle_instrument_response(self, DataResponse response):
         self.handle_instrument(response.data)
-        self._finish_response(response.correlation_id)
+        if response.is_final:
+            self._finish_response(response.correlation_id)
 
     cpdef void _handle_instruments_response(self, DataResponse response):
         self.handle_instruments(response.data)
-        self._finish_response(response.correlation_id)
+        if response.is_final:
+            self._finish_response(response.correlation_id)
 
     cpdef void _handle_quote_ticks_response(self, DataResponse response):
         self.handle_quote_ticks(response.data)
-        self._finish_response(response.correlation_id)
+        if response.is_final:
+            self._finish_response(response.correlation_id)
 
     cpdef void _handle_trade_ticks_response(self, DataResponse response):
         self.handle_trade_ticks(response.data)
-        self._finish_response(response.correlation_id)
+        if response.is_final:
+            self._finish_response(response.correlation_id)
 
     cpdef void _handle_bars_response(self, DataResponse response):
         self.handle_bars(response.data)
-        self._finish_response(response.correlation_id)
+        if response.is_final:
+            self._finish_response(response.correlation_id)
 
     cpdef void _finish_response(self, UUID4 request_id):
         callback: Callable | None = self._pending_requests.pop(request_id, None)
@@ -2915,8 +2923,9 @@ cdef class Actor(Component):
         Retrieve the Greeks data for a given instrument.
 
         This method handles both options and futures instruments. For options,
-        it retrieves the Greeks data from the cache. For futures, it creates
-        a GreeksData object based on the instrument's delta and multiplier.
+        it retrieves the Greeks data from the cache (either per option, or from
+        the cached option chain Greeks). For futures, it creates a GreeksData
+        object based on the instrument's delta and multiplier.
 
         Parameters
         ----------
@@ -2933,7 +2942,12 @@ cdef class Actor(Component):
 
         # Option case, to avoid querying definition
         if ' ' in instrument_id.symbol.value:
-            return GreeksData.from_bytes(self.cache.get(greeks_key(instrument_id)))
+            greeks_bytes = self.cache.get(greeks_key(instrument_id))
+            if greeks_bytes is not None:
+                return GreeksData.from_bytes(greeks_bytes)
+
+            chain_greeks = self._option_chain_greeks(instrument_id)
+            return chain_greeks.greeks(instrument_id) if chain_greeks is not None else None
 
         # Future case
         if instrument_id not in self._future_greeks:
@@ -2971,10 +2985,16 @@ cdef class Actor(Component):
             The aggregated Greeks data for the portfolio, including delta, gamma, vega, theta.
 
         """
+        from nautilus_trader.risk.greeks import greeks_key
+
         ts_event = self.clock.timestamp_ns()
         portfolio_greeks = PortfolioGreeks(ts_event, ts_event)
         open_positions = self.cache.positions_open(venue, instrument_id, strategy_id, side)
 
+        # Option positions covered by cached option chain Greeks are aggregated per chain
+        cdef dict chains = {}
+        cdef dict chain_quantities = {}
+
         for position in open_positions:
             position_instrument_id = position.instrument_id
 
@@ -2982,8 +3002,45 @@ cdef class Actor(Component):
                 continue
 
             quantity = float(position.signed_qty)
+
+            if ' ' in position_instrument_id.symbol.value and self.cache.get(greeks_key(position_instrument_id)) is None:
+                chain_greeks = self._option_chain_greeks(position_instrument_id)
+                if chain_greeks is not None:
+                    chains[chain_greeks.underlying] = chain_greeks
+                    quantities = chain_quantities.setdefault(chain_greeks.underlying, {})
+                    quantities[position_instrument_id] = quantities.get(position_instrument_id, 0.0) + quantity
+                    continue
+
             instrument_greeks = self.instrument_greeks_data(position_instrument_id)
             position_greeks = quantity * instrument_greeks
             portfolio_greeks += position_greeks
 
+        for chain_underlying, quantities in chain_quantities.items():
+            portfolio_greeks += chains[chain_underlying].portfolio_greeks(quantities)
+
         return portfolio_greeks
+
+    def _option_chain_greeks(self, InstrumentId instrument_id) -> OptionChainGreeks | None:
+        from nautilus_trader.risk.greeks import option_chain_greeks_key
+
+        instrument = self.cache.instrument(instrument_id)
+        chain_underlying = getattr(instrument, "underlying", None)
+        if chain_underlying is None:
+            return None
+
+        chain_bytes = self.cache.get(option_chain_greeks_key(chain_underlying))
+        if chain_bytes is None:
+            return None
+
+        # The decoded chain (and its index) is kept until the cached bytes are replaced
+        decoded = self._option_chain_greeks_decoded.get(chain_underlying)
+        if decoded is not None and decoded[0] is chain_bytes:
+            chain_greeks = decoded[1]
+        else:
+            chain_greeks = OptionChainGreeks.from_bytes(chain_bytes)
+            self._option_chain_greeks_decoded[chain_underlying] = (chain_bytes, chain_greeks)
+
+        if chain_greeks.index(instrument_id) is None:
+            return None
+
+        return chain_greeks
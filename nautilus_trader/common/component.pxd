@@ -83,15 +83,42 @@ cdef class Clock:
 
 
 cdef dict[UUID4, Clock] _COMPONENT_CLOCKS
+cdef dict[UUID4, TestClockScheduler] _COMPONENT_CLOCK_SCHEDULERS
 
 cdef list[TestClock] get_component_clocks(UUID4 instance_id)
+cpdef TestClockScheduler get_component_clock_scheduler(UUID4 instance_id)
 cpdef void register_component_clock(UUID4 instance_id, Clock clock)
 cpdef void deregister_component_clock(UUID4 instance_id, Clock clock)
 
 
+cdef class TestClockScheduler:
+    cdef list _clocks
+    cdef list _heap
+    cdef set _dirty
+    cdef uint64_t _next_index
+    cdef uint64_t _seq
+
+    cdef readonly uint64_t ts_now
+    """The shared current UNIX timestamp (nanoseconds) for all attached clocks.\n\n:returns: `uint64_t`"""
+
+    cpdef void attach(self, TestClock clock)
+    cpdef void detach(self, TestClock clock)
+    cpdef void set_time(self, uint64_t to_time_ns)
+    cpdef uint64_t next_time_ns(self)
+    cpdef list due_clocks(self, uint64_t to_time_ns)
+    cdef void mark_dirty(self, TestClock clock)
+    cdef void _refresh(self)
+
+
 cdef class TestClock(Clock):
     cdef TestClock_API _mem
+    cdef TestClockScheduler _scheduler
+    cdef uint64_t _scheduler_index
+    cdef uint64_t _next_expiry_ns
 
+    cdef void _sync_time(self)
+    cdef void _timers_changed(self)
+    cdef uint64_t _compute_next_expiry_ns(self)
     cpdef void set_time(self, uint64_t to_time_ns)
     cdef CVec advance_time_c(self, uint64_t to_time_ns, bint set_time=*)
     cpdef list advance_time(self, uint64_t to_time_ns, bint set_time=*)
@@ -253,11 +280,15 @@ cdef class MessageBus:
     cdef object _database
     cdef dict[Subscription, list[str]] _subscriptions
     cdef dict[str, Subscription[:]] _patterns
+    cdef dict[str, list[Subscription]] _exact_subs
+    cdef dict _wildcard_subs
+    cdef dict _topic_trie
+    cdef dict[Subscription, uint64_t] _subscription_seqs
+    cdef uint64_t _subscription_count
     cdef dict[str, object] _endpoints
     cdef dict[UUID4, object] _correlation_index
     cdef tuple[type] _publishable_types
     cdef set[type] _streaming_types
-    cdef bint _resolved
 
     cdef readonly TraderId trader_id
     """The trader ID associated with the bus.\n\n:returns: `TraderId`"""
@@ -294,6 +325,7 @@ cdef class MessageBus:
     cpdef void publish(self, str topic, msg, bint external_pub=*)
     cdef void publish_c(self, str topic, msg, bint external_pub=*)
     cdef Subscription[:] _resolve_subscriptions(self, str topic)
+    cdef Subscription[:] _sort_subscriptions(self, list subs)
 
 
 cdef bint is_matching(str topic, str pattern)
@@ -15,6 +15,7 @@
 
 import asyncio
 import copy
+import heapq
 import socket
 import sys
 import traceback
@@ -516,6 +517,9 @@ cdef class Clock:
 # Global map of clocks per kernel instance used when running a `BacktestEngine`
 _COMPONENT_CLOCKS = {}
 
+# Global map of shared clock schedulers per kernel instance
+_COMPONENT_CLOCK_SCHEDULERS = {}
+
 
 cdef list[TestClock] get_component_clocks(UUID4 instance_id):
     # Create a shallow copy of the clocks list, in case a new
@@ -523,6 +527,41 @@ cdef list[TestClock] get_component_clocks(UUID4 instance_id):
     return _COMPONENT_CLOCKS[instance_id].copy()
 
 
+cpdef TestClockScheduler get_component_clock_scheduler(UUID4 instance_id):
+    """
+    Return the shared clock scheduler for the given kernel instance.
+
+    The scheduler is created on first access, at which point every `TestClock`
+    already registered for the instance is attached. Test clocks registered
+    afterwards are attached automatically.
+
+    Parameters
+    ----------
+    instance_id : UUID4
+        The kernel instance ID.
+
+    Returns
+    -------
+    TestClockScheduler
+
+    """
+    Condition.not_none(instance_id, "instance_id")
+
+    cdef TestClockScheduler scheduler = _COMPONENT_CLOCK_SCHEDULERS.get(instance_id)
+    if scheduler is not None:
+        return scheduler
+
+    scheduler = TestClockScheduler()
+    _COMPONENT_CLOCK_SCHEDULERS[instance_id] = scheduler
+
+    cdef Clock clock
+    for clock in _COMPONENT_CLOCKS.get(instance_id, []):
+        if isinstance(clock, TestClock):
+            scheduler.attach(clock)
+
+    return scheduler
+
+
 cpdef void register_component_clock(UUID4 instance_id, Clock clock):
     Condition.not_none(instance_id, "instance_id")
     Condition.not_none(clock, "clock")
@@ -536,11 +575,19 @@ cpdef void register_component_clock(UUID4 instance_id, Clock clock):
     if clock not in clocks:
         clocks.append(clock)
 
+    cdef TestClockScheduler scheduler = _COMPONENT_CLOCK_SCHEDULERS.get(instance_id)
+    if scheduler is not None and isinstance(clock, TestClock):
+        scheduler.attach(clock)
+
 
 cpdef void deregister_component_clock(UUID4 instance_id, Clock clock):
     Condition.not_none(instance_id, "instance_id")
     Condition.not_none(clock, "clock")
 
+    cdef TestClockScheduler scheduler = _COMPONENT_CLOCK_SCHEDULERS.get(instance_id)
+    if scheduler is not None and isinstance(clock, TestClock):
+        scheduler.detach(clock)
+
     cdef list[Clock] clocks = _COMPONENT_CLOCKS.get(instance_id)
 
     if clocks is None:
@@ -553,19 +600,236 @@ cpdef void deregister_component_clock(UUID4 instance_id, Clock clock):
 cpdef void remove_instance_component_clocks(UUID4 instance_id):
     Condition.not_none(instance_id, "instance_id")
 
+    cdef TestClockScheduler scheduler = _COMPONENT_CLOCK_SCHEDULERS.pop(instance_id, None)
+    if scheduler is not None:
+        scheduler.clear()
+
     _COMPONENT_CLOCKS.pop(instance_id, None)
 
 
+cdef class TestClockScheduler:
+    """
+    Provides a shared time and timer schedule for a group of test clocks.
+
+    Attached clocks read their time from a single shared "now" held by the
+    scheduler, so setting the time is O(1) regardless of the number of clocks.
+    The scheduler also keeps a heap of each clock's next timer expiry, so only
+    clocks with timers due need to be advanced.
+
+    Warnings
+    --------
+    Setting the time of any attached clock sets the time for all attached clocks.
+
+    """
+
+    __test__ = False  # Prevents pytest from collecting this as a test class
+
+    def __init__(self):
+        self._clocks = []
+        self._heap = []
+        self._dirty = set()
+        self._next_index = 0
+        self._seq = 0
+
+        self.ts_now = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(ts_now={self.ts_now}, clocks={len(self._clocks)})"
+
+    @property
+    def clocks(self) -> list[TestClock]:
+        """
+        Return the attached clocks (in order of attachment).
+
+        Returns
+        -------
+        list[TestClock]
+
+        """
+        return self._clocks.copy()
+
+    cpdef void attach(self, TestClock clock):
+        """
+        Attach the given clock to the scheduler.
+
+        The clock will read its time from the shared "now" from this point on.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to attach.
+
+        Raises
+        ------
+        ValueError
+            If `clock` is already attached to another scheduler.
+
+        """
+        Condition.not_none(clock, "clock")
+
+        if clock._scheduler is self:
+            return
+
+        Condition.is_true(clock._scheduler is None, "`clock` was attached to another scheduler")
+
+        test_clock_set_time(&clock._mem, self.ts_now)
+        clock._scheduler = self
+        clock._scheduler_index = self._next_index
+        clock._next_expiry_ns = 0
+        self._next_index += 1
+        self._clocks.append(clock)
+        self._dirty.add(clock)
+
+    cpdef void detach(self, TestClock clock):
+        """
+        Detach the given clock from the scheduler.
+
+        The clock keeps the current shared time as its own time.
+
+        Parameters
+        ----------
+        clock : TestClock
+            The clock to detach.
+
+        """
+        Condition.not_none(clock, "clock")
+
+        if clock._scheduler is not self:
+            return
+
+        test_clock_set_time(&clock._mem, self.ts_now)
+        clock._scheduler = None
+        clock._next_expiry_ns = 0
+        self._clocks.remove(clock)
+        self._dirty.discard(clock)
+        # Any heap entries for the clock are discarded lazily
+
+    def clear(self) -> None:
+        """
+        Detach all clocks from the scheduler.
+        """
+        cdef TestClock clock
+        for clock in self._clocks.copy():
+            self.detach(clock)
+
+        self._heap.clear()
+
+    cpdef void set_time(self, uint64_t to_time_ns):
+        """
+        Set the shared time for all attached clocks.
+
+        Parameters
+        ----------
+        to_time_ns : uint64_t
+            The UNIX timestamp (nanoseconds) to set.
+
+        """
+        cdef TestClock clock
+        if to_time_ns < self.ts_now:
+            # Time moved backwards (such as for a new run), so clocks underlying
+            # times are re-synced to keep their timers monotonic.
+            for clock in self._clocks:
+                test_clock_set_time(&clock._mem, to_time_ns)
+
+        self.ts_now = to_time_ns
+
+    cpdef uint64_t next_time_ns(self):
+        """
+        Return the earliest pending timer expiry across all attached clocks.
+
+        Returns
+        -------
+        uint64_t
+            Zero if no timers are pending.
+
+        """
+        self._refresh()
+
+        cdef tuple entry
+        cdef TestClock clock
+        while self._heap:
+            entry = self._heap[0]
+            clock = entry[2]
+            if clock._scheduler is self and clock._next_expiry_ns == entry[0]:
+                return entry[0]
+            heapq.heappop(self._heap)  # Stale entry
+
+        return 0
+
+    cpdef list due_clocks(self, uint64_t to_time_ns):
+        """
+        Return the attached clocks with a timer due at or before the given time.
+
+        Returned clocks are assumed to be advanced by the caller, and will have
+        their next expiry recalculated on the next scheduler access.
+
+        Parameters
+        ----------
+        to_time_ns : uint64_t
+            The UNIX timestamp (nanoseconds) to check timers against.
+
+        Returns
+        -------
+        list[TestClock]
+            Ordered by attachment (consistent with clock registration order).
+
+        """
+        self._refresh()
+
+        cdef list due = []
+        cdef tuple entry
+        cdef TestClock clock
+        while self._heap and self._heap[0][0] <= to_time_ns:
+            entry = heapq.heappop(self._heap)
+            clock = entry[2]
+            if clock._scheduler is not self or clock._next_expiry_ns != entry[0]:
+                continue  # Stale entry
+            clock._next_expiry_ns = 0
+            self._dirty.add(clock)
+            due.append((clock._scheduler_index, clock))
+
+        if len(due) > 1:
+            due.sort()  # Attachment indexes are unique so clocks are never compared
+
+        return [x[1] for x in due]
+
+    cdef void mark_dirty(self, TestClock clock):
+        self._dirty.add(clock)
+
+    cdef void _refresh(self):
+        if not self._dirty:
+            return
+
+        cdef TestClock clock
+        cdef uint64_t next_ns
+        for clock in self._dirty:
+            next_ns = clock._compute_next_expiry_ns()
+            if next_ns == clock._next_expiry_ns:
+                continue  # Existing heap entry remains valid
+            clock._next_expiry_ns = next_ns
+            if next_ns > 0:
+                heapq.heappush(self._heap, (next_ns, self._seq, clock))
+                self._seq += 1
+
+        self._dirty.clear()
+
+
 cdef class TestClock(Clock):
     """
     Provides a monotonic clock for backtesting and unit testing.
 
+    When attached to a `TestClockScheduler` the clock reads its time from the
+    schedulers shared "now", and setting the time sets it for all attached clocks.
+
     """
 
     __test__ = False  # Prevents pytest from collecting this as a test class
 
     def __init__(self):
         self._mem = test_clock_new()
+        self._scheduler = None
+        self._scheduler_index = 0
+        self._next_expiry_ns = 0
 
     def __del__(self) -> None:
         if self._mem._0 != NULL:
@@ -580,15 +844,23 @@ cdef class TestClock(Clock):
         return test_clock_timer_count(&self._mem)
 
     cpdef double timestamp(self):
+        if self._scheduler is not None:
+            return nanos_to_secs(self._scheduler.ts_now)
         return test_clock_timestamp(&self._mem)
 
     cpdef uint64_t timestamp_ms(self):
+        if self._scheduler is not None:
+            return nanos_to_millis(self._scheduler.ts_now)
         return test_clock_timestamp_ms(&self._mem)
 
     cpdef uint64_t timestamp_us(self):
+        if self._scheduler is not None:
+            return self._scheduler.ts_now // 1_000
         return test_clock_timestamp_us(&self._mem)
 
     cpdef uint64_t timestamp_ns(self):
+        if self._scheduler is not None:
+            return self._scheduler.ts_now
         return test_clock_timestamp_ns(&self._mem)
 
     cpdef void register_default_handler(self, callback: Callable[[TimeEvent], None]):
@@ -605,12 +877,14 @@ cdef class TestClock(Clock):
         Condition.valid_string(name, "name")
         Condition.not_in(name, self.timer_names, "name", "self.timer_names")
 
+        self._sync_time()
         test_clock_set_time_alert(
             &self._mem,
             pystr_to_cstr(name),
             alert_time_ns,
             <PyObject *>callback,
         )
+        self._timers_changed()
 
     cpdef void set_timer_ns(
         self,
@@ -639,6 +913,7 @@ cdef class TestClock(Clock):
             stop_time_ns,
             <PyObject *>callback,
         )
+        self._timers_changed()
 
     cpdef uint64_t next_time_ns(self, str name):
         Condition.valid_string(name, "name")
@@ -649,26 +924,42 @@ cdef class TestClock(Clock):
         Condition.is_in(name, self.timer_names, "name", "self.timer_names")
 
         test_clock_cancel_timer(&self._mem, pystr_to_cstr(name))
+        self._timers_changed()
 
     cpdef void cancel_timers(self):
         test_clock_cancel_timers(&self._mem)
+        self._timers_changed()
 
     cpdef void set_time(self, uint64_t to_time_ns):
         """
         Set the clocks datetime to the given time (UTC).
 
+        If the clock is attached to a scheduler then the shared time is set.
+
         Parameters
         ----------
         to_time_ns : uint64_t
             The UNIX timestamp (nanoseconds) to set.
 
         """
+        if self._scheduler is not None:
+            self._scheduler.set_time(to_time_ns)
+            return
+
         test_clock_set_time(&self._mem, to_time_ns)
 
     cdef CVec advance_time_c(self, uint64_t to_time_ns, bint set_time=True):
-        Condition.is_true(to_time_ns >= test_clock_timestamp_ns(&self._mem), "to_time_ns was < time_ns (not monotonic)")
+        Condition.is_true(to_time_ns >= self.timestamp_ns(), "to_time_ns was < time_ns (not monotonic)")
+
+        self._sync_time()
+        cdef CVec raw_handler_vec = <CVec>test_clock_advance_time(&self._mem, to_time_ns, set_time)
 
-        return <CVec>test_clock_advance_time(&self._mem, to_time_ns, set_time)
+        if self._scheduler is not None:
+            if set_time:
+                self._scheduler.set_time(to_time_ns)
+            self._scheduler.mark_dirty(self)
+
+        return raw_handler_vec
 
     cpdef list advance_time(self, uint64_t to_time_ns, bint set_time=True):
         """
@@ -718,6 +1009,30 @@ cdef class TestClock(Clock):
 
         return event_handlers
 
+    cdef void _sync_time(self):
+        # Bring the underlying clock time up to the shared time (the Rust clock
+        # uses it as the reference for time alerts and advancing).
+        if self._scheduler is None:
+            return
+
+        if test_clock_timestamp_ns(&self._mem) != self._scheduler.ts_now:
+            test_clock_set_time(&self._mem, self._scheduler.ts_now)
+
+    cdef void _timers_changed(self):
+        if self._scheduler is not None:
+            self._scheduler.mark_dirty(self)
+
+    cdef uint64_t _compute_next_expiry_ns(self):
+        cdef uint64_t next_ns = 0
+        cdef uint64_t timer_ns
+        cdef str name
+        for name in <list>test_clock_timer_names(&self._mem):
+            timer_ns = test_clock_next_time(&self._mem, pystr_to_cstr(name))
+            if next_ns == 0 or timer_ns < next_ns:
+                next_ns = timer_ns
+
+        return next_ns
+
 
 cdef class LiveClock(Clock):
     """
@@ -2069,12 +2384,16 @@ cdef class MessageBus:
         self._endpoints: dict[str, Callable[[Any], None]] = {}
         self._patterns: dict[str, Subscription[:]] = {}
         self._subscriptions: dict[Subscription, list[str]] = {}
+        self._exact_subs: dict[str, list[Subscription]] = {}
+        self._wildcard_subs: dict = {}  # Trie of wildcard subscriptions by literal segments
+        self._topic_trie: dict = {}  # Trie of resolved topics by segments
+        self._subscription_seqs: dict[Subscription, uint64_t] = {}
+        self._subscription_count = 0
         self._correlation_index: dict[UUID4, Callable[[Any], None]] = {}
         self._publishable_types = tuple(_EXTERNAL_PUBLISHABLE_TYPES)
         if types_filter is not None:
             self._publishable_types = tuple(o for o in _EXTERNAL_PUBLISHABLE_TYPES if o not in types_filter)
         self._streaming_types = set()
-        self._resolved = False
 
         # Counters
         self.sent_count = 0
@@ -2429,23 +2748,33 @@ cdef class MessageBus:
             self._log.debug(f"{sub} already exists")
             return
 
-        cdef list matches = []
-        cdef list patterns = list(self._patterns.keys())
+        self._subscription_seqs[sub] = self._subscription_count
+        self._subscription_count += 1
+
+        # Index the subscription, and find the candidate resolved topics to update
+        cdef list segments = _literal_segments(topic)
+        cdef list candidates
+        cdef dict node
+        if _is_wildcard(topic):
+            _trie_items(_trie_node(self._wildcard_subs, segments, True)).append(sub)
+            node = _trie_node(self._topic_trie, segments, False)
+            candidates = _trie_collect(node) if node is not None else []
+        else:
+            self._exact_subs.setdefault(topic, []).append(sub)
+            candidates = [topic] if topic in self._patterns else []
 
+        cdef list matches = []
         cdef str pattern
         cdef list subs
-        for pattern in patterns:
-            if is_matching(topic, pattern):
+        for pattern in candidates:
+            if is_matching(pattern, topic):
                 subs = list(self._patterns[pattern])
                 subs.append(sub)
-                subs = sorted(subs, reverse=True)
-                self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
+                self._patterns[pattern] = self._sort_subscriptions(subs)
                 matches.append(pattern)
 
         self._subscriptions[sub] = sorted(matches)
 
-        self._resolved = False
-
         self._log.debug(f"Added {sub}")
 
     cpdef void unsubscribe(self, str topic, handler: Callable[[Any], None]):
@@ -2484,12 +2813,21 @@ cdef class MessageBus:
         for pattern in patterns:
             subs = list(self._patterns[pattern])
             subs.remove(sub)
-            subs = sorted(subs, reverse=True)
-            self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
+            self._patterns[pattern] = self._sort_subscriptions(subs)
 
-        del self._subscriptions[sub]
+        # Remove from the subscription indexes
+        cdef list indexed
+        if _is_wildcard(topic):
+            indexed = _trie_items(_trie_node(self._wildcard_subs, _literal_segments(topic), True))
+        else:
+            indexed = self._exact_subs.get(topic, [])
+        if sub in indexed:
+            indexed.remove(sub)
+        if not indexed:
+            self._exact_subs.pop(topic, None)
 
-        self._resolved = False
+        del self._subscriptions[sub]
+        self._subscription_seqs.pop(sub, None)
 
         self._log.debug(f"Removed {sub}")
 
@@ -2521,10 +2859,9 @@ cdef class MessageBus:
         # Get all subscriptions matching topic pattern
         # Note: cannot use truthiness on array
         cdef Subscription[:] subs = self._patterns.get(topic)
-        if subs is None or (not self._resolved and len(subs) == 0):
+        if subs is None:
             # Add the topic pattern and get matching subscribers
             subs = self._resolve_subscriptions(topic)
-            self._resolved = True
 
         # Send message to all matched subscribers
         cdef:
@@ -2550,16 +2887,28 @@ cdef class MessageBus:
         self.pub_count += 1
 
     cdef Subscription[:] _resolve_subscriptions(self, str topic):
-        cdef list subs_list = []
+        # Candidates are the exact subscriptions for the topic, plus wildcard
+        # subscriptions whose literal leading segments are a prefix of the topic
+        cdef list subs_list = list(self._exact_subs.get(topic, []))
+        cdef list candidates = []
+        cdef dict node = self._wildcard_subs
+        candidates.extend(node.get(None, []))
+
+        cdef str segment
+        for segment in topic.split("."):
+            node = node.get(segment)
+            if node is None:
+                break
+            candidates.extend(node.get(None, []))
+
         cdef Subscription existing_sub
-        # Copy to handle subscription changes on iteration
-        for existing_sub in self._subscriptions.copy():
+        for existing_sub in candidates:
             if is_matching(topic, existing_sub.topic):
                 subs_list.append(existing_sub)
 
-        subs_list = sorted(subs_list, reverse=True)
-        cdef Subscription[:] subs_array = np.ascontiguousarray(subs_list, dtype=Subscription)
+        cdef Subscription[:] subs_array = self._sort_subscriptions(subs_list)
         self._patterns[topic] = subs_array
+        _trie_items(_trie_node(self._topic_trie, topic.split("."), True)).append(topic)
 
         cdef list matches
         for sub in subs_array:
@@ -2570,35 +2919,101 @@ cdef class MessageBus:
 
         return subs_array
 
+    cdef Subscription[:] _sort_subscriptions(self, list subs):
+        # Highest priority first, then in order of subscription
+        cdef dict seqs = self._subscription_seqs
+        subs.sort(key=lambda s: (-s.priority, seqs.get(s, 0)))
+        return np.ascontiguousarray(subs, dtype=Subscription)
+
+
+cdef inline bint _is_wildcard(str pattern):
+    return "*" in pattern or "?" in pattern
+
+
+cdef list _literal_segments(str pattern):
+    # Return the complete segments of the pattern prior to any wildcard character
+    cdef Py_ssize_t i
+    cdef Py_UCS4 c
+    for i in range(len(pattern)):
+        c = pattern[i]
+        if c == "*" or c == "?":
+            return pattern[:i].split(".")[:-1]
+    return pattern.split(".")
+
+
+cdef dict _trie_node(dict root, list segments, bint create):
+    cdef dict node = root
+    cdef dict child
+    cdef str segment
+    for segment in segments:
+        child = node.get(segment)
+        if child is None:
+            if not create:
+                return None
+            child = {}
+            node[segment] = child
+        node = child
+    return node
+
+
+cdef list _trie_items(dict node):
+    # Items are held under the `None` key (segments are always strings)
+    cdef list items = node.get(None)
+    if items is None:
+        items = []
+        node[None] = items
+    return items
+
+
+cdef list _trie_collect(dict node):
+    cdef list items = []
+    cdef list stack = [node]
+    cdef dict current
+    while stack:
+        current = stack.pop()
+        for key, value in current.items():
+            if key is None:
+                items.extend(value)
+            else:
+                stack.append(value)
+    return items
+
 
 cdef inline bint is_matching(str topic, str pattern):
-    # Get length of string and wildcard pattern
-    cdef int n = len(topic)
-    cdef int m = len(pattern)
-
-    # Create a DP lookup table
-    cdef np.ndarray[np.int8_t, ndim=2] t = np.empty((n + 1, m + 1), dtype=np.int8)
-    t.fill(False)
-
-    # If both pattern and string are empty: match
-    t[0, 0] = True
-
-    # Handle empty string case (i == 0)
-    cdef int j
-    for j in range(1, m + 1):
-        if pattern[j - 1] == '*':
-            t[0, j] = t[0, j - 1]
-
-    # Build a matrix in a bottom-up manner
-    cdef int i
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            if pattern[j - 1] == '*':
-                t[i, j] = t[i - 1, j] or t[i, j - 1]
-            elif pattern[j - 1] == '?' or topic[i - 1] == pattern[j - 1]:
-                t[i, j] = t[i - 1, j - 1]
-
-    return t[n, m]
+    # Iterative wildcard match with single star backtracking (no allocations)
+    cdef Py_ssize_t n = len(topic)
+    cdef Py_ssize_t m = len(pattern)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j = 0
+    cdef Py_ssize_t star = -1
+    cdef Py_ssize_t mark = 0
+    cdef Py_UCS4 p
+    while i < n:
+        if j < m:
+            p = pattern[j]
+            if p == "*":
+                # Record the star position, initially matching zero characters
+                star = j
+                mark = i
+                j += 1
+                continue
+            if p == "?" or p == topic[i]:
+                i += 1
+                j += 1
+                continue
+        if star != -1:
+            # Backtrack: let the last star consume one more character
+            j = star + 1
+            mark += 1
+            i = mark
+            continue
+        return False
+
+    # Remaining pattern characters must all be stars
+    while j < m and pattern[j] == "*":
+        j += 1
+
+    return j == m
 
 
 # Python wrapper for test access
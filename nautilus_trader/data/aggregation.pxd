@@ -78,6 +78,16 @@ cdef class BarAggregator:
     cdef void _build_and_send(self, uint64_t ts_event, uint64_t ts_init)
 
 
+cdef class BarAggregatorGroup:
+    cdef list _aggregators
+
+    cpdef void add(self, BarAggregator aggregator)
+    cpdef void remove(self, BarAggregator aggregator)
+    cpdef bint is_empty(self)
+    cpdef void handle_quote_tick(self, QuoteTick tick)
+    cpdef void handle_trade_tick(self, TradeTick tick)
+
+
 cdef class TickBarAggregator(BarAggregator):
     pass
 
@@ -92,8 +102,12 @@ cdef class ValueBarAggregator(BarAggregator):
     cpdef object get_cumulative_value(self)
 
 
+cdef class TimeBarScheduler
+
+
 cdef class TimeBarAggregator(BarAggregator):
     cdef Clock _clock
+    cdef TimeBarScheduler _scheduler
     cdef bint _build_on_next_tick
     cdef uint64_t _stored_open_ns
     cdef uint64_t _stored_close_ns
@@ -117,3 +131,13 @@ cdef class TimeBarAggregator(BarAggregator):
     cdef uint64_t _get_interval_ns(self)
     cpdef void _set_build_timer(self)
     cpdef void _build_bar(self, TimeEvent event)
+
+
+cdef class TimeBarScheduler:
+    cdef Clock _clock
+    cdef dict _schedules
+
+    cpdef str add(self, TimeBarAggregator aggregator)
+    cpdef void remove(self, TimeBarAggregator aggregator)
+    cpdef list timer_names(self)
+    cpdef void reset(self)
@@ -384,6 +384,88 @@ cdef class BarAggregator:
         self._handler(bar)
 
 
+cdef class BarAggregatorGroup:
+    """
+    Provides a group of bar aggregators sharing a single tick stream.
+
+    The group is subscribed to the tick stream once and applies each tick to all
+    of its aggregators in one pass, rather than each aggregator being a separate
+    message bus handler.
+    """
+
+    def __init__(self):
+        self._aggregators = []
+
+    def __len__(self) -> int:
+        return len(self._aggregators)
+
+    cpdef void add(self, BarAggregator aggregator):
+        """
+        Add the given aggregator to the group.
+
+        Parameters
+        ----------
+        aggregator : BarAggregator
+            The aggregator to add.
+
+        """
+        Condition.not_none(aggregator, "aggregator")
+
+        self._aggregators.append(aggregator)
+
+    cpdef void remove(self, BarAggregator aggregator):
+        """
+        Remove the given aggregator from the group (if found).
+
+        Parameters
+        ----------
+        aggregator : BarAggregator
+            The aggregator to remove.
+
+        """
+        if aggregator in self._aggregators:
+            self._aggregators.remove(aggregator)
+
+    cpdef bint is_empty(self):
+        """
+        Return whether the group has no aggregators.
+
+        Returns
+        -------
+        bool
+
+        """
+        return not self._aggregators
+
+    cpdef void handle_quote_tick(self, QuoteTick tick):
+        """
+        Update all aggregators in the group with the given tick.
+
+        Parameters
+        ----------
+        tick : QuoteTick
+            The tick for the update.
+
+        """
+        cdef BarAggregator aggregator
+        for aggregator in self._aggregators:
+            aggregator.handle_quote_tick(tick)
+
+    cpdef void handle_trade_tick(self, TradeTick tick):
+        """
+        Update all aggregators in the group with the given tick.
+
+        Parameters
+        ----------
+        tick : TradeTick
+            The tick for the update.
+
+        """
+        cdef BarAggregator aggregator
+        for aggregator in self._aggregators:
+            aggregator.handle_trade_tick(tick)
+
+
 cdef class TickBarAggregator(BarAggregator):
     """
     Provides a means of building tick bars from ticks.
@@ -665,6 +747,9 @@ cdef class TimeBarAggregator(BarAggregator):
         Determines the type of interval used for time aggregation.
         - 'left-open': start time is excluded and end time is included (default).
         - 'right-open': start time is included and end time is excluded.
+    scheduler : TimeBarScheduler, optional
+        The scheduler for closing bars from a timer shared with other aggregators.
+        If ``None`` then the aggregator sets its own timer on the clock.
 
     Raises
     ------
@@ -680,6 +765,7 @@ cdef class TimeBarAggregator(BarAggregator):
         bint build_with_no_updates = True,
         bint timestamp_on_close = True,
         str interval_type = "left-open",
+        TimeBarScheduler scheduler = None,
     ):
         super().__init__(
             instrument=instrument,
@@ -688,6 +774,7 @@ cdef class TimeBarAggregator(BarAggregator):
         )
 
         self._clock = clock
+        self._scheduler = scheduler
         self.interval = self._get_interval()
         self.interval_ns = self._get_interval_ns()
         self._timer_name = None
@@ -785,7 +872,10 @@ cdef class TimeBarAggregator(BarAggregator):
         """
         Stop the bar aggregator.
         """
-        self._clock.cancel_timer(str(self.bar_type))
+        if self._scheduler is not None:
+            self._scheduler.remove(self)
+        else:
+            self._clock.cancel_timer(str(self.bar_type))
 
     cdef timedelta _get_interval(self):
         cdef BarAggregation aggregation = self.bar_type.spec.aggregation
@@ -828,6 +918,10 @@ cdef class TimeBarAggregator(BarAggregator):
             )
 
     cpdef void _set_build_timer(self):
+        if self._scheduler is not None:
+            self._timer_name = self._scheduler.add(self)
+            return
+
         self._timer_name = str(self.bar_type)
         self._clock.set_timer(
             name=self._timer_name,
@@ -882,3 +976,118 @@ cdef class TimeBarAggregator(BarAggregator):
 
         # On receiving this event, timer should now have a new `next_time_ns`
         self.next_close_ns = self._clock.next_time_ns(self._timer_name)
+
+
+cdef class TimeBarScheduler:
+    """
+    Provides shared timers for closing time bars across many aggregators.
+
+    Aggregators with the same interval and the same bar open times (phase) close
+    together, so they share a single timer on the clock which builds all of their
+    bars when it fires. Subscribing the same bar specifications across many
+    instruments then needs one timer per distinct specification.
+
+    Parameters
+    ----------
+    clock : Clock
+        The clock for the scheduler.
+    """
+
+    def __init__(self, Clock clock not None):
+        self._clock = clock
+        self._schedules: dict[str, list[TimeBarAggregator]] = {}
+
+    cpdef str add(self, TimeBarAggregator aggregator):
+        """
+        Add the given aggregator to the schedule for its interval and phase.
+
+        A timer is set on the clock for the first aggregator of a schedule.
+
+        Parameters
+        ----------
+        aggregator : TimeBarAggregator
+            The aggregator to add.
+
+        Returns
+        -------
+        str
+            The name of the timer closing the aggregators bars.
+
+        """
+        Condition.not_none(aggregator, "aggregator")
+
+        cdef datetime start_time = aggregator.get_start_time()
+        cdef uint64_t start_ns = dt_to_unix_nanos(start_time)
+        cdef str timer_name = f"TimeBars-{aggregator.interval_ns}-{start_ns % aggregator.interval_ns}"
+
+        cdef list aggregators = self._schedules.get(timer_name)
+        if aggregators is None:
+            aggregators = []
+            self._schedules[timer_name] = aggregators
+            self._clock.set_timer(
+                name=timer_name,
+                interval=aggregator.interval,
+                start_time=start_time,
+                stop_time=None,
+                callback=self._build_bars,
+            )
+
+        aggregators.append(aggregator)
+        return timer_name
+
+    cpdef void remove(self, TimeBarAggregator aggregator):
+        """
+        Remove the given aggregator from its schedule (if found).
+
+        The timer is canceled when no aggregators remain for the schedule.
+
+        Parameters
+        ----------
+        aggregator : TimeBarAggregator
+            The aggregator to remove.
+
+        """
+        Condition.not_none(aggregator, "aggregator")
+
+        cdef list aggregators = self._schedules.get(aggregator._timer_name)
+        if aggregators is None or aggregator not in aggregators:
+            return
+
+        aggregators.remove(aggregator)
+        if not aggregators:
+            del self._schedules[aggregator._timer_name]
+            self._clock.cancel_timer(aggregator._timer_name)
+
+    cpdef list timer_names(self):
+        """
+        Return the names of the timers set by the scheduler.
+
+        Returns
+        -------
+        list[str]
+
+        """
+        return list(self._schedules.keys())
+
+    cpdef void reset(self):
+        """
+        Reset the scheduler.
+
+        All timers set by the scheduler are canceled and all schedules cleared.
+
+        """
+        cdef str timer_name
+        for timer_name in self._schedules:
+            if timer_name in self._clock.timer_names:
+                self._clock.cancel_timer(timer_name)
+
+        self._schedules.clear()
+
+    def _build_bars(self, TimeEvent event):
+        cdef list aggregators = self._schedules.get(event.to_str())
+        if aggregators is None:
+            return
+
+        cdef TimeBarAggregator aggregator
+        for aggregator in aggregators.copy():  # Handlers may remove aggregators
+            aggregator._build_bar(event)
@@ -20,6 +20,9 @@ from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport TimeEvent
 from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.rust.model cimport BookType
+from nautilus_trader.data.aggregation cimport BarAggregator
+from nautilus_trader.data.aggregation cimport BarAggregatorGroup
+from nautilus_trader.data.aggregation cimport TimeBarScheduler
 from nautilus_trader.data.client cimport DataClient
 from nautilus_trader.data.client cimport MarketDataClient
 from nautilus_trader.data.messages cimport DataCommand
@@ -56,6 +59,8 @@ cdef class DataEngine(Component):
     cdef readonly dict[Venue, DataClient] _routing_map
     cdef readonly dict _order_book_intervals
     cdef readonly dict[BarType, BarAggregator] _bar_aggregators
+    cdef readonly dict[str, BarAggregatorGroup] _bar_aggregator_groups
+    cdef readonly TimeBarScheduler _time_bar_scheduler
     cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_quote_feeds
     cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_trade_feeds
     cdef readonly list[InstrumentId] _subscribed_synthetic_quotes
@@ -143,6 +148,8 @@ cdef class DataEngine(Component):
     cpdef void _handle_unsubscribe_data(self, DataClient client, DataType data_type)
     cpdef void _handle_request(self, DataRequest request)
     cpdef void _query_catalog(self, DataRequest request)
+    cpdef tuple _catalog_time_range(self, DataRequest request)
+    cpdef void _handle_catalog_data(self, DataRequest request, list data, bint is_final)
 
 # -- DATA HANDLERS --------------------------------------------------------------------------------
 
@@ -161,6 +168,7 @@ cdef class DataEngine(Component):
 # -- RESPONSE HANDLERS ----------------------------------------------------------------------------
 
     cpdef void _handle_response(self, DataResponse response)
+    cpdef void _handle_response_data(self, DataResponse response)
     cpdef void _handle_instruments(self, list instruments)
     cpdef void _handle_quote_ticks(self, list ticks)
     cpdef void _handle_trade_ticks(self, list ticks)
@@ -174,6 +182,9 @@ cdef class DataEngine(Component):
     cpdef void _publish_order_book(self, InstrumentId instrument_id, str topic)
     cpdef void _start_bar_aggregator(self, MarketDataClient client, BarType bar_type, bint await_partial)
     cpdef void _stop_bar_aggregator(self, MarketDataClient client, BarType bar_type)
+    cdef str _bar_aggregator_group_topic(self, BarType bar_type)
+    cdef object _bar_aggregator_group_handler(self, BarAggregatorGroup group, bint is_trades)
+    cdef void _remove_from_bar_aggregator_group(self, BarAggregator aggregator)
     cpdef void _update_synthetics_with_quote(self, list synthetics, QuoteTick update)
     cpdef void _update_synthetic_with_quote(self, SyntheticInstrument synthetic, QuoteTick update)
     cpdef void _update_synthetics_with_trade(self, list synthetics, TradeTick update)
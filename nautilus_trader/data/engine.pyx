@@ -59,8 +59,10 @@ from nautilus_trader.core.rust.model cimport BookType
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.data.aggregation cimport BarAggregator
+from nautilus_trader.data.aggregation cimport BarAggregatorGroup
 from nautilus_trader.data.aggregation cimport TickBarAggregator
 from nautilus_trader.data.aggregation cimport TimeBarAggregator
+from nautilus_trader.data.aggregation cimport TimeBarScheduler
 from nautilus_trader.data.aggregation cimport ValueBarAggregator
 from nautilus_trader.data.aggregation cimport VolumeBarAggregator
 from nautilus_trader.data.client cimport DataClient
@@ -135,6 +137,8 @@ cdef class DataEngine(Component):
         self._catalog: ParquetDataCatalog | None = None
         self._order_book_intervals: dict[tuple[InstrumentId, int], list[Callable[[OrderBook], None]]] = {}
         self._bar_aggregators: dict[BarType, BarAggregator] = {}
+        self._bar_aggregator_groups: dict[str, BarAggregatorGroup] = {}
+        self._time_bar_scheduler = TimeBarScheduler(clock=self._clock)
         self._synthetic_quote_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
         self._synthetic_trade_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
         self._subscribed_synthetic_quotes: list[InstrumentId] = []
@@ -534,12 +538,14 @@ cdef class DataEngine(Component):
 
         self._order_book_intervals.clear()
         self._bar_aggregators.clear()
+        self._bar_aggregator_groups.clear()
         self._synthetic_quote_feeds.clear()
         self._synthetic_trade_feeds.clear()
         self._subscribed_synthetic_quotes.clear()
         self._subscribed_synthetic_trades.clear()
         self._buffered_deltas_map.clear()
         self._snapshot_info.clear()
+        self._time_bar_scheduler.reset()
 
         self._clock.cancel_timers()
         self.command_count = 0
@@ -1342,22 +1348,9 @@ cdef class DataEngine(Component):
                 self._log.error(f"Cannot handle request: unrecognized data type {request.data_type}")
 
     cpdef void _query_catalog(self, DataRequest request):
-        cdef datetime start = request.data_type.metadata.get("start")
-        cdef datetime end = request.data_type.metadata.get("end")
-
-        cdef uint64_t ts_now = self._clock.timestamp_ns()
-        cdef uint64_t ts_start = dt_to_unix_nanos(start) if start is not None else 0
-        cdef uint64_t ts_end = dt_to_unix_nanos(end) if end is not None else ts_now
-
-        # Validate request time range
-        Condition.is_true(ts_start <= ts_end, f"{ts_start=} was greater than {ts_end=}")
-
-        if end is not None and ts_end > ts_now:
-            self._log.warning(
-                "Cannot request data beyond current time. "
-                f"Truncating `end` to current UNIX nanoseconds {unix_nanos_to_dt(ts_now)}",
-            )
-            ts_end = ts_now
+        cdef tuple time_range = self._catalog_time_range(request)
+        cdef uint64_t ts_start = time_range[0]
+        cdef uint64_t ts_end = time_range[1]
 
         if request.data_type.type == Instrument:
             instrument_id = request.data_type.metadata.get("instrument_id")
@@ -1402,6 +1395,31 @@ cdef class DataEngine(Component):
                 end=ts_end,
             )
 
+        self._handle_catalog_data(request, data, True)
+
+    cpdef tuple _catalog_time_range(self, DataRequest request):
+        cdef datetime start = request.data_type.metadata.get("start")
+        cdef datetime end = request.data_type.metadata.get("end")
+
+        cdef uint64_t ts_now = self._clock.timestamp_ns()
+        cdef uint64_t ts_start = dt_to_unix_nanos(start) if start is not None else 0
+        cdef uint64_t ts_end = dt_to_unix_nanos(end) if end is not None else ts_now
+
+        # Validate request time range
+        Condition.is_true(ts_start <= ts_end, f"{ts_start=} was greater than {ts_end=}")
+
+        if end is not None and ts_end > ts_now:
+            self._log.warning(
+                "Cannot request data beyond current time. "
+                f"Truncating `end` to current UNIX nanoseconds {unix_nanos_to_dt(ts_now)}",
+            )
+            ts_end = ts_now
+
+        return ts_start, ts_end
+
+    cpdef void _handle_catalog_data(self, DataRequest request, list data, bint is_final):
+        cdef uint64_t ts_now = self._clock.timestamp_ns()
+
         # Validation data is not from the future
         if data and data[-1].ts_init > ts_now:
             raise RuntimeError(
@@ -1416,9 +1434,16 @@ cdef class DataEngine(Component):
             data=data,
             correlation_id=request.id,
             response_id=UUID4(),
-            ts_init=self._clock.timestamp_ns(),
+            ts_init=ts_now,
+            is_final=is_final,
         )
-        self._handle_response(response)
+
+        if is_final:
+            self._handle_response(response)
+        else:
+            # Deliver the chunk while keeping the request pending for the final response
+            self._handle_response_data(response)
+            request.callback(response)
 
 # -- DATA HANDLERS --------------------------------------------------------------------------------
 
@@ -1621,6 +1646,10 @@ cdef class DataEngine(Component):
 # -- RESPONSE HANDLERS ----------------------------------------------------------------------------
 
     cpdef void _handle_response(self, DataResponse response):
+        self._handle_response_data(response)
+        self._msgbus.response(response)
+
+    cpdef void _handle_response_data(self, DataResponse response):
         if self.debug:
             self._log.debug(f"{RECV}{RES} {response}", LogColor.MAGENTA)
         self.response_count += 1
@@ -1635,9 +1664,11 @@ cdef class DataEngine(Component):
         elif response.data_type.type == TradeTick:
             self._handle_trade_ticks(response.data)
         elif response.data_type.type == Bar:
-            self._handle_bars(response.data, response.data_type.metadata.get("Partial"))
-
-        self._msgbus.response(response)
+            # Only apply a partial bar once all bars for the request have been handled
+            self._handle_bars(
+                response.data,
+                response.data_type.metadata.get("Partial") if response.is_final else None,
+            )
 
     cpdef void _handle_instruments(self, list instruments):
         cdef Instrument instrument
@@ -1745,6 +1776,7 @@ cdef class DataEngine(Component):
                 build_with_no_updates=self._time_bars_build_with_no_updates,
                 timestamp_on_close=self._time_bars_timestamp_on_close,
                 interval_type=self._time_bars_interval_type,
+                scheduler=self._time_bar_scheduler,
             )
         elif bar_type.spec.aggregation == BarAggregation.TICK:
             aggregator = TickBarAggregator(
@@ -1787,23 +1819,26 @@ cdef class DataEngine(Component):
                 handler=aggregator.handle_bar,
             )
             self._handle_subscribe_bars(client, composite_bar_type, False)
-        elif bar_type.spec.price_type == PriceType.LAST:
+            return
+
+        # Aggregators from the same ticks share a single subscription
+        cdef bint is_trades = bar_type.spec.price_type == PriceType.LAST
+        cdef str topic = self._bar_aggregator_group_topic(bar_type)
+        cdef BarAggregatorGroup group = self._bar_aggregator_groups.get(topic)
+        if group is None:
+            group = BarAggregatorGroup()
+            self._bar_aggregator_groups[topic] = group
             self._msgbus.subscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
-                handler=aggregator.handle_trade_tick,
+                topic=topic,
+                handler=self._bar_aggregator_group_handler(group, is_trades),
                 priority=5,
             )
+
+        group.add(aggregator)
+
+        if is_trades:
             self._handle_subscribe_trade_ticks(client, bar_type.instrument_id)
         else:
-            self._msgbus.subscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
-                handler=aggregator.handle_quote_tick,
-                priority=5,
-            )
             self._handle_subscribe_quote_ticks(client, bar_type.instrument_id)
 
     cpdef void _stop_bar_aggregator(self, MarketDataClient client, BarType bar_type):
@@ -1827,26 +1862,45 @@ cdef class DataEngine(Component):
                 handler=aggregator.handle_bar,
             )
             self._handle_unsubscribe_bars(client, composite_bar_type)
-        elif bar_type.spec.price_type == PriceType.LAST:
-            self._msgbus.unsubscribe(
-                topic=f"data.trades"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
-                handler=aggregator.handle_trade_tick,
-            )
-            self._handle_unsubscribe_trade_ticks(client, bar_type.instrument_id)
         else:
-            self._msgbus.unsubscribe(
-                topic=f"data.quotes"
-                      f".{bar_type.instrument_id.venue}"
-                      f".{bar_type.instrument_id.symbol}",
-                handler=aggregator.handle_quote_tick,
-            )
-            self._handle_unsubscribe_quote_ticks(client, bar_type.instrument_id)
+            self._remove_from_bar_aggregator_group(aggregator)
+
+            if bar_type.spec.price_type == PriceType.LAST:
+                self._handle_unsubscribe_trade_ticks(client, bar_type.instrument_id)
+            else:
+                self._handle_unsubscribe_quote_ticks(client, bar_type.instrument_id)
 
         # Remove from aggregators
         del self._bar_aggregators[bar_type.standard()]
 
+    cdef str _bar_aggregator_group_topic(self, BarType bar_type):
+        if bar_type.spec.price_type == PriceType.LAST:
+            return f"data.trades.{bar_type.instrument_id.venue}.{bar_type.instrument_id.symbol}"
+        else:
+            return f"data.quotes.{bar_type.instrument_id.venue}.{bar_type.instrument_id.symbol}"
+
+    cdef object _bar_aggregator_group_handler(self, BarAggregatorGroup group, bint is_trades):
+        if is_trades:
+            return group.handle_trade_tick
+        else:
+            return group.handle_quote_tick
+
+    cdef void _remove_from_bar_aggregator_group(self, BarAggregator aggregator):
+        cdef BarType bar_type = aggregator.bar_type
+        cdef bint is_trades = bar_type.spec.price_type == PriceType.LAST
+        cdef str topic = self._bar_aggregator_group_topic(bar_type)
+        cdef BarAggregatorGroup group = self._bar_aggregator_groups.get(topic)
+        if group is None:
+            return
+
+        group.remove(aggregator)
+        if group.is_empty():
+            self._msgbus.unsubscribe(
+                topic=topic,
+                handler=self._bar_aggregator_group_handler(group, is_trades),
+            )
+            del self._bar_aggregator_groups[topic]
+
     cpdef void _update_synthetics_with_quote(self, list synthetics, QuoteTick update):
         cdef SyntheticInstrument synthetic
         for synthetic in synthetics:
@@ -56,3 +56,5 @@ cdef class DataResponse(Response):
     """The response data type.\n\n:returns: `type`"""
     cdef readonly object data
     """The response data.\n\n:returns: `object`"""
+    cdef readonly bint is_final
+    """If the response is the final response for the request.\n\n:returns: `bool`"""
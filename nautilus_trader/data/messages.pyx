@@ -250,6 +250,10 @@ cdef class DataResponse(Response):
         The response ID.
     ts_init : uint64_t
         UNIX timestamp (nanoseconds) when the object was initialized.
+    is_final : bool, default True
+        If the response is the final response for the request. Requests may be
+        responded to with a sequence of chunked responses, of which only the last
+        is final.
 
     Raises
     ------
@@ -267,6 +271,7 @@ cdef class DataResponse(Response):
         UUID4 correlation_id not None,
         UUID4 response_id not None,
         uint64_t ts_init,
+        bint is_final = True,
     ):
         Condition.is_true(client_id or venue, "Both `client_id` and `venue` were None")
         super().__init__(
@@ -279,6 +284,7 @@ cdef class DataResponse(Response):
         self.venue = venue
         self.data_type = data_type
         self.data = data
+        self.is_final = is_final
 
     def __str__(self) -> str:
         return (
@@ -262,10 +262,17 @@ cdef class OrderEmulator(Actor):
             return  # Order not in cache yet
 
         cdef MatchingCore matching_core = None
+        cdef InstrumentId trigger_instrument_id
         if order.is_closed_c():
             matching_core = self._matching_cores.get(order.instrument_id)
             if matching_core is not None:
                 matching_core.delete_order(order)
+        elif isinstance(event, OrderUpdated):
+            # Price level of the order may have changed
+            trigger_instrument_id = order.instrument_id if order.trigger_instrument_id is None else order.trigger_instrument_id
+            matching_core = self._matching_cores.get(trigger_instrument_id)
+            if matching_core is not None:
+                matching_core.update_order(order)
 
     cpdef void on_stop(self):
         pass
@@ -510,12 +517,7 @@ cdef class OrderEmulator(Actor):
             return
 
         matching_core.match_order(order)
-        if order.side == OrderSide.BUY:
-            matching_core.sort_bid_orders()
-        elif order.side == OrderSide.SELL:
-            matching_core.sort_ask_orders()
-        else:
-            raise RuntimeError("invalid `OrderSide`")  # pragma: no cover (design-time error)
+        matching_core.update_order(order)
 
     cdef void _handle_cancel_order(self, CancelOrder command):
         cdef Order order = self.cache.order(command.client_order_id)
@@ -926,5 +928,6 @@ cdef class OrderEmulator(Actor):
         )
         order.apply(event)
         self.cache.update_order(order)
+        matching_core.update_order(order)
 
         self._manager.send_risk_event(event)
@@ -25,6 +25,19 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 
 
+cdef class PriceLevels:
+    cdef list _keys
+    cdef dict _levels
+    cdef readonly int count
+
+    cdef void add(self, int64_t key, Order order)
+    cdef void remove(self, int64_t key, ClientOrderId client_order_id)
+    cdef void clear(self)
+    cdef list orders(self)
+    cdef list orders_at_or_above(self, int64_t key)
+    cdef list orders_at_or_below(self, int64_t key)
+
+
 cdef class MatchingCore:
     cdef InstrumentId _instrument_id
     cdef Price _price_increment
@@ -41,8 +54,12 @@ cdef class MatchingCore:
     cdef object _fill_limit_order
 
     cdef dict _orders
-    cdef list _orders_bid
-    cdef list _orders_ask
+    cdef dict _order_index
+    cdef uint64_t _order_seq
+    cdef PriceLevels _bid_limits
+    cdef PriceLevels _bid_stops
+    cdef PriceLevels _ask_limits
+    cdef PriceLevels _ask_stops
 
 # -- QUERIES --------------------------------------------------------------------------------------
 
@@ -61,10 +78,15 @@ cdef class MatchingCore:
     cpdef void reset(self)
     cpdef void add_order(self, Order order)
     cdef void _add_order(self, Order order)
+    cpdef void update_order(self, Order order)
     cdef void sort_bid_orders(self)
     cdef void sort_ask_orders(self)
     cpdef void delete_order(self, Order order)
     cpdef void iterate(self, uint64_t timestamp_ns)
+    cdef void _index_order(self, Order order, uint64_t seq)
+    cdef tuple _unindex_order(self, ClientOrderId client_order_id)
+    cdef void _reindex_orders(self, list orders)
+    cdef list _sort_orders(self, list orders, bint descending)
 
 # -- MATCHING -------------------------------------------------------------------------------------
 
@@ -81,3 +103,4 @@ cdef class MatchingCore:
 
 
 cdef int64_t order_sort_key(Order order)
+cdef bint order_is_stop(Order order)
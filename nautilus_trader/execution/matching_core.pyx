@@ -13,8 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from bisect import bisect_left
+from bisect import bisect_right
+from bisect import insort
 from typing import Callable
 
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
@@ -27,6 +31,67 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.orders.base cimport Order
 
 
+cdef class PriceLevels:
+    """
+    Provides resting orders indexed by price level, with a FIFO queue of orders
+    at each level.
+
+    Levels are held in ascending price order, so the orders at or beyond a price
+    are found by binary search.
+    """
+
+    def __init__(self):
+        self._keys: list[int] = []  # Sorted raw level prices
+        self._levels: dict[int, dict[ClientOrderId, Order]] = {}
+        self.count = 0
+
+    cdef void add(self, int64_t key, Order order):
+        cdef dict level = self._levels.get(key)
+        if level is None:
+            level = {}
+            self._levels[key] = level
+            insort(self._keys, key)
+
+        level[order.client_order_id] = order
+        self.count += 1
+
+    cdef void remove(self, int64_t key, ClientOrderId client_order_id):
+        cdef dict level = self._levels.get(key)
+        if level is None or level.pop(client_order_id, None) is None:
+            return
+
+        self.count -= 1
+        if not level:
+            del self._levels[key]
+            del self._keys[bisect_left(self._keys, key)]
+
+    cdef void clear(self):
+        self._keys.clear()
+        self._levels.clear()
+        self.count = 0
+
+    cdef list orders(self):
+        cdef list orders = []
+        cdef dict level
+        for level in self._levels.values():
+            orders.extend(level.values())
+        return orders
+
+    cdef list orders_at_or_above(self, int64_t key):
+        cdef list orders = []
+        cdef Py_ssize_t i
+        for i in range(bisect_left(self._keys, key), len(self._keys)):
+            orders.extend((<dict>self._levels[self._keys[i]]).values())
+        return orders
+
+    cdef list orders_at_or_below(self, int64_t key):
+        cdef list orders = []
+        cdef Py_ssize_t i
+        for i in range(bisect_right(self._keys, key)):
+            orders.extend((<dict>self._levels[self._keys[i]]).values())
+        return orders
+
+
 cdef class MatchingCore:
     """
     Provides a generic order matching core.
@@ -43,6 +108,16 @@ cdef class MatchingCore:
         The callable when a market order is filled.
     fill_limit_order : Callable[[Order], None]
         The callable when a limit order is filled.
+
+    Notes
+    -----
+    Resting orders are indexed by price level for each side, separately for orders
+    which match when the market reaches their price (limit and touched orders)
+    and orders which trigger when the market moves through their price (stop orders).
+    Iterating the core then only matches orders with crossed prices.
+
+    An orders price, trigger price or triggered state must not change while it is
+    resting in the core without a subsequent call to `update_order`.
     """
 
     def __init__(
@@ -72,8 +147,12 @@ cdef class MatchingCore:
 
         # Orders
         self._orders: dict[ClientOrderId, Order] = {}
-        self._orders_bid: list[Order] = []
-        self._orders_ask: list[Order] = []
+        self._order_index: dict[ClientOrderId, tuple[PriceLevels, int, int]] = {}
+        self._order_seq = 0
+        self._bid_limits = PriceLevels()
+        self._bid_stops = PriceLevels()
+        self._ask_limits = PriceLevels()
+        self._ask_stops = PriceLevels()
 
     @property
     def instrument_id(self) -> InstrumentId:
@@ -167,13 +246,43 @@ cdef class MatchingCore:
         return client_order_id in self._orders
 
     cpdef list get_orders(self):
-        return self._orders_bid + self._orders_ask
+        """
+        Return all orders in the core, in the order they were added.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        return list(self._orders.values())
 
     cpdef list get_orders_bid(self):
-        return self._orders_bid
+        """
+        Return the bid orders in the core, in price-time priority.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        return self._sort_orders(
+            self._bid_limits.orders() + self._bid_stops.orders(),
+            descending=True,
+        )
 
     cpdef list get_orders_ask(self):
-        return self._orders_ask
+        """
+        Return the ask orders in the core, in price-time priority.
+
+        Returns
+        -------
+        list[Order]
+
+        """
+        return self._sort_orders(
+            self._ask_limits.orders() + self._ask_stops.orders(),
+            descending=False,
+        )
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -191,8 +300,12 @@ cdef class MatchingCore:
 
     cpdef void reset(self):
         self._orders.clear()
-        self._orders_bid.clear()
-        self._orders_ask.clear()
+        self._order_index.clear()
+        self._order_seq = 0
+        self._bid_limits.clear()
+        self._bid_stops.clear()
+        self._ask_limits.clear()
+        self._ask_stops.clear()
         self.bid_raw = 0
         self.ask_raw = 0
         self.last_raw = 0
@@ -207,45 +320,113 @@ cdef class MatchingCore:
         self._add_order(order)
 
     cdef void _add_order(self, Order order):
-        # Index order
+        if order.side != OrderSide.BUY and order.side != OrderSide.SELL:
+            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+
+        # Index order (an order added again keeps its time priority)
         self._orders[order.client_order_id] = order
 
-        if order.side == OrderSide.BUY:
-            self._orders_bid.append(order)
-            self.sort_bid_orders()
-        elif order.side == OrderSide.SELL:
-            self._orders_ask.append(order)
-            self.sort_ask_orders()
+        cdef tuple entry = self._unindex_order(order.client_order_id)
+        cdef uint64_t seq
+        if entry is not None:
+            seq = entry[2]
         else:
-            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+            self._order_seq += 1
+            seq = self._order_seq
+
+        self._index_order(order, seq)
+
+    cpdef void update_order(self, Order order):
+        """
+        Update the price level of the given order, following a change of its
+        price, trigger price or triggered state.
+
+        Parameters
+        ----------
+        order : Order
+            The order to update.
+
+        """
+        Condition.not_none(order, "order")
+
+        cdef tuple entry = self._unindex_order(order.client_order_id)
+        if entry is None:
+            return  # Order not held in the core
+
+        self._index_order(order, entry[2])
 
     cdef void sort_bid_orders(self):
-        self._orders_bid.sort(key=order_sort_key, reverse=True)
+        self._reindex_orders(self._bid_limits.orders() + self._bid_stops.orders())
 
     cdef void sort_ask_orders(self):
-        self._orders_ask.sort(key=order_sort_key)
+        self._reindex_orders(self._ask_limits.orders() + self._ask_stops.orders())
 
     cpdef void delete_order(self, Order order):
         Condition.not_none(order, "order")
 
         self._orders.pop(order.client_order_id, None)
-
-        if order.side == OrderSide.BUY:
-            if order in self._orders_bid:
-                self._orders_bid.remove(order)
-        elif order.side == OrderSide.SELL:
-            if order in self._orders_ask:
-                self._orders_ask.remove(order)
-        else:
-            raise RuntimeError(f"invalid `OrderSide`, was {order.side}")  # pragma: no cover (design-time error)
+        self._unindex_order(order.client_order_id)
 
     cpdef void iterate(self, uint64_t timestamp_ns):
+        cdef list orders_bid = []
+        cdef list orders_ask = []
+
+        # Only orders with crossed prices can be matched
+        if self.is_ask_initialized:
+            orders_bid = self._bid_limits.orders_at_or_above(self.ask_raw)
+            orders_bid += self._bid_stops.orders_at_or_below(self.ask_raw)
+        if self.is_bid_initialized:
+            orders_ask = self._ask_limits.orders_at_or_below(self.bid_raw)
+            orders_ask += self._ask_stops.orders_at_or_above(self.bid_raw)
+
+        cdef list orders = (
+            self._sort_orders(orders_bid, descending=True)
+            + self._sort_orders(orders_ask, descending=False)
+        )
+
         cdef Order order
-        for order in self._orders_bid + self._orders_ask:  # Lists implicitly copied
+        for order in orders:
             if order.is_closed_c():
                 continue  # Orders state has changed since iteration started  # pragma: no cover
             self.match_order(order)
 
+    cdef void _index_order(self, Order order, uint64_t seq):
+        cdef int64_t key = order_sort_key(order)
+        cdef PriceLevels levels
+        if order.side == OrderSide.BUY:
+            levels = self._bid_stops if order_is_stop(order) else self._bid_limits
+        else:
+            levels = self._ask_stops if order_is_stop(order) else self._ask_limits
+
+        levels.add(key, order)
+        self._order_index[order.client_order_id] = (levels, key, seq)
+
+    cdef tuple _unindex_order(self, ClientOrderId client_order_id):
+        cdef tuple entry = self._order_index.pop(client_order_id, None)
+        if entry is not None:
+            (<PriceLevels>entry[0]).remove(entry[1], client_order_id)
+        return entry
+
+    cdef void _reindex_orders(self, list orders):
+        cdef Order order
+        for order in orders:
+            self.update_order(order)
+
+    cdef list _sort_orders(self, list orders, bint descending):
+        if len(orders) < 2:
+            return orders
+
+        # Price-time priority: by price level, then by the sequence orders were added
+        cdef list decorated = []
+        cdef Order order
+        cdef tuple entry
+        for order in orders:
+            entry = self._order_index[order.client_order_id]
+            decorated.append((-entry[1] if descending else entry[1], entry[2], order))
+
+        decorated.sort()
+        return [entry[2] for entry in decorated]
+
 # -- MATCHING -------------------------------------------------------------------------------------
 
     cpdef void match_order(self, Order order, bint initial = False):
@@ -456,3 +637,13 @@ cdef inline int64_t order_sort_key(Order order):
             f"invalid order type to sort in book, "
             f"was {order_type_to_str(order.order_type)}",
         )
+
+
+cdef inline bint order_is_stop(Order order):
+    # Stop orders trigger when the market moves through their price,
+    # all other resting orders match when the market reaches their price.
+    if order.order_type == OrderType.STOP_MARKET or order.order_type == OrderType.TRAILING_STOP_MARKET:
+        return True
+    elif order.order_type == OrderType.STOP_LIMIT or order.order_type == OrderType.TRAILING_STOP_LIMIT:
+        return not order.is_triggered
+    return False
@@ -13,6 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import cython
+import numpy as np
+
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
@@ -106,3 +111,50 @@ cdef class ExponentialMovingAverage(MovingAverage):
 
         self.value = self.alpha * value + ((1.0 - self.alpha) * self.value)
         self._increment_count()
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef np.ndarray update_raw_batch(self, values):
+        """
+        Update the indicator with the given raw values, in order.
+
+        The indicator is left in the same state as if each value had been
+        passed to `update_raw` sequentially.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The update values (one dimensional).
+
+        Returns
+        -------
+        np.ndarray
+            The indicator value following each update.
+
+        """
+        Condition.not_none(values, "values")
+
+        cdef double[::1] values_mv = np.ascontiguousarray(values, dtype=np.float64)
+        cdef Py_ssize_t count = values_mv.shape[0]
+        cdef np.ndarray output = np.empty(count, dtype=np.float64)
+        cdef double[::1] output_mv = output
+
+        cdef double alpha = self.alpha
+        cdef double value = self.value
+        cdef bint has_inputs = self.has_inputs
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(count):
+                # Check if this is the initial input
+                if not has_inputs:
+                    value = values_mv[i]
+                    has_inputs = True
+
+                value = alpha * values_mv[i] + ((1.0 - alpha) * value)
+                output_mv[i] = value
+
+        if count > 0:
+            self.value = value
+            self._increment_count_batch(count)
+
+        return output
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
@@ -28,5 +30,7 @@ cdef class MovingAverage(Indicator):
     """The current output value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double value)
+    cpdef np.ndarray update_raw_batch(self, values)
     cpdef void _increment_count(self)
+    cdef void _increment_count_batch(self, Py_ssize_t count)
     cpdef void _reset_ma(self)
@@ -16,9 +16,14 @@
 from enum import Enum
 from enum import unique
 
+import numpy as np
+
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.model.data cimport Bar
 
 
 @unique
@@ -80,6 +85,60 @@ cdef class MovingAverage(Indicator):
         """
         raise NotImplementedError("method `update_raw` must be implemented in the subclass")  # pragma: no cover
 
+    cpdef np.ndarray update_raw_batch(self, values):
+        """
+        Update the indicator with the given raw values, in order.
+
+        The indicator is left in the same state as if each value had been
+        passed to `update_raw` sequentially.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The update values (one dimensional).
+
+        Returns
+        -------
+        np.ndarray
+            The indicator value following each update.
+
+        """
+        Condition.not_none(values, "values")
+
+        cdef double[::1] values_mv = np.ascontiguousarray(values, dtype=np.float64)
+        cdef Py_ssize_t count = values_mv.shape[0]
+        cdef np.ndarray output = np.empty(count, dtype=np.float64)
+        cdef double[::1] output_mv = output
+
+        # Generic implementation (override with a vectorized version where possible)
+        cdef Py_ssize_t i
+        for i in range(count):
+            self.update_raw(values_mv[i])
+            output_mv[i] = self.value
+
+        return output
+
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars, in order.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars to handle.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef Py_ssize_t count = len(bars)
+        cdef np.ndarray closes = np.empty(count, dtype=np.float64)
+        cdef double[::1] closes_mv = closes
+        cdef Py_ssize_t i
+        for i in range(count):
+            closes_mv[i] = (<Bar>bars[i]).close.as_double()
+
+        self.update_raw_batch(closes)
+
     cpdef void _increment_count(self):
         self.count += 1
 
@@ -89,6 +148,18 @@ cdef class MovingAverage(Indicator):
             if self.count >= self.period:
                 self._set_initialized(True)
 
+    cdef void _increment_count_batch(self, Py_ssize_t count):
+        if count <= 0:
+            return
+
+        self.count += count
+
+        # Initialization logic
+        if not self.initialized:
+            self._set_has_inputs(True)
+            if self.count >= self.period:
+                self._set_initialized(True)
+
     cpdef void _reset(self):
         self._reset_ma()
         self.count = 0
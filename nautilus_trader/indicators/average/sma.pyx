@@ -15,8 +15,11 @@
 
 from collections import deque
 
+import cython
 import numpy as np
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.core.stats cimport fast_mean
@@ -109,5 +112,58 @@ cdef class SimpleMovingAverage(MovingAverage):
         self.value = fast_mean(np.asarray(self._inputs, dtype=np.float64))
         self._increment_count()
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef np.ndarray update_raw_batch(self, values):
+        """
+        Update the indicator with the given raw values, in order.
+
+        The indicator is left in the same state as if each value had been
+        passed to `update_raw` sequentially.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The update values (one dimensional).
+
+        Returns
+        -------
+        np.ndarray
+            The indicator value following each update.
+
+        """
+        Condition.not_none(values, "values")
+
+        cdef np.ndarray new_inputs = np.ascontiguousarray(values, dtype=np.float64)
+        cdef Py_ssize_t count = len(new_inputs)
+        cdef Py_ssize_t prior = len(self._inputs)
+        cdef np.ndarray inputs = np.concatenate(
+            (np.asarray(self._inputs, dtype=np.float64), new_inputs),
+        )
+        cdef double[::1] inputs_mv = inputs
+        cdef np.ndarray output = np.empty(count, dtype=np.float64)
+        cdef double[::1] output_mv = output
+
+        # Sum each window in the same order as `fast_mean` for identical results
+        cdef Py_ssize_t period = self.period
+        cdef Py_ssize_t i, j, end, start
+        cdef double total
+        with nogil:
+            for i in range(count):
+                end = prior + i + 1
+                start = end - period if end > period else 0
+                total = 0.0
+                for j in range(start, end):
+                    total += inputs_mv[j]
+                output_mv[i] = total / (end - start)
+
+        if count > 0:
+            self._inputs.clear()
+            self._inputs.extend(inputs[-period:].tolist())
+            self.value = output_mv[count - 1]
+            self._increment_count_batch(count)
+
+        return output
+
     cpdef void _reset_ma(self):
         self._inputs.clear()
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -57,6 +58,22 @@ cdef class Indicator:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError(f"Cannot handle {repr(bar)}: method `handle_bar` not implemented in subclass")  # pragma: no cover
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars, in order.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars to handle.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef Bar bar
+        for bar in bars:
+            self.handle_bar(bar)
+
     cpdef void reset(self):
         """
         Reset the indicator.
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
 
@@ -32,3 +34,4 @@ cdef class BollingerBands(Indicator):
     """The current value of the lower band.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low, double close)
+    cpdef tuple update_raw_batch(self, high, low, close)
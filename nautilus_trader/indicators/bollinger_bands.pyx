@@ -15,11 +15,15 @@
 
 from collections import deque
 
+import cython
 import numpy as np
 
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+from libc.math cimport sqrt
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.stats cimport fast_std_with_mean
 from nautilus_trader.indicators.base.indicator cimport Indicator
@@ -122,6 +126,35 @@ cdef class BollingerBands(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars, in order.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The update bars to handle.
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef Py_ssize_t count = len(bars)
+        cdef np.ndarray highs = np.empty(count, dtype=np.float64)
+        cdef np.ndarray lows = np.empty(count, dtype=np.float64)
+        cdef np.ndarray closes = np.empty(count, dtype=np.float64)
+        cdef double[::1] highs_mv = highs
+        cdef double[::1] lows_mv = lows
+        cdef double[::1] closes_mv = closes
+        cdef Py_ssize_t i
+        cdef Bar bar
+        for i in range(count):
+            bar = bars[i]
+            highs_mv[i] = bar.high.as_double()
+            lows_mv[i] = bar.low.as_double()
+            closes_mv[i] = bar.close.as_double()
+
+        self.update_raw_batch(highs, lows, closes)
+
     cpdef void update_raw(self, double high, double low, double close):
         """
         Update the indicator with the given prices.
@@ -159,6 +192,88 @@ cdef class BollingerBands(Indicator):
         self.middle = self._ma.value
         self.lower = self._ma.value - (self.k * std)
 
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cpdef tuple update_raw_batch(self, high, low, close):
+        """
+        Update the indicator with the given price arrays, in order.
+
+        The indicator is left in the same state as if each set of prices had
+        been passed to `update_raw` sequentially.
+
+        Parameters
+        ----------
+        high : np.ndarray
+            The high prices for calculations.
+        low : np.ndarray
+            The low prices for calculations.
+        close : np.ndarray
+            The closing prices for calculations.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The upper, middle and lower band values following each update.
+
+        """
+        Condition.not_none(high, "high")
+        Condition.not_none(low, "low")
+        Condition.not_none(close, "close")
+
+        cdef np.ndarray typical = (
+            np.asarray(high, dtype=np.float64)
+            + np.asarray(low, dtype=np.float64)
+            + np.asarray(close, dtype=np.float64)
+        ) / 3.0
+        Condition.equal(typical.ndim, 1, "typical.ndim", "1")
+
+        cdef np.ndarray middle = np.ascontiguousarray(self._ma.update_raw_batch(typical))
+        cdef Py_ssize_t count = len(typical)
+        cdef Py_ssize_t prior = len(self._prices)
+        cdef np.ndarray prices = np.concatenate(
+            (np.asarray(self._prices, dtype=np.float64), typical),
+        )
+        cdef np.ndarray upper = np.empty(count, dtype=np.float64)
+        cdef np.ndarray lower = np.empty(count, dtype=np.float64)
+        cdef double[::1] prices_mv = prices
+        cdef double[::1] middle_mv = middle
+        cdef double[::1] upper_mv = upper
+        cdef double[::1] lower_mv = lower
+
+        # Deviation of each window in the same order as `fast_std_with_mean`
+        cdef Py_ssize_t period = self.period
+        cdef double k = self.k
+        cdef Py_ssize_t i, j, end, start
+        cdef double mean, diff, total, std
+        with nogil:
+            for i in range(count):
+                end = prior + i + 1
+                start = end - period if end > period else 0
+                mean = middle_mv[i]
+                total = 0.0
+                for j in range(start, end):
+                    diff = prices_mv[j] - mean
+                    total += diff * diff
+                std = sqrt(total / (end - start))
+                upper_mv[i] = mean + (k * std)
+                lower_mv[i] = mean - (k * std)
+
+        if count > 0:
+            self._prices.clear()
+            self._prices.extend(prices[-period:].tolist())
+
+            # Initialization logic
+            if not self.initialized:
+                self._set_has_inputs(True)
+                if len(self._prices) >= self.period:
+                    self._set_initialized(True)
+
+            self.upper = upper_mv[count - 1]
+            self.middle = middle_mv[count - 1]
+            self.lower = lower_mv[count - 1]
+
+        return upper, middle, lower
+
     cpdef void _reset(self):
         self._ma.reset()
         self._prices.clear()
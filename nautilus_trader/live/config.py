@@ -42,10 +42,14 @@ class LiveDataEngineConfig(DataEngineConfig, frozen=True):
     ----------
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    catalog_chunk_size : PositiveInt, default 10_000
+        The maximum number of data points per response when streaming catalog
+        request results back to the requester.
 
     """
 
     qsize: PositiveInt = 100_000
+    catalog_chunk_size: PositiveInt = 10_000
 
 
 class LiveRiskEngineConfig(RiskEngineConfig, frozen=True):
@@ -210,6 +214,8 @@ class TradingNodeConfig(NautilusKernelConfig, frozen=True):
         The live risk engine configuration.
     exec_engine : LiveExecEngineConfig, optional
         The live execution engine configuration.
+    portfolio : PortfolioConfig, optional
+        The portfolio configuration.
     data_clients : dict[str, ImportableConfig | LiveDataClientConfig], optional
         The data client configurations.
     exec_clients : dict[str, ImportableConfig | LiveExecClientConfig], optional
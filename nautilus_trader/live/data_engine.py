@@ -23,10 +23,13 @@ from nautilus_trader.common.component import MessageBus
 from nautilus_trader.config import LiveDataEngineConfig
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.core.data import Data
+from nautilus_trader.core.inspect import is_nautilus_class
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.data.messages import DataCommand
 from nautilus_trader.data.messages import DataRequest
 from nautilus_trader.data.messages import DataResponse
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.instruments import Instrument
 
 
 class LiveDataEngine(DataEngine):
@@ -74,6 +77,7 @@ class LiveDataEngine(DataEngine):
         )
 
         self._loop: asyncio.AbstractEventLoop = loop
+        self._catalog_chunk_size: int = config.catalog_chunk_size
         self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._req_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._res_queue: asyncio.Queue = Queue(maxsize=config.qsize)
@@ -378,6 +382,89 @@ class LiveDataEngine(DataEngine):
         # This will stop the queues processing as soon as they see the sentinel message
         self._enqueue_sentinels()
 
+    def _query_catalog(self, request: DataRequest) -> None:
+        # Run the query on the default executor so the event loop is never blocked,
+        # with the results streamed back to the requester in chunks
+        ts_start, ts_end = self._catalog_time_range(request)
+
+        if request.data_type.type == Bar and request.data_type.metadata.get("bar_type") is None:
+            self._log.error("No bar type provided for bars request")
+            return
+
+        self._loop.run_in_executor(
+            None,
+            self._stream_catalog_query,
+            request,
+            ts_start,
+            ts_end,
+        )
+
+    def _stream_catalog_query(self, request: DataRequest, ts_start: int, ts_end: int) -> None:
+        # Runs on an executor thread: each chunk is handed back to the event loop, holding
+        # back the latest chunk so that the final response always carries data (if any)
+        previous: list = []
+        try:
+            for chunk in self._query_catalog_chunks(request, ts_start, ts_end):
+                if previous:
+                    self._loop.call_soon_threadsafe(
+                        self._handle_catalog_chunk,
+                        request,
+                        previous,
+                        False,
+                    )
+                previous = chunk
+        except Exception as e:
+            self._log.exception(f"Error querying catalog for {request}", e)
+            previous = []
+
+        self._loop.call_soon_threadsafe(self._handle_catalog_chunk, request, previous, True)
+
+    def _query_catalog_chunks(self, request: DataRequest, ts_start: int, ts_end: int):
+        data_type = request.data_type
+
+        if data_type.type == Instrument:
+            instrument_id = data_type.metadata.get("instrument_id")
+            if instrument_id is None:
+                yield self._catalog.instruments()
+            else:
+                yield self._catalog.instruments(instrument_ids=[str(instrument_id)])
+            return
+
+        if not is_nautilus_class(data_type.type):
+            # Custom data is filtered by its metadata only
+            yield from self._catalog.query_chunks(
+                data_cls=data_type.type,
+                start=ts_start,
+                end=ts_end,
+                chunk_size=self._catalog_chunk_size,
+                metadata=data_type.metadata,
+            )
+            return
+
+        instrument_ids: list[str] | None = None
+        bar_types: list[str] | None = None
+        if data_type.type == Bar:
+            bar_type = data_type.metadata["bar_type"]
+            instrument_ids = [str(bar_type.instrument_id)]
+            bar_types = [str(bar_type)]
+        elif data_type.metadata.get("instrument_id") is not None:
+            instrument_ids = [str(data_type.metadata["instrument_id"])]
+
+        yield from self._catalog.query_chunks(
+            data_cls=data_type.type,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=ts_start,
+            end=ts_end,
+            chunk_size=self._catalog_chunk_size,
+        )
+
+    def _handle_catalog_chunk(self, request: DataRequest, data: list, is_final: bool) -> None:
+        try:
+            self._handle_catalog_data(request, data, is_final)
+        except RuntimeError as e:
+            self._log.error(f"RuntimeError: {e}")
+
     async def _run_cmd_queue(self) -> None:
         self._log.debug(
             f"DataCommand message queue processing starting (qsize={self.cmd_qsize()})",
@@ -789,7 +789,7 @@ class LiveExecutionEngine(ExecutionEngine):
         report: FillReport,
         instrument: Instrument,
     ) -> bool:
-        if report.trade_id in order.trade_ids:
+        if order.has_trade_id(report.trade_id):
             return True  # Fill already applied (assumes consistent trades)
         try:
             self._generate_order_filled(order, report, instrument)
@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 from dataclasses import field
+from functools import cached_property
 
 import numpy as np
 
@@ -106,6 +107,165 @@ class PortfolioGreeks(Data):
         )
 
 
+@customdataclass
+class OptionChainGreeks(Data):
+    """
+    Represents the Greeks for a whole option chain of an underlying.
+
+    Each array attribute holds one value per option of the chain, ordered as
+    `instrument_ids`, so a chain is computed, published and cached as one object
+    rather than one `GreeksData` per option.
+
+    Attributes:
+        underlying (str): The underlying symbol of the chain (such as "ESZ4").
+        underlying_price (float): The underlying price the Greeks were computed for.
+        instrument_ids (np.ndarray): The option instrument IDs.
+        is_call, strike, expiry, expiry_in_years, interest_rate, vol, price,
+        delta, gamma, vega, theta, itm_prob (np.ndarray): The per option values,
+        as for `GreeksData`.
+
+    """
+
+    underlying: str = ""
+    underlying_price: float = 0.0
+    instrument_ids: np.ndarray = field(default_factory=lambda: np.array([], dtype=object))
+    is_call: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.bool_))
+    strike: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    expiry: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.int64))
+    expiry_in_years: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    interest_rate: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    vol: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    price: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    delta: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    gamma: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    vega: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    theta: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+    itm_prob: np.ndarray = field(default_factory=lambda: np.array([], dtype=np.float64))
+
+    def __repr__(self):
+        return (
+            f"OptionChainGreeks(underlying={self.underlying}, "
+            f"underlying_price={self.underlying_price}, options={len(self)}, "
+            f"ts_event={unix_nanos_to_str(self.ts_event)}, ts_init={unix_nanos_to_str(self.ts_init)})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.instrument_ids)
+
+    def index(self, instrument_id: InstrumentId) -> int | None:
+        """
+        Return the position of the given option in the chain arrays (if found).
+        """
+        return self._index_map.get(instrument_id)
+
+    @cached_property
+    def _index_map(self) -> dict[InstrumentId, int]:
+        return {x: i for i, x in enumerate(self.instrument_ids)}
+
+    def greeks(self, instrument_id: InstrumentId) -> GreeksData | None:
+        """
+        Return the Greeks for the given option of the chain (if found).
+        """
+        i = self.index(instrument_id)
+        if i is None:
+            return None
+
+        return GreeksData(
+            self._ts_event,
+            self._ts_init,
+            instrument_id,
+            bool(self.is_call[i]),
+            float(self.strike[i]),
+            int(self.expiry[i]),
+            self.underlying_price,
+            float(self.expiry_in_years[i]),
+            float(self.interest_rate[i]),
+            float(self.vol[i]),
+            float(self.price[i]),
+            float(self.delta[i]),
+            float(self.gamma[i]),
+            float(self.vega[i]),
+            float(self.theta[i]),
+            1.0,
+            float(self.itm_prob[i]),
+        )
+
+    def portfolio_greeks(self, quantities: dict[InstrumentId, float]) -> PortfolioGreeks:
+        """
+        Return the Greeks of the given option quantities aggregated over the chain.
+
+        Options not found in the chain are ignored.
+        """
+        indexes = []
+        weights = []
+        for instrument_id, quantity in quantities.items():
+            i = self.index(instrument_id)
+            if i is not None:
+                indexes.append(i)
+                weights.append(quantity)
+
+        weights = np.asarray(weights, dtype=np.float64)
+
+        return PortfolioGreeks(
+            self._ts_event,
+            self._ts_init,
+            float(weights @ self.delta[indexes]),
+            float(weights @ self.gamma[indexes]),
+            float(weights @ self.vega[indexes]),
+            float(weights @ self.theta[indexes]),
+        )
+
+    def to_dict(self, to_arrow=False):
+        result = {
+            "underlying": self.underlying,
+            "underlying_price": self.underlying_price,
+            "instrument_ids": "\n".join(x.value for x in self.instrument_ids).encode(),
+            "type": "OptionChainGreeks",
+            "ts_event": self._ts_event,
+            "ts_init": self._ts_init,
+        }
+
+        for attr in _OPTION_CHAIN_ARRAY_DTYPES:
+            result[attr] = np.ascontiguousarray(getattr(self, attr)).tobytes()
+
+        if to_arrow:
+            result["date"] = int(unix_nanos_to_dt(result["ts_event"]).strftime("%Y%m%d"))
+
+        return result
+
+    @classmethod
+    def from_dict(cls, data):
+        data.pop("type", None)
+        data.pop("date", None)
+
+        instrument_ids = data["instrument_ids"].decode()
+        data["instrument_ids"] = np.array(
+            [InstrumentId.from_str(x) for x in instrument_ids.split("\n")] if instrument_ids else [],
+            dtype=object,
+        )
+
+        for attr, dtype in _OPTION_CHAIN_ARRAY_DTYPES.items():
+            data[attr] = np.frombuffer(data[attr], dtype=dtype)
+
+        return OptionChainGreeks(**data)
+
+
+_OPTION_CHAIN_ARRAY_DTYPES = {
+    "is_call": np.bool_,
+    "strike": np.float64,
+    "expiry": np.int64,
+    "expiry_in_years": np.float64,
+    "interest_rate": np.float64,
+    "vol": np.float64,
+    "price": np.float64,
+    "delta": np.float64,
+    "gamma": np.float64,
+    "vega": np.float64,
+    "theta": np.float64,
+    "itm_prob": np.float64,
+}
+
+
 @customdataclass
 class InterestRateData(Data):
     """
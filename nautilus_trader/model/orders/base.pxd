@@ -57,8 +57,12 @@ cdef set[OrderStatus] LOCAL_ACTIVE_ORDER_STATUS
 
 cdef class Order:
     cdef list _events
+    cdef set _event_ids
+    cdef int _event_count
+    cdef int _event_capacity
     cdef list _venue_order_ids
     cdef list _trade_ids
+    cdef set _trade_ids_index
     cdef dict _commissions
     cdef FiniteStateMachine _fsm
     cdef OrderStatus _previous_status
@@ -147,6 +151,8 @@ cdef class Order:
     cdef list venue_order_ids_c(self)
     cdef list trade_ids_c(self)
     cdef int event_count_c(self)
+    cdef bint has_event_c(self, UUID4 event_id)
+    cdef bint has_trade_id_c(self, TradeId trade_id)
     cdef str status_string_c(self)
     cdef str type_string_c(self)
     cdef str side_string_c(self)
@@ -181,7 +187,16 @@ cdef class Order:
     cpdef bint would_reduce_only(self, PositionSide position_side, Quantity position_qty)
     cpdef list commissions(self)
 
+    cpdef bint has_event(self, UUID4 event_id)
+    cpdef bint has_trade_id(self, TradeId trade_id)
+    cpdef void set_event_capacity(self, int capacity)
     cpdef void apply(self, OrderEvent event)
+    cpdef void apply_events(self, list events)
+
+    cdef dict state_c(self)
+    cdef void restore_state_c(self, dict state, list events)
+    cdef void _apply(self, OrderEvent event)
+    cdef void _compact_events(self)
 
     cdef void _denied(self, OrderDenied event)
     cdef void _submitted(self, OrderSubmitted event)
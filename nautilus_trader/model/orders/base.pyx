@@ -161,8 +161,12 @@ cdef class Order:
         Condition.positive(init.quantity, "init.quantity")
 
         self._events: list[OrderEvent] = [init]
+        self._event_ids: set[UUID4] = {init.id}
+        self._event_count = 1
+        self._event_capacity = 0  # No compaction
         self._venue_order_ids: list[VenueOrderId] = []
         self._trade_ids: list[TradeId] = []
+        self._trade_ids_index: set[TradeId] = set()
         self._commissions: dict[Currency, Money] = {}
         self._fsm = FiniteStateMachine(
             state_transition_table=_ORDER_STATE_TABLE,
@@ -336,7 +340,13 @@ cdef class Order:
         return self._trade_ids.copy()
 
     cdef int event_count_c(self):
-        return len(self._events)
+        return self._event_count
+
+    cdef bint has_event_c(self, UUID4 event_id):
+        return event_id in self._event_ids
+
+    cdef bint has_trade_id_c(self, TradeId trade_id):
+        return trade_id in self._trade_ids_index
 
     cdef str status_string_c(self):
         return self._fsm.state_string_c()
@@ -494,6 +504,11 @@ cdef class Order:
         -------
         list[OrderEvent]
 
+        Notes
+        -----
+        If event compaction is enabled then only the initialization event and
+        the most recent events are retained.
+
         """
         return self.events_c()
 
@@ -514,6 +529,9 @@ cdef class Order:
         """
         Return the trade match IDs.
 
+        Only the most recent trade match IDs are retained when event
+        compaction is enabled (see `set_event_capacity`).
+
         Returns
         -------
         list[TradeId]
@@ -530,6 +548,10 @@ cdef class Order:
         -------
         int
 
+        Notes
+        -----
+        Includes any events dropped from the history by event compaction.
+
         """
         return self.event_count_c()
 
@@ -930,6 +952,73 @@ cdef class Order:
         """
         return sorted(self._commissions.values())
 
+    cpdef bint has_event(self, UUID4 event_id):
+        """
+        Return a value indicating whether an event with the given ID has been
+        applied to the order.
+
+        Parameters
+        ----------
+        event_id : UUID4
+            The event ID to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        Condition.not_none(event_id, "event_id")
+
+        return self.has_event_c(event_id)
+
+    cpdef bint has_trade_id(self, TradeId trade_id):
+        """
+        Return a value indicating whether a fill with the given trade match ID
+        has been applied to the order.
+
+        Parameters
+        ----------
+        trade_id : TradeId
+            The trade match ID to check.
+
+        Returns
+        -------
+        bool
+
+        """
+        Condition.not_none(trade_id, "trade_id")
+
+        return self.has_trade_id_c(trade_id)
+
+    cpdef void set_event_capacity(self, int capacity):
+        """
+        Set the maximum number of events retained in the order event history.
+
+        When the capacity is exceeded the oldest events (after the
+        initialization event) are dropped, along with their event IDs. The
+        fill trade match IDs are bounded to the same capacity, so duplicate
+        detection only covers the retained events and most recent fills. The
+        order state and aggregates (status, filled quantity, average price,
+        commissions etc.) are unaffected.
+
+        Parameters
+        ----------
+        capacity : int
+            The event capacity (including the initialization event), zero to
+            retain the full history.
+
+        Raises
+        ------
+        ValueError
+            If `capacity` is negative (< 0) or one.
+
+        """
+        Condition.not_negative_int(capacity, "capacity")
+        Condition.is_true(capacity != 1, "`capacity` must retain at least the initialization and last events")
+
+        self._event_capacity = capacity
+        self._compact_events()
+
     cpdef void apply(self, OrderEvent event):
         """
         Apply the given order event to the order.
@@ -952,6 +1041,47 @@ cdef class Order:
 
         """
         Condition.not_none(event, "event")
+
+        self._apply(event)
+        self._compact_events()
+
+    cpdef void apply_events(self, list events):
+        """
+        Apply the given order events to the order in sequence.
+
+        Event compaction (if enabled) is performed once after all events
+        have been applied.
+
+        Parameters
+        ----------
+        events : list[OrderEvent]
+            The order events to apply.
+
+        Raises
+        ------
+        ValueError
+            If an event is not valid for the order (see `apply`).
+        InvalidStateTrigger
+            If an event is not a valid trigger from the current `order.status`.
+        KeyError
+            If an event is `OrderFilled` and `event.trade_id` already applied to the order.
+
+        Warnings
+        --------
+        Any events prior to an event which raises will remain applied.
+
+        """
+        Condition.not_none(events, "events")
+
+        cdef OrderEvent event
+        try:
+            for event in events:
+                Condition.not_none(event, "event")
+                self._apply(event)
+        finally:
+            self._compact_events()
+
+    cdef void _apply(self, OrderEvent event):
         Condition.equal(event.client_order_id, self.client_order_id, "event.client_order_id", "self.client_order_id")
         if self.venue_order_id is not None and event.venue_order_id is not None and not isinstance(event, OrderUpdated):
             Condition.equal(self.venue_order_id, event.venue_order_id, "self.venue_order_id", "event.venue_order_id")
@@ -1016,7 +1146,7 @@ cdef class Order:
             if self.venue_order_id is None:
                 self.venue_order_id = event.venue_order_id
             else:
-                Condition.not_in(event.trade_id, self._trade_ids, "event.trade_id", "_trade_ids")
+                Condition.not_in(event.trade_id, self._trade_ids_index, "event.trade_id", "_trade_ids")
             # Fill order
             self._filled(event)
         else:
@@ -1029,8 +1159,101 @@ cdef class Order:
             self._previous_status = previous_status
 
         self._events.append(event)
+        self._event_ids.add(event.id)
+        self._event_count += 1
         self.ts_last = event.ts_event
 
+    cdef void _compact_events(self):
+        if self._event_capacity == 0:
+            return
+
+        cdef OrderEvent event
+        cdef TradeId trade_id
+        cdef int excess = len(self._events) - self._event_capacity
+        if excess > 0:
+            # Retain the initialization event at index 0
+            for event in self._events[1:excess + 1]:
+                self._event_ids.discard(event.id)
+            del self._events[1:excess + 1]
+
+        excess = len(self._trade_ids) - self._event_capacity
+        if excess > 0:
+            for trade_id in self._trade_ids[:excess]:
+                self._trade_ids_index.discard(trade_id)
+            del self._trade_ids[:excess]
+
+    cdef dict state_c(self):
+        # The mutable state of the order, used with `restore_state_c` to
+        # restore the order from a cache snapshot without re-applying its events.
+        # Event and trade IDs are rebuilt from the events, so are not included.
+        cdef VenueOrderId venue_order_id
+        cdef Money commission
+        return {
+            "status": self._fsm.state,
+            "previous_status": self._previous_status,
+            "triggered_price": str(self._triggered_price) if self._triggered_price is not None else None,
+            "event_count": self._event_count,
+            "venue_order_ids": [venue_order_id.to_str() for venue_order_id in self._venue_order_ids],
+            "commissions": [str(commission) for commission in self._commissions.values()],
+            "strategy_id": self.strategy_id.to_str(),
+            "venue_order_id": self.venue_order_id.to_str() if self.venue_order_id is not None else None,
+            "position_id": self.position_id.to_str() if self.position_id is not None else None,
+            "account_id": self.account_id.to_str() if self.account_id is not None else None,
+            "last_trade_id": self.last_trade_id.to_str() if self.last_trade_id is not None else None,
+            "liquidity_side": self.liquidity_side,
+            "quantity": str(self.quantity),
+            "filled_qty": str(self.filled_qty),
+            "leaves_qty": str(self.leaves_qty),
+            "avg_px": self.avg_px,
+            "slippage": self.slippage,
+            "emulation_trigger": self.emulation_trigger,
+            "ts_last": self.ts_last,
+        }
+
+    cdef void restore_state_c(self, dict state, list events):
+        # Restores the state from `state_c` onto an order created from its
+        # initialization event, along with the `events` the state was taken
+        # after (starting with the initialization event), which are not re-applied.
+        cdef str value
+        cdef Money commission
+        cdef OrderEvent event
+        self._fsm.state = state["status"]
+        self._previous_status = <OrderStatus>state["previous_status"]
+        value = state["triggered_price"]
+        self._triggered_price = Price.from_str_c(value) if value is not None else None
+        self._event_count = state["event_count"]
+        self._events = list(events)
+        self._event_ids = set()
+        self._trade_ids = []
+        for event in events:
+            self._event_ids.add(event.id)
+            if isinstance(event, OrderFilled):
+                self._trade_ids.append((<OrderFilled>event).trade_id)
+        self._trade_ids_index = set(self._trade_ids)
+        self._venue_order_ids = [VenueOrderId(value) for value in state["venue_order_ids"]]
+        self._commissions = {}
+        for value in state["commissions"]:
+            commission = Money.from_str_c(value)
+            self._commissions[commission.currency] = commission
+
+        self.strategy_id = StrategyId(state["strategy_id"])
+        value = state["venue_order_id"]
+        self.venue_order_id = VenueOrderId(value) if value is not None else None
+        value = state["position_id"]
+        self.position_id = PositionId(value) if value is not None else None
+        value = state["account_id"]
+        self.account_id = AccountId(value) if value is not None else None
+        value = state["last_trade_id"]
+        self.last_trade_id = TradeId(value) if value is not None else None
+        self.liquidity_side = <LiquiditySide>state["liquidity_side"]
+        self.quantity = Quantity.from_str_c(state["quantity"])
+        self.filled_qty = Quantity.from_str_c(state["filled_qty"])
+        self.leaves_qty = Quantity.from_str_c(state["leaves_qty"])
+        self.avg_px = state["avg_px"]
+        self.slippage = state["slippage"]
+        self.emulation_trigger = <TriggerType>state["emulation_trigger"]
+        self.ts_last = state["ts_last"]
+
     cdef void _denied(self, OrderDenied event):
         pass  # Do nothing else
 
@@ -1067,6 +1290,7 @@ cdef class Order:
         self.position_id = fill.position_id
         self.strategy_id = fill.strategy_id
         self._trade_ids.append(fill.trade_id)
+        self._trade_ids_index.add(fill.trade_id)
         self.last_trade_id = fill.trade_id
         cdef uint64_t raw_filled_qty = self.filled_qty._mem.raw + fill.last_qty._mem.raw
         cdef int64_t raw_leaves_qty = self.quantity._mem.raw - raw_filled_qty
@@ -1111,3 +1335,8 @@ cdef class Order:
             # Insert each event to the beginning of the events list in reverse
             # to preserve correct order of events.
             transformed._events.insert(0, event)
+
+        transformed._event_ids.update(original._event_ids)
+        transformed._event_count += original._event_count
+        transformed._event_capacity = original._event_capacity
+        transformed._compact_events()
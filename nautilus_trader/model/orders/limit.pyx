@@ -207,6 +207,17 @@ cdef class LimitOrder(Order):
         self.expire_time_ns = expire_time_ns
         self.display_qty = display_qty
 
+    cdef dict state_c(self):
+        cdef dict state = Order.state_c(self)
+        state["price"] = str(self.price) if self.price is not None else None
+        return state
+
+    cdef void restore_state_c(self, dict state, list events):
+        cdef str value
+        Order.restore_state_c(self, state, events)
+        value = state["price"]
+        self.price = Price.from_str_c(value) if value is not None else None
+
     cdef void _updated(self, OrderUpdated event):
         if self.venue_order_id is not None and event.venue_order_id is not None and self.venue_order_id != event.venue_order_id:
             self._venue_order_ids.append(self.venue_order_id)
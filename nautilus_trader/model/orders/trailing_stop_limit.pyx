@@ -238,6 +238,24 @@ cdef class TrailingStopLimitOrder(Order):
         self.is_triggered = False
         self.ts_triggered = 0
 
+    cdef dict state_c(self):
+        cdef dict state = Order.state_c(self)
+        state["price"] = str(self.price) if self.price is not None else None
+        state["trigger_price"] = str(self.trigger_price) if self.trigger_price is not None else None
+        state["is_triggered"] = self.is_triggered
+        state["ts_triggered"] = self.ts_triggered
+        return state
+
+    cdef void restore_state_c(self, dict state, list events):
+        cdef str value
+        Order.restore_state_c(self, state, events)
+        value = state["price"]
+        self.price = Price.from_str_c(value) if value is not None else None
+        value = state["trigger_price"]
+        self.trigger_price = Price.from_str_c(value) if value is not None else None
+        self.is_triggered = state["is_triggered"]
+        self.ts_triggered = state["ts_triggered"]
+
     cdef void _updated(self, OrderUpdated event):
         if self.venue_order_id is not None and event.venue_order_id is not None and self.venue_order_id != event.venue_order_id:
             self._venue_order_ids.append(self.venue_order_id)
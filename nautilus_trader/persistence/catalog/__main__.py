@@ -0,0 +1,104 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import click
+
+from nautilus_trader.common.config import resolve_path
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+
+@click.group()
+def main() -> None:
+    pass
+
+
+@main.command(name="rebuild-index")
+@click.option("--uri", required=True, help="The catalog URI (a local path or an fsspec url)")
+@click.option(
+    "--data-cls",
+    help="The data class path to rebuild the index for, such as `nautilus_trader.model.data:QuoteTick` (all data types if not given)",
+)
+def rebuild_index(
+    uri: str,
+    data_cls: str | None = None,
+) -> None:
+    catalog = ParquetDataCatalog.from_uri(uri)
+    catalog.rebuild_index(data_cls=resolve_path(data_cls) if data_cls else None)
+
+
+@main.command(name="ingest")
+@click.option("--uri", required=True, help="The catalog URI (a local path or an fsspec url)")
+@click.option(
+    "--source",
+    "sources",
+    required=True,
+    multiple=True,
+    type=click.Path(exists=True),
+    help="A data file, or a directory searched recursively for data files (can be repeated)",
+)
+@click.option(
+    "--format",
+    "file_format",
+    required=True,
+    type=click.Choice(["tardis", "databento"]),
+    help="The format of the data files",
+)
+@click.option(
+    "--data-type",
+    help="The Tardis data type of the files, such as `incremental_book_L2` (Tardis only)",
+)
+@click.option("--price-precision", type=int, help="The price precision for parsing (Tardis only)")
+@click.option("--size-precision", type=int, help="The size precision for parsing (Tardis only)")
+@click.option("--instrument-id", help="The instrument ID to override in the data")
+@click.option("--pattern", help="The glob pattern for data files in directories")
+@click.option("--max-workers", type=int, help="The maximum number of worker processes")
+@click.option("--name", default="default", help="The name of the progress manifest")
+def ingest(
+    uri: str,
+    sources: tuple[str, ...],
+    file_format: str,
+    data_type: str | None = None,
+    price_precision: int | None = None,
+    size_precision: int | None = None,
+    instrument_id: str | None = None,
+    pattern: str | None = None,
+    max_workers: int | None = None,
+    name: str = "default",
+) -> None:
+    from nautilus_trader.model.identifiers import InstrumentId
+    from nautilus_trader.persistence.ingest import CatalogIngester
+
+    instrument = InstrumentId.from_str(instrument_id) if instrument_id else None
+    if file_format == "tardis":
+        from nautilus_trader.adapters.tardis.loaders import TardisIngestLoader
+
+        if data_type is None or price_precision is None or size_precision is None:
+            raise click.UsageError(
+                "Tardis ingestion requires --data-type, --price-precision and --size-precision",
+            )
+        loader = TardisIngestLoader(data_type, price_precision, size_precision, instrument)
+    else:
+        from nautilus_trader.adapters.databento.loaders import DatabentoIngestLoader
+
+        loader = DatabentoIngestLoader(instrument)
+
+    catalog = ParquetDataCatalog.from_uri(uri)
+    ingester = CatalogIngester(catalog, loader, max_workers=max_workers, name=name)
+    results = ingester.ingest(list(sources), pattern=pattern, raise_exception=True)
+    click.echo(f"Ingested {len(results)} file(s) ({sum(r.num_rows for r in results)} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import heapq
 import itertools
 import os
 import pathlib
@@ -22,6 +23,7 @@ import platform
 from collections import defaultdict
 from collections.abc import Callable
 from collections.abc import Generator
+from collections.abc import Iterator
 from itertools import groupby
 from os import PathLike
 from pathlib import Path
@@ -30,6 +32,7 @@ from typing import Any, NamedTuple
 import fsspec
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as pds
 import pyarrow.parquet as pq
 from fsspec.implementations.local import make_path_posix
@@ -55,6 +58,7 @@ from nautilus_trader.model.data import OrderBookDepth10
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.data import capsule_to_list
+from nautilus_trader.model.enums import RecordFlag
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
 from nautilus_trader.persistence.funcs import class_to_filename
@@ -66,6 +70,15 @@ from nautilus_trader.serialization.arrow.serializer import list_schemas
 
 TimestampLike = int | str | float
 
+_RUST_QUERY_TYPES = (
+    OrderBookDelta,
+    OrderBookDeltas,
+    OrderBookDepth10,
+    QuoteTick,
+    TradeTick,
+    Bar,
+)
+
 
 class FeatherFile(NamedTuple):
     path: str
@@ -74,6 +87,59 @@ class FeatherFile(NamedTuple):
 
 _NAUTILUS_PATH = "NAUTILUS_PATH"
 _DEFAULT_FS_PROTOCOL = "file"
+_UINT64_MAX = 2**64 - 1
+
+# One entry per row group of every data file, paths are relative to the catalog root
+_INDEX_SCHEMA = pa.schema(
+    [
+        pa.field("path", pa.string()),
+        pa.field("key", pa.string()),
+        pa.field("row_group", pa.int32()),
+        pa.field("num_rows", pa.int64()),
+        pa.field("ts_init_min", pa.uint64()),
+        pa.field("ts_init_max", pa.uint64()),
+    ],
+)
+
+# Index updates are written as delta files, merged into the base index file once
+# their row count reaches that of the base (so each entry is rewritten O(1) times)
+_INDEX_COMPACT_MIN_ROWS = 256
+
+
+def _urisafe_keys(ids: list[str] | str | None) -> list[str] | None:
+    if ids is None:
+        return None
+    if not isinstance(ids, list):
+        ids = [ids]
+    return [urisafe_instrument_id(x) for x in ids]
+
+
+def _key_filter(
+    data_cls: type | None,
+    instrument_ids: list[str] | None = None,
+    bar_types: list[str] | None = None,
+) -> Callable[[str | None], bool] | None:
+    # Data files are under data/{file_prefix}/{key}/ where the key is the URI safe
+    # instrument ID or bar type, so files are matched on their key directory name
+    # (bar keys start with the instrument ID). Returns ``None`` when not filtering.
+    if instrument_ids is None and bar_types is None:
+        return None
+
+    safe_ids = _urisafe_keys(instrument_ids)
+    safe_bar_types = _urisafe_keys(bar_types)
+
+    def matches(key: str | None) -> bool:
+        if key is None:
+            return False
+        if safe_ids is not None:
+            if data_cls == Bar:
+                if not any(key.startswith(x + "-") for x in safe_ids):
+                    return False
+            elif key not in safe_ids:
+                return False
+        return safe_bar_types is None or key in safe_bar_types
+
+    return matches
 
 
 class ParquetDataCatalog(BaseDataCatalog):
@@ -138,6 +204,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         self.min_rows_per_group = min_rows_per_group
         self.max_rows_per_group = max_rows_per_group
         self.show_query_paths = show_query_paths
+        self._index_frames: dict[str, tuple[tuple, pd.DataFrame, pd.Series]] = {}
 
         if self.fs_protocol == "file":
             final_path = str(make_path_posix(str(path)))
@@ -242,11 +309,105 @@ class ParquetDataCatalog(BaseDataCatalog):
         if isinstance(data[0], CustomData):
             data = [d.data for d in data]
         table = self._objects_to_table(data, data_cls=data_cls)
+        self._write_table(
+            table=table,
+            data_cls=data_cls,
+            instrument_id=instrument_id,
+            basename_template=basename_template,
+            mode=mode,
+            **kwargs,
+        )
+
+    def write_table(
+        self,
+        table: pa.Table,
+        data_cls: type[Data],
+        instrument_id: str | None = None,
+        basename_template: str = "part-{i}",
+        mode: str = "overwrite",
+        **kwargs: Any,
+    ) -> None:
+        """
+        Write the given Arrow `table` of data to the catalog.
+
+        This avoids building (and then serializing) data objects for data which is
+        already columnar, such as the tables from the wrangler `process_arrow` methods.
+
+        Parameters
+        ----------
+        table : pa.Table
+            The data to write, in the catalog schema for `data_cls`.
+        data_cls : type[Data]
+            The data type of the table.
+        instrument_id : str, optional
+            The instrument ID (or bar type) of the data. If ``None`` then the
+            'bar_type' or 'instrument_id' of the table schema metadata is used (if any).
+        basename_template : str, default 'part-{i}'
+            The token '{i}' will be replaced with an automatically incremented
+            integer as files are partitioned.
+        mode : str, default 'overwrite'
+            The mode to use when writing data and when a file already exists
+            (one of 'overwrite', 'append' or 'prepend').
+        kwargs : Any
+            Additional keyword arguments for the dataset writer.
+
+        Raises
+        ------
+        ValueError
+            If `table` is empty.
+        ValueError
+            If `table` is not monotonically increasing (or non-decreasing) based on `ts_init`.
+
+        """
+        PyCondition.is_true(table.num_rows > 0, "table was empty")
+
+        ts_init = table["ts_init"]
+        is_sorted = pc.all(
+            pc.greater_equal(ts_init.slice(1), ts_init.slice(0, len(ts_init) - 1)),
+            min_count=0,
+        )
+        if not is_sorted.as_py():
+            raise ValueError(
+                "Data should be monotonically increasing (or non-decreasing) based on `ts_init`. "
+                "Consider sorting your table with `table.sort_by('ts_init')` prior to writing "
+                "to the catalog",
+            )
+
+        if instrument_id is None and table.schema.metadata:
+            metadata = table.schema.metadata
+            key = metadata.get(b"bar_type") or metadata.get(b"instrument_id")
+            instrument_id = key.decode() if key is not None else None
+
+        self._write_table(
+            table=table,
+            data_cls=data_cls,
+            instrument_id=instrument_id,
+            basename_template=basename_template,
+            mode=mode,
+            **kwargs,
+        )
+
+    def _write_table(
+        self,
+        table: pa.Table,
+        data_cls: type[Data],
+        instrument_id: str | None,
+        basename_template: str,
+        mode: str,
+        **kwargs: Any,
+    ) -> None:
         path = self._make_path(data_cls=data_cls, instrument_id=instrument_id)
         kw = dict(**self.dataset_kwargs, **kwargs)
 
+        # Only maintain the index when it covers all existing data for the type
+        file_prefix = class_to_filename(data_cls)
+        maintain_index = self._index_exists(file_prefix) or not self.fs.exists(
+            f"{self.path}/data/{file_prefix}",
+        )
+
+        written_path: str = path
         if "partitioning" not in kw:
-            self._fast_write(
+            written_path = self._fast_write(
                 table=table,
                 path=path,
                 fs=self.fs,
@@ -266,6 +427,9 @@ class ParquetDataCatalog(BaseDataCatalog):
                 **kw,
             )
 
+        if maintain_index:
+            self._update_index(file_prefix, written_path)
+
     def _fast_write(
         self,
         table: pa.Table,
@@ -273,7 +437,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         fs: fsspec.AbstractFileSystem,
         basename_template: str,
         mode: str = "overwrite",
-    ) -> None:
+    ) -> str:
         name = basename_template.format(i=0)
         fs.mkdirs(path, exist_ok=True)
         parquet_file = f"{path}/{name}.parquet"
@@ -304,6 +468,8 @@ class ParquetDataCatalog(BaseDataCatalog):
                 row_group_size=self.max_rows_per_group,
             )
 
+        return parquet_file
+
     def write_data(
         self,
         data: list[Data | Event] | list[NautilusRustDataType],
@@ -387,6 +553,315 @@ class ParquetDataCatalog(BaseDataCatalog):
                 **kwargs,
             )
 
+    # -- INDEX ------------------------------------------------------------------------------------
+
+    def rebuild_index(self, data_cls: type | None = None) -> None:
+        """
+        Rebuild the catalog index from the data files in the catalog.
+
+        The index holds the instrument ID (or bar type), the `ts_init` range and the
+        number of rows of every row group of every data file. Queries use the index to
+        prune files and row groups before any data is read.
+
+        Parameters
+        ----------
+        data_cls : type, optional
+            The data type to rebuild the index for. If ``None`` then the index is
+            rebuilt for every data type in the catalog.
+
+        Notes
+        -----
+        The index is maintained by `write_chunk` and `write_data`, so a rebuild is only
+        required for existing catalogs, or after data files were modified outside of
+        the catalog.
+
+        """
+        if data_cls is not None:
+            file_prefixes = [class_to_filename(data_cls)]
+        else:
+            file_prefixes = self.list_data_types()
+
+        for file_prefix in file_prefixes:
+            dataset_path = f"{self.path}/data/{file_prefix}"
+            if not self.fs.exists(dataset_path):
+                if self._index_exists(file_prefix):
+                    self.fs.rm(self._index_path(file_prefix))
+                self._remove_index_deltas(file_prefix)
+                self._index_frames.pop(file_prefix, None)
+                continue
+
+            entries = [
+                entry
+                for file in self._list_parquet_files(dataset_path)
+                for entry in self._index_entries(file)
+            ]
+            self._write_index(file_prefix, pa.Table.from_pylist(entries, schema=_INDEX_SCHEMA))
+
+    def index_exists(self, data_type: str) -> bool:
+        """
+        Return whether the catalog index exists for the given data type.
+
+        Parameters
+        ----------
+        data_type : str
+            The data type name (as returned by `list_data_types`).
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._index_exists(data_type)
+
+    def update_index(self, data_type: str, paths: list[str]) -> None:
+        """
+        Update the catalog index for the given data files of the data type.
+
+        Parameters
+        ----------
+        data_type : str
+            The data type name (as returned by `list_data_types`).
+        paths : list[str]
+            The data files, or directories of data files, which were written.
+
+        Notes
+        -----
+        Only required for data files written outside of `write_chunk` and `write_data`.
+        The entries of a directory replace all entries for files under the directory,
+        so files removed from the directory are dropped from the index.
+
+        """
+        for path in paths:
+            self._update_index(data_type, path)
+
+    def _index_path(self, file_prefix: str) -> str:
+        return f"{self.path}/index/{file_prefix}.parquet"
+
+    def _index_exists(self, file_prefix: str) -> bool:
+        return self.fs.exists(self._index_path(file_prefix))
+
+    def _index_delta_dir(self, file_prefix: str) -> str:
+        return f"{self.path}/index/{file_prefix}"
+
+    def _index_deltas(self, file_prefix: str) -> list[tuple[int, int, str]]:
+        # Delta files are named {seq}-{num_rows}.parquet, returned in sequence order
+        delta_dir = self._index_delta_dir(file_prefix)
+        if not self.fs.exists(delta_dir):
+            return []
+
+        deltas: list[tuple[int, int, str]] = []
+        for path in self.fs.ls(delta_dir, detail=False):
+            seq, num_rows = Path(path).stem.split("-")
+            deltas.append((int(seq), int(num_rows), path))
+
+        return sorted(deltas)
+
+    def _remove_index_deltas(self, file_prefix: str) -> None:
+        self._index_frames.pop(file_prefix, None)
+        delta_dir = self._index_delta_dir(file_prefix)
+        if self.fs.exists(delta_dir):
+            self.fs.rm(delta_dir, recursive=True)
+
+    def _list_parquet_files(self, path: str) -> list[str]:
+        return sorted(p for p in self.fs.find(path) if p.endswith(".parquet"))
+
+    def _relative_path(self, path: str) -> str:
+        root = self.fs._strip_protocol(self.path).rstrip("/")
+        return self.fs._strip_protocol(path)[len(root) + 1 :]
+
+    def _index_entries(self, path: str) -> list[dict[str, Any]]:
+        # Only the file footer is read, which holds the row group statistics
+        metadata = pq.read_metadata(path, filesystem=self.fs)
+        relative_path = self._relative_path(path)
+
+        # Data files are under data/{file_prefix}/{key}/ where the key is the instrument ID or bar type
+        parts = relative_path.split("/")
+        key = parts[2] if len(parts) > 3 else None
+        names = metadata.schema.names
+        ts_column = names.index("ts_init") if "ts_init" in names else None
+
+        entries: list[dict[str, Any]] = []
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            ts_min, ts_max = 0, _UINT64_MAX  # Never pruned without statistics
+            if ts_column is not None:
+                stats = row_group.column(ts_column).statistics
+                if stats is not None and stats.has_min_max and isinstance(stats.min, int):
+                    ts_min, ts_max = stats.min, stats.max
+            entries.append(
+                {
+                    "path": relative_path,
+                    "key": key,
+                    "row_group": i,
+                    "num_rows": row_group.num_rows,
+                    "ts_init_min": ts_min,
+                    "ts_init_max": ts_max,
+                },
+            )
+
+        return entries
+
+    def _read_index(self, file_prefix: str) -> pa.Table | None:
+        if not self._index_exists(file_prefix):
+            return None
+
+        index = pq.read_table(self._index_path(file_prefix), filesystem=self.fs)
+        for _, _, delta_path in self._index_deltas(file_prefix):
+            # Entries of a later delta replace all earlier entries for the same files
+            delta = pq.read_table(delta_path, filesystem=self.fs)
+            stale = pc.is_in(index["path"], value_set=pc.unique(delta["path"]))
+            index = pa.concat_tables([index.filter(pc.invert(stale)), delta])
+
+        return index
+
+    def _write_index(self, file_prefix: str, index: pa.Table) -> None:
+        self._index_frames.pop(file_prefix, None)
+        self.fs.mkdirs(f"{self.path}/index", exist_ok=True)
+        pq.write_table(
+            index.sort_by([("path", "ascending"), ("row_group", "ascending")]),
+            where=self._index_path(file_prefix),
+            filesystem=self.fs,
+        )
+        self._remove_index_deltas(file_prefix)
+
+    def _update_index(self, file_prefix: str, path: str) -> None:
+        # Replace the entries of the written file, or of all files under a written directory
+        self._index_frames.pop(file_prefix, None)
+        relative_path = self._relative_path(path)
+        is_dir = self.fs.isdir(path)
+        files = self._list_parquet_files(path) if is_dir else [path]
+        entries = [entry for file in files for entry in self._index_entries(file)]
+        table = pa.Table.from_pylist(entries, schema=_INDEX_SCHEMA)
+
+        if not self._index_exists(file_prefix):
+            self._write_index(file_prefix, table)
+            return
+
+        if not is_dir:
+            # Only the entries of the written file are written (as a delta), unless
+            # the deltas have grown to the size of the base index
+            deltas = self._index_deltas(file_prefix)
+            base_rows = pq.read_metadata(self._index_path(file_prefix), filesystem=self.fs).num_rows
+            delta_rows = sum(num_rows for _, num_rows, _ in deltas) + table.num_rows
+            if delta_rows < max(base_rows, _INDEX_COMPACT_MIN_ROWS):
+                seq = deltas[-1][0] + 1 if deltas else 1
+                delta_dir = self._index_delta_dir(file_prefix)
+                self.fs.mkdirs(delta_dir, exist_ok=True)
+                pq.write_table(
+                    table,
+                    where=f"{delta_dir}/{seq:010d}-{table.num_rows}.parquet",
+                    filesystem=self.fs,
+                )
+                return
+
+        # Merge into the base index, files removed from a written directory are dropped
+        index = self._read_index(file_prefix)
+        if is_dir:
+            stale = pc.starts_with(index["path"], pattern=relative_path + "/")
+        else:
+            stale = pc.equal(index["path"], relative_path)
+        self._write_index(file_prefix, pa.concat_tables([index.filter(pc.invert(stale)), table]))
+
+    def _query_index(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> dict[str, list[int] | None] | None:
+        # Return the matching files (relative paths) mapped to the row groups to read
+        # (``None`` for all row groups), or ``None`` if the data type is not indexed.
+        frame = self._index_frame(class_to_filename(data_cls))
+        if frame is None:
+            return None
+
+        df, row_group_counts = frame
+        mask = pd.Series(True, index=df.index)
+
+        key_filter = _key_filter(data_cls, instrument_ids, bar_types)
+        if key_filter is not None:
+            keys = [key for key in df["key"].unique() if key_filter(key)]
+            mask &= df["key"].isin(keys)
+
+        if start is not None:
+            mask &= df["ts_init_max"] >= pd.Timestamp(start).value
+        if end is not None:
+            mask &= df["ts_init_min"] <= pd.Timestamp(end).value
+
+        files: dict[str, list[int] | None] = {}
+        for path, row_groups in df[mask].groupby("path")["row_group"]:
+            selected = row_groups.tolist()
+            files[path] = None if len(selected) == row_group_counts[path] else selected
+
+        return files
+
+    def _index_frame(self, file_prefix: str) -> tuple[pd.DataFrame, pd.Series] | None:
+        # The index is cached between queries, and invalidated whenever it is written.
+        # Writes by other catalog instances are detected from the index file key and
+        # the delta files, which only requires listing metadata.
+        if not self._index_exists(file_prefix):
+            self._index_frames.pop(file_prefix, None)
+            return None
+
+        token = (
+            self.fs.ukey(self._index_path(file_prefix)),
+            tuple(path for _, _, path in self._index_deltas(file_prefix)),
+        )
+        cached = self._index_frames.get(file_prefix)
+        if cached is not None and cached[0] == token:
+            return cached[1], cached[2]
+
+        index = self._read_index(file_prefix)
+        if index is None:
+            return None
+
+        df = index.to_pandas()
+        row_group_counts = df.groupby("path").size()
+        self._index_frames[file_prefix] = (token, df, row_group_counts)
+        return df, row_group_counts
+
+    def _indexed_dataset(
+        self,
+        files: dict[str, list[int] | None],
+        path: str,
+        data_cls: type,
+    ) -> pds.Dataset:
+        if not files:
+            # Nothing matched, an empty dataset still needs the schema for filtering
+            return pds.dataset(
+                [],
+                schema=self._dataset_schema(path, data_cls),
+                filesystem=self.fs,
+                format="parquet",
+            )
+
+        dataset = pds.dataset(
+            [f"{self.path}/{path}" for path in files],
+            filesystem=self.fs,
+            format="parquet",
+        )
+        if all(row_groups is None for row_groups in files.values()):
+            return dataset
+
+        # Restrict fragments to the matching row groups, without reading the other files
+        fragments = [
+            dataset.format.make_fragment(file, filesystem=dataset.filesystem, row_groups=row_groups)
+            for file, row_groups in zip(dataset.files, files.values(), strict=True)
+        ]
+        return pds.FileSystemDataset(
+            fragments,
+            schema=dataset.schema,
+            format=dataset.format,
+            filesystem=dataset.filesystem,
+        )
+
+    def _dataset_schema(self, path: str, data_cls: type) -> pa.Schema:
+        data_files = self._list_parquet_files(path)
+        if data_files:
+            return pq.read_schema(data_files[0], filesystem=self.fs)
+        return list_schemas()[data_cls]
+
     # -- QUERIES ----------------------------------------------------------------------------------
 
     def query(
@@ -399,14 +874,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         where: str | None = None,
         **kwargs: Any,
     ) -> list[Data | CustomData]:
-        if self.fs_protocol == "file" and data_cls in (
-            OrderBookDelta,
-            OrderBookDeltas,
-            OrderBookDepth10,
-            QuoteTick,
-            TradeTick,
-            Bar,
-        ):
+        if self.fs_protocol == "file" and data_cls in _RUST_QUERY_TYPES:
             data = self.query_rust(
                 data_cls=data_cls,
                 instrument_ids=instrument_ids,
@@ -435,6 +903,228 @@ class ParquetDataCatalog(BaseDataCatalog):
             ]
         return data
 
+    def query_chunks(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        where: str | None = None,
+        chunk_size: int = 10_000,
+        **kwargs: Any,
+    ) -> Generator[list[Data | CustomData], None, None]:
+        """
+        Query the catalog for `data_cls`, lazily yielding the results in chunks.
+
+        Chunks are yielded in non-decreasing `ts_init` order, and hold at most
+        `chunk_size` rows. Only the chunks being read are held in memory, so
+        resident memory is bounded regardless of the time range queried.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data type to query.
+        instrument_ids : list[str], optional
+            The instrument IDs to filter by.
+        bar_types : list[str], optional
+            The bar types to filter by.
+        start : TimestampLike, optional
+            The start time (inclusive) of the query.
+        end : TimestampLike, optional
+            The end time (inclusive) of the query.
+        where : str, optional
+            The SQL condition for queries through the Rust backend.
+        chunk_size : int, default 10_000
+            The maximum number of rows per chunk (the row budget).
+        kwargs : Any
+            Additional keyword arguments (such as `filter_expr` and `metadata`).
+
+        Returns
+        -------
+        Generator[list[Data | CustomData], None, None]
+
+        Notes
+        -----
+        For `OrderBookDeltas` a chunk is only batched up to the last delta with the
+        `F_LAST` flag, with the remaining deltas carried into the next chunk.
+
+        """
+        PyCondition.positive_int(chunk_size, "chunk_size")
+
+        chunks: Iterator[list[Data]]
+        if self.fs_protocol == "file" and data_cls in _RUST_QUERY_TYPES:
+            chunks = self._query_rust_chunks(
+                data_cls=data_cls,
+                instrument_ids=instrument_ids,
+                bar_types=bar_types,
+                start=start,
+                end=end,
+                where=where,
+                chunk_size=chunk_size,
+                **kwargs,
+            )
+        else:
+            chunks = self._query_pyarrow_chunks(
+                data_cls=data_cls,
+                instrument_ids=instrument_ids,
+                bar_types=bar_types,
+                start=start,
+                end=end,
+                chunk_size=chunk_size,
+                **kwargs,
+            )
+
+        if not is_nautilus_class(data_cls):
+            # Special handling for generic data
+            data_type = DataType(data_cls, metadata=kwargs.get("metadata"))
+            return ([CustomData(data_type=data_type, data=d) for d in chunk] for chunk in chunks)
+
+        return (chunk for chunk in chunks)
+
+    def _query_rust_chunks(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None,
+        bar_types: list[str] | None,
+        start: TimestampLike | None,
+        end: TimestampLike | None,
+        where: str | None,
+        chunk_size: int,
+        **kwargs: Any,
+    ) -> Generator[list[Data], None, None]:
+        query_data_cls = OrderBookDelta if data_cls == OrderBookDeltas else data_cls
+        session = self.backend_session(
+            data_cls=query_data_cls,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+            where=where,
+            session=DataBackendSession(chunk_size=chunk_size),
+            **kwargs,
+        )
+
+        pending: list[OrderBookDelta] = []
+        for chunk in session.to_query_result():
+            data = capsule_to_list(chunk)
+            if data_cls != OrderBookDeltas:
+                yield data
+                continue
+
+            # Batch deltas up to the final `F_LAST` flag, carrying the remainder
+            data = pending + data
+            last = len(data) - 1
+            while last >= 0 and data[last].flags != RecordFlag.F_LAST:
+                last -= 1
+            pending = data[last + 1 :]
+            if last >= 0:
+                yield OrderBookDeltas.batch(data[: last + 1])
+
+        if pending:
+            # Will warn for the deltas after the final `F_LAST` flag
+            yield OrderBookDeltas.batch(pending)
+
+    def _query_pyarrow_chunks(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None,
+        bar_types: list[str] | None,
+        start: TimestampLike | None,
+        end: TimestampLike | None,
+        chunk_size: int,
+        filter_expr: str | None = None,
+        **kwargs: Any,
+    ) -> Generator[list[Data], None, None]:
+        file_prefix = class_to_filename(data_cls)
+        dataset_path = f"{self.path}/data/{file_prefix}"
+        if not self.fs.exists(dataset_path):
+            return
+
+        dataset, filter_ = self._load_pyarrow_dataset(
+            path=dataset_path,
+            filter_expr=filter_expr,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+            data_cls=data_cls,
+        )
+
+        # Row groups are read in order of their `ts_init` statistics. Each file is sorted,
+        # so rows before the start of the next unread row group can be merged and
+        # released, holding only the row groups overlapping in time (and a chunk of
+        # objects) in memory, rather than every file at once.
+        row_groups = self._sorted_row_groups(dataset)
+        buffered: list[pa.Table] = []
+        buffered_rows = 0
+        pending: list[Data] = []
+        for i, (_, fragment) in enumerate(row_groups):
+            table = fragment.to_table(
+                schema=dataset.schema.with_metadata(fragment.physical_schema.metadata),
+                filter=filter_,
+            )
+            if table.num_rows:
+                buffered.append(table)
+                buffered_rows += table.num_rows
+
+            next_start = row_groups[i + 1][0] if i + 1 < len(row_groups) else None
+            if next_start is not None and buffered_rows < chunk_size:
+                continue  # Read further row groups before merging
+
+            ready, buffered = self._merge_buffered(buffered, next_start, data_cls)
+            buffered_rows = sum(table.num_rows for table in buffered)
+            pending.extend(ready)
+
+            while len(pending) >= chunk_size:
+                yield pending[:chunk_size]
+                pending = pending[chunk_size:]
+
+        if pending:
+            yield pending
+
+    def _merge_buffered(
+        self,
+        buffered: list[pa.Table],
+        next_start: int | None,
+        data_cls: type,
+    ) -> tuple[list[Data], list[pa.Table]]:
+        # Return the merged objects before `next_start`, and the tables carried over
+        ready: list[list[Data]] = []
+        carried: list[pa.Table] = []
+        for table in buffered:
+            if next_start is not None:
+                before = pc.less(table["ts_init"], next_start)
+                carry = table.filter(pc.invert(before))
+                if carry.num_rows:
+                    carried.append(carry)
+                table = table.filter(before)
+            if table.num_rows:
+                ready.append(self._handle_table_nautilus(table, data_cls=data_cls))
+
+        if len(ready) == 1:
+            return ready[0], carried
+        return list(heapq.merge(*ready, key=lambda d: d.ts_init)), carried
+
+    @staticmethod
+    def _sorted_row_groups(dataset: pds.Dataset) -> list[tuple[int, pds.Fragment]]:
+        # Return a fragment per row group with its minimum `ts_init` (0 without statistics)
+        row_groups: list[tuple[int, pds.Fragment]] = []
+        for fragment in dataset.get_fragments():
+            fragment.ensure_complete_metadata()
+            for row_group in fragment.row_groups:
+                stats = (row_group.statistics or {}).get("ts_init") or {}
+                ts_min = stats.get("min")
+                row_groups.append(
+                    (
+                        ts_min if isinstance(ts_min, int) else 0,
+                        fragment.subset(row_group_ids=[row_group.id]),
+                    ),
+                )
+
+        row_groups.sort(key=lambda x: x[0])  # Stable, so file order is kept for ties
+        return row_groups
+
     def backend_session(
         self,
         data_cls: type,
@@ -453,30 +1143,29 @@ class ParquetDataCatalog(BaseDataCatalog):
             session = DataBackendSession()
 
         file_prefix = class_to_filename(data_cls)
-        glob_path = f"{self.path}/data/{file_prefix}/**/*"
-        dirs: list[str] = self.fs.glob(glob_path)
+        indexed_files = self._query_index(
+            data_cls=data_cls,
+            instrument_ids=instrument_ids or None,
+            bar_types=bar_types or None,
+            start=start,
+            end=end,
+        )
+        dirs: list[str]
+        if indexed_files is not None:
+            # Row groups are pruned by the backend from the file statistics
+            dirs = [f"{self.path}/{path}" for path in indexed_files]
+        else:
+            glob_path = f"{self.path}/data/{file_prefix}/**/*"
+            dirs = self.fs.glob(glob_path)
         if self.show_query_paths:
             print(dirs)
 
+        key_filter = _key_filter(data_cls, instrument_ids or None, bar_types or None)
         for idx, path in enumerate(dirs):
             assert self.fs.exists(path)
             # Parse the parent directory which *should* be the instrument ID,
             # this prevents us matching all instrument ID substrings.
-            dir = path.split("/")[-2]
-
-            # Filter by instrument ID
-            if data_cls == Bar:
-                if instrument_ids and not any(
-                    dir.startswith(urisafe_instrument_id(x) + "-") for x in instrument_ids
-                ):
-                    continue
-            elif instrument_ids and not any(
-                dir == urisafe_instrument_id(x) for x in instrument_ids
-            ):
-                continue
-
-            # Filter by bar type
-            if bar_types and not any(dir == urisafe_instrument_id(x) for x in bar_types):
+            if key_filter is not None and not key_filter(path.split("/")[-2]):
                 continue
 
             table = f"{file_prefix}_{idx}"
@@ -548,6 +1237,7 @@ class ParquetDataCatalog(BaseDataCatalog):
             bar_types=bar_types,
             start=start,
             end=end,
+            data_cls=data_cls,
         )
 
         assert (
@@ -559,6 +1249,84 @@ class ParquetDataCatalog(BaseDataCatalog):
 
         return self._handle_table_nautilus(table, data_cls=data_cls)
 
+    def query_table(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        filter_expr: str | None = None,
+        **kwargs: Any,
+    ) -> pa.Table | None:
+        """
+        Query the catalog for `data_cls`, returning the matching rows as an Arrow
+        table without deserializing to Nautilus objects.
+
+        Returns ``None`` if no rows match the query.
+
+        """
+        file_prefix = class_to_filename(data_cls)
+        dataset_path = f"{self.path}/data/{file_prefix}"
+        if not self.fs.exists(dataset_path):
+            return None
+        table = self._load_pyarrow_table(
+            path=dataset_path,
+            filter_expr=filter_expr,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+            data_cls=data_cls,
+        )
+        if table is None or table.num_rows == 0:
+            return None
+        return table
+
+    def query_table_groups(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        filter_expr: str | None = None,
+        **kwargs: Any,
+    ) -> list[pa.Table]:
+        """
+        Query the catalog for `data_cls`, returning the matching rows as Arrow
+        tables grouped by the schema metadata of their files.
+
+        The Nautilus decoders read the instrument ID and price/size precisions from
+        the schema metadata, so each table holds only files with identical metadata
+        (and is sorted by `ts_init`), to be decoded separately.
+
+        """
+        file_prefix = class_to_filename(data_cls)
+        dataset_path = f"{self.path}/data/{file_prefix}"
+        if not self.fs.exists(dataset_path):
+            return []
+        dataset, filter_ = self._load_pyarrow_dataset(
+            path=dataset_path,
+            filter_expr=filter_expr,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+            data_cls=data_cls,
+        )
+
+        groups: dict[tuple, list[pa.Table]] = {}
+        for fragment in dataset.get_fragments():
+            table = fragment.to_table(filter=filter_)
+            if table.num_rows == 0:
+                continue
+            metadata = fragment.physical_schema.metadata or {}
+            group = groups.setdefault(tuple(sorted(metadata.items())), [])
+            group.append(table.replace_schema_metadata(metadata))
+
+        return [pa.concat_tables(tables).sort_by("ts_init") for tables in groups.values()]
+
     def _load_pyarrow_table(
         self,
         path: str,
@@ -568,28 +1336,46 @@ class ParquetDataCatalog(BaseDataCatalog):
         start: TimestampLike | None = None,
         end: TimestampLike | None = None,
         ts_column: str = "ts_init",
+        data_cls: type | None = None,
     ) -> pds.Dataset | None:
-        # Original dataset
-        dataset = pds.dataset(path, filesystem=self.fs)
+        dataset, filter_ = self._load_pyarrow_dataset(
+            path=path,
+            filter_expr=filter_expr,
+            instrument_ids=instrument_ids,
+            bar_types=bar_types,
+            start=start,
+            end=end,
+            ts_column=ts_column,
+            data_cls=data_cls,
+        )
+        return dataset.to_table(filter=filter_)
 
-        # Instrument id filters (not stored in table, need to filter based on files)
-        if instrument_ids is not None:
-            if not isinstance(instrument_ids, list):
-                instrument_ids = [instrument_ids]
-            valid_files = [
-                fn
-                for fn in dataset.files
-                if any(urisafe_instrument_id(x) in fn for x in instrument_ids)
-            ]
-            dataset = pds.dataset(valid_files, filesystem=self.fs)
+    def _load_pyarrow_dataset(
+        self,
+        path: str,
+        filter_expr: str | None = None,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+        ts_column: str = "ts_init",
+        data_cls: type | None = None,
+    ) -> tuple[pds.Dataset, pds.Expression | None]:
+        indexed_files = None
+        if data_cls is not None:
+            indexed_files = self._query_index(
+                data_cls=data_cls,
+                instrument_ids=instrument_ids,
+                bar_types=bar_types,
+                start=start,
+                end=end,
+            )
 
-        if bar_types is not None:
-            if not isinstance(bar_types, list):
-                bar_types = [bar_types]
-            valid_files = [
-                fn for fn in dataset.files if any(x.replace("/", "") in fn for x in bar_types)
-            ]
-            dataset = pds.dataset(valid_files, filesystem=self.fs)
+        if indexed_files is not None:
+            # Files and row groups pruned by the catalog index
+            dataset = self._indexed_dataset(indexed_files, path, data_cls)
+        else:
+            dataset = self._filter_dataset_files(path, instrument_ids, bar_types, data_cls)
 
         filters: list[pds.Expression] = [filter_expr] if filter_expr is not None else []
         if start is not None:
@@ -600,7 +1386,25 @@ class ParquetDataCatalog(BaseDataCatalog):
             filter_ = combine_filters(*filters)
         else:
             filter_ = None
-        return dataset.to_table(filter=filter_)
+        return dataset, filter_
+
+    def _filter_dataset_files(
+        self,
+        path: str,
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+        data_cls: type | None = None,
+    ) -> pds.Dataset:
+        # Original dataset
+        dataset = pds.dataset(path, filesystem=self.fs)
+
+        # Instrument id filters (not stored in table, need to filter based on files)
+        key_filter = _key_filter(data_cls, instrument_ids, bar_types)
+        if key_filter is not None:
+            valid_files = [fn for fn in dataset.files if key_filter(fn.split("/")[-2])]
+            dataset = pds.dataset(valid_files, filesystem=self.fs)
+
+        return dataset
 
     def _build_query(
         self,
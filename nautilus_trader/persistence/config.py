@@ -53,6 +53,13 @@ class StreamingConfig(NautilusConfig, frozen=True):
         The time of day for file rotation (for SCHEDULED_DATES mode).
     rotation_timezone : str, default 'UTC'
         The timezone for rotation calculations (for SCHEDULED_DATES mode).
+    background_writer : bool, default False
+        If objects should be serialized and written in batches on a background thread,
+        off the event loop (or backtest loop).
+    buffer_size : int, default 100_000
+        The capacity of the background writer ring buffer (objects).
+    batch_size : int, default 1_000
+        The maximum number of objects written per background write cycle.
 
     """
 
@@ -67,6 +74,9 @@ class StreamingConfig(NautilusConfig, frozen=True):
     rotation_interval: pd.Timedelta = pd.Timedelta(days=1)
     rotation_time: time = time(0, 0, 0, 0)
     rotation_timezone: str = "UTC"
+    background_writer: bool = False
+    buffer_size: int = 100_000
+    batch_size: int = 1_000
 
     @property
     def fs(self):
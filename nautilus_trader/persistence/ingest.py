@@ -0,0 +1,592 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+from collections.abc import Callable
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from dataclasses import dataclass
+from io import BytesIO
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+import fsspec
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from nautilus_trader.common.component import Logger
+from nautilus_trader.core import nautilus_pyo3
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.nautilus_pyo3 import DataTransformer
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.funcs import class_to_filename
+from nautilus_trader.persistence.funcs import urisafe_instrument_id
+
+
+_DIGEST_CHUNK_SIZE = 8 * 1024 * 1024
+
+_RECORD_BATCH_ENCODERS: dict[type, Callable[[list[Any]], bytes]] = {
+    nautilus_pyo3.OrderBookDelta: DataTransformer.pyo3_order_book_deltas_to_record_batch_bytes,
+    nautilus_pyo3.OrderBookDepth10: DataTransformer.pyo3_order_book_depth10_to_record_batch_bytes,
+    nautilus_pyo3.QuoteTick: DataTransformer.pyo3_quote_ticks_to_record_batch_bytes,
+    nautilus_pyo3.TradeTick: DataTransformer.pyo3_trade_ticks_to_record_batch_bytes,
+    nautilus_pyo3.Bar: DataTransformer.pyo3_bars_to_record_batch_bytes,
+}
+
+
+class IngestLoader:
+    """
+    The base class for loaders of data files for a `CatalogIngester`.
+
+    Loaders are sent to the worker processes, so must be picklable and should only
+    hold plain configuration values.
+
+    """
+
+    pattern: str = "*"
+
+    @property
+    def single_instrument(self) -> bool:
+        """
+        Return whether all records loaded by the loader are of a single data type and
+        for a single instrument (so records do not need to be grouped).
+
+        Returns
+        -------
+        bool
+
+        """
+        return False
+
+    def load(self, path: str) -> list[Any]:
+        """
+        Load the data file at the given `path` as `pyo3` data objects.
+
+        Parameters
+        ----------
+        path : str
+            The local path of the data file.
+
+        Returns
+        -------
+        list[Any]
+
+        """
+        raise NotImplementedError("method `load` must be implemented in the subclass")  # pragma: no cover
+
+    def load_chunks(self, path: str, chunk_size: int) -> Iterator[list[Any]]:
+        """
+        Load the data file at the given `path` as chunks of `pyo3` data objects.
+
+        The default implementation loads the whole file with `load`, loaders which
+        can read a file incrementally should override this so that only about
+        `chunk_size` records are held in memory at a time.
+
+        Parameters
+        ----------
+        path : str
+            The local path of the data file.
+        chunk_size : int
+            The target number of records per chunk.
+
+        Returns
+        -------
+        Iterator[list[Any]]
+
+        """
+        data = self.load(path)
+        for i in range(0, len(data), chunk_size):
+            yield data[i : i + chunk_size]
+
+
+@dataclass(frozen=True)
+class IngestedFile:
+    """
+    Represents a data file processed by a `CatalogIngester`.
+    """
+
+    path: str
+    digest: str
+    num_rows: int
+    outputs: list[str]
+    duplicate_of: str | None = None
+
+
+class CatalogIngester:
+    """
+    Provides bulk ingestion of directories of data files into a `ParquetDataCatalog`.
+
+    Files are loaded by a pool of worker processes in chunks of records, and each
+    chunk is encoded straight to Arrow and appended to one Parquet file per data type
+    and instrument, so no data is sent between processes or converted to legacy
+    Cython objects. Memory per worker is bounded by `batch_size` for loaders which
+    read files incrementally (see `IngestLoader.load_chunks`).
+
+    Progress is tracked in a manifest under the catalog `ingest/` directory. Files
+    which were already ingested (same path, size and modification time) are skipped
+    when ingesting again, as are files with the same content as an ingested file.
+    Output files are named from the source file content digest, so reprocessing a
+    file replaces its previous output rather than duplicating data.
+
+    Parameters
+    ----------
+    catalog : ParquetDataCatalog
+        The catalog to ingest into.
+    loader : IngestLoader
+        The loader for the data files.
+    max_workers : int, optional
+        The maximum number of worker processes (defaults to the number of CPUs).
+    batch_size : int, default 1_000_000
+        The target number of records loaded and written at a time.
+    name : str, default 'default'
+        The name of the progress manifest, ingestions with different names track
+        their progress separately.
+
+    Raises
+    ------
+    ValueError
+        If the `catalog` filesystem is in memory (not shared with worker processes).
+    ValueError
+        If `batch_size` is not positive.
+
+    """
+
+    def __init__(
+        self,
+        catalog: ParquetDataCatalog,
+        loader: IngestLoader,
+        max_workers: int | None = None,
+        batch_size: int = 1_000_000,
+        name: str = "default",
+    ) -> None:
+        PyCondition.not_none(loader, "loader")
+        PyCondition.positive_int(batch_size, "batch_size")
+        if catalog.fs_protocol == "memory":
+            raise ValueError("Cannot ingest into an in-memory catalog from worker processes")
+
+        self._catalog = catalog
+        self._loader = loader
+        self._max_workers = max_workers
+        self._batch_size = batch_size
+        self._progress_path = f"{catalog.path}/ingest/{name}.json"
+        self._log = Logger(type(self).__name__)
+
+    def ingest(
+        self,
+        paths: list[PathLike[str] | str],
+        pattern: str | None = None,
+        raise_exception: bool = False,
+    ) -> list[IngestedFile]:
+        """
+        Ingest the data files in the given `paths` into the catalog.
+
+        Parameters
+        ----------
+        paths : list[PathLike[str] | str]
+            The data files, or directories which are searched recursively for data files.
+        pattern : str, optional
+            The glob pattern for data files in directories (defaults to the loader pattern).
+        raise_exception : bool, default False
+            If an exception from a worker should be raised, otherwise failed files are
+            logged and left pending for the next ingestion.
+
+        Returns
+        -------
+        list[IngestedFile]
+            The files processed by this ingestion.
+
+        """
+        files = self._discover(paths, pattern or self._loader.pattern)
+        progress = self._read_progress()
+        pending = self._pending_files(files, progress)
+        self._log.info(f"Ingesting {len(pending)} of {len(files)} file(s)")
+
+        digests = self._digest_files(list(pending))
+        tasks, duplicates = self._plan(pending, digests, progress)
+
+        # The index is only maintained when it covers all existing data for a type
+        existing_prefixes = set(self._catalog.list_data_types())
+
+        results: list[IngestedFile] = []
+        removed: dict[str, set[str]] = {}
+        try:
+            # Duplicates of files ingested previously are recorded straight away
+            for original in set(duplicates).difference(tasks):
+                results.extend(
+                    self._record_duplicates(original, duplicates, pending, digests, progress),
+                )
+            self._write_progress(progress)
+
+            for file, outputs in self._run_workers(tasks, digests, raise_exception):
+                results.append(
+                    self._record_ingested(file, outputs, pending, digests, progress, removed),
+                )
+                # Duplicates are only recorded once their original has been written
+                results.extend(
+                    self._record_duplicates(file, duplicates, pending, digests, progress),
+                )
+                self._write_progress(progress)
+        finally:
+            self._update_index(progress, existing_prefixes, removed)
+            self._write_progress(progress)
+
+        return results
+
+    def _pending_files(
+        self,
+        files: list[str],
+        progress: dict[str, dict[str, Any]],
+    ) -> dict[str, os.stat_result]:
+        pending: dict[str, os.stat_result] = {}
+        for file in files:
+            stat = os.stat(file)
+            entry = progress.get(file)
+            if (
+                entry is not None
+                and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+            ):
+                continue  # Already ingested
+            pending[file] = stat
+
+        return pending
+
+    def _plan(
+        self,
+        pending: dict[str, os.stat_result],
+        digests: dict[str, str],
+        progress: dict[str, dict[str, Any]],
+    ) -> tuple[list[str], dict[str, list[str]]]:
+        # Returns the files to ingest, and the duplicate files by their original file
+        ingested: dict[str, str] = {
+            entry["digest"]: path
+            for path, entry in progress.items()
+            if entry["duplicate_of"] is None and path not in pending
+        }
+
+        tasks: list[str] = []
+        duplicates: dict[str, list[str]] = {}
+        for file in pending:
+            digest = digests[file]
+            if digest in ingested:
+                duplicates.setdefault(ingested[digest], []).append(file)
+                continue
+            ingested[digest] = file
+            tasks.append(file)
+
+        return tasks, duplicates
+
+    def _run_workers(
+        self,
+        tasks: list[str],
+        digests: dict[str, str],
+        raise_exception: bool,
+    ) -> Iterator[tuple[str, list[tuple[str, int]]]]:
+        # Yields the outputs of each file as its worker completes
+        executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        with executor:
+            futures: dict[Future, str] = {
+                executor.submit(
+                    _ingest_file,
+                    self._catalog.path,
+                    self._catalog.fs_protocol,
+                    self._catalog.fs_storage_options,
+                    self._catalog.max_rows_per_group,
+                    self._loader,
+                    file,
+                    digests[file],
+                    self._batch_size,
+                ): file
+                for file in tasks
+            }
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file = futures.pop(future)
+                    try:
+                        outputs = future.result()
+                    except Exception as e:
+                        self._log.error(f"Error ingesting {file}: {e}")
+                        if raise_exception:
+                            for other in futures:
+                                other.cancel()
+                            raise e
+                        continue  # Left pending for the next ingestion
+                    yield file, outputs
+
+    def _record_ingested(
+        self,
+        file: str,
+        outputs: list[tuple[str, int]],
+        pending: dict[str, os.stat_result],
+        digests: dict[str, str],
+        progress: dict[str, dict[str, Any]],
+        removed: dict[str, set[str]],
+    ) -> IngestedFile:
+        num_rows = sum(rows for _, rows in outputs)
+        paths_written = [path for path, _ in outputs]
+        previous = progress.get(file)
+        if previous is not None:
+            # The file changed since it was ingested, so remove the old output
+            for output in set(previous["outputs"]) - set(paths_written):
+                self._remove_output(output, removed)
+
+        progress[file] = self._progress_entry(pending[file], digests[file], num_rows, paths_written)
+        self._log.info(f"Ingested {file} ({num_rows} rows)")
+
+        return IngestedFile(file, digests[file], num_rows, paths_written)
+
+    def _record_duplicates(
+        self,
+        original: str,
+        duplicates: dict[str, list[str]],
+        pending: dict[str, os.stat_result],
+        digests: dict[str, str],
+        progress: dict[str, dict[str, Any]],
+    ) -> list[IngestedFile]:
+        results: list[IngestedFile] = []
+        for file in duplicates.pop(original, []):
+            digest = digests[file]
+            self._log.info(f"Skipping {file} (duplicate of {original})")
+            progress[file] = self._progress_entry(pending[file], digest, 0, [], duplicate_of=original)
+            results.append(IngestedFile(file, digest, 0, [], duplicate_of=original))
+
+        return results
+
+    def _remove_output(self, output: str, removed: dict[str, set[str]]) -> None:
+        path = f"{self._catalog.path}/{output}"
+        if self._catalog.fs.exists(path):
+            self._catalog.fs.rm(path)
+        removed.setdefault(output.split("/")[1], set()).add(output.rsplit("/", 1)[0])
+
+    def _discover(self, paths: list[PathLike[str] | str], pattern: str) -> list[str]:
+        files: list[str] = []
+        for path in paths:
+            path = Path(path).resolve()
+            if path.is_dir():
+                files.extend(str(p) for p in sorted(path.rglob(pattern)) if p.is_file())
+            else:
+                files.append(str(path))
+
+        return list(dict.fromkeys(files))
+
+    def _digest_files(self, files: list[str]) -> dict[str, str]:
+        # Hashing releases the GIL, so files are hashed concurrently in threads
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            return dict(zip(files, executor.map(_file_digest, files), strict=True))
+
+    @staticmethod
+    def _progress_entry(
+        stat: os.stat_result,
+        digest: str,
+        num_rows: int,
+        outputs: list[str],
+        duplicate_of: str | None = None,
+    ) -> dict[str, Any]:
+        return {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": digest,
+            "num_rows": num_rows,
+            "outputs": outputs,
+            "duplicate_of": duplicate_of,
+            "indexed": not outputs,
+        }
+
+    def _read_progress(self) -> dict[str, dict[str, Any]]:
+        fs = self._catalog.fs
+        if not fs.exists(self._progress_path):
+            return {}
+        with fs.open(self._progress_path, "r") as f:
+            return json.load(f)
+
+    def _write_progress(self, progress: dict[str, dict[str, Any]]) -> None:
+        # Write then rename so an interrupted ingestion never leaves a partial manifest
+        fs = self._catalog.fs
+        fs.mkdirs(f"{self._catalog.path}/ingest", exist_ok=True)
+        tmp_path = f"{self._progress_path}.tmp"
+        with fs.open(tmp_path, "w") as f:
+            json.dump(progress, f, indent=2, sort_keys=True)
+        fs.mv(tmp_path, self._progress_path)
+
+    def _update_index(
+        self,
+        progress: dict[str, dict[str, Any]],
+        existing_prefixes: set[str],
+        removed: dict[str, set[str]],
+    ) -> None:
+        # Update the index once per written directory, rather than once per file
+        unindexed = [entry for entry in progress.values() if not entry["indexed"]]
+        directories: dict[str, set[str]] = {prefix: set(dirs) for prefix, dirs in removed.items()}
+        for entry in unindexed:
+            for output in entry["outputs"]:
+                file_prefix = output.split("/")[1]
+                directories.setdefault(file_prefix, set()).add(output.rsplit("/", 1)[0])
+
+        for file_prefix, dirs in directories.items():
+            if file_prefix in existing_prefixes and not self._catalog.index_exists(file_prefix):
+                continue
+            self._catalog.update_index(
+                file_prefix,
+                [f"{self._catalog.path}/{directory}" for directory in sorted(dirs)],
+            )
+
+        for entry in unindexed:
+            entry["indexed"] = True
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(_DIGEST_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _data_key(obj: Any) -> str:
+    if hasattr(obj, "bar_type"):
+        return str(obj.bar_type)
+    return obj.instrument_id.value
+
+
+def _ingest_file(
+    catalog_path: str,
+    fs_protocol: str,
+    fs_storage_options: dict,
+    max_rows_per_group: int,
+    loader: IngestLoader,
+    path: str,
+    digest: str,
+    batch_size: int,
+) -> list[tuple[str, int]]:
+    # Runs in a worker process, returning the written (catalog relative) paths and row counts
+    fs = fsspec.filesystem(fs_protocol, **fs_storage_options)
+    basename = f"{Path(path).name.split('.')[0]}-{digest}"
+    writers: dict[tuple[type, str], _IngestWriter] = {}
+    try:
+        for chunk in loader.load_chunks(path, batch_size):
+            groups: dict[tuple[type, str], list[Any]] = {}
+            if loader.single_instrument:
+                if chunk:
+                    groups[(type(chunk[0]), _data_key(chunk[0]))] = chunk
+            else:
+                for obj in chunk:
+                    groups.setdefault((type(obj), _data_key(obj)), []).append(obj)
+            del chunk
+
+            for data_cls, key in list(groups):
+                records = groups.pop((data_cls, key))
+                writer = writers.get((data_cls, key))
+                if writer is None:
+                    writer = _IngestWriter(fs, catalog_path, data_cls, key, basename)
+                    writers[(data_cls, key)] = writer
+                writer.write(records, max_rows_per_group)
+                del records
+
+        return [writer.close(max_rows_per_group) for writer in writers.values()]
+    except BaseException:
+        for writer in writers.values():
+            writer.abort()
+        raise
+
+
+class _IngestWriter:
+    """
+    Appends the record batches of one data type and instrument to a temporary
+    Parquet file, which is moved into place when closed.
+    """
+
+    def __init__(
+        self,
+        fs: fsspec.AbstractFileSystem,
+        catalog_path: str,
+        data_cls: type,
+        key: str,
+        basename: str,
+    ) -> None:
+        self._encoder = _RECORD_BATCH_ENCODERS.get(data_cls)
+        if self._encoder is None:
+            raise RuntimeError(
+                f"Unsupported data type for ingestion, was `{data_cls.__name__}` "
+                "(use `ParquetDataCatalog.write_data` instead)",
+            )
+
+        self._fs = fs
+        relative_dir = f"data/{class_to_filename(data_cls)}/{urisafe_instrument_id(key)}"
+        fs.mkdirs(f"{catalog_path}/{relative_dir}", exist_ok=True)
+        self._relative_path = f"{relative_dir}/{basename}.parquet"
+        self._path = f"{catalog_path}/{self._relative_path}"
+        self._tmp_path = f"{self._path}.tmp"
+        self._writer: pq.ParquetWriter | None = None
+        self._num_rows = 0
+        self._last_ts_init: int | None = None
+        self._is_sorted = True
+
+    def write(self, records: list[Any], max_rows_per_group: int) -> None:
+        table = pa.ipc.open_stream(BytesIO(self._encoder(records))).read_all()
+        if len(table) == 0:
+            return
+
+        # Files are almost always already in order, so only track whether a sort is required
+        ts_init = table["ts_init"]
+        if self._is_sorted:
+            if self._last_ts_init is not None and ts_init[0].as_py() < self._last_ts_init:
+                self._is_sorted = False
+            elif len(table) > 1 and not pc.all(
+                pc.greater_equal(ts_init.slice(1), ts_init.slice(0, len(table) - 1)),
+            ).as_py():
+                self._is_sorted = False
+        self._last_ts_init = ts_init[-1].as_py()
+
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._tmp_path, table.schema, filesystem=self._fs)
+        self._writer.write_table(table, row_group_size=max_rows_per_group)
+        self._num_rows += len(table)
+
+    def close(self, max_rows_per_group: int) -> tuple[str, int]:
+        if self._writer is not None:
+            self._writer.close()
+            if not self._is_sorted:
+                # Only out of order data is read back in full for a (stable) sort
+                table = pq.read_table(self._tmp_path, filesystem=self._fs).sort_by("ts_init")
+                pq.write_table(
+                    table,
+                    where=self._tmp_path,
+                    filesystem=self._fs,
+                    row_group_size=max_rows_per_group,
+                )
+            self._fs.mv(self._tmp_path, self._path)
+
+        return self._relative_path, self._num_rows
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._fs.exists(self._tmp_path):
+            self._fs.rm(self._tmp_path)
@@ -18,7 +18,9 @@ from copy import copy
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
+from nautilus_trader.core import nautilus_pyo3
 from nautilus_trader.model.enums import book_action_from_str
 from nautilus_trader.model.enums import order_side_from_str
 
@@ -30,6 +32,7 @@ from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.datetime cimport as_utc_index
 from nautilus_trader.core.rust.model cimport AggressorSide
 from nautilus_trader.core.rust.model cimport BookAction
+from nautilus_trader.core.rust.model cimport FIXED_PRECISION
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport RecordFlag
 from nautilus_trader.model.data cimport Bar
@@ -114,10 +117,14 @@ def calculate_bar_price_offsets(num_records, timestamp_is_close: bool, offset_in
 
     # Randomize high and low if seed is given
     if random_seed is not None:
+        # With a 50% chance, swap high and low. The swaps are the top bit of each 32-bit
+        # word drawn, so are the same as calling `getrandbits(1)` once per record.
         local_random = random.Random(random_seed)
-        for i in range(num_records):
-            if local_random.getrandbits(1):  # With a 50% chance, swap high and low
-                offsets["high"][i], offsets["low"][i] = offsets["low"][i], offsets["high"][i]
+        words = local_random.getrandbits(32 * num_records).to_bytes(4 * num_records, "little")
+        swap = (np.frombuffer(words, dtype="<u4") >> 31).astype(bool)
+        high = offsets["high"]
+        offsets["high"] = np.where(swap, offsets["low"], high)
+        offsets["low"] = np.where(swap, high, offsets["low"])
 
     return offsets
 
@@ -176,6 +183,66 @@ def prepare_event_and_init_timestamps(
     return ts_events, ts_inits
 
 
+def to_fixed_raw(values, int precision, dtype=np.int64):
+    """
+    Convert the given values to Nautilus fixed-point raw values.
+
+    The values are rounded to the given precision, as for `Price` and `Quantity`.
+
+    Parameters
+    ----------
+    values : array-like
+        The values to convert.
+    precision : int
+        The decimal precision to round the values to.
+    dtype : numpy.dtype, default int64
+        The raw value type (int64 for prices, uint64 for quantities).
+
+    Returns
+    -------
+    np.ndarray
+
+    """
+    Condition.in_range_int(precision, 0, FIXED_PRECISION, "precision")
+    scaled = np.asarray(values, dtype=np.float64) * 10 ** precision
+    # Round half away from zero (not to even) to match the Rust fixed-point conversion
+    rounded = np.trunc(scaled + np.copysign(0.5, scaled)).astype(dtype)
+    return rounded * np.dtype(dtype).type(10 ** (FIXED_PRECISION - precision))
+
+
+def _instrument_metadata(Instrument instrument) -> dict[str, str]:
+    return {
+        "instrument_id": instrument.id.value,
+        "price_precision": str(instrument.price_precision),
+        "size_precision": str(instrument.size_precision),
+    }
+
+
+def _arrow_table(fields, dict columns, dict metadata) -> pa.Table:
+    # Build a table in the catalog (Rust defined) schema, with columns in the schema order
+    schema = pa.schema(
+        [pa.field(k, pa.type_for_alias(v), False) for k, v in fields.items()],
+        metadata=metadata,
+    )
+    arrays = [
+        columns[field.name] if isinstance(columns[field.name], pa.Array)
+        else pa.array(np.asarray(columns[field.name]), type=field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _bar_tick_prices(data: pd.DataFrame, prefix: str = ""):
+    # The open, high, low and close prices of the bars, as consecutive blocks of ticks
+    return np.concatenate([data[f"{prefix}{key}"].to_numpy().astype(np.int64) for key in BAR_PRICES])
+
+
+def _bar_tick_timestamps(index: pd.DatetimeIndex, dict offsets):
+    # The timestamps of the ticks from `_bar_tick_prices`
+    timestamps = index.to_numpy(dtype="datetime64[ns]")
+    return np.concatenate([timestamps + offsets[key] for key in BAR_PRICES]).view(np.uint64)
+
+
 cdef class OrderBookDeltaDataWrangler:
     """
     Provides a means of building lists of Nautilus `OrderBookDelta` objects.
@@ -387,6 +454,63 @@ cdef class QuoteTickDataWrangler:
             ts_inits,
         ))
 
+    def process_arrow(
+        self,
+        data: pd.DataFrame,
+        default_volume: float=1_000_000.0,
+        ts_init_delta: int=0,
+    ):
+        """
+        Process the given tick dataset into an Arrow table of `QuoteTick` data.
+
+        The table is in the data catalog schema, and is built with vectorized operations
+        without creating any intermediate objects.
+
+        Expects columns ['bid_price', 'ask_price'] with 'timestamp' index.
+        Note: The 'bid_size' and 'ask_size' columns are optional, will then use
+        the `default_volume`.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The tick data to process.
+        default_volume : float
+            The default volume for each tick (if not provided).
+        ts_init_delta : int
+            The difference in nanoseconds between the data timestamps and the
+            `ts_init` value. Can be used to represent/simulate latency between
+            the data source and the Nautilus system. Cannot be negative.
+
+        Returns
+        -------
+        pa.Table
+
+        """
+        Condition.is_false(data.empty, "data.empty")
+        Condition.not_none(default_volume, "default_volume")
+
+        data = as_utc_index(data)
+        data = data.rename(columns={"bid": "bid_price", "ask": "ask_price"})
+        ts_events, ts_inits = prepare_event_and_init_timestamps(data.index, ts_init_delta)
+
+        cdef uint8_t price_precision = self.instrument.price_precision
+        cdef uint8_t size_precision = self.instrument.size_precision
+        columns = {
+            "bid_price": to_fixed_raw(data["bid_price"], price_precision),
+            "ask_price": to_fixed_raw(data["ask_price"], price_precision),
+            "ts_event": ts_events,
+            "ts_init": ts_inits,
+        }
+        for name in ("bid_size", "ask_size"):
+            sizes = data[name] if name in data.columns else np.full(len(data), float(default_volume))
+            columns[name] = to_fixed_raw(sizes, size_precision, np.uint64)
+
+        return _arrow_table(
+            nautilus_pyo3.QuoteTick.get_fields(),
+            columns,
+            _instrument_metadata(self.instrument),
+        )
+
     def process_bar_data(
         self,
         bid_data: pd.DataFrame,
@@ -434,6 +558,110 @@ cdef class QuoteTickDataWrangler:
             If the data should be sorted by timestamp.
 
         """
+        columns = self._process_bar_data_raw(
+            bid_data,
+            ask_data,
+            default_volume,
+            ts_init_delta,
+            offset_interval_ms,
+            timestamp_is_close,
+            random_seed,
+            is_raw,
+            sort_data,
+        )
+
+        return QuoteTick.from_raw_arrays_to_list_c(
+            self.instrument.id,
+            self.instrument.price_precision,
+            self.instrument.size_precision,
+            columns["bid_price"],
+            columns["ask_price"],
+            columns["bid_size"],
+            columns["ask_size"],
+            columns["ts_event"],
+            columns["ts_init"],
+        )
+
+    def process_bar_data_arrow(
+        self,
+        bid_data: pd.DataFrame,
+        ask_data: pd.DataFrame,
+        default_volume: float = 1_000_000.0,
+        ts_init_delta: int = 0,
+        offset_interval_ms: int = 100,
+        bint timestamp_is_close: bool = True,
+        random_seed: int | None = None,
+        bint is_raw: bool = False,
+        bint sort_data: bool = True,
+    ):
+        """
+        Process the given bar datasets into an Arrow table of `QuoteTick` data.
+
+        The table is in the data catalog schema, and holds the same ticks as
+        `process_bar_data` without creating any intermediate objects.
+
+        Parameters
+        ----------
+        bid_data : pd.DataFrame
+            The bid bar data.
+        ask_data : pd.DataFrame
+            The ask bar data.
+        default_volume : float
+            The volume per tick if not available from the data.
+        ts_init_delta : int
+            The difference in nanoseconds between the data timestamps and the
+            `ts_init` value.
+        offset_interval_ms : int, default 100
+            The number of milliseconds to offset each tick for the bar timestamps.
+        random_seed : int, optional
+            The random seed for shuffling order of high and low ticks from bar
+            data. If random_seed is ``None`` then won't shuffle.
+        is_raw : bool, default False
+            If the data is scaled to Nautilus fixed-point values.
+        timestamp_is_close : bool, default True
+            If bar timestamps are at the close.
+        sort_data : bool, default True
+            If the data should be sorted by timestamp.
+
+        Returns
+        -------
+        pa.Table
+
+        See Also
+        --------
+        process_bar_data
+
+        """
+        columns = self._process_bar_data_raw(
+            bid_data,
+            ask_data,
+            default_volume,
+            ts_init_delta,
+            offset_interval_ms,
+            timestamp_is_close,
+            random_seed,
+            is_raw,
+            sort_data,
+        )
+
+        return _arrow_table(
+            nautilus_pyo3.QuoteTick.get_fields(),
+            columns,
+            _instrument_metadata(self.instrument),
+        )
+
+    def _process_bar_data_raw(
+        self,
+        bid_data,
+        ask_data,
+        default_volume,
+        ts_init_delta,
+        offset_interval_ms,
+        bint timestamp_is_close,
+        random_seed,
+        bint is_raw,
+        bint sort_data,
+    ):
         Condition.type(bid_data, pd.DataFrame, "bid_data")
         Condition.type(ask_data, pd.DataFrame, "ask_data")
         Condition.is_false(bid_data.empty, "bid_data.empty")
@@ -441,6 +669,7 @@ cdef class QuoteTickDataWrangler:
         Condition.type(bid_data.index, pd.DatetimeIndex, "bid_data.index")
         Condition.type(ask_data.index, pd.DatetimeIndex, "ask_data.index")
         Condition.not_none(default_volume, "default_volume")
+        Condition.not_negative(ts_init_delta, "ts_init_delta")
         for col in BAR_PRICES:
             Condition.is_in(col, bid_data.columns, col, "bid_data.columns")
             Condition.is_in(col, ask_data.columns, col, "ask_data.columns")
@@ -459,64 +688,26 @@ cdef class QuoteTickDataWrangler:
 
         merged_data = align_bid_ask_bar_data(bid_data, ask_data)
         offsets = calculate_bar_price_offsets(len(merged_data), timestamp_is_close, offset_interval_ms, random_seed)
-        ticks_final = self._create_quote_ticks_array(merged_data, is_raw, self.instrument, offsets, ts_init_delta)
+
+        # Each bar is four ticks (open, high, low, close) each with a quarter of the volume
+        cdef uint8_t size_precision = self.instrument.size_precision
+        bid_sizes = calculate_volume_quarter(merged_data["bid_volume"].to_numpy(), size_precision)
+        ask_sizes = calculate_volume_quarter(merged_data["ask_volume"].to_numpy(), size_precision)
+        columns = {
+            "bid_price": _bar_tick_prices(merged_data, "bid_"),
+            "ask_price": _bar_tick_prices(merged_data, "ask_"),
+            "bid_size": np.tile(bid_sizes, len(BAR_PRICES)),
+            "ask_size": np.tile(ask_sizes, len(BAR_PRICES)),
+            "ts_event": _bar_tick_timestamps(merged_data.index, offsets),
+        }
 
         # Sort data by timestamp, if required
         if sort_data:
-            sorted_indices = np.argsort(ticks_final["timestamp"])
-            ticks_final = ticks_final[sorted_indices]
-
-        ts_events = ticks_final["timestamp"].view(np.uint64)
-        ts_inits = ts_events + ts_init_delta
-
-        return QuoteTick.from_raw_arrays_to_list_c(
-            self.instrument.id,
-            self.instrument.price_precision,
-            self.instrument.size_precision,
-            ticks_final["bid_price_raw"],
-            ticks_final["ask_price_raw"],
-            ticks_final["bid_size_raw"],
-            ticks_final["ask_size_raw"],
-            ts_events,
-            ts_inits,
-        )
-
-    def _create_quote_ticks_array(
-        self,
-        merged_data,
-        is_raw,
-        instrument: Instrument,
-        offsets,
-        ts_init_delta,
-    ):
-        dtype = [
-            ("bid_price_raw", np.int64), ("ask_price_raw", np.int64),
-            ("bid_size_raw", np.uint64), ("ask_size_raw", np.uint64),
-            ("timestamp", "datetime64[ns]")
-        ]
-
-        size_precision = instrument.size_precision
-        merged_data.loc[:, "bid_volume"] = calculate_volume_quarter(merged_data["bid_volume"], size_precision)
-        merged_data.loc[:, "ask_volume"] = calculate_volume_quarter(merged_data["ask_volume"], size_precision)
+            sorted_indices = np.argsort(columns["ts_event"], kind="stable")
+            columns = {name: values[sorted_indices] for name, values in columns.items()}
 
-        # Convert to record array
-        records = merged_data.to_records()
-
-        # Create structured array
-        total_records = len(records) * 4  # For open, high, low, close
-        tick_data = np.empty(total_records, dtype=dtype)
-
-        for i, price_key in enumerate(BAR_PRICES):
-            start_index = i * len(records)
-            end_index = start_index + len(records)
-
-            tick_data["bid_price_raw"][start_index:end_index] = records[f"bid_{price_key}"].astype(np.int64)
-            tick_data["ask_price_raw"][start_index:end_index] = records[f"ask_{price_key}"].astype(np.int64)
-            tick_data["bid_size_raw"][start_index:end_index] = records["bid_volume"].astype(np.uint64)
-            tick_data["ask_size_raw"][start_index:end_index] = records["ask_volume"].astype(np.uint64)
-            tick_data["timestamp"][start_index:end_index] = records["timestamp"] + offsets[price_key]
-
-        return tick_data
+        columns["ts_init"] = columns["ts_event"] + np.uint64(ts_init_delta)
+        return columns
 
     # cpdef method for Python wrap() (called with map)
     cpdef QuoteTick _build_tick_from_raw(
@@ -630,6 +821,62 @@ cdef class TradeTickDataWrangler:
                 ts_inits,
             ))
 
+    def process_arrow(self, data: pd.DataFrame, ts_init_delta: int=0, bint is_raw=False):
+        """
+        Process the given trade tick dataset into an Arrow table of `TradeTick` data.
+
+        The table is in the data catalog schema, and is built with vectorized operations
+        without creating any intermediate objects.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data to process.
+        ts_init_delta : int
+            The difference in nanoseconds between the data timestamps and the
+            `ts_init` value. Can be used to represent/simulate latency between
+            the data source and the Nautilus system.
+        is_raw : bool, default False
+            If the data is scaled to Nautilus fixed-point values.
+
+        Returns
+        -------
+        pa.Table
+
+        Raises
+        ------
+        ValueError
+            If `data` is empty.
+
+        """
+        Condition.not_none(data, "data")
+        Condition.is_false(data.empty, "data.empty")
+
+        data = as_utc_index(data)
+        ts_events, ts_inits = prepare_event_and_init_timestamps(data.index, ts_init_delta)
+
+        if is_raw:
+            prices = data["price"].to_numpy().astype(np.int64)
+            sizes = data["quantity"].to_numpy().astype(np.uint64)
+        else:
+            prices = to_fixed_raw(data["price"], self.instrument.price_precision)
+            sizes = to_fixed_raw(data["quantity"], self.instrument.size_precision, np.uint64)
+
+        columns = {
+            "price": prices,
+            "size": sizes,
+            "aggressor_side": self._create_side_if_not_exist(data),
+            "trade_id": pa.array(data["trade_id"].astype(str).to_numpy(), type=pa.string()),
+            "ts_event": ts_events,
+            "ts_init": ts_inits,
+        }
+
+        return _arrow_table(
+            nautilus_pyo3.TradeTick.get_fields(),
+            columns,
+            _instrument_metadata(self.instrument),
+        )
+
     def process_bar_data(
         self,
         data: pd.DataFrame,
@@ -671,9 +918,103 @@ cdef class TradeTickDataWrangler:
             If the data should be sorted by timestamp.
 
         """
+        columns = self._process_bar_data_raw(
+            data,
+            ts_init_delta,
+            offset_interval_ms,
+            timestamp_is_close,
+            random_seed,
+            is_raw,
+            sort_data,
+        )
+
+        return TradeTick.from_raw_arrays_to_list_c(
+            self.instrument.id,
+            self.instrument.price_precision,
+            self.instrument.size_precision,
+            columns["price"],
+            columns["size"],
+            columns["aggressor_side"],
+            columns["trade_id"].tolist(),
+            columns["ts_event"],
+            columns["ts_init"],
+        )
+
+    def process_bar_data_arrow(
+        self,
+        data: pd.DataFrame,
+        ts_init_delta: int = 0,
+        offset_interval_ms: int = 100,
+        bint timestamp_is_close: bool = True,
+        random_seed: int | None = None,
+        bint is_raw: bool = False,
+        bint sort_data: bool = True,
+    ):
+        """
+        Process the given bar datasets into an Arrow table of `TradeTick` data.
+
+        The table is in the data catalog schema, and holds the same ticks as
+        `process_bar_data` without creating any intermediate objects.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The trade bar data.
+        ts_init_delta : int
+            The difference in nanoseconds between the data timestamps and the
+            `ts_init` value.
+        offset_interval_ms : int, default 100
+            The number of milliseconds to offset each tick for the bar timestamps.
+        random_seed : int, optional
+            The random seed for shuffling order of high and low ticks from bar
+            data. If random_seed is ``None`` then won't shuffle.
+        is_raw : bool, default False
+            If the data is scaled to Nautilus fixed-point.
+        timestamp_is_close : bool, default True
+            If bar timestamps are at the close.
+        sort_data : bool, default True
+            If the data should be sorted by timestamp.
+
+        Returns
+        -------
+        pa.Table
+
+        See Also
+        --------
+        process_bar_data
+
+        """
+        columns = self._process_bar_data_raw(
+            data,
+            ts_init_delta,
+            offset_interval_ms,
+            timestamp_is_close,
+            random_seed,
+            is_raw,
+            sort_data,
+        )
+        columns["trade_id"] = pa.array(columns["trade_id"], type=pa.string())
+
+        return _arrow_table(
+            nautilus_pyo3.TradeTick.get_fields(),
+            columns,
+            _instrument_metadata(self.instrument),
+        )
+
+    def _process_bar_data_raw(
+        self,
+        data,
+        ts_init_delta,
+        offset_interval_ms,
+        bint timestamp_is_close,
+        random_seed,
+        bint is_raw,
+        bint sort_data,
+    ):
         Condition.type(data, pd.DataFrame, "data")
         Condition.is_false(data.empty, "data.empty")
         Condition.type(data.index, pd.DatetimeIndex, "data.index")
+        Condition.not_negative(ts_init_delta, "ts_init_delta")
         for col in BAR_COLUMNS:
             Condition.is_in(col, data.columns, col, "data.columns")
         if random_seed is not None:
@@ -681,58 +1022,36 @@ cdef class TradeTickDataWrangler:
 
         # Standardize and preprocess data
         data = preprocess_bar_data(data, is_raw)
-        data.loc[:, "volume"] = calculate_volume_quarter(data["volume"], self.instrument.size_precision)
-        data.loc[:, "trade_id"] = data.index.view(np.uint64).astype(str)
+        offsets = calculate_bar_price_offsets(len(data), timestamp_is_close, offset_interval_ms, random_seed)
 
-        records = data.to_records()
-        offsets = calculate_bar_price_offsets(len(records), timestamp_is_close, offset_interval_ms, random_seed)
-        ticks_final = self._create_trade_ticks_array(records, offsets)
+        # Each bar is four ticks (open, high, low, close) each with a quarter of the volume
+        sizes = calculate_volume_quarter(data["volume"].to_numpy(), self.instrument.size_precision)
+        columns = {
+            "price": _bar_tick_prices(data),
+            "size": np.tile(sizes, len(BAR_PRICES)),
+            "ts_event": _bar_tick_timestamps(data.index, offsets),
+        }
 
         # Sort data by timestamp, if required
         if sort_data:
-            sorted_indices = np.argsort(ticks_final["timestamp"])
-            ticks_final = ticks_final[sorted_indices]
-
-        ts_events = ticks_final["timestamp"].view(np.uint64)
-        ts_inits = ts_events + ts_init_delta
+            sorted_indices = np.argsort(columns["ts_event"], kind="stable")
+            columns = {name: values[sorted_indices] for name, values in columns.items()}
 
-        cdef uint8_t[:] aggressor_sides = np.full(len(ts_events), AggressorSide.NO_AGGRESSOR, dtype=np.uint8)
-
-        return TradeTick.from_raw_arrays_to_list_c(
-            self.instrument.id,
-            self.instrument.price_precision,
-            self.instrument.size_precision,
-            ticks_final["price"],
-            ticks_final["size"],
-            aggressor_sides,
-            ts_events.astype(str).tolist(),
-            ts_events,
-            ts_inits,
-        )
-
-    def _create_trade_ticks_array(
-        self,
-        records,
-        offsets,
-    ):
-        dtype = [("price", np.int64), ("size", np.uint64), ("timestamp", "datetime64[ns]")]
-        tick_data = np.empty(len(records) * 4, dtype=dtype)
-        for i, price_key in enumerate(BAR_PRICES):
-            start_index = i * len(records)
-            end_index = start_index + len(records)
-            tick_data["price"][start_index:end_index] = records[price_key].astype(np.int64)
-            tick_data["size"][start_index:end_index] = records["volume"].astype(np.uint64)
-            tick_data["timestamp"][start_index:end_index] = records["timestamp"] + offsets[price_key]
-
-        return tick_data
+        ts_events = columns["ts_event"]
+        columns["aggressor_side"] = np.full(len(ts_events), AggressorSide.NO_AGGRESSOR, dtype=np.uint8)
+        columns["trade_id"] = ts_events.astype(str)
+        columns["ts_init"] = ts_events + np.uint64(ts_init_delta)
+        return columns
 
     def _create_side_if_not_exist(self, data):
         if "side" in data.columns:
-            return data["side"].apply(lambda x: AggressorSide.BUYER if str(x).upper() == "BUY" else AggressorSide.SELLER)
+            is_buy = data["side"].astype(str).str.upper().to_numpy() == "BUY"
+            return np.where(is_buy, AggressorSide.BUYER, AggressorSide.SELLER).astype(np.uint8)
         elif "buyer_maker" in data.columns:
-            return data["buyer_maker"].apply(lambda x: AggressorSide.SELLER if x is True else AggressorSide.BUYER)
+            is_buyer_maker = data["buyer_maker"].eq(True).to_numpy()
+            return np.where(is_buyer_maker, AggressorSide.SELLER, AggressorSide.BUYER).astype(np.uint8)
         else:
-            return [AggressorSide.NO_AGGRESSOR] * len(data)
+            return np.full(len(data), AggressorSide.NO_AGGRESSOR, dtype=np.uint8)
 
     # cpdef method for Python wrap() (called with map)
     cpdef TradeTick _build_tick_from_raw(
@@ -855,6 +1174,62 @@ cdef class BarDataWrangler:
             ts_inits
         ))
 
+    def process_arrow(
+        self,
+        data: pd.DataFrame,
+        default_volume: float=1_000_000.0,
+        ts_init_delta: int=0,
+    ):
+        """
+        Process the given bar dataset into an Arrow table of `Bar` data.
+
+        The table is in the data catalog schema, and is built with vectorized operations
+        without creating any intermediate objects.
+
+        Expects columns ['open', 'high', 'low', 'close', 'volume'] with 'timestamp' index.
+        Note: The 'volume' column is optional, if one does not exist then will use the `default_volume`.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data to process.
+        default_volume : float
+            The default volume for each bar (if not provided).
+        ts_init_delta : int
+            The difference in nanoseconds between the data timestamps and the
+            `ts_init` value. Can be used to represent/simulate latency between
+            the data source and the Nautilus system.
+
+        Returns
+        -------
+        pa.Table
+
+        Raises
+        ------
+        ValueError
+            If `data` is empty.
+
+        """
+        Condition.not_none(data, "data")
+        Condition.is_false(data.empty, "data.empty")
+        Condition.not_none(default_volume, "default_volume")
+
+        data = as_utc_index(data)
+        ts_events, ts_inits = prepare_event_and_init_timestamps(data.index, ts_init_delta)
+
+        cdef uint8_t price_precision = self.instrument.price_precision
+        columns = {key: to_fixed_raw(data[key], price_precision) for key in BAR_PRICES}
+        volumes = data["volume"] if "volume" in data else np.full(len(data), float(default_volume))
+        columns["volume"] = to_fixed_raw(volumes, self.instrument.size_precision, np.uint64)
+        columns["ts_event"] = ts_events
+        columns["ts_init"] = ts_inits
+
+        metadata = _instrument_metadata(self.instrument)
+        metadata["instrument_id"] = self.bar_type.instrument_id.value
+        metadata["bar_type"] = str(self.bar_type)
+
+        return _arrow_table(nautilus_pyo3.Bar.get_fields(), columns, metadata)
+
     # cpdef method for Python wrap() (called with map)
     cpdef Bar _build_bar(self, double[:] values, uint64_t ts_event, uint64_t ts_init):
         # Build a bar from the given index and values. The function expects the
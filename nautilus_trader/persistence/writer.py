@@ -14,6 +14,8 @@
 # -------------------------------------------------------------------------------------------------
 
 import datetime as dt
+import threading
+from collections import deque
 from enum import Enum
 from io import TextIOWrapper
 from typing import Any, BinaryIO
@@ -35,6 +37,8 @@ from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.persistence.funcs import class_to_filename
 from nautilus_trader.persistence.funcs import urisafe_instrument_id
 from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
@@ -80,6 +84,23 @@ class StreamingFeatherWriter:
         The time of day for file rotation (for `SCHEDULED_DATES` mode).
     rotation_timezone : str, default 'UTC'
         The timezone for rotation calculations(for `SCHEDULED_DATES` mode).
+    background_writer : bool, default False
+        If objects should be serialized and written on a background thread. When enabled
+        `write` only enqueues the object into a bounded ring buffer, and the writer thread
+        converts the buffered objects to Arrow record batches in bulk.
+    buffer_size : int, default 100_000
+        The maximum number of objects held in the ring buffer (for `background_writer` mode).
+        When the buffer is full `write` blocks until the writer thread has made space.
+    batch_size : int, default 1_000
+        The maximum number of objects taken from the ring buffer per write cycle
+        (for `background_writer` mode).
+
+    Raises
+    ------
+    ValueError
+        If `buffer_size` is not positive (> 0).
+    ValueError
+        If `batch_size` is not positive (> 0).
 
     """
 
@@ -97,7 +118,13 @@ class StreamingFeatherWriter:
         rotation_interval: pd.Timedelta = pd.Timedelta(days=1),
         rotation_time: dt.time = dt.time(0, 0, 0, 0),
         rotation_timezone: str = "UTC",
+        background_writer: bool = False,
+        buffer_size: int = 100_000,
+        batch_size: int = 1_000,
     ) -> None:
+        PyCondition.positive_int(buffer_size, "buffer_size")
+        PyCondition.positive_int(batch_size, "batch_size")
+
         self.path = path
         self.cache = cache
         self.clock = clock
@@ -144,12 +171,55 @@ class StreamingFeatherWriter:
         self._last_flush = self.clock.utc_now()
         self.missing_writers: set[type] = set()
 
+        # Background writer
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self._buffer: deque[tuple[object, int]] = deque()
+        self._buffer_cond = threading.Condition()
+        self._stopping = False
+        self._flush_requested = 0
+        self._flush_completed = 0
+        self._enqueued_count = 0
+        self._written_count = 0
+        self._batch_count = 0
+        self._blocked_count = 0
+        self._max_pending = 0
+        self._writer_ts_ns = 0
+        self._writer_error: Exception | None = None
+        self._instruments: dict[InstrumentId, Instrument] = {}
+        self._writer_thread: threading.Thread | None = None
+        if background_writer:
+            self._writer_thread = threading.Thread(
+                target=self._run_writer,
+                name=f"{type(self).__name__}-writer",
+                daemon=True,
+            )
+            self._writer_thread.start()
+
+    def _on_writer_thread(self) -> bool:
+        return self._writer_thread is not None and threading.current_thread() is self._writer_thread
+
+    def _timestamp_ns(self) -> int:
+        # The writer thread uses the time captured by `write` on the event loop thread
+        if self._on_writer_thread():
+            return self._writer_ts_ns
+        return self.clock.timestamp_ns()
+
+    def _utc_now(self) -> pd.Timestamp:
+        return pd.Timestamp(self._timestamp_ns(), tz="UTC")
+
+    def _instrument(self, instrument_id: InstrumentId) -> Instrument | None:
+        # The writer thread uses the instruments captured by `write` on the event loop thread
+        if self._on_writer_thread():
+            return self._instruments.get(instrument_id)
+        return self.cache.instrument(instrument_id)
+
     def _update_next_rotation_time(self, table_name: str | tuple[str, str]) -> None:
         """
         Update the next rotation time for a specific table based on the current rotation
         mode and clock.
         """
-        now = self.clock.utc_now()
+        now = self._utc_now()
         if self.rotation_mode == RotationMode.INTERVAL:
             self._next_rotation_times[table_name] = now + self.rotation_interval
         elif self.rotation_mode == RotationMode.SCHEDULED_DATES:
@@ -190,7 +260,7 @@ class StreamingFeatherWriter:
         elif self.rotation_mode == RotationMode.SIZE:
             return self._file_sizes.get(table_name, 0) >= self.max_file_size
         elif self.rotation_mode in (RotationMode.INTERVAL, RotationMode.SCHEDULED_DATES):
-            now = self.clock.utc_now()
+            now = self._utc_now()
             next_rotation_time = self._next_rotation_times.get(table_name)
             if next_rotation_time is None:
                 self._update_next_rotation_time(table_name)
@@ -221,7 +291,7 @@ class StreamingFeatherWriter:
 
         self._create_writer(cls=cls, table_name=table_name)
         self._file_sizes[table_name] = 0
-        self._file_creation_times[table_name] = self.clock.utc_now()
+        self._file_creation_times[table_name] = self._utc_now()
         self.logger.info(f"Rotated regular file for table '{table_name}'")
 
     def _rotate_per_instrument_file(self, cls: type, obj: Any) -> None:
@@ -248,7 +318,7 @@ class StreamingFeatherWriter:
         self._create_instrument_writer(cls=cls, obj=obj)
 
         self._file_sizes[key] = 0
-        self._file_creation_times[key] = self.clock.utc_now()
+        self._file_creation_times[key] = self._utc_now()
         self.logger.info(
             f"Rotated instrument file for table '{table_name}' with instrument ID '{obj.instrument_id.value}'",
         )
@@ -266,7 +336,7 @@ class StreamingFeatherWriter:
             return
 
         schema = self._schemas[cls]
-        timestamp = self.clock.timestamp_ns()
+        timestamp = self._timestamp_ns()
         full_path = f"{self.path}/{table_name}_{timestamp}.feather"
         print(full_path)
 
@@ -275,7 +345,7 @@ class StreamingFeatherWriter:
         self._files[table_name] = f
         self._writers[table_name] = pa.ipc.new_stream(f, schema)
         self._file_sizes[table_name] = 0
-        self._file_creation_times[table_name] = self.clock.utc_now()
+        self._file_creation_times[table_name] = self._utc_now()
 
         self.logger.info(f"Created writer for table '{table_name}'")
 
@@ -297,21 +367,21 @@ class StreamingFeatherWriter:
         key = (table_name, obj.instrument_id.value)
         self.fs.makedirs(folder, exist_ok=True)
 
-        timestamp = self.clock.timestamp_ns()
+        timestamp = self._timestamp_ns()
         full_path = f"{folder}/{urisafe_instrument_id(obj.instrument_id.value)}_{timestamp}.feather"
 
         f = self.fs.open(full_path, "wb")
         self._files[key] = f
         self._instrument_writers[key] = pa.ipc.new_stream(f, schema)
         self._file_sizes[key] = 0
-        self._file_creation_times[key] = self.clock.utc_now()
+        self._file_creation_times[key] = self._utc_now()
         self.logger.info(f"Created writer for table '{table_name}'")
 
     def _extract_obj_metadata(
         self,
         obj: TradeTick | QuoteTick | Bar | OrderBookDelta,
     ) -> dict[bytes, bytes]:
-        instrument = self.cache.instrument(obj.instrument_id)
+        instrument = self._instrument(obj.instrument_id)
         metadata = {b"instrument_id": obj.instrument_id.value.encode()}
         if (
             isinstance(obj, OrderBookDelta)
@@ -339,10 +409,13 @@ class StreamingFeatherWriter:
 
         return metadata
 
-    def write(self, obj: object) -> None:  # noqa: C901
+    def write(self, obj: object) -> None:
         """
         Write the object to the stream.
 
+        When the background writer is enabled the object is only enqueued, and will
+        be serialized and written by the writer thread.
+
         Parameters
         ----------
         obj : object
@@ -352,16 +425,39 @@ class StreamingFeatherWriter:
         ------
         ValueError
             If `obj` is ``None``.
+        RuntimeError
+            If the background writer failed since the last write or flush.
 
         """
         PyCondition.not_none(obj, "obj")
 
-        cls = obj.__class__
-
         # Check if an include types filter has been specified
-        if self.include_types is not None and cls not in self.include_types:
+        if self.include_types is not None and obj.__class__ not in self.include_types:
             return
 
+        if self._writer_thread is not None:
+            self._raise_writer_error()
+            instrument_id = getattr(obj, "instrument_id", None)
+            if instrument_id is not None and instrument_id not in self._instruments:
+                instrument = self.cache.instrument(instrument_id)
+                if instrument is not None:
+                    self._instruments[instrument_id] = instrument
+            if self._enqueue(obj, self.clock.timestamp_ns()):
+                return
+            # The writer thread has stopped, so write synchronously from here on
+            self._write_pending()
+
+        route = self._resolve_writer(obj)
+        if route is not None:
+            self._write_objects(*route, objs=[obj])
+
+    def _resolve_writer(  # noqa: C901
+        self,
+        obj: object,
+    ) -> tuple[type, str, str | tuple[str, str]] | None:
+        # Return the data class, table and writer key for the object,
+        # creating the writer if required.
+        cls = obj.__class__
         if isinstance(obj, CustomData):
             cls = obj.data_type.type
 
@@ -378,26 +474,37 @@ class StreamingFeatherWriter:
                 self._create_writer(cls=cls, table_name=table)
             elif table in self._per_instrument_writers:
                 key = (table, obj.instrument_id.value)  # type: ignore
-                instrument = self.cache.instrument(obj.instrument_id)  # type: ignore
+                instrument = self._instrument(obj.instrument_id)  # type: ignore
                 if key not in self._instrument_writers and instrument is not None:
                     self._create_instrument_writer(cls=cls, obj=obj)
             elif cls not in self.missing_writers:
                 self.logger.warning(f"Can't find writer for cls: {cls}")
                 self.missing_writers.add(cls)
-                return
+                return None
             else:
-                return
+                return None
 
         if table in self._per_instrument_writers:
             key = (table, obj.instrument_id.value)  # type: ignore
-            if key in self._instrument_writers:
-                writer: RecordBatchStreamWriter = self._instrument_writers[key]
-            else:
-                return
+            if key not in self._instrument_writers:
+                return None
+            return cls, table, key
+
+        return cls, table, table
+
+    def _write_objects(
+        self,
+        cls: type,
+        table: str,
+        writer_key: str | tuple[str, str],
+        objs: list[object],
+    ) -> None:
+        if isinstance(writer_key, tuple):
+            writer: RecordBatchStreamWriter = self._instrument_writers[writer_key]
         else:
-            writer: RecordBatchStreamWriter = self._writers[table]  # type: ignore
+            writer = self._writers[writer_key]
 
-        serialized = ArrowSerializer.serialize_batch([obj], data_cls=cls)
+        serialized = ArrowSerializer.serialize_batch(objs, data_cls=cls)
         if not serialized:
             return
         try:
@@ -406,19 +513,145 @@ class StreamingFeatherWriter:
             self.check_flush()
             if self._check_file_rotation(table):
                 if table in self._per_instrument_writers:
-                    self._rotate_per_instrument_file(cls=cls, obj=obj)
+                    self._rotate_per_instrument_file(cls=cls, obj=objs[-1])
                 else:
                     self._rotate_regular_file(table, cls)
         except Exception as e:
             self.logger.error(f"Failed to serialize {cls=}")
             self.logger.error(f"ERROR = `{e}`")
-            self.logger.debug(f"data = {obj}")
+            self.logger.debug(f"data = {objs}")
+
+    def _write_batch(self, batch: list[tuple[object, int]]) -> None:
+        # Group objects by writer (preserving their order) to serialize each group in bulk
+        groups: dict[str | tuple[str, str], tuple[type, str, list[object]]] = {}
+        for obj, _ in batch:
+            route = self._resolve_writer(obj)
+            if route is None:
+                continue
+            cls, table, writer_key = route
+            group = groups.get(writer_key)
+            if group is None:
+                groups[writer_key] = (cls, table, [obj])
+            else:
+                group[2].append(obj)
+
+        for writer_key, (cls, table, objs) in groups.items():
+            self._write_objects(cls, table, writer_key, objs)
+
+        self._written_count += len(batch)
+        self._batch_count += 1
+
+    def _enqueue(self, obj: object, ts_ns: int) -> bool:
+        # Return whether the object was enqueued, which fails once the writer thread has stopped
+        writer_thread = self._writer_thread
+        with self._buffer_cond:
+            # Objects written while stopping are still drained by the writer thread
+            if not writer_thread.is_alive():
+                return False
+            if len(self._buffer) >= self.buffer_size:
+                # Backpressure: wait for the writer thread to make space
+                self._blocked_count += 1
+                while len(self._buffer) >= self.buffer_size:
+                    if not writer_thread.is_alive():
+                        return False
+                    self._buffer_cond.wait(timeout=0.1)
+            self._buffer.append((obj, ts_ns))
+            self._enqueued_count += 1
+            pending = len(self._buffer)
+            if pending > self._max_pending:
+                self._max_pending = pending
+            if pending >= self.batch_size:
+                self._buffer_cond.notify_all()
+        return True
+
+    def _write_pending(self) -> None:
+        # Write any objects left in the buffer by a stopped writer thread
+        with self._buffer_cond:
+            batch = list(self._buffer)
+            self._buffer.clear()
+            self._buffer_cond.notify_all()
+        if batch:
+            self.logger.warning(f"Writing {len(batch)} buffered objects synchronously")
+            self._write_batch(batch)
+
+    def _run_writer(self) -> None:
+        cond = self._buffer_cond
+        while True:
+            with cond:
+                timed_out = False
+                if not self._buffer and not self._stopping and not self._is_flush_pending():
+                    # Wake up at least every flush interval to flush idle streams
+                    timed_out = not cond.wait(timeout=self.flush_interval_ms / 1000)
+                size = min(len(self._buffer), self.batch_size)
+                batch = [self._buffer.popleft() for _ in range(size)]
+                drained = not self._buffer
+                flush_requested = self._flush_requested
+                stop = self._stopping and drained
+                flush = stop or (drained and self._is_flush_pending()) or timed_out
+                cond.notify_all()  # Wake any writes waiting on a full buffer
+
+            try:
+                if batch:
+                    self._writer_ts_ns = batch[-1][1]
+                    self._write_batch(batch)
+                if flush:
+                    self._flush_streams()
+                elif batch:
+                    self.check_flush()
+            except Exception as e:
+                # Keep the thread alive, so writes are not blocked on a full buffer,
+                # the error is raised to the caller on the next write or flush
+                with cond:
+                    self._writer_error = e
+                self.logger.error(f"Background writer failed: {e}")
+            finally:
+                if flush:
+                    with cond:
+                        self._flush_completed = flush_requested
+                        cond.notify_all()
+
+            if stop:
+                return
+
+    def _is_flush_pending(self) -> bool:
+        return self._flush_requested != self._flush_completed
+
+    def _raise_writer_error(self) -> None:
+        with self._buffer_cond:
+            error = self._writer_error
+            self._writer_error = None
+        if error is not None:
+            raise RuntimeError(f"Background writer failed: {error}") from error
+
+    def get_buffer_stats(self) -> dict[str, int]:
+        """
+        Return the background writer buffer statistics.
+
+        The statistics are the number of objects `enqueued` and `written`, the
+        number currently `pending` in the ring buffer and its high-water mark
+        `max_pending`, the number of `batches` written, and the number of writes
+        `blocked` due to a full buffer (backpressure).
+
+        Returns
+        -------
+        dict[str, int]
+
+        """
+        with self._buffer_cond:
+            return {
+                "enqueued": self._enqueued_count,
+                "written": self._written_count,
+                "pending": len(self._buffer),
+                "max_pending": self._max_pending,
+                "batches": self._batch_count,
+                "blocked": self._blocked_count,
+            }
 
     def check_flush(self) -> None:
         """
         Flush all stream writers if current time greater than the next flush interval.
         """
-        now = self.clock.utc_now()
+        now = self._utc_now()
         if (now - self._last_flush).total_seconds() * 1000 > self.flush_interval_ms:
             self.flush()
             self._last_flush = now
@@ -426,7 +659,31 @@ class StreamingFeatherWriter:
     def flush(self) -> None:
         """
         Flush all stream writers.
+
+        When the background writer is enabled, blocks until all objects written prior
+        to the call have been written and flushed by the writer thread.
+
+        Raises
+        ------
+        RuntimeError
+            If the background writer failed since the last write or flush.
+
         """
+        writer_thread = self._writer_thread
+        if writer_thread is None or threading.current_thread() is writer_thread:
+            self._flush_streams()
+            return
+
+        with self._buffer_cond:
+            self._flush_requested += 1
+            request = self._flush_requested
+            self._buffer_cond.notify_all()
+            while self._flush_completed < request and writer_thread.is_alive():
+                self._buffer_cond.wait(timeout=0.1)
+
+        self._raise_writer_error()
+
+    def _flush_streams(self) -> None:
         for stream in self._files.values():
             if not stream.closed:
                 stream.flush()
@@ -434,7 +691,26 @@ class StreamingFeatherWriter:
     def close(self) -> None:
         """
         Flush and close all stream writers.
+
+        When the background writer is enabled, all buffered objects (including any
+        written while closing) are written before the writer thread is stopped.
+
+        Raises
+        ------
+        RuntimeError
+            If the background writer failed since the last write or flush (raised
+            once all streams are closed).
+
         """
+        background = self._writer_thread is not None
+        if background:
+            with self._buffer_cond:
+                self._stopping = True
+                self._buffer_cond.notify_all()
+            self._writer_thread.join()
+            self._writer_thread = None
+            self._write_pending()
+
         self.flush()
         for wcls in tuple(self._writers):
             self._writers[wcls].close()
@@ -442,6 +718,9 @@ class StreamingFeatherWriter:
         for fcls in self._files:
             self._files[fcls].close()
 
+        if background:
+            self._raise_writer_error()
+
     def get_current_file_info(self) -> dict[str | tuple[str, str], dict[str, Any]]:
         """
         Get information about the current files being written.
@@ -33,6 +33,16 @@ from nautilus_trader.model.position cimport Position
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
 
+cdef class _VenueAggregates:
+    cdef set instrument_ids
+    cdef set unverified_ids
+    cdef dict pnl_totals
+    cdef set pnl_pending
+    cdef dict exposure_totals
+    cdef set exposure_pending
+    cdef set exposure_volatile
+
+
 cdef class Portfolio(PortfolioFacade):
     cdef Clock _clock
     cdef Logger _log
@@ -42,8 +52,11 @@ cdef class Portfolio(PortfolioFacade):
 
     cdef Venue _venue
     cdef dict _unrealized_pnls
+    cdef dict _net_exposures
     cdef dict _net_positions
     cdef set _pending_calcs
+    cdef dict _pnl_contributions
+    cdef dict _venue_aggregates
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -59,6 +72,13 @@ cdef class Portfolio(PortfolioFacade):
 
     cdef object _net_position(self, InstrumentId instrument_id)
     cdef void _update_net_position(self, InstrumentId instrument_id, list positions_open)
+    cdef _VenueAggregates _aggregates(self, Venue venue)
+    cdef void _update_open_instrument(self, InstrumentId instrument_id, bint is_open)
+    cdef void _verify_open_instruments(self, _VenueAggregates aggregates)
+    cdef void _update_unrealized_pnl(self, InstrumentId instrument_id, Money pnl)
+    cdef void _update_pnl_contribution(self, InstrumentId instrument_id)
+    cdef void _invalidate_net_exposure(self, InstrumentId instrument_id)
+    cdef tuple _calculate_net_exposure(self, Account account, InstrumentId instrument_id)
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id)
     cdef Price _get_last_price(self, Position position)
     cdef double _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side)
@@ -28,6 +28,7 @@ from decimal import Decimal
 
 from nautilus_trader.analysis import statistics
 from nautilus_trader.analysis.analyzer import PortfolioAnalyzer
+from nautilus_trader.portfolio.config import PortfolioConfig
 
 from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.accounting.factory cimport AccountFactory
@@ -51,6 +52,7 @@ from nautilus_trader.model.events.order cimport OrderEvent
 from nautilus_trader.model.events.order cimport OrderFilled
 from nautilus_trader.model.events.order cimport OrderRejected
 from nautilus_trader.model.events.order cimport OrderUpdated
+from nautilus_trader.model.events.position cimport PositionClosed
 from nautilus_trader.model.events.position cimport PositionEvent
 from nautilus_trader.model.functions cimport position_side_to_str
 from nautilus_trader.model.identifiers cimport InstrumentId
@@ -72,6 +74,53 @@ cdef tuple _UPDATE_ORDER_EVENTS = (
 )
 
 
+cdef class _VenueAggregates:
+    """
+    Holds the running per-currency totals for a single venue.
+
+    Totals map each currency to a ``[raw, count]`` pair, being the sum of the
+    raw fixed-point contributions and the number of contributing instruments.
+    """
+
+    def __init__(self):
+        self.instrument_ids: set[InstrumentId] = set()
+        self.unverified_ids: set[InstrumentId] = set()
+        self.pnl_totals: dict[Currency, list[int]] = {}
+        self.pnl_pending: set[InstrumentId] = set()
+        self.exposure_totals: dict[Currency, list[int]] = {}
+        self.exposure_pending: set[InstrumentId] = set()
+        self.exposure_volatile: set[InstrumentId] = set()
+
+
+cdef inline void _add_to_totals(dict totals, Money value):
+    cdef Currency currency = value.currency
+    cdef list entry = totals.get(currency)
+    if entry is None:
+        totals[currency] = [value._mem.raw, 1]
+        return
+    entry[0] += value._mem.raw
+    entry[1] += 1
+
+
+cdef inline void _remove_from_totals(dict totals, Money value):
+    cdef Currency currency = value.currency
+    cdef list entry = totals[currency]
+    if entry[1] == 1:
+        del totals[currency]
+        return
+    entry[0] -= value._mem.raw
+    entry[1] -= 1
+
+
+cdef inline dict _totals_to_money(dict totals):
+    cdef Currency currency
+    cdef list entry
+    return {
+        currency: Money.from_raw(entry[0], currency)
+        for currency, entry in totals.items()
+    }
+
+
 cdef class Portfolio(PortfolioFacade):
     """
     Provides a trading portfolio.
@@ -87,6 +136,13 @@ cdef class Portfolio(PortfolioFacade):
         The read-only cache for the portfolio.
     clock : Clock
         The clock for the portfolio.
+    config : PortfolioConfig, optional
+        The configuration for the instance.
+
+    Raises
+    ------
+    TypeError
+        If `config` is not of type `PortfolioConfig`.
     """
 
     def __init__(
@@ -94,7 +150,12 @@ cdef class Portfolio(PortfolioFacade):
         MessageBus msgbus not None,
         CacheFacade cache not None,
         Clock clock not None,
+        config: PortfolioConfig | None = None,
     ):
+        if config is None:
+            config = PortfolioConfig()
+        Condition.type(config, PortfolioConfig, "config")
+
         self._clock = clock
         self._log = Logger(name=type(self).__name__)
         self._msgbus = msgbus
@@ -107,10 +168,13 @@ cdef class Portfolio(PortfolioFacade):
 
         self._venue = None  # Venue for specific portfolio behavior (Interactive Brokers)
         self._unrealized_pnls: dict[InstrumentId, Money] = {}
+        self._net_exposures: dict[InstrumentId, Money] = {}
         self._net_positions: dict[InstrumentId, Decimal] = {}
         self._pending_calcs: set[InstrumentId] = set()
+        self._pnl_contributions: dict[InstrumentId, Money] = {}
+        self._venue_aggregates: dict[Venue, _VenueAggregates] = {}
 
-        self.analyzer = PortfolioAnalyzer()
+        self.analyzer = PortfolioAnalyzer(incremental=config.incremental_statistics)
 
         # Register default statistics
         self.analyzer.register_statistic(statistics.winner_max.MaxWinner())
@@ -226,6 +290,9 @@ cdef class Portfolio(PortfolioFacade):
         """
         # Clean slate
         self._unrealized_pnls.clear()
+        self._net_exposures.clear()
+        self._pnl_contributions.clear()
+        self._venue_aggregates.clear()
 
         cdef list all_positions_open = self._cache.positions_open()
 
@@ -253,7 +320,10 @@ cdef class Portfolio(PortfolioFacade):
                 positions_open=positions_open,
             )
 
-            self._unrealized_pnls[instrument_id] = self._calculate_unrealized_pnl(instrument_id)
+            self._update_unrealized_pnl(
+                instrument_id,
+                self._calculate_unrealized_pnl(instrument_id),
+            )
 
             account = self._cache.account_for_venue(self._venue or instrument_id.venue)
             if account is None:
@@ -300,9 +370,10 @@ cdef class Portfolio(PortfolioFacade):
         """
         Update the portfolio with the given tick.
 
-        Clears the unrealized PnL for the quote ticks instrument, and
-        performs any initialization calculations which may have been pending
-        a market quote update.
+        Clears the unrealized PnL and net exposure for the quote ticks
+        instrument (to be recalculated on the next query), and performs any
+        initialization calculations which may have been pending a market quote
+        update.
 
         Parameters
         ----------
@@ -312,7 +383,10 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(tick, "tick")
 
-        self._unrealized_pnls.pop(tick.instrument_id, None)
+        cdef InstrumentId instrument_id = tick.instrument_id
+        self._unrealized_pnls.pop(instrument_id, None)
+        self._update_pnl_contribution(instrument_id)
+        self._invalidate_net_exposure(instrument_id)
 
         if self.initialized:
             return
@@ -457,9 +531,11 @@ cdef class Portfolio(PortfolioFacade):
             )
 
 
-            self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
-                instrument_id=event.instrument_id,
+            self._update_unrealized_pnl(
+                event.instrument_id,
+                self._calculate_unrealized_pnl(instrument_id=event.instrument_id),
             )
+            self._invalidate_net_exposure(event.instrument_id)
 
         cdef list orders_open = self._cache.orders_open(
             venue=None,  # Faster query filtering
@@ -507,8 +583,9 @@ cdef class Portfolio(PortfolioFacade):
             positions_open=positions_open
         )
 
-        self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
-            instrument_id=event.instrument_id,
+        self._update_unrealized_pnl(
+            event.instrument_id,
+            self._calculate_unrealized_pnl(instrument_id=event.instrument_id),
         )
 
         cdef Account account = self._cache.account(event.account_id)
@@ -519,6 +596,12 @@ cdef class Portfolio(PortfolioFacade):
             )
             return  # No account registered
 
+        cdef Position position
+        if self.analyzer.incremental and isinstance(event, PositionClosed):
+            position = self._cache.position(event.position_id)
+            if position is not None:
+                self.analyzer.update_statistics(account, position)
+
         if account.type != AccountType.MARGIN or not account.calculate_account_state:
             return  # Nothing to calculate
 
@@ -540,7 +623,10 @@ cdef class Portfolio(PortfolioFacade):
     def _reset(self) -> None:
         self._net_positions.clear()
         self._unrealized_pnls.clear()
+        self._net_exposures.clear()
         self._pending_calcs.clear()
+        self._pnl_contributions.clear()
+        self._venue_aggregates.clear()
         self.analyzer.reset()
 
         self.initialized = False
@@ -699,30 +785,24 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(venue, "venue")
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
-            return {}  # Nothing to calculate
-
-        cdef set instrument_ids = {p.instrument_id for p in positions_open}
+        cdef _VenueAggregates aggregates = self._venue_aggregates.get(venue)
+        if aggregates is not None and aggregates.unverified_ids:
+            self._verify_open_instruments(aggregates)
 
-        cdef dict unrealized_pnls = {}  # type: dict[Currency, 0.0]
+        if aggregates is None or not aggregates.instrument_ids:
+            return {}  # Nothing to calculate
 
+        # Only instruments changed since the last query need calculating
         cdef:
             InstrumentId instrument_id
             Money pnl
-        for instrument_id in instrument_ids:
-            pnl = self._unrealized_pnls.get(instrument_id)
-            if pnl is not None:
-                # PnL already calculated
-                unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, 0.0) + pnl.as_f64_c()
-                continue  # To next instrument_id
-            # Calculate PnL
+        for instrument_id in list(aggregates.pnl_pending):
             pnl = self._calculate_unrealized_pnl(instrument_id)
             if pnl is None:
                 continue  # Error logged in `_calculate_unrealized_pnl`
-            unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, 0.0) + pnl.as_f64_c()
+            self._update_unrealized_pnl(instrument_id, pnl)
 
-        return {k: Money(v, k) for k, v in unrealized_pnls.items()}
+        return _totals_to_money(aggregates.pnl_totals)
 
     cpdef dict net_exposures(self, Venue venue):
         """
@@ -748,72 +828,51 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
+        cdef _VenueAggregates aggregates = self._venue_aggregates.get(venue)
+        if aggregates is not None and aggregates.unverified_ids:
+            self._verify_open_instruments(aggregates)
+
+        if aggregates is None or not aggregates.instrument_ids:
             return {}  # Nothing to calculate
 
-        cdef dict net_exposures = {}  # type: dict[Currency, float]
+        # Instruments priced from quotes in their settlement currency are held
+        # in the running totals until their next quote or position update,
+        # all others (volatile) are recalculated on every query.
+        cdef list volatile_exposures = []
 
         cdef:
-            Position position
-            Instrument instrument
-            Price last
-            Currency settlement_currency
-            double xrate
-        for position in positions_open:
-            instrument = self._cache.instrument(position.instrument_id)
-            if instrument is None:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"no instrument for {position.instrument_id}"
-                )
-                return None  # Cannot calculate
-
-            if position.side == PositionSide.FLAT:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"position is flat for {position.instrument_id}"
-                )
-                continue  # Nothing to calculate
-
-            last = self._get_last_price(position)
-            if last is None:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"no prices for {position.instrument_id}"
-                )
-                continue  # Cannot calculate
-
-            xrate = self._calculate_xrate_to_base(
-                instrument=instrument,
-                account=account,
-                side=position.entry,
-            )
-
-            if xrate == 0.0:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"insufficient data for {instrument.get_settlement_currency()}/{account.base_currency}"
-                )
+            InstrumentId instrument_id
+            Money net_exposure
+            bint calculated
+            bint stable
+        for instrument_id in aggregates.exposure_pending | aggregates.exposure_volatile:
+            calculated, net_exposure, stable = self._calculate_net_exposure(account, instrument_id)
+            if not calculated:
                 return None  # Cannot calculate
 
-            if account.base_currency is not None:
-                settlement_currency = account.base_currency
+            aggregates.exposure_pending.discard(instrument_id)
+            if stable:
+                aggregates.exposure_volatile.discard(instrument_id)
+                self._net_exposures[instrument_id] = net_exposure
+                _add_to_totals(aggregates.exposure_totals, net_exposure)
             else:
-                settlement_currency = instrument.get_settlement_currency()
-
-            net_exposure = instrument.notional_value(
-                position.quantity,
-                last,
-            ).as_f64_c()
-            net_exposure = round(net_exposure * xrate, settlement_currency._mem.precision)
+                aggregates.exposure_volatile.add(instrument_id)
+                if net_exposure is not None:
+                    volatile_exposures.append(net_exposure)
 
-            total_net_exposure = net_exposures.get(settlement_currency, 0.0)
-            total_net_exposure += net_exposure
+        if not volatile_exposures:
+            return _totals_to_money(aggregates.exposure_totals)
 
-            net_exposures[settlement_currency] = total_net_exposure
+        cdef Currency currency
+        cdef list entry
+        cdef dict net_exposures = {
+            currency: list(entry)
+            for currency, entry in aggregates.exposure_totals.items()
+        }
+        for net_exposure in volatile_exposures:
+            _add_to_totals(net_exposures, net_exposure)
 
-        return {k: Money(v, k) for k, v in net_exposures.items()}
+        return _totals_to_money(net_exposures)
 
     cpdef Money unrealized_pnl(self, InstrumentId instrument_id):
         """
@@ -836,7 +895,7 @@ cdef class Portfolio(PortfolioFacade):
             return pnl
 
         pnl = self._calculate_unrealized_pnl(instrument_id)
-        self._unrealized_pnls[instrument_id] = pnl
+        self._update_unrealized_pnl(instrument_id, pnl)
 
         return pnl
 
@@ -1031,6 +1090,159 @@ cdef class Portfolio(PortfolioFacade):
             self._net_positions[instrument_id] = net_position
             self._log.info(f"{instrument_id} net_position={net_position}")
 
+        cdef bint is_open = len(positions_open) > 0
+        cdef _VenueAggregates aggregates = self._aggregates(instrument_id.venue)
+        if is_open:
+            aggregates.unverified_ids.discard(instrument_id)
+        else:
+            # The position may be added to the cache after its event is handled
+            aggregates.unverified_ids.add(instrument_id)
+
+        self._update_open_instrument(instrument_id, is_open)
+        self._invalidate_net_exposure(instrument_id)
+
+    cdef _VenueAggregates _aggregates(self, Venue venue):
+        cdef _VenueAggregates aggregates = self._venue_aggregates.get(venue)
+        if aggregates is None:
+            aggregates = _VenueAggregates()
+            self._venue_aggregates[venue] = aggregates
+
+        return aggregates
+
+    cdef void _update_open_instrument(self, InstrumentId instrument_id, bint is_open):
+        cdef _VenueAggregates aggregates = self._aggregates(instrument_id.venue)
+        if is_open == (instrument_id in aggregates.instrument_ids):
+            return  # No change
+
+        if is_open:
+            aggregates.instrument_ids.add(instrument_id)
+        else:
+            aggregates.instrument_ids.discard(instrument_id)
+
+        self._update_pnl_contribution(instrument_id)
+        self._invalidate_net_exposure(instrument_id)
+
+    cdef void _verify_open_instruments(self, _VenueAggregates aggregates):
+        # Re-checks instruments which had no open positions when last updated
+        cdef InstrumentId instrument_id
+        for instrument_id in aggregates.unverified_ids:
+            if not self._cache.position_open_ids(venue=None, instrument_id=instrument_id):
+                continue  # Still flat
+            self._unrealized_pnls.pop(instrument_id, None)
+            self._update_open_instrument(instrument_id, True)
+
+        aggregates.unverified_ids.clear()
+
+    cdef void _update_unrealized_pnl(self, InstrumentId instrument_id, Money pnl):
+        self._unrealized_pnls[instrument_id] = pnl
+        self._update_pnl_contribution(instrument_id)
+
+    cdef void _update_pnl_contribution(self, InstrumentId instrument_id):
+        # Swaps the instruments cached unrealized PnL into its venue totals
+        cdef _VenueAggregates aggregates = self._aggregates(instrument_id.venue)
+        cdef Money pnl = self._pnl_contributions.pop(instrument_id, None)
+        if pnl is not None:
+            _remove_from_totals(aggregates.pnl_totals, pnl)
+
+        if instrument_id not in aggregates.instrument_ids:
+            aggregates.pnl_pending.discard(instrument_id)
+            return  # No open positions to contribute
+
+        pnl = self._unrealized_pnls.get(instrument_id)
+        if pnl is None:
+            aggregates.pnl_pending.add(instrument_id)
+            return  # Calculated on next query
+
+        aggregates.pnl_pending.discard(instrument_id)
+        _add_to_totals(aggregates.pnl_totals, pnl)
+        self._pnl_contributions[instrument_id] = pnl
+
+    cdef void _invalidate_net_exposure(self, InstrumentId instrument_id):
+        cdef _VenueAggregates aggregates = self._aggregates(instrument_id.venue)
+        cdef Money net_exposure = self._net_exposures.pop(instrument_id, None)
+        if net_exposure is not None:
+            _remove_from_totals(aggregates.exposure_totals, net_exposure)
+
+        aggregates.exposure_volatile.discard(instrument_id)
+        if instrument_id in aggregates.instrument_ids:
+            aggregates.exposure_pending.add(instrument_id)
+        else:
+            aggregates.exposure_pending.discard(instrument_id)
+
+    cdef tuple _calculate_net_exposure(self, Account account, InstrumentId instrument_id):
+        # Returns a tuple of (calculated, net exposure or ``None``, stable)
+        cdef Instrument instrument = self._cache.instrument(instrument_id)
+        if instrument is None:
+            self._log.error(
+                f"Cannot calculate net exposures: "
+                f"no instrument for {instrument_id}"
+            )
+            return False, None, False  # Cannot calculate
+
+        cdef Currency settlement_currency
+        if account.base_currency is not None:
+            settlement_currency = account.base_currency
+        else:
+            settlement_currency = instrument.get_settlement_currency()
+
+        # Stable when only a new quote or position update can change the value
+        cdef bint stable = (
+            settlement_currency == instrument.get_settlement_currency()
+            and self._cache.quote_tick(instrument_id) is not None
+        )
+
+        cdef list positions_open = self._cache.positions_open(
+            venue=None,  # Faster query filtering
+            instrument_id=instrument_id,
+        )
+
+        cdef double net_exposure = 0.0
+        cdef bint has_exposure = False
+
+        cdef:
+            Position position
+            Price last
+            double xrate
+        for position in positions_open:
+            if position.side == PositionSide.FLAT:
+                self._log.error(
+                    f"Cannot calculate net exposures: "
+                    f"position is flat for {position.instrument_id}"
+                )
+                continue  # Nothing to calculate
+
+            last = self._get_last_price(position)
+            if last is None:
+                self._log.error(
+                    f"Cannot calculate net exposures: "
+                    f"no prices for {position.instrument_id}"
+                )
+                continue  # Cannot calculate
+
+            xrate = self._calculate_xrate_to_base(
+                instrument=instrument,
+                account=account,
+                side=position.entry,
+            )
+
+            if xrate == 0.0:
+                self._log.error(
+                    f"Cannot calculate net exposures: "
+                    f"insufficient data for {instrument.get_settlement_currency()}/{account.base_currency}"
+                )
+                return False, None, False  # Cannot calculate
+
+            net_exposure += round(
+                instrument.notional_value(position.quantity, last).as_f64_c() * xrate,
+                settlement_currency._mem.precision,
+            )
+            has_exposure = True
+
+        if not has_exposure:
+            return True, None, False
+
+        return True, Money(net_exposure, settlement_currency), stable
+
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id):
         cdef Account account = self._cache.account_for_venue(self._venue or instrument_id.venue)
         if account is None:
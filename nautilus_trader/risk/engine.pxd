@@ -15,6 +15,7 @@
 
 from decimal import Decimal
 
+from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport Throttler
@@ -27,8 +28,11 @@ from nautilus_trader.execution.messages cimport ModifyOrder
 from nautilus_trader.execution.messages cimport SubmitOrder
 from nautilus_trader.execution.messages cimport SubmitOrderList
 from nautilus_trader.execution.messages cimport TradingCommand
+from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
@@ -36,10 +40,25 @@ from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
 
+cdef class RiskContext:
+    cdef readonly Instrument instrument
+    """The instrument for the context.\n\n:returns: `Instrument`"""
+    cdef readonly Money max_notional
+    """The maximum notional per order for the instrument.\n\n:returns: `Money` or ``None``"""
+    cdef readonly Currency base_currency
+    """The base currency for the instrument.\n\n:returns: `Currency` or ``None``"""
+    cdef readonly Account account
+    """The account for the instrument venue.\n\n:returns: `Account` or ``None``"""
+
+    cpdef void update_instrument(self, Instrument instrument, max_notional)
+    cpdef void update_account(self, Account account)
+
+
 cdef class RiskEngine(Component):
     cdef readonly PortfolioFacade _portfolio
     cdef readonly Cache _cache
     cdef readonly dict _max_notional_per_order
+    cdef readonly dict _risk_contexts
     cdef readonly Throttler _order_submit_throttler
     cdef readonly Throttler _order_modify_throttler
 
@@ -87,6 +106,7 @@ cdef class RiskEngine(Component):
     cpdef bint _check_order_price(self, Instrument instrument, Order order)
     cpdef bint _check_order_quantity(self, Instrument instrument, Order order)
     cpdef bint _check_orders_risk(self, Instrument instrument, list orders)
+    cdef RiskContext _risk_context(self, Instrument instrument)
     cpdef str _check_price(self, Instrument instrument, Price price)
     cpdef str _check_quantity(self, Instrument instrument, Quantity quantity)
 
@@ -107,3 +127,4 @@ cdef class RiskEngine(Component):
 # -- EVENT HANDLERS -------------------------------------------------------------------------------
 
     cpdef void _handle_event(self, Event event)
+    cpdef void _handle_account_state(self, AccountState event)
@@ -51,6 +51,7 @@ from nautilus_trader.execution.messages cimport SubmitOrderList
 from nautilus_trader.execution.messages cimport TradingCommand
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.events.account cimport AccountState
 from nautilus_trader.model.events.order cimport OrderCancelRejected
 from nautilus_trader.model.events.order cimport OrderDenied
 from nautilus_trader.model.events.order cimport OrderModifyRejected
@@ -172,6 +173,7 @@ cdef class RiskEngine(Component):
 
         # Risk settings
         self._max_notional_per_order: dict[InstrumentId, Decimal] = {}
+        self._risk_contexts: dict[InstrumentId, RiskContext] = {}
 
         # Configure
         self._initialize_risk_checks(config)
@@ -184,6 +186,9 @@ cdef class RiskEngine(Component):
         self._msgbus.subscribe(topic="events.order.*", handler=self._handle_event, priority=10)
         self._msgbus.subscribe(topic="events.position.*", handler=self._handle_event, priority=10)
 
+        # Risk context subscriptions (after the portfolio has applied the account state)
+        self._msgbus.subscribe(topic="events.account.*", handler=self._handle_account_state)
+
     def _initialize_risk_checks(self, config: RiskEngineConfig):
         cdef dict max_notional_config = config.max_notional_per_order
         for instrument_id, value in max_notional_config.items():
@@ -298,6 +303,10 @@ cdef class RiskEngine(Component):
         old_value: Decimal = self._max_notional_per_order.get(instrument_id)
         self._max_notional_per_order[instrument_id] = new_value
 
+        cdef RiskContext context = self._risk_contexts.get(instrument_id)
+        if context is not None:
+            context.update_instrument(context.instrument, new_value)
+
         cdef str new_value_str = f"{new_value:,}" if new_value is not None else str(None)
         self._log.info(
             f"Set MAX_NOTIONAL_PER_ORDER: {instrument_id} {new_value_str}",
@@ -381,6 +390,7 @@ cdef class RiskEngine(Component):
         self.event_count = 0
         self._order_submit_throttler.reset()
         self._order_modify_throttler.reset()
+        self._risk_contexts.clear()
 
     cpdef void _dispose(self):
         pass
@@ -460,13 +470,18 @@ cdef class RiskEngine(Component):
         ########################################################################
         # PRE-TRADE ORDER(S) CHECKS
         ########################################################################
+        cdef str reason = f"OrderList {command.order_list.id.to_str()} DENIED"
+        cdef Order order
         for order in command.order_list.orders:
             if not self._check_order(instrument, order):
+                # Deny remaining orders in list
+                self._deny_order_list(command.order_list, reason)
                 return  # Denied
 
+        # Risk checked as a batch (context, account and prices resolved once)
         if not self._check_orders_risk(instrument, command.order_list.orders):
             # Deny all orders in list
-            self._deny_order_list(command.order_list, "OrderList {command.order_list.id.to_str()} DENIED")
+            self._deny_order_list(command.order_list, reason)
             return # Denied
 
         self._execution_gateway(instrument, command)
@@ -599,15 +614,11 @@ cdef class RiskEngine(Component):
         cdef Price last_px = None
         cdef Money free
 
-        # Determine max notional
-        cdef Money max_notional = None
-        max_notional_setting: Decimal | None = self._max_notional_per_order.get(instrument.id)
-        if max_notional_setting:
-            # TODO: Improve efficiency of this
-            max_notional = Money(float(max_notional_setting), instrument.quote_currency)
+        cdef RiskContext context = self._risk_context(instrument)
+        cdef Money max_notional = context.max_notional
 
         # Get account for risk checks
-        cdef Account account = self._cache.account_for_venue(instrument.id.venue)
+        cdef Account account = context.account
         if account is None:
             self._log.debug(f"Cannot find account for venue {instrument.id.venue}")
             return True  # TODO: Temporary early return until handling routing/multiple venues
@@ -710,7 +721,7 @@ cdef class RiskEngine(Component):
                 return False  # Denied
 
             if base_currency is None:
-                base_currency = instrument.get_base_currency()
+                base_currency = context.base_currency
 
             if order.is_buy_c():
                 if cum_notional_buy is None:
@@ -795,6 +806,22 @@ cdef class RiskEngine(Component):
             # Check failed
             return f"quantity {quantity} invalid (< minimum trade size of {instrument.min_quantity})"
 
+    cdef RiskContext _risk_context(self, Instrument instrument):
+        cdef RiskContext context = self._risk_contexts.get(instrument.id)
+        if context is None:
+            # Initialize from the cache, then the account is maintained from account events
+            context = RiskContext(instrument, self._max_notional_per_order.get(instrument.id))
+            self._risk_contexts[instrument.id] = context
+        elif context.instrument is not instrument:
+            # Instrument updated in the cache
+            context.update_instrument(instrument, self._max_notional_per_order.get(instrument.id))
+
+        if context.account is None:
+            # Account may not have been registered when the context was created
+            context.update_account(self._cache.account_for_venue(instrument.id.venue))
+
+        return context
+
 # -- DENIALS --------------------------------------------------------------------------------------
 
     cpdef void _deny_command(self, TradingCommand command, str reason):
@@ -932,3 +959,71 @@ cdef class RiskEngine(Component):
         if self.debug:
             self._log.debug(f"{RECV}{EVT} {event}", LogColor.MAGENTA)
         self.event_count += 1
+
+    cpdef void _handle_account_state(self, AccountState event):
+        # Accounts are registered (or replaced) with account state events
+        cdef RiskContext context
+        for context in self._risk_contexts.values():
+            context.update_account(self._cache.account_for_venue(context.instrument.id.venue))
+
+
+cdef class RiskContext:
+    """
+    Provides the pre-trade risk context for an instrument.
+
+    The context holds the values needed to check order risk for an instrument,
+    so they are not resolved through the cache for every order. The instrument
+    values are precomputed, and the account is updated from account events.
+    Market prices are always read from the cache, which is updated before the
+    data is published.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the context.
+    max_notional : Decimal, optional
+        The maximum notional per order setting for the instrument.
+
+    """
+
+    def __init__(self, Instrument instrument not None, max_notional: Decimal | None = None) -> None:
+        self.account = None
+        self.update_instrument(instrument, max_notional)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument.id}, "
+            f"max_notional={self.max_notional}, "
+            f"account_id={self.account.id if self.account is not None else None})"
+        )
+
+    cpdef void update_instrument(self, Instrument instrument, max_notional):
+        """
+        Update the context with the given instrument and max notional setting.
+
+        Parameters
+        ----------
+        instrument : Instrument
+            The instrument for the context.
+        max_notional : Decimal or ``None``
+            The maximum notional per order setting for the instrument.
+
+        """
+        Condition.not_none(instrument, "instrument")
+
+        self.instrument = instrument
+        self.max_notional = Money(float(max_notional), instrument.quote_currency) if max_notional else None
+        self.base_currency = instrument.get_base_currency()
+
+    cpdef void update_account(self, Account account):
+        """
+        Update the context with the given account for the instrument venue.
+
+        Parameters
+        ----------
+        account : Account or ``None``
+            The account for the context.
+
+        """
+        self.account = account
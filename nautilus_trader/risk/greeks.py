@@ -13,12 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.common.actor import Actor
 from nautilus_trader.common.config import ActorConfig
 from nautilus_trader.core.datetime import unix_nanos_to_dt
-from nautilus_trader.core.nautilus_pyo3 import imply_vol_and_greeks
 from nautilus_trader.core.rust.model import OptionKind
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import DataType
@@ -27,6 +27,7 @@ from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.greeks import GreeksData
 from nautilus_trader.model.greeks import InterestRateCurveData
 from nautilus_trader.model.greeks import InterestRateData
+from nautilus_trader.model.greeks import OptionChainGreeks
 from nautilus_trader.model.identifiers import InstrumentId
 
 
@@ -34,6 +35,13 @@ def greeks_key(instrument_id: InstrumentId):
     return f"{instrument_id}_GREEKS"
 
 
+def option_chain_greeks_key(underlying: str):
+    return f"{underlying}_CHAIN_GREEKS"
+
+
+_NANOSECONDS_IN_DAY = 86_400_000_000_000
+
+
 class GreeksCalculatorConfig(ActorConfig, frozen=True):
     """
     Configuration settings for the GreeksCalculator actor.
@@ -65,7 +73,8 @@ class GreeksCalculator(Actor):
     A class for calculating option Greeks for futures options.
 
     This calculator works specifically for European options on futures with no dividends.
-    It computes the Greeks for all options of a given underlying when a bar of the future is received.
+    It computes the Greeks for all options of a given underlying when a bar of the future is received,
+    solving the whole option chain at once and publishing a single `OptionChainGreeks`.
 
     Parameters
     ----------
@@ -90,7 +99,7 @@ class GreeksCalculator(Actor):
     on_start()
         Initializes data subscriptions when the actor starts.
     on_data(data)
-        Handles incoming data updates (GreeksData, InterestRateData or InterestRateCurveData).
+        Handles incoming data updates (GreeksData, OptionChainGreeks, InterestRateData or InterestRateCurveData).
     on_bar(bar: Bar)
         Processes incoming bar data and triggers Greek calculations.
     compute_greeks(instrument_id: InstrumentId, future_price: float, ts_event: int)
@@ -112,11 +121,16 @@ class GreeksCalculator(Actor):
             interest_rate=config.interest_rate,
         )
 
+        self._option_chains: dict[str, tuple[frozenset[InstrumentId], dict[str, np.ndarray]]] = {}
+
     def on_start(self):
         if self.load_greeks:
             self.subscribe_data(
                 DataType(GreeksData, metadata={"instrument_id": f"{self.underlying}*"}),
             )
+            self.subscribe_data(
+                DataType(OptionChainGreeks, metadata={"underlying": f"{self.underlying}*"}),
+            )
         else:
             self.msgbus.subscribe(
                 topic=f"data.bars.{self.underlying}*-{self.bar_spec}*",
@@ -131,6 +145,8 @@ class GreeksCalculator(Actor):
     def on_data(self, data):
         if isinstance(data, GreeksData):
             self.cache_greeks(data)
+        elif isinstance(data, OptionChainGreeks):
+            self.cache_option_chain_greeks(data)
         elif isinstance(data, InterestRateData) or isinstance(data, InterestRateCurveData):
             self.interest_rate = data
 
@@ -146,70 +162,100 @@ class GreeksCalculator(Actor):
         future_underlying = instrument_id.symbol.value
         multiplier = float(future_definition.multiplier)
 
-        utc_now = unix_nanos_to_dt(ts_event)
-
-        for option_definition in self.cache.instruments():
-            if (
-                option_definition.instrument_class is not InstrumentClass.OPTION
-                or option_definition.underlying != future_underlying
-            ):
-                continue
+        chain = self._option_chain(future_underlying)
+        if chain is None:
+            return
 
-            is_call = option_definition.option_kind is OptionKind.CALL
-            strike = float(option_definition.strike_price)
+        option_ids = chain["instrument_ids"]
+        option_mid_prices = np.array(
+            [self.cache.price(option_id, PriceType.MID) for option_id in option_ids],
+            dtype=np.float64,  # Options without a price yet are NaN
+        )
+        priced = ~np.isnan(option_mid_prices)
+
+        days_to_expiry = (chain["expiration_ns"] - ts_event) // _NANOSECONDS_IN_DAY
+        expiry_in_years = np.minimum(days_to_expiry, 1) / 365.25
+
+        # Interest rates only vary with expiry, so are evaluated once per distinct expiry
+        unique_expiries, expiry_index = np.unique(expiry_in_years, return_inverse=True)
+        interest_rate = np.array(
+            [self.interest_rate(float(x)) for x in unique_expiries],
+            dtype=np.float64,
+        )[expiry_index]
+
+        greeks = imply_vol_and_greeks_array(
+            future_price,
+            interest_rate[priced],
+            0.0,
+            chain["is_call"][priced],
+            chain["strike"][priced],
+            expiry_in_years[priced],
+            option_mid_prices[priced],
+            multiplier,
+        )
 
-            expiry_utc = option_definition.expiration_utc
-            expiry = date_to_int(expiry_utc)
-            expiry_in_years = min((expiry_utc - utc_now).days, 1) / 365.25
+        chain_greeks = OptionChainGreeks(
+            ts_event,
+            ts_event,
+            future_underlying,
+            future_price,
+            option_ids[priced],
+            chain["is_call"][priced],
+            chain["strike"][priced],
+            chain["expiry"][priced],
+            expiry_in_years[priced],
+            interest_rate[priced],
+            greeks["vol"],
+            greeks["price"],
+            greeks["delta"],
+            greeks["gamma"],
+            greeks["vega"],
+            greeks["theta"],
+            np.abs(greeks["delta"] / multiplier),
+        )
 
-            interest_rate = self.interest_rate(expiry_in_years)
-            self.log.debug(f"Interest rate for {option_definition.id}: {interest_rate}")
+        # write greeks to the cache
+        self.cache_option_chain_greeks(chain_greeks)
 
-            option_mid_price = float(self.cache.price(option_definition.id, PriceType.MID))
+        # publish greeks on message bus
+        self.publish_data(
+            DataType(OptionChainGreeks, metadata={"underlying": future_underlying}),
+            chain_greeks,
+        )
 
-            greeks = imply_vol_and_greeks(
-                future_price,
-                interest_rate,
-                0.0,
-                is_call,
-                strike,
-                expiry_in_years,
-                option_mid_price,
-                multiplier,
-            )
+    def _option_chain(self, underlying: str) -> dict[str, np.ndarray] | None:
+        # Static option definitions are kept as arrays, and only rebuilt when the
+        # option chain for the underlying changes in the cache.
+        options = [
+            x
+            for x in self.cache.instruments(underlying=underlying)
+            if x.instrument_class is InstrumentClass.OPTION
+        ]
+        if not options:
+            return None
 
-            greeks_data = GreeksData(
-                ts_event,
-                ts_event,
-                option_definition.id,
-                is_call,
-                strike,
-                expiry,
-                future_price,
-                expiry_in_years,
-                interest_rate,
-                greeks.vol,
-                greeks.price,
-                greeks.delta,
-                greeks.gamma,
-                greeks.vega,
-                greeks.theta,
-                1.0,
-                abs(greeks.delta / multiplier),
-            )
+        instrument_ids = frozenset(x.id for x in options)
+        cached = self._option_chains.get(underlying)
+        if cached is not None and cached[0] == instrument_ids:
+            return cached[1]
 
-            # write greeks to the cache
-            self.cache_greeks(greeks_data)
+        chain = {
+            "instrument_ids": np.array([x.id for x in options], dtype=object),
+            "is_call": np.array([x.option_kind is OptionKind.CALL for x in options], dtype=np.bool_),
+            "strike": np.array([float(x.strike_price) for x in options], dtype=np.float64),
+            "expiration_ns": np.array([x.expiration_ns for x in options], dtype=np.int64),
+            "expiry": np.array([date_to_int(x.expiration_utc) for x in options], dtype=np.int64),
+        }
+        self._option_chains[underlying] = (instrument_ids, chain)
 
-            # publish greeks on message bus
-            self.publish_data(
-                DataType(GreeksData, metadata={"instrument_id": greeks_data.instrument_id.value}),
-                greeks_data,
-            )
+        return chain
 
     def cache_greeks(self, greeks_data: GreeksData):
         self.cache.add(greeks_key(greeks_data.instrument_id), greeks_data.to_bytes())
 
+    def cache_option_chain_greeks(self, chain_greeks: OptionChainGreeks):
+        self.cache.add(option_chain_greeks_key(chain_greeks.underlying), chain_greeks.to_bytes())
+
 
 class InterestRateProviderConfig(ActorConfig, frozen=True):
     """
@@ -337,3 +383,319 @@ def date_to_string(date, string_format="%Y%m%d"):
 
 def date_to_int(date):
     return int(date_to_string(date))
+
+
+# Coefficients of the double precision normal CDF approximation (Hart 1968, as per West 2005)
+_CDF_NUM = (
+    3.52624965998911e-02,
+    0.700383064443688,
+    6.37396220353165,
+    33.912866078383,
+    112.079291497871,
+    221.213596169931,
+    220.206867912376,
+)
+_CDF_DEN = (
+    8.83883476483184e-02,
+    1.75566716318264,
+    16.064177579207,
+    86.7807322029461,
+    296.564248779674,
+    637.333633378831,
+    793.826512519948,
+    440.413735824752,
+)
+_SQRT_2PI = 2.506628274631000
+_DAYS_PER_YEAR_INV = 0.0027378507871321013  # 1 / 365.25
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    xabs = np.abs(x)
+    exponential = np.exp(-0.5 * xabs * xabs)
+
+    num = np.full_like(xabs, _CDF_NUM[0])
+    for coef in _CDF_NUM[1:]:
+        num = num * xabs + coef
+
+    den = np.full_like(xabs, _CDF_DEN[0])
+    for coef in _CDF_DEN[1:]:
+        den = den * xabs + coef
+
+    # Continued fraction for the far tail
+    cf = xabs + 0.65
+    for n in (4.0, 3.0, 2.0, 1.0):
+        cf = xabs + n / cf
+
+    tail = np.where(xabs < 7.07106781186547, exponential * num / den, exponential / cf / _SQRT_2PI)
+    tail = np.where(xabs > 37.0, 0.0, tail)
+
+    return np.where(x > 0.0, 1.0 - tail, tail)
+
+
+def black_scholes_greeks_array(
+    s: float | np.ndarray,
+    r: float | np.ndarray,
+    b: float | np.ndarray,
+    vol: float | np.ndarray,
+    is_call: bool | np.ndarray,
+    k: float | np.ndarray,
+    t: float | np.ndarray,
+    multiplier: float | np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    Calculate the Black-Scholes price and Greeks for arrays of option contracts.
+
+    This is the vectorized equivalent of `black_scholes_greeks`, all parameters
+    may be scalars or arrays which broadcast together.
+
+    Parameters
+    ----------
+    s : float or np.ndarray
+        The current price of the underlying asset.
+    r : float or np.ndarray
+        The risk-free interest rate.
+    b : float or np.ndarray
+        The cost of carry of the underlying asset.
+    vol : float or np.ndarray
+        The volatility of the underlying asset.
+    is_call : bool or np.ndarray
+        Whether the option is a call (True) or a put (False).
+    k : float or np.ndarray
+        The strike price of the option.
+    t : float or np.ndarray
+        The time to expiration of the option in years.
+    multiplier : float or np.ndarray
+        The multiplier for the option contract.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The option 'price', 'delta', 'gamma', 'vega' and 'theta' arrays.
+
+    """
+    s = np.asarray(s, dtype=np.float64)
+    r = np.asarray(r, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    vol = np.asarray(vol, dtype=np.float64)
+    k = np.asarray(k, dtype=np.float64)
+    t = np.asarray(t, dtype=np.float64)
+    multiplier = np.asarray(multiplier, dtype=np.float64)
+    phi = np.where(is_call, 1.0, -1.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sqrt_t = np.sqrt(t)
+        scaled_vol = vol * sqrt_t
+        d1 = (np.log(s / k) + (b + 0.5 * vol * vol) * t) / scaled_vol
+        d2 = d1 - scaled_vol
+        cdf_phi_d1 = _norm_cdf(phi * d1)
+        cdf_phi_d2 = _norm_cdf(phi * d2)
+        dist_d1 = _norm_pdf(d1)
+        df = np.exp((b - r) * t)
+        s_t = s * df
+        k_t = k * np.exp(-r * t)
+
+        price = multiplier * phi * (s_t * cdf_phi_d1 - k_t * cdf_phi_d2)
+        delta = multiplier * phi * df * cdf_phi_d1
+        gamma = multiplier * df * dist_d1 / (s * scaled_vol)
+        vega = multiplier * s_t * sqrt_t * dist_d1 * 0.01  # In absolute percent change
+        theta = (
+            multiplier
+            * (
+                s_t * (-dist_d1 * vol / (2.0 * sqrt_t) - phi * (b - r) * cdf_phi_d1)
+                - phi * r * k_t * cdf_phi_d2
+            )
+            * _DAYS_PER_YEAR_INV  # In change per calendar day
+        )
+
+    return {
+        "price": price,
+        "delta": delta,
+        "gamma": gamma,
+        "vega": vega,
+        "theta": theta,
+    }
+
+
+def imply_vol_array(
+    s: float | np.ndarray,
+    r: float | np.ndarray,
+    b: float | np.ndarray,
+    is_call: bool | np.ndarray,
+    k: float | np.ndarray,
+    t: float | np.ndarray,
+    price: float | np.ndarray,
+    max_iterations: int = 100,
+    tolerance: float = 1e-12,
+) -> np.ndarray:
+    """
+    Calculate the implied volatility for arrays of option contracts.
+
+    A safeguarded Newton-Raphson iteration is run on the whole array at once,
+    falling back to bisection whenever a Newton step leaves the current bracket.
+
+    Parameters
+    ----------
+    s : float or np.ndarray
+        The current price of the underlying asset.
+    r : float or np.ndarray
+        The risk-free interest rate.
+    b : float or np.ndarray
+        The cost of carry of the underlying asset.
+    is_call : bool or np.ndarray
+        Whether the option is a call (True) or a put (False).
+    k : float or np.ndarray
+        The strike price of the option.
+    t : float or np.ndarray
+        The time to expiration of the option in years.
+    price : float or np.ndarray
+        The current market price of the option.
+    max_iterations : int, default 100
+        The maximum number of solver iterations.
+    tolerance : float, default 1e-12
+        The relative price (or volatility bracket) tolerance for convergence.
+
+    Returns
+    -------
+    np.ndarray
+        The implied volatilities, NaN where the price is outside the no-arbitrage
+        bounds (at or below intrinsic value, or at or above the upper bound).
+
+    """
+    s, r, b, is_call, k, t, price = np.broadcast_arrays(
+        np.asarray(s, dtype=np.float64),
+        np.asarray(r, dtype=np.float64),
+        np.asarray(b, dtype=np.float64),
+        np.asarray(is_call, dtype=np.bool_),
+        np.asarray(k, dtype=np.float64),
+        np.asarray(t, dtype=np.float64),
+        np.asarray(price, dtype=np.float64),
+    )
+    shape = s.shape
+    vol = np.full(s.size, np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Solve on undiscounted (forward) prices
+        forward = (s * np.exp(b * t)).ravel()
+        target = (price * np.exp(r * t)).ravel()
+        k = k.ravel()
+        t = t.ravel()
+        phi = np.where(is_call.ravel(), 1.0, -1.0)
+        intrinsic = np.maximum(phi * (forward - k), 0.0)
+        upper = np.where(phi > 0.0, forward, k)
+        valid = (t > 0.0) & (target > intrinsic) & (target < upper)
+
+        # Solve for the out-of-the-money option by put-call parity (better conditioned)
+        idx = np.flatnonzero(valid)
+        forward = forward[idx]
+        k = k[idx]
+        sqrt_t = np.sqrt(t[idx])
+        target = target[idx] - intrinsic[idx]
+        phi = np.where(forward > k, -1.0, 1.0)
+        log_moneyness = np.log(forward / k)
+
+        # Brenner-Subrahmanyam initial guess
+        sigma = np.clip(np.sqrt(2.0 * np.pi) * target / (forward * sqrt_t), 1e-4, 5.0)
+        lower_sigma = np.zeros_like(sigma)
+        upper_sigma = np.full_like(sigma, np.inf)
+
+        for _ in range(max_iterations):
+            scaled_sigma = sigma * sqrt_t
+            d1 = log_moneyness / scaled_sigma + 0.5 * scaled_sigma
+            d2 = d1 - scaled_sigma
+            diff = phi * (forward * _norm_cdf(phi * d1) - k * _norm_cdf(phi * d2)) - target
+
+            upper_sigma = np.where(diff > 0.0, np.minimum(upper_sigma, sigma), upper_sigma)
+            lower_sigma = np.where(diff < 0.0, np.maximum(lower_sigma, sigma), lower_sigma)
+            done = (np.abs(diff) <= tolerance * target) | (
+                upper_sigma - lower_sigma <= tolerance * sigma
+            )
+            vol[idx[done]] = sigma[done]
+
+            # Only keep iterating on the unconverged options
+            if done.all():
+                idx = idx[:0]
+                break
+            if done.any():
+                active = ~done
+                idx = idx[active]
+                forward = forward[active]
+                k = k[active]
+                sqrt_t = sqrt_t[active]
+                target = target[active]
+                phi = phi[active]
+                log_moneyness = log_moneyness[active]
+                sigma = sigma[active]
+                lower_sigma = lower_sigma[active]
+                upper_sigma = upper_sigma[active]
+                d1 = d1[active]
+                diff = diff[active]
+
+            # Without an upper bound yet, steps are limited to doubling the volatility
+            newton = sigma - diff / (forward * sqrt_t * _norm_pdf(d1))
+            bisect = np.where(
+                np.isinf(upper_sigma),
+                2.0 * sigma,
+                0.5 * (lower_sigma + upper_sigma),
+            )
+            in_bracket = (
+                np.isfinite(newton)
+                & (newton > lower_sigma)
+                & (newton < np.minimum(upper_sigma, 2.0 * sigma))
+            )
+            sigma = np.where(in_bracket, newton, bisect)
+
+        # Best estimate for any options which did not converge
+        vol[idx] = sigma
+
+    return vol.reshape(shape)
+
+
+def imply_vol_and_greeks_array(
+    s: float | np.ndarray,
+    r: float | np.ndarray,
+    b: float | np.ndarray,
+    is_call: bool | np.ndarray,
+    k: float | np.ndarray,
+    t: float | np.ndarray,
+    price: float | np.ndarray,
+    multiplier: float | np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    Calculate the implied volatility and Greeks for arrays of option contracts.
+
+    This is the vectorized equivalent of `imply_vol_and_greeks`, used to solve a
+    whole option chain at once.
+
+    Parameters
+    ----------
+    s : float or np.ndarray
+        The current price of the underlying asset.
+    r : float or np.ndarray
+        The risk-free interest rate.
+    b : float or np.ndarray
+        The cost of carry of the underlying asset.
+    is_call : bool or np.ndarray
+        Whether the option is a call (True) or a put (False).
+    k : float or np.ndarray
+        The strike price of the option.
+    t : float or np.ndarray
+        The time to expiration of the option in years.
+    price : float or np.ndarray
+        The current market price of the option.
+    multiplier : float or np.ndarray
+        The multiplier for the option contract.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The implied 'vol' with the option 'price', 'delta', 'gamma', 'vega' and 'theta' arrays.
+
+    """
+    vol = imply_vol_array(s, r, b, is_call, k, t, price)
+    greeks = black_scholes_greeks_array(s, r, b, vol, is_call, k, t, multiplier)
+
+    return {"vol": vol, **greeks}
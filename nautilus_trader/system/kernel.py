@@ -314,6 +314,7 @@ class NautilusKernel:
             msgbus=self._msgbus,
             cache=self._cache,
             clock=self._clock,
+            config=config.portfolio,
         )
 
         ########################################################################
@@ -526,6 +527,9 @@ class NautilusKernel:
             rotation_interval=config.rotation_interval,
             rotation_time=config.rotation_time,
             rotation_timezone=config.rotation_timezone,
+            background_writer=config.background_writer,
+            buffer_size=config.buffer_size,
+            batch_size=config.batch_size,
         )
         self._trader.subscribe("*", self._writer.write)
         self._log.info(f"Writing data & events to {path}")
@@ -0,0 +1,154 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+
+import msgspec
+import pytest
+
+from nautilus_trader.adapters.binance.common.enums import BinanceAccountType
+from nautilus_trader.adapters.binance.config import BinanceDataClientConfig
+from nautilus_trader.adapters.binance.futures.data import BinanceFuturesDataClient
+from nautilus_trader.adapters.binance.futures.providers import BinanceFuturesInstrumentProvider
+from nautilus_trader.adapters.binance.http.client import BinanceHttpClient
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+@pytest.fixture(name="data_client")
+def fixture_data_client() -> BinanceFuturesDataClient:
+    clock = LiveClock()
+    msgbus = MessageBus(
+        trader_id=TestIdStubs.trader_id(),
+        clock=clock,
+    )
+
+    http_client = BinanceHttpClient(
+        clock=clock,
+        api_key="SOME_BINANCE_API_KEY",
+        api_secret="SOME_BINANCE_API_SECRET",
+        base_url="https://fapi.binance.com/",
+    )
+
+    return BinanceFuturesDataClient(
+        loop=asyncio.new_event_loop(),
+        client=http_client,
+        msgbus=msgbus,
+        cache=TestComponentStubs.cache(),
+        clock=clock,
+        instrument_provider=BinanceFuturesInstrumentProvider(
+            client=http_client,
+            clock=clock,
+            account_type=BinanceAccountType.USDT_FUTURE,
+        ),
+        base_url_ws="wss://fstream.binance.com",
+        config=BinanceDataClientConfig(),
+    )
+
+
+@pytest.mark.parametrize(
+    ("stream", "expected"),
+    [
+        ("btcusdt@depth", "depth"),
+        ("btcusdt@depth@100ms", "depth"),
+        ("btcusdt@depth5", "depth5"),
+        ("btcusdt@depth5@100ms", "depth5"),
+        ("btcusdt@depth20@500ms", "depth20"),
+        ("btcusdt@kline_1m", "kline"),
+        ("btcusdt@aggTrade", "aggTrade"),
+        ("btcusdt@markPrice@1s", "markPrice"),
+    ],
+)
+def test_parse_stream_channel(data_client, stream: str, expected: str) -> None:
+    # Arrange, Act
+    result = data_client._parse_stream_channel(stream)
+
+    # Assert
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ("stream", "channel"),
+    [
+        ("btcusdt@depth@100ms", "depth"),
+        ("btcusdt@depth5@100ms", "depth5"),
+        ("btcusdt@kline_1m", "kline"),
+    ],
+)
+def test_handle_ws_message_dispatches_to_channel_handler(
+    data_client,
+    stream: str,
+    channel: str,
+) -> None:
+    # Arrange
+    received: dict[str, list] = {}
+    for name in ("depth", "depth5", "kline"):
+        data_client._ws_handlers[name] = received.setdefault(name, []).append
+    raw = b'{"stream":"' + stream.encode() + b'","data":{}}'
+
+    # Act
+    data_client._handle_ws_message(raw)
+    data_client._handle_ws_message(raw)
+
+    # Assert
+    assert [wrapper.stream for wrapper in received[channel]] == [stream, stream]
+    assert sum(len(wrappers) for wrappers in received.values()) == 2
+    assert data_client._ws_stream_handlers[stream] == data_client._ws_handlers[channel]
+
+
+def test_handle_ws_message_with_unrecognized_stream_does_not_cache_handler(data_client) -> None:
+    # Arrange
+    raw = b'{"stream":"btcusdt@unknown","data":{}}'
+
+    # Act
+    data_client._handle_ws_message(raw)
+
+    # Assert
+    assert "btcusdt@unknown" not in data_client._ws_stream_handlers
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b'{"result":null,"id":1}',
+        b'{"stream":"btcusdt@depth@100ms","data":null}',
+    ],
+)
+def test_handle_ws_message_without_data_does_not_dispatch(data_client, raw: bytes) -> None:
+    # Arrange
+    received: list = []
+    data_client._ws_handlers["depth"] = received.append
+
+    # Act
+    data_client._handle_ws_message(raw)
+
+    # Assert
+    assert received == []
+
+
+def test_handle_ws_message_keeps_data_payload_raw(data_client) -> None:
+    # Arrange
+    received: list = []
+    data_client._ws_handlers["depth"] = received.append
+    raw = b'{"stream":"btcusdt@depth@100ms","data":{"e":"depthUpdate","s":"BTCUSDT"}}'
+
+    # Act
+    data_client._handle_ws_message(raw)
+
+    # Assert
+    assert len(received) == 1
+    assert msgspec.json.decode(received[0].data) == {"e": "depthUpdate", "s": "BTCUSDT"}
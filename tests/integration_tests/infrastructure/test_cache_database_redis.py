@@ -897,6 +897,132 @@ class TestCacheDatabaseAdapter:
         assert result == position
         assert position.id == position_id
 
+    @pytest.mark.asyncio
+    async def test_load_order_when_closed_order_restores_from_state_snapshot(self):
+        # Arrange
+        order = self.strategy.order_factory.limit(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+
+        self.database.add_order(order)
+        order.apply(TestEventStubs.order_submitted(order))
+        self.database.update_order(order)
+        order.apply(TestEventStubs.order_accepted(order))
+        self.database.update_order(order)
+        order.apply(TestEventStubs.order_filled(order, instrument=_AUDUSD_SIM))
+        self.database.update_order(order)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: self.database.keys("states:orders*"))
+
+        # Act
+        result = self.database.load_order(order.client_order_id)
+
+        # Assert
+        assert result == order
+        assert result.status == order.status
+        assert result.filled_qty == order.filled_qty
+        assert result.avg_px == order.avg_px
+        assert result.venue_order_id == order.venue_order_id
+        assert result.trade_ids == order.trade_ids
+        assert result.commissions() == order.commissions()
+        assert result.event_count == 4
+        assert result.init_event == order.init_event
+        assert result.last_event == order.last_event
+        assert result.has_event(order.events[1].id)
+        assert result.events == order.events
+
+    @pytest.mark.asyncio
+    async def test_load_orders_applies_only_events_after_state_snapshot(self):
+        # Arrange
+        order = self.strategy.order_factory.limit(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+
+        self.database.add_order(order)
+        order.apply(TestEventStubs.order_submitted(order))
+        self.database.update_order(order)
+        order.apply(TestEventStubs.order_accepted(order))
+        self.database.update_order(order)
+
+        # State snapshot written at the 100th event, then a single event after it
+        while order.event_count < 101:
+            if order.is_pending_update:
+                order.apply(TestEventStubs.order_updated(order, price=Price.from_str("0.99000")))
+            else:
+                order.apply(TestEventStubs.order_pending_update(order))
+            self.database.update_order(order)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: self.database.load_order(order.client_order_id))
+        await eventually(
+            lambda: self.database.load_order(order.client_order_id).event_count == 101,
+        )
+
+        # Act
+        result = self.database.load_orders()[order.client_order_id]
+
+        # Assert
+        assert result.status == order.status
+        assert result.price == Price.from_str("0.99000")
+        assert result.last_event == order.last_event
+        assert result.events == order.events
+        assert result.event_count == 101
+
+    @pytest.mark.asyncio
+    async def test_load_position_when_reopened_restores_from_state_snapshot(self):
+        # Arrange
+        self.database.add_instrument(_AUDUSD_SIM)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: self.database.load_instrument(_AUDUSD_SIM.id))
+
+        position_id = PositionId("P-1")
+        fills = []
+        for i, side in enumerate((OrderSide.BUY, OrderSide.SELL, OrderSide.BUY)):
+            order = self.strategy.order_factory.market(
+                _AUDUSD_SIM.id,
+                side,
+                Quantity.from_int(100_000),
+            )
+            order.apply(TestEventStubs.order_submitted(order))
+            order.apply(TestEventStubs.order_accepted(order))
+            fills.append(
+                TestEventStubs.order_filled(
+                    order,
+                    instrument=_AUDUSD_SIM,
+                    position_id=position_id,
+                    last_px=Price.from_str("1.00000"),
+                    trade_id=TradeId(str(i)),
+                ),
+            )
+
+        position = Position(instrument=_AUDUSD_SIM, fill=fills[0])
+        self.database.add_position(position)
+        position.apply(fills[1])  # Closes the position (state snapshot written)
+        self.database.update_position(position)
+        position.apply(fills[2])  # Reopens the position
+        self.database.update_position(position)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: self.database.keys("states:positions*"))
+        await eventually(lambda: self.database.load_position(position_id).is_open)
+
+        # Act
+        result = self.database.load_position(position_id)
+
+        # Assert
+        assert result == position
+        assert result.side == position.side
+        assert result.quantity == position.quantity
+        assert result.events == [fills[2]]
+
     @pytest.mark.asyncio
     async def test_load_accounts_when_no_accounts_returns_empty_dict(self):
         # Arrange, Act
@@ -947,6 +1073,39 @@ class TestCacheDatabaseAdapter:
         # Assert
         assert result == {order.client_order_id: order}
 
+    @pytest.mark.asyncio
+    async def test_load_orders_cache_when_many_orders_with_events_in_database(self):
+        # Arrange
+        orders = [
+            self.strategy.order_factory.limit(
+                _AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+                Price.from_str("1.00000"),
+            )
+            for _ in range(5)
+        ]
+
+        for order in orders:
+            self.database.add_order(order)
+            order.apply(TestEventStubs.order_submitted(order))
+            self.database.update_order(order)
+            order.apply(TestEventStubs.order_accepted(order))
+            self.database.update_order(order)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: len(self.database.load_orders()) == len(orders))
+        await eventually(
+            lambda: all(o.is_open for o in self.database.load_orders().values()),
+        )
+
+        # Act
+        result = self.database.load_orders()
+
+        # Assert
+        assert result == {order.client_order_id: order for order in orders}
+        assert all(result[o.client_order_id].event_count == 3 for o in orders)
+
     @pytest.mark.asyncio
     async def test_load_positions_cache_when_no_positions(self):
         # Arrange, Act
@@ -174,3 +174,43 @@ def test_run_with_ema_cross_strategy(benchmark):
         engine.run(start=start, end=end)
 
     benchmark.pedantic(run, setup=setup, rounds=1, iterations=1)
+
+
+def test_run_with_many_venues(benchmark):
+    venue_count = 12
+
+    def setup():
+        config = BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True))
+        engine = BacktestEngine(config=config)
+        provider = TestDataProvider()
+        bid_data = provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:10_000]
+        ask_data = provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")[:10_000]
+
+        event_count = 0
+        for i in range(venue_count):
+            venue = Venue(f"SIM{i}")
+            engine.add_venue(
+                venue=venue,
+                oms_type=OmsType.HEDGING,
+                account_type=AccountType.MARGIN,
+                base_currency=USD,
+                starting_balances=[Money(1_000_000, USD)],
+            )
+
+            instrument = TestInstrumentProvider.default_fx_ccy("USD/JPY", venue)
+            engine.add_instrument(instrument)
+
+            # Set up data
+            wrangler = QuoteTickDataWrangler(instrument)
+            ticks = wrangler.process_bar_data(bid_data=bid_data, ask_data=ask_data)
+            engine.add_data(ticks, sort=i == venue_count - 1)
+            event_count += len(ticks)
+
+        benchmark.extra_info["events"] = event_count
+        return (engine, [Strategy()]), {}
+
+    def run(engine, strategies):
+        engine.add_strategies(strategies=strategies)
+        engine.run()
+
+    benchmark.pedantic(run, setup=setup, rounds=1, iterations=1)
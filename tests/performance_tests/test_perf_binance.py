@@ -0,0 +1,85 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import asyncio
+import pkgutil
+
+import pytest
+
+from nautilus_trader.adapters.binance.common.enums import BinanceAccountType
+from nautilus_trader.adapters.binance.config import BinanceDataClientConfig
+from nautilus_trader.adapters.binance.futures.data import BinanceFuturesDataClient
+from nautilus_trader.adapters.binance.futures.providers import BinanceFuturesInstrumentProvider
+from nautilus_trader.adapters.binance.http.client import BinanceHttpClient
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+def _ws_message(resource: str) -> bytes:
+    return pkgutil.get_data(
+        package="tests.integration_tests.adapters.binance.resources.ws_messages",
+        resource=resource,
+    )
+
+
+@pytest.fixture(name="data_client")
+def fixture_data_client() -> BinanceFuturesDataClient:
+    clock = LiveClock()
+    msgbus = MessageBus(
+        trader_id=TestIdStubs.trader_id(),
+        clock=clock,
+    )
+    handler: list = []
+    msgbus.register(endpoint="DataEngine.process", handler=handler.append)
+
+    http_client = BinanceHttpClient(
+        clock=clock,
+        api_key="SOME_BINANCE_API_KEY",
+        api_secret="SOME_BINANCE_API_SECRET",
+        base_url="https://fapi.binance.com/",
+    )
+
+    return BinanceFuturesDataClient(
+        loop=asyncio.new_event_loop(),
+        client=http_client,
+        msgbus=msgbus,
+        cache=TestComponentStubs.cache(),
+        clock=clock,
+        instrument_provider=BinanceFuturesInstrumentProvider(
+            client=http_client,
+            clock=clock,
+            account_type=BinanceAccountType.USDT_FUTURE,
+        ),
+        base_url_ws="wss://fstream.binance.com",
+        config=BinanceDataClientConfig(),
+    )
+
+
+def test_handle_ws_messages_depth_and_agg_trades(benchmark, data_client):
+    # Replay recorded depth diff and aggregated trade payloads in the proportions
+    # seen on busy futures streams (mostly depth updates)
+    depth = b'{"stream":"btcusdt@depth@100ms","data":' + _ws_message(
+        "ws_futures_depth_diff_update.json",
+    ) + b"}"
+    agg_trade = _ws_message("ws_spot_agg_trade.json")
+    messages = ([depth] * 3 + [agg_trade]) * 10_000
+
+    def replay():
+        for raw in messages:
+            data_client._handle_ws_message(raw)
+
+    benchmark.pedantic(replay, iterations=1, rounds=1)
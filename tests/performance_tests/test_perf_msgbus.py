@@ -0,0 +1,69 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+@pytest.fixture(name="msgbus")
+def fixture_msgbus() -> MessageBus:
+    msgbus = MessageBus(
+        trader_id=TestIdStubs.trader_id(),
+        clock=TestClock(),
+    )
+    handler = []
+    for i in range(1_000):
+        msgbus.subscribe(topic=f"data.quotes.SIM.INST{i}", handler=handler.append)
+        msgbus.subscribe(topic=f"data.trades.SIM.INST{i}", handler=handler.append)
+    msgbus.subscribe(topic="data.quotes.*", handler=handler.append)
+    msgbus.subscribe(topic="events.order.*", handler=handler.append)
+    return msgbus
+
+
+def test_publish_resolved_topic(benchmark, msgbus):
+    msgbus.publish("data.quotes.SIM.INST0", "MESSAGE")  # Resolve topic
+    benchmark.pedantic(
+        msgbus.publish,
+        args=("data.quotes.SIM.INST0", "MESSAGE"),
+        iterations=100_000,
+        rounds=1,
+    )
+
+
+def test_publish_new_topics(benchmark, msgbus):
+    topics = [f"data.bars.SIM.INST{i}" for i in range(10_000)]
+
+    def publish_all():
+        for topic in topics:
+            msgbus.publish(topic, "MESSAGE")
+
+    benchmark.pedantic(publish_all, iterations=1, rounds=1)
+
+
+def test_subscribe_with_many_resolved_topics(benchmark, msgbus):
+    for i in range(1_000):
+        msgbus.publish(f"data.quotes.SIM.INST{i}", "MESSAGE")
+        msgbus.publish(f"data.trades.SIM.INST{i}", "MESSAGE")
+
+    handler = []
+
+    def subscribe_all():
+        for i in range(1_000):
+            msgbus.subscribe(topic=f"data.trades.SIM.INST{i}.*", handler=handler.append)
+
+    benchmark.pedantic(subscribe_all, iterations=1, rounds=1)
@@ -0,0 +1,93 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import AccountId
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.position import Position
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+XNAS = Venue("XNAS")
+INSTRUMENT_COUNT = 500
+POSITIONS_PER_INSTRUMENT = 3
+UPDATES_PER_ROUND = 1_000
+
+
+def _setup_large_book():
+    clock = TestClock()
+    trader_id = TestIdStubs.trader_id()
+    msgbus = MessageBus(trader_id=trader_id, clock=clock)
+    cache = TestComponentStubs.cache()
+    portfolio = Portfolio(msgbus=msgbus, cache=cache, clock=clock)
+    portfolio.update_account(TestEventStubs.cash_account_state(AccountId("XNAS-001")))
+
+    order_factory = OrderFactory(
+        trader_id=trader_id,
+        strategy_id=StrategyId("S-001"),
+        clock=clock,
+    )
+
+    instruments = [
+        TestInstrumentProvider.equity(symbol=f"EQ{i}", venue=XNAS.value)
+        for i in range(INSTRUMENT_COUNT)
+    ]
+    for instrument in instruments:
+        cache.add_instrument(instrument)
+        cache.add_quote_tick(TestDataStubs.quote_tick(instrument, 100.0, 100.01))
+        for side in (OrderSide.BUY, OrderSide.SELL, OrderSide.BUY)[:POSITIONS_PER_INSTRUMENT]:
+            order = order_factory.market(instrument.id, side, Quantity.from_int(100))
+            fill = TestEventStubs.order_filled(
+                order,
+                instrument=instrument,
+                position_id=PositionId(f"P-{order.client_order_id.value}"),
+            )
+            cache.add_position(Position(instrument=instrument, fill=fill), OmsType.HEDGING)
+
+    portfolio.initialize_positions()
+
+    quotes = [
+        TestDataStubs.quote_tick(instruments[i % INSTRUMENT_COUNT], 100.0 + i % 7, 100.01 + i % 7)
+        for i in range(UPDATES_PER_ROUND)
+    ]
+
+    return cache, portfolio, quotes
+
+
+def test_quote_updates_with_venue_exposure_and_pnl_queries_large_book(benchmark) -> None:
+    # A quote for one instrument followed by venue level queries, as a risk
+    # check or strategy would make on every tick across a large book
+    cache, portfolio, quotes = _setup_large_book()
+
+    def update_and_query() -> None:
+        for quote in quotes:
+            cache.add_quote_tick(quote)
+            portfolio.update_quote_tick(quote)
+            portfolio.unrealized_pnls(XNAS)
+            portfolio.net_exposures(XNAS)
+
+    benchmark.pedantic(update_and_query, rounds=10, warmup_rounds=1)
@@ -0,0 +1,167 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.config import ExecEngineConfig
+from nautilus_trader.config import RiskEngineConfig
+from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.execution.messages import SubmitOrder
+from nautilus_trader.execution.messages import SubmitOrderList
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import ClientId
+from nautilus_trader.model.identifiers import OrderListId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.orders.list import OrderList
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.risk.engine import RiskEngine
+from nautilus_trader.test_kit.mocks.exec_clients import MockExecutionClient
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+from nautilus_trader.trading.strategy import Strategy
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+ORDERS_PER_ROUND = 1_000
+
+
+def _setup():
+    clock = TestClock()
+    trader_id = TestIdStubs.trader_id()
+    msgbus = MessageBus(trader_id=trader_id, clock=clock)
+    cache = TestComponentStubs.cache()
+    portfolio = Portfolio(msgbus=msgbus, cache=cache, clock=clock)
+    exec_engine = ExecutionEngine(
+        msgbus=msgbus,
+        cache=cache,
+        clock=clock,
+        config=ExecEngineConfig(),
+    )
+    risk_engine = RiskEngine(
+        portfolio=portfolio,
+        msgbus=msgbus,
+        cache=cache,
+        clock=clock,
+        config=RiskEngineConfig(
+            max_order_submit_rate=f"{ORDERS_PER_ROUND * 10}/00:00:01",
+            max_notional_per_order={str(AUDUSD_SIM.id): 10_000_000},
+        ),
+    )
+    exec_client = MockExecutionClient(
+        client_id=ClientId("SIM"),
+        venue=Venue("SIM"),
+        account_type=AccountType.CASH,
+        base_currency=USD,
+        msgbus=msgbus,
+        cache=cache,
+        clock=clock,
+    )
+    portfolio.update_account(TestEventStubs.cash_account_state())
+    exec_engine.register_client(exec_client)
+    cache.add_instrument(AUDUSD_SIM)
+    cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM))
+    exec_engine.start()
+    risk_engine.start()
+
+    strategy = Strategy()
+    strategy.register(
+        trader_id=trader_id,
+        portfolio=portfolio,
+        msgbus=msgbus,
+        cache=cache,
+        clock=clock,
+    )
+
+    return clock, risk_engine, strategy
+
+
+def _submit_orders(clock, risk_engine, strategy, lookup_per_order: bool) -> None:
+    for _ in range(ORDERS_PER_ROUND):
+        if lookup_per_order:
+            # Resolve the account and max notional through the cache for every
+            # order, as the checks did before the risk contexts were kept
+            risk_engine._risk_contexts.clear()
+        order = strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(1_000),
+        )
+        risk_engine.execute(
+            SubmitOrder(
+                trader_id=strategy.trader_id,
+                strategy_id=strategy.id,
+                position_id=None,
+                order=order,
+                command_id=UUID4(),
+                ts_init=clock.timestamp_ns(),
+            ),
+        )
+    clock.advance_time(clock.timestamp_ns() + 1_000_000_000)  # Clear throttler window
+
+
+@pytest.mark.parametrize(
+    "lookup_per_order",
+    [True, False],
+    ids=["lookup_per_order", "risk_context"],
+)
+def test_submit_order_to_exec_client(benchmark, lookup_per_order: bool) -> None:
+    # The per order lookup run is the baseline for the check path without
+    # incrementally maintained risk contexts
+    clock, risk_engine, strategy = _setup()
+
+    benchmark.pedantic(
+        _submit_orders,
+        args=(clock, risk_engine, strategy, lookup_per_order),
+        rounds=10,
+        warmup_rounds=2,
+    )
+
+
+def test_submit_order_list_to_exec_client(benchmark) -> None:
+    clock, risk_engine, strategy = _setup()
+
+    def submit_order_lists() -> None:
+        for _ in range(ORDERS_PER_ROUND // 10):
+            orders = [
+                strategy.order_factory.limit(
+                    AUDUSD_SIM.id,
+                    OrderSide.BUY,
+                    Quantity.from_int(1_000),
+                    Price.from_str("1.00000"),
+                )
+                for _ in range(10)
+            ]
+            risk_engine.execute(
+                SubmitOrderList(
+                    strategy.trader_id,
+                    strategy.id,
+                    OrderList(order_list_id=OrderListId(UUID4().value), orders=orders),
+                    UUID4(),
+                    clock.timestamp_ns(),
+                ),
+            )
+        clock.advance_time(clock.timestamp_ns() + 1_000_000_000)  # Clear throttler window
+
+    benchmark.pedantic(submit_order_lists, rounds=10, warmup_rounds=2)
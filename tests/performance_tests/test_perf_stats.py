@@ -14,9 +14,18 @@
 # -------------------------------------------------------------------------------------------------
 
 import numpy as np
+import pandas as pd
 
+from nautilus_trader.analysis.analyzer import PortfolioAnalyzer
+from nautilus_trader.analysis.statistics.returns_volatility import ReturnsVolatility
+from nautilus_trader.analysis.statistics.sharpe_ratio import SharpeRatio
+from nautilus_trader.analysis.statistics.sortino_ratio import SortinoRatio
+from nautilus_trader.analysis.statistics.win_rate import WinRate
 from nautilus_trader.core.stats import fast_mean
 from nautilus_trader.core.stats import fast_std
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.objects import Money
 
 
 def test_np_mean(benchmark):
@@ -57,3 +66,21 @@ def test_fast_std(benchmark):
         rounds=1,
     )
     # ~0.0ms / ~1.0μs / 968ns minimum of 100,000 runs @ 1 iteration each run.
+
+
+def test_portfolio_analyzer_statistics(benchmark):
+    rng = np.random.default_rng(10)
+    pnls = rng.normal(size=200_000)
+    timestamps = pd.date_range("2020-01-01", periods=len(pnls), freq="5min", tz="UTC")
+
+    def run():
+        analyzer = PortfolioAnalyzer()
+        for statistic in (SharpeRatio(), SortinoRatio(), ReturnsVolatility(), WinRate()):
+            analyzer.register_statistic(statistic)
+        for i, (timestamp, pnl) in enumerate(zip(timestamps, pnls)):
+            analyzer.add_trade(PositionId(f"P-{i}"), Money(pnl, USD))
+            analyzer.add_return(timestamp, pnl / 1_000)
+        analyzer.get_performance_stats_pnls(USD)
+        analyzer.get_performance_stats_returns()
+
+    benchmark.pedantic(run, iterations=1, rounds=1)
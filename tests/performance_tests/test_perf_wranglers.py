@@ -55,3 +55,40 @@ def test_trade_tick_data_wrangler_process(benchmark):
         iterations=1,
     )
     # ~500.2ms / ~500210.6μs / 500210608ns minimum of 10 runs @ 1 iteration each run.
+
+
+def test_trade_tick_data_wrangler_process_arrow(benchmark):
+    ethusdt = TestInstrumentProvider.ethusdt_binance()
+    wrangler = TradeTickDataWrangler(instrument=ethusdt)
+    provider = TestDataProvider()
+
+    def wrangler_process_arrow():
+        # 69806 ticks in data
+        wrangler.process_arrow(data=provider.read_csv_ticks("binance/ethusdt-trades.csv"))
+
+    benchmark.pedantic(
+        target=wrangler_process_arrow,
+        rounds=10,
+        iterations=1,
+    )
+
+
+def test_quote_tick_data_wrangler_process_bar_data_arrow(benchmark):
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+    provider = TestDataProvider()
+    bid_data = provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")
+    ask_data = provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")
+
+    def wrangler_process_bar_data_arrow():
+        wrangler.process_bar_data_arrow(
+            bid_data=bid_data.copy(),
+            ask_data=ask_data.copy(),
+            random_seed=42,
+        )
+
+    benchmark.pedantic(
+        target=wrangler_process_bar_data_arrow,
+        rounds=10,
+        iterations=1,
+    )
@@ -14,9 +14,15 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.accounting.calculators import ExchangeRateCalculator
+from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import ETH
+from nautilus_trader.model.currencies import JPY
 from nautilus_trader.model.currencies import USDT
 from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
 
 def test_get_rate(benchmark):
@@ -42,3 +48,18 @@ def test_get_rate(benchmark):
     )
     # ~0.0ms / ~8.2μs / 8198ns minimum of 100,000 runs @ 1 iteration each run.
     # ~0.0ms / ~4.7μs / 4732ns minimum of 100,000 runs @ 1 iteration each run.
+
+
+def test_cache_get_xrate(benchmark):
+    cache = TestComponentStubs.cache()
+    for symbol in ("AUD/USD", "USD/JPY", "EUR/USD", "GBP/USD", "USD/CAD", "USD/CHF"):
+        instrument = TestInstrumentProvider.default_fx_ccy(symbol)
+        cache.add_instrument(instrument)
+        cache.add_quote_tick(TestDataStubs.quote_tick(instrument, bid_price=1.0, ask_price=1.0))
+
+    benchmark.pedantic(
+        target=cache.get_xrate,
+        args=(Venue("SIM"), AUD, JPY, PriceType.MID),
+        rounds=100_000,
+        iterations=1,
+    )
@@ -15,8 +15,19 @@
 
 from datetime import datetime
 
+import pytest
+
 from nautilus_trader.analysis.analyzer import PortfolioAnalyzer
+from nautilus_trader.analysis.statistics.expectancy import Expectancy
+from nautilus_trader.analysis.statistics.loser_max import MaxLoser
+from nautilus_trader.analysis.statistics.profit_factor import ProfitFactor
+from nautilus_trader.analysis.statistics.returns_avg import ReturnsAverage
+from nautilus_trader.analysis.statistics.returns_volatility import ReturnsVolatility
+from nautilus_trader.analysis.statistics.risk_return_ratio import RiskReturnRatio
 from nautilus_trader.analysis.statistics.sharpe_ratio import SharpeRatio
+from nautilus_trader.analysis.statistics.sortino_ratio import SortinoRatio
+from nautilus_trader.analysis.statistics.win_rate import WinRate
+from nautilus_trader.analysis.statistics.winner_max import MaxWinner
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.model.currencies import AUD
@@ -25,11 +36,14 @@ from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import TraderId
+from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.position import Position
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
 from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
 
 
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
@@ -124,6 +138,181 @@ class TestPortfolioAnalyzer:
         # Assert
         assert len(result) == 10
 
+    def test_analyzer_returns_sorted_with_duplicate_timestamps_summed(self):
+        # Arrange
+        t1 = datetime(year=2010, month=1, day=1)
+        t2 = datetime(year=2010, month=1, day=2)
+
+        # Act
+        self.analyzer.add_return(t2, 0.10)
+        self.analyzer.add_return(t1, 0.05)
+        self.analyzer.add_return(t2, 0.20)
+        result = self.analyzer.returns()
+
+        # Assert
+        assert list(result.index) == [t1, t2]
+        assert result[t1] == 0.05
+        assert result[t2] == pytest.approx(0.30)
+
+    def test_add_trade_beyond_initial_capacity_tracks_all_trades(self):
+        # Arrange
+        count = 5_000
+
+        # Act
+        for i in range(count):
+            self.analyzer.add_trade(PositionId(f"P-{i}"), Money(i, USD))
+        self.analyzer.add_trade(PositionId("P-0"), Money(100, USD))  # Overwrites
+        result = self.analyzer.realized_pnls(USD)
+
+        # Assert
+        assert len(result) == count
+        assert result.index[0] == "P-0"
+        assert result["P-0"] == 100.0
+        assert result[f"P-{count - 1}"] == float(count - 1)
+
+    def _register_statistics(self, analyzer: PortfolioAnalyzer) -> None:
+        analyzer.register_statistic(Expectancy())
+        analyzer.register_statistic(MaxLoser())
+        analyzer.register_statistic(MaxWinner())
+        analyzer.register_statistic(WinRate())
+        analyzer.register_statistic(ProfitFactor())
+        analyzer.register_statistic(ReturnsAverage())
+        analyzer.register_statistic(ReturnsVolatility())
+        analyzer.register_statistic(RiskReturnRatio())
+        analyzer.register_statistic(SharpeRatio())
+        analyzer.register_statistic(SortinoRatio())
+
+    def test_incremental_returns_statistics_match_bulk_calculation(self):
+        # Arrange
+        incremental = PortfolioAnalyzer(incremental=True)
+        self._register_statistics(incremental)
+        self._register_statistics(self.analyzer)
+
+        returns = [
+            (datetime(year=2010, month=1, day=1, hour=9), 0.05),
+            (datetime(year=2010, month=1, day=1, hour=15), -0.02),
+            (datetime(year=2010, month=1, day=2), -0.10),
+            (datetime(year=2010, month=1, day=5), 0.10),  # Gap days bin to zero
+            (datetime(year=2010, month=1, day=6), -0.21),
+            (datetime(year=2010, month=1, day=6), 0.22),  # Summed with previous
+            (datetime(year=2010, month=1, day=3), -0.03),  # Out of order
+            (datetime(year=2010, month=1, day=9), 0.24),
+        ]
+
+        # Act
+        for timestamp, value in returns:
+            incremental.add_return(timestamp, value)
+            self.analyzer.add_return(timestamp, value)
+            incremental.get_performance_stats_returns()
+        result = incremental.get_performance_stats_returns()
+
+        # Assert
+        expected = self.analyzer.get_performance_stats_returns()
+        assert result.keys() == expected.keys()
+        for name, value in expected.items():
+            assert result[name] == pytest.approx(value, nan_ok=True), name
+
+    def test_daily_returns_statistics_match_calculation_from_returns(self):
+        # Arrange
+        stats = [SharpeRatio(), SortinoRatio(), ReturnsVolatility()]
+        for stat in stats:
+            self.analyzer.register_statistic(stat)
+
+        self.analyzer.add_return(datetime(year=2010, month=1, day=1, hour=9), 0.05)
+        self.analyzer.add_return(datetime(year=2010, month=1, day=1, hour=15), -0.02)
+        self.analyzer.add_return(datetime(year=2010, month=1, day=2), -0.10)
+        self.analyzer.add_return(datetime(year=2010, month=1, day=5), 0.10)
+        self.analyzer.add_return(datetime(year=2010, month=1, day=6), -0.21)
+
+        # Act
+        result = self.analyzer.get_performance_stats_returns()
+
+        # Assert
+        for stat in stats:
+            expected = stat.calculate_from_returns(self.analyzer.returns())
+            assert result[stat.name] == pytest.approx(expected), stat.name
+
+    def test_incremental_pnls_statistics_match_bulk_calculation(self):
+        # Arrange
+        incremental = PortfolioAnalyzer(incremental=True)
+        self._register_statistics(incremental)
+        self._register_statistics(self.analyzer)
+
+        trades = [
+            ("P-1", 100.0),
+            ("P-2", -50.0),
+            ("P-3", 0.0),
+            ("P-4", 250.0),
+            ("P-2", -75.0),  # Overwrites the earlier trade
+            ("P-5", -10.0),
+        ]
+
+        # Act
+        for position_id, pnl in trades:
+            incremental.add_trade(PositionId(position_id), Money(pnl, USD))
+            self.analyzer.add_trade(PositionId(position_id), Money(pnl, USD))
+            incremental.get_performance_stats_pnls(USD)
+        result = incremental.get_performance_stats_pnls(USD)
+
+        # Assert
+        expected = self.analyzer.get_performance_stats_pnls(USD)
+        assert result == pytest.approx(expected)
+        assert result["Max Loser"] == -75.0
+        assert result["Win Rate"] == 0.4
+
+    def test_incremental_update_statistics_with_reopened_netting_position_matches_bulk(self):
+        # Arrange
+        incremental = PortfolioAnalyzer(incremental=True)
+        self._register_statistics(incremental)
+        self._register_statistics(self.analyzer)
+
+        account = TestExecStubs.margin_account()
+        cache = TestComponentStubs.cache()
+        fills = []
+        for i, (side, px) in enumerate(
+            [
+                (OrderSide.BUY, "1.00000"),
+                (OrderSide.SELL, "1.00010"),
+                (OrderSide.BUY, "1.00000"),
+                (OrderSide.SELL, "0.99980"),
+            ],
+        ):
+            order = self.order_factory.market(AUDUSD_SIM.id, side, Quantity.from_int(100_000))
+            fills.append(
+                TestEventStubs.order_filled(
+                    order,
+                    instrument=AUDUSD_SIM,
+                    position_id=PositionId("P-1"),
+                    strategy_id=StrategyId("S-001"),
+                    last_px=Price.from_str(px),
+                    ts_filled_ns=(i + 1) * 1_000_000_000,
+                ),
+            )
+
+        # Act
+        position = Position(instrument=AUDUSD_SIM, fill=fills[0])
+        position.apply(fills[1])
+        incremental.update_statistics(account, position)
+        incremental.update_statistics(account, position)  # Duplicate close is ignored
+        incremental.get_performance_stats_pnls(USD)
+
+        cache.snapshot_position(position)  # As the execution engine does on reopening
+        position.apply(fills[2])
+        position.apply(fills[3])
+        incremental.update_statistics(account, position)
+
+        # Assert
+        self.analyzer.calculate_statistics(account, [position, *cache.position_snapshots()])
+        assert len(incremental.realized_pnls(USD)) == 2
+        assert incremental.realized_pnls(USD).sum() == self.analyzer.realized_pnls(USD).sum()
+        assert incremental.get_performance_stats_pnls(USD) == pytest.approx(
+            self.analyzer.get_performance_stats_pnls(USD),
+        )
+        assert incremental.get_performance_stats_returns() == pytest.approx(
+            self.analyzer.get_performance_stats_returns(),
+            nan_ok=True,
+        )
+
     def test_get_realized_pnls_when_all_flat_positions_returns_expected_series(self):
         # Arrange
         order1 = self.order_factory.market(
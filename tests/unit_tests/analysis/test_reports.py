@@ -14,6 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import pandas as pd
+import pyarrow as pa
 
 from nautilus_trader.accounting.accounts.margin import MarginAccount
 from nautilus_trader.analysis.reporter import ReportProvider
@@ -347,3 +348,143 @@ class TestReportProvider:
         assert report.iloc[0]["ts_opened"] == UNIX_EPOCH
         assert pd.isna(report.iloc[0]["ts_closed"])
         assert report.iloc[0]["realized_return"] == 0.0
+
+    def test_generate_positions_table_matches_positions_report(self):
+        # Arrange
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00010"),
+        )
+
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123457"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00010"),
+        )
+
+        position1 = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position1.apply(fill2)
+
+        positions = [position1]
+
+        # Act
+        table = ReportProvider.generate_positions_table(positions)
+
+        # Assert
+        report = ReportProvider.generate_positions_report(positions)
+        assert table.num_rows == 1
+        assert table.column_names == ["position_id", *report.columns]
+        assert table.schema.field("ts_opened").type == pa.timestamp("ns", tz="UTC")
+        assert table.column("position_id").to_pylist() == [position1.id.value]
+        assert table.column("ts_opened").to_pylist() == [UNIX_EPOCH]
+        assert table.column("ts_closed").to_pylist() == [None]
+        assert table.column("realized_pnl").to_pylist() == [report.iloc[0]["realized_pnl"]]
+
+    def test_generate_orders_table_matches_order_dicts(self):
+        # Arrange
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(1_500_000),
+            Price.from_str("0.80010"),
+        )
+        order2 = self.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(1_500_000),
+            Price.from_str("0.80000"),
+        )
+        order1.apply(TestEventStubs.order_submitted(order1))
+        order1.apply(TestEventStubs.order_accepted(order1))
+        order1.apply(TestEventStubs.order_filled(order1, instrument=AUDUSD_SIM))
+
+        # Act
+        table = ReportProvider.generate_orders_table([order2, order1])
+
+        # Assert
+        assert table.num_rows == 2
+        rows = table.to_pylist()
+        for order, row in zip([order1, order2], rows, strict=True):
+            for key, value in order.to_dict().items():
+                if key in ("ts_init", "ts_last"):
+                    assert row[key] == pd.Timestamp(value, tz="UTC"), key
+                else:
+                    assert row[key] == value, key
+        assert rows[0]["trigger_price"] is None
+        assert rows[1]["price"] is None
+        assert table.schema.field("ts_last").type == pa.timestamp("ns", tz="UTC")
+
+    def test_generate_orders_report_matches_orders_table(self):
+        # Arrange
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(1_500_000),
+            Price.from_str("0.80010"),
+        )
+        order2 = self.order_factory.stop_market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(1_500_000),
+            Price.from_str("0.80000"),
+        )
+        order1.apply(TestEventStubs.order_submitted(order1))
+        order1.apply(TestEventStubs.order_accepted(order1))
+        order1.apply(TestEventStubs.order_filled(order1, instrument=AUDUSD_SIM))
+
+        # Act
+        report = ReportProvider.generate_orders_report([order2, order1])
+
+        # Assert
+        table = ReportProvider.generate_orders_table([order2, order1])
+        assert list(report.index) == table.column("client_order_id").to_pylist()
+        assert [report.index.name, *report.columns] == table.column_names
+        assert list(report["ts_last"]) == table.column("ts_last").to_pylist()
+        assert report.iloc[0]["commissions"] == [str(c) for c in order1.commissions()]
+
+    def test_generate_fills_table_matches_fill_dicts(self):
+        # Arrange
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+        fill = TestEventStubs.order_filled(order, instrument=AUDUSD_SIM)
+        order.apply(fill)
+
+        # Act
+        table = ReportProvider.generate_fills_table([order])
+
+        # Assert
+        expected = fill.to_dict(fill)
+        del expected["type"]
+        row = table.to_pylist()[0]
+        assert table.column_names == list(expected)
+        assert table.schema.field("ts_event").type == pa.timestamp("ns", tz="UTC")
+        for key in ("client_order_id", "trade_id", "last_qty", "last_px", "commission", "event_id"):
+            assert row[key] == expected[key], key
+
+    def test_generate_tables_when_no_data_returns_empty_tables(self):
+        # Arrange, Act, Assert
+        assert ReportProvider.generate_orders_table([]).num_rows == 0
+        assert ReportProvider.generate_fills_table([]).num_rows == 0
+        assert ReportProvider.generate_positions_table([]).num_rows == 0
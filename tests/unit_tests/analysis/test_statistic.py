@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import pandas as pd
+import pytest
+
 from nautilus_trader.analysis.statistic import PortfolioStatistic
 
 
@@ -33,3 +36,16 @@ class TestPortfolioStatistic:
 
         # Assert
         assert result == "Portfolio Statistic"
+
+    def test_downsample_to_daily_bins_sums_returns_per_day(self):
+        # Arrange
+        index = pd.date_range("2020-01-01", periods=48, freq="h", tz="UTC")
+        returns = pd.Series(0.01, index=index)
+
+        # Act
+        result = PortfolioStatistic()._downsample_to_daily_bins(returns)
+
+        # Assert
+        assert len(result) == 2
+        assert result.iloc[0] == pytest.approx(0.24)
+        assert result.iloc[1] == pytest.approx(0.24)
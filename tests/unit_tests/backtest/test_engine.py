@@ -20,6 +20,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
+from nautilus_trader.backtest.engine import BacktestDataIterator
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.backtest.models import FillModel
@@ -188,6 +189,52 @@ class TestBacktestEngine:
         # Assert
         assert self.engine.iteration == 8000
 
+    def test_run_with_data_iterator(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        wrangler = QuoteTickDataWrangler(AUDUSD_SIM)
+        provider = TestDataProvider()
+        ticks = wrangler.process(provider.read_csv_ticks("truefx/audusd-ticks.csv")[:5_000])
+
+        def chunks():
+            for i in range(0, len(ticks), 1_000):
+                yield ticks[i : i + 1_000]
+
+        # Act
+        self.engine.add_data_iterator("audusd_quotes", chunks())
+        self.engine.run()
+
+        # Assert
+        assert self.engine.iteration == 8000 + 5_000
+        assert len(self.engine.data) == 8000  # Streamed data is not materialized
+
+    def test_run_with_consecutive_end_times_does_not_skip_streamed_data(self):
+        # Arrange
+        engine = BacktestEngine(BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)))
+        engine.add_venue(
+            venue=Venue("SIM"),
+            oms_type=OmsType.HEDGING,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            starting_balances=[Money(1_000_000, USD)],
+        )
+        engine.add_instrument(AUDUSD_SIM)
+        wrangler = QuoteTickDataWrangler(AUDUSD_SIM)
+        provider = TestDataProvider()
+        ticks = wrangler.process(provider.read_csv_ticks("truefx/audusd-ticks.csv")[:3_000])
+        first_end = next(t.ts_init for t in ticks[1_500:] if t.ts_init > ticks[1_499].ts_init) - 1
+        engine.add_data_iterator("audusd_quotes", iter([ticks[:1_000], ticks[1_000:]]))
+
+        # Act
+        engine.run(end=first_end, streaming=True)
+        first_count = engine.kernel.data_engine.data_count
+        engine.run(end=ticks[-1].ts_init)
+
+        # Assert
+        assert first_count == sum(1 for t in ticks if t.ts_init <= first_end)
+        assert engine.kernel.data_engine.data_count == len(ticks)
+        engine.dispose()
+
     def test_run(self):
         # Arrange, Act
         self.engine.add_strategy(Strategy())
@@ -668,6 +715,64 @@ class TestBacktestEngineData:
         assert self.engine.data == data
 
 
+class TestBacktestDataIterator:
+    def test_merges_streams_in_ts_init_order(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+        data1 = [TestDataStubs.quote_tick(ts_init=ts) for ts in (1, 4, 7)]
+        data2 = [TestDataStubs.quote_tick(ts_init=ts) for ts in (2, 5)]
+        data3 = [TestDataStubs.quote_tick(ts_init=ts) for ts in (3, 6, 8)]
+
+        # Act
+        iterator.add_data("data1", data1)
+        iterator.add_stream("data2", iter(data2))
+        iterator.add_stream("data3", iter([data3[:2], [], data3[2:]]))  # Chunks
+
+        # Assert
+        assert [d.ts_init for d in iterator] == [1, 2, 3, 4, 5, 6, 7, 8]
+        assert iterator.is_empty()
+
+    def test_equal_timestamps_yield_in_stream_order(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+        quote1 = TestDataStubs.quote_tick(bid_price=1.0, ts_init=1)
+        quote2 = TestDataStubs.quote_tick(bid_price=2.0, ts_init=1)
+
+        # Act
+        iterator.add_stream("a", [quote1])
+        iterator.add_stream("b", [quote2])
+
+        # Assert
+        assert list(iterator) == [quote1, quote2]
+
+    def test_remove_stream(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+        iterator.add_data("a", [TestDataStubs.quote_tick(ts_init=1)])
+        iterator.add_data("b", [TestDataStubs.quote_tick(ts_init=2)])
+
+        # Act
+        iterator.remove_stream("a")
+
+        # Assert
+        assert iterator.stream_names == ["b"]
+        assert [d.ts_init for d in iterator] == [2]
+
+    def test_add_data_with_start_index_and_peek(self):
+        # Arrange
+        iterator = BacktestDataIterator()
+        data = [TestDataStubs.quote_tick(ts_init=ts) for ts in (1, 2, 3)]
+
+        # Act
+        iterator.add_data("a", data, start_index=1)
+
+        # Assert
+        assert iterator.peek() == data[1]
+        assert iterator.peek_stream("a") == data[1]
+        assert list(iterator) == data[1:]
+        assert iterator.peek() is None
+
+
 class TestBacktestWithAddedBars:
     def setup(self):
         # Fixture Setup
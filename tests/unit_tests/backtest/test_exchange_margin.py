@@ -306,6 +306,26 @@ class TestSimulatedExchangeMarginAccount:
         assert len(self.strategy.store) == 3
         assert isinstance(self.strategy.store[2], OrderAccepted)
 
+    def test_has_pending_commands(self) -> None:
+        # Arrange
+        order = self.strategy.order_factory.limit(
+            _USDJPY_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            _USDJPY_SIM.make_price(110.000),
+        )
+
+        # Act
+        has_pending_before = self.exchange.has_pending_commands(0)
+        self.strategy.submit_order(order)
+        has_pending_after_submit = self.exchange.has_pending_commands(0)
+        self.exchange.process(0)
+
+        # Assert
+        assert not has_pending_before
+        assert has_pending_after_submit
+        assert not self.exchange.has_pending_commands(0)
+
     @pytest.mark.parametrize(
         ("side", "price", "new_price"),
         [
@@ -31,6 +31,7 @@ from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import TimeInForce
 from nautilus_trader.model.events import OrderFilled
+from nautilus_trader.model.identifiers import ClientOrderId
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.orders import MarketOrder
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -128,6 +129,88 @@ class TestOrderMatchingEngine:
         # Assert
         assert exec_messages
 
+    def test_open_orders_returned_in_price_time_priority(self) -> None:
+        # Arrange
+        tick: QuoteTick = TestDataStubs.quote_tick(
+            instrument=self.instrument,
+            bid_price=1000.0,
+            ask_price=1001.0,
+        )
+        self.matching_engine.process_quote_tick(tick)
+
+        prices = [990.0, 995.0, 995.0, 999.0, 980.0]
+        for i, price in enumerate(prices):
+            order = TestExecStubs.limit_order(
+                instrument=self.instrument,
+                order_side=OrderSide.BUY,
+                price=self.instrument.make_price(price),
+                client_order_id=ClientOrderId(f"O-BID-{i}"),
+            )
+            self.matching_engine.process_order(order, self.account_id)
+
+        for i, price in enumerate(reversed(prices)):
+            order = TestExecStubs.limit_order(
+                instrument=self.instrument,
+                order_side=OrderSide.SELL,
+                price=self.instrument.make_price(price + 30.0),
+                client_order_id=ClientOrderId(f"O-ASK-{i}"),
+            )
+            self.matching_engine.process_order(order, self.account_id)
+
+        # Act
+        bids = self.matching_engine.get_open_bid_orders()
+        asks = self.matching_engine.get_open_ask_orders()
+
+        # Assert
+        assert [o.client_order_id.value for o in bids] == [
+            "O-BID-3",
+            "O-BID-1",
+            "O-BID-2",
+            "O-BID-0",
+            "O-BID-4",
+        ]
+        assert [o.client_order_id.value for o in asks] == [
+            "O-ASK-0",
+            "O-ASK-4",
+            "O-ASK-2",
+            "O-ASK-3",
+            "O-ASK-1",
+        ]
+
+    def test_process_quote_tick_matches_only_crossed_limit_orders(self) -> None:
+        # Arrange
+        exec_messages = []
+        self.msgbus.register("ExecEngine.process", lambda x: exec_messages.append(x))
+        tick: QuoteTick = TestDataStubs.quote_tick(
+            instrument=self.instrument,
+            bid_price=1000.0,
+            ask_price=1001.0,
+        )
+        self.matching_engine.process_quote_tick(tick)
+
+        for i, price in enumerate([990.0, 995.0, 995.0, 999.0, 980.0]):
+            order = TestExecStubs.limit_order(
+                instrument=self.instrument,
+                order_side=OrderSide.BUY,
+                price=self.instrument.make_price(price),
+                client_order_id=ClientOrderId(f"O-{i}"),
+            )
+            self.matching_engine.process_order(order, self.account_id)
+
+        exec_messages.clear()
+
+        # Act
+        tick = TestDataStubs.quote_tick(
+            instrument=self.instrument,
+            bid_price=990.0,
+            ask_price=995.0,
+        )
+        self.matching_engine.process_quote_tick(tick)
+
+        # Assert
+        filled = [m.client_order_id.value for m in exec_messages if isinstance(m, OrderFilled)]
+        assert filled == ["O-3", "O-1", "O-2"]
+
     @pytest.mark.skip(reason="WIP to introduce flags")
     def test_process_auction_book(self) -> None:
         # Arrange
@@ -28,6 +28,8 @@ from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.test_kit.mocks.data import load_catalog_with_stub_quote_ticks_audusd
 from nautilus_trader.test_kit.mocks.data import setup_catalog
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
 
 class TestBacktestNode:
@@ -146,6 +148,79 @@ class TestBacktestNode:
         # Assert
         assert len(results) == 1
 
+    def test_run_parallel(self, tmp_path):
+        # Arrange
+        configs = [
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(
+                    strategies=self.strategies,
+                    logging=LoggingConfig(bypass_logging=True),
+                ),
+                venues=[self.venue_config],
+                data=[self.data_config],
+                chunk_size=chunk_size,
+            )
+            for chunk_size in (None, 5_000)
+        ]
+        node = BacktestNode(configs=configs)
+
+        # Act
+        results = list(
+            node.run_parallel(
+                max_workers=2,
+                shared_data_dir=str(tmp_path),
+                raise_exception=True,
+            ),
+        )
+
+        # Assert
+        assert len(results) == 2
+        assert {r.run_config_id for r in results} == {c.id for c in configs}
+        assert len(list(tmp_path.glob("*.arrow"))) == 1  # Data slice staged once
+        assert results[0].iterations == results[1].iterations
+
+    def test_load_shared_data_config_decodes_each_instrument_with_its_precision(self, tmp_path):
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        start = self.data_config.start_time
+        self.catalog.write_data(
+            [
+                TestDataStubs.quote_tick(
+                    usdjpy,
+                    bid_price=110.123,
+                    ask_price=110.125,
+                    ts_event=start + i * 1_000_000_001,
+                    ts_init=start + i * 1_000_000_001,
+                )
+                for i in range(10)
+            ],
+        )
+        data_config = BacktestDataConfig(
+            catalog_path=self.catalog.path,
+            catalog_fs_protocol=self.catalog.fs_protocol,
+            data_cls=QuoteTick,
+            start_time=self.data_config.start_time,
+            end_time=self.data_config.end_time,
+        )
+        config = BacktestRunConfig(
+            engine=BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True)),
+            venues=[self.venue_config],
+            data=[data_config],
+        )
+        node = BacktestNode(configs=[config])
+
+        # Act
+        shared_data = node._stage_shared_data(str(tmp_path))
+        result = node.load_shared_data_config(data_config, shared_data.get(data_config.id))
+
+        # Assert
+        expected = node.load_data_config(data_config).data
+        ts_inits = [q.ts_init for q in result.data]
+        assert len(shared_data[data_config.id]) == 2  # One file per instrument
+        assert ts_inits == sorted(ts_inits)
+        assert sorted(repr(q) for q in result.data) == sorted(repr(q) for q in expected)
+        assert str(next(q for q in result.data if q.instrument_id == usdjpy.id).bid_price) == "110.123"
+
     def test_backtest_run_results(self):
         # Arrange
         node = BacktestNode(configs=self.backtest_configs)
@@ -0,0 +1,189 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.cache.buffers import BarBuffer
+from nautilus_trader.cache.buffers import QuoteTickBuffer
+from nautilus_trader.cache.buffers import TradeTickBuffer
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+def _bar(close: str, ts: int) -> Bar:
+    return Bar(
+        bar_type=TestDataStubs.bartype_audusd_1min_bid(),
+        open=Price.from_str("1.00002"),
+        high=Price.from_str("1.00010"),
+        low=Price.from_str("1.00001"),
+        close=Price.from_str(close),
+        volume=Quantity.from_int(1_000_000),
+        ts_event=ts,
+        ts_init=ts,
+    )
+
+
+class TestQuoteTickBuffer:
+    def test_instantiate_with_invalid_capacity_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTickBuffer(AUDUSD_SIM.id, 0)
+
+    def test_empty_buffer(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM.id, 3)
+
+        # Act, Assert
+        assert len(buffer) == 0
+        assert buffer.get() is None
+        assert list(buffer) == []
+        assert len(buffer.bid_price_raw) == 0
+        with pytest.raises(IndexError):
+            buffer[0]
+
+    def test_appendleft_materializes_equal_ticks_most_recent_first(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM.id, 3)
+        ticks = [
+            TestDataStubs.quote_tick(bid_price=1.00001 + i / 100_000, ts_event=i, ts_init=i)
+            for i in range(2)
+        ]
+
+        # Act
+        for tick in ticks:
+            buffer.appendleft(tick)
+
+        # Assert
+        assert len(buffer) == 2
+        assert buffer[0] == ticks[1]
+        assert buffer[-1] == ticks[0]
+        assert buffer.get(0).bid_price == ticks[1].bid_price
+        assert list(buffer) == list(reversed(ticks))
+
+    def test_appendleft_when_full_overwrites_oldest(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM.id, 3)
+        ticks = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(5)]
+
+        # Act
+        for tick in ticks:
+            buffer.appendleft(tick)
+
+        # Assert
+        assert len(buffer) == 3
+        assert list(buffer) == list(reversed(ticks[2:]))
+        assert buffer.get(3) is None
+
+    def test_field_views_are_chronological_and_read_only(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM.id, 3)
+        ticks = [
+            TestDataStubs.quote_tick(ask_price=1.00010 + i / 100_000, ts_event=i, ts_init=i)
+            for i in range(5)
+        ]
+        for tick in ticks:
+            buffer.appendleft(tick)
+
+        # Act
+        ts_event = buffer.ts_event
+        ask_price_raw = buffer.ask_price_raw
+
+        # Assert
+        assert ts_event.tolist() == [2, 3, 4]
+        assert ask_price_raw.tolist() == [tick.ask_price.raw for tick in ticks[2:]]
+        assert not ts_event.flags.writeable
+        assert not ts_event.flags.owndata
+
+    def test_clear(self):
+        # Arrange
+        buffer = QuoteTickBuffer(AUDUSD_SIM.id, 3)
+        buffer.appendleft(TestDataStubs.quote_tick())
+
+        # Act
+        buffer.clear()
+
+        # Assert
+        assert len(buffer) == 0
+        assert buffer.get() is None
+
+
+class TestTradeTickBuffer:
+    def test_appendleft_materializes_equal_ticks(self):
+        # Arrange
+        buffer = TradeTickBuffer(AUDUSD_SIM.id, 2)
+        ticks = [
+            TestDataStubs.trade_tick(
+                price=1.00001 + i / 100_000,
+                aggressor_side=AggressorSide.SELLER if i % 2 else AggressorSide.BUYER,
+                trade_id=f"T-{i}",
+                ts_event=i,
+                ts_init=i,
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        for tick in ticks:
+            buffer.appendleft(tick)
+
+        # Assert
+        assert len(buffer) == 2
+        assert buffer[0] == ticks[2]
+        assert buffer[1] == ticks[1]
+        assert buffer[0].trade_id == ticks[2].trade_id
+        assert buffer[1].aggressor_side == AggressorSide.SELLER
+        assert buffer.price_raw.tolist() == [ticks[1].price.raw, ticks[2].price.raw]
+
+
+class TestBarBuffer:
+    def test_appendleft_materializes_equal_bars(self):
+        # Arrange
+        bar_type = TestDataStubs.bartype_audusd_1min_bid()
+        buffer = BarBuffer(bar_type, 10)
+        bars = [_bar("1.00003", 0), _bar("1.00005", 60_000_000_000)]
+
+        # Act
+        for bar in bars:
+            buffer.appendleft(bar)
+
+        # Assert
+        assert buffer[0] == bars[1]
+        assert buffer[1] == bars[0]
+        assert buffer[0].close == Price.from_str("1.00005")
+        assert buffer.close_raw.tolist() == [bar.close.raw for bar in bars]
+
+    def test_setitem_replaces_most_recent_bar(self):
+        # Arrange
+        bar_type = TestDataStubs.bartype_audusd_1min_bid()
+        buffer = BarBuffer(bar_type, 2)
+        for i in range(3):
+            buffer.appendleft(_bar("1.00003", i))
+
+        revised = _bar("1.00008", 2)
+
+        # Act
+        buffer[0] = revised
+
+        # Assert
+        assert buffer[0] == revised
+        assert buffer.close_raw[-1] == revised.close.raw
+        assert len(buffer) == 2
@@ -17,6 +17,8 @@ from decimal import Decimal
 
 import pytest
 
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.cache.config import CacheConfig
 from nautilus_trader.core.rust.model import AggregationSource
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import JPY
@@ -204,6 +206,23 @@ class TestCache:
         # Assert
         assert result == [instrument1]
 
+    def test_instruments_with_underlying_returns_option_chain(self):
+        # Arrange
+        future = TestInstrumentProvider.future(symbol="ESZ24", underlying="ES")
+        option = TestInstrumentProvider.aapl_option()
+
+        self.cache.add_instrument(future)
+        self.cache.add_instrument(option)
+
+        # Act
+        result1 = self.cache.instruments(underlying="AAPL")
+        result2 = self.cache.instruments(venue=future.id.venue, underlying="AAPL")
+
+        # Assert
+        assert result1 == [option]
+        assert result2 == []
+        assert self.cache.instruments(underlying="UNKNOWN") == []
+
     def test_synthetic_ids_when_one_synthetic_instrument_returns_expected_list(self):
         # Arrange
         synthetic = TestInstrumentProvider.synthetic_instrument()
@@ -621,6 +640,49 @@ class TestCache:
         # Assert
         assert result == 0.80005
 
+    def test_get_xrate_with_cross_conversion_via_common_currency(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_instrument(USDJPY_SIM)
+        self.cache.add_quote_tick(
+            TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=0.80000, ask_price=0.80010),
+        )
+
+        # Act
+        result1 = self.cache.get_xrate(SIM, AUD, JPY)  # No USD/JPY quotes yet
+        self.cache.add_quote_tick(
+            TestDataStubs.quote_tick(USDJPY_SIM, bid_price=110.000, ask_price=110.002),
+        )
+        result2 = self.cache.get_xrate(SIM, AUD, JPY)
+        result3 = self.cache.get_xrate(SIM, JPY, AUD, PriceType.BID)
+
+        # Assert
+        assert result1 == 0.0
+        assert result2 == pytest.approx(0.80005 * 110.001)
+        assert result3 == pytest.approx(1.0 / (0.80000 * 110.000))
+
+    def test_get_xrate_after_quote_update_returns_latest_rate(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_quote_tick(
+            TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=0.80000, ask_price=0.80010),
+        )
+        self.cache.get_xrate(SIM, AUD, USD)  # Memoize conversion path
+
+        # Act
+        self.cache.add_quote_tick(
+            TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=0.70000, ask_price=0.70010),
+        )
+        result = self.cache.get_xrate(SIM, USD, AUD, PriceType.ASK)
+
+        # Assert
+        assert result == pytest.approx(1.0 / 0.70010)
+
+    def test_get_xrate_with_last_price_type_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.cache.get_xrate(SIM, AUD, USD, PriceType.LAST)
+
     def test_get_xrate_fallbacks_to_bars_if_no_quotes_returns_correct_rate(self):
         # Arrange
         self.cache.reset()
@@ -716,3 +778,85 @@ class TestCache:
 
         # Assert
         assert result == 0.80005
+
+
+class TestCacheColumnarStorage:
+    def setup(self):
+        # Fixture Setup
+        self.cache = Cache(config=CacheConfig(tick_capacity=3, bar_capacity=3, columnar_storage=True))
+
+    def test_buffers_when_not_enabled_returns_none(self):
+        # Arrange
+        cache = TestComponentStubs.cache()
+        tick = TestDataStubs.quote_tick()
+        cache.add_quote_tick(tick)
+
+        # Act, Assert
+        assert cache.quote_tick_buffer(tick.instrument_id) is None
+        assert cache.trade_tick_buffer(tick.instrument_id) is None
+
+    def test_quote_ticks_match_deque_storage(self):
+        # Arrange
+        cache = TestComponentStubs.cache()
+        ticks = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(5)]
+
+        # Act
+        for tick in ticks:
+            cache.add_quote_tick(tick)
+            self.cache.add_quote_tick(tick)
+
+        # Assert
+        instrument_id = ticks[0].instrument_id
+        assert self.cache.quote_ticks(instrument_id) == list(reversed(ticks[2:]))
+        assert self.cache.quote_tick(instrument_id) == cache.quote_tick(instrument_id)
+        assert self.cache.quote_tick(instrument_id, index=2) == ticks[2]
+        assert self.cache.quote_tick(instrument_id, index=3) is None
+        assert self.cache.quote_tick_count(instrument_id) == 3
+        assert self.cache.has_quote_ticks(instrument_id)
+
+    def test_trade_ticks_buffer_exposes_views(self):
+        # Arrange
+        ticks = [TestDataStubs.trade_tick(ts_event=i, ts_init=i) for i in range(2)]
+        self.cache.add_trade_ticks(ticks)
+
+        # Act
+        buffer = self.cache.trade_tick_buffer(ticks[0].instrument_id)
+
+        # Assert
+        assert buffer.ts_event.tolist() == [0, 1]
+        assert self.cache.trade_ticks(ticks[0].instrument_id) == ticks
+        assert self.cache.trade_tick(ticks[0].instrument_id) == ticks[0]
+
+    def test_bars_and_xrate_fallback(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+        bid_bar = Bar(
+            bar_type=BarType.from_str(f"{AUDUSD_SIM.id}-1-DAY-BID-EXTERNAL"),
+            open=Price.from_str("0.80000"),
+            high=Price.from_str("0.80010"),
+            low=Price.from_str("0.80000"),
+            close=Price.from_str("0.80000"),
+            volume=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+        ask_bar = Bar(
+            bar_type=BarType.from_str(f"{AUDUSD_SIM.id}-1-DAY-ASK-EXTERNAL"),
+            open=Price.from_str("0.80010"),
+            high=Price.from_str("0.80010"),
+            low=Price.from_str("0.80010"),
+            close=Price.from_str("0.80010"),
+            volume=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        self.cache.add_bar(bid_bar)
+        self.cache.add_bar(ask_bar)
+
+        # Assert
+        assert self.cache.bars(bid_bar.bar_type) == [bid_bar]
+        assert self.cache.bar(ask_bar.bar_type) == ask_bar
+        assert self.cache.bar_buffer(bid_bar.bar_type).close_raw.tolist() == [bid_bar.close.raw]
+        assert self.cache.get_xrate(SIM, AUD, USD) == 0.80005
@@ -23,6 +23,7 @@ import pytz
 
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import TestClock
+from nautilus_trader.common.component import TestClockScheduler
 from nautilus_trader.common.component import TimeEvent
 from nautilus_trader.common.component import TimeEventHandler
 from nautilus_trader.core.datetime import millis_to_nanos
@@ -566,6 +567,123 @@ class TestTestClock:
         assert clock.timer_count == 2
 
 
+class TestTestClockScheduler:
+    def setup(self):
+        # Fixture Setup
+        self.handler = []
+        self.scheduler = TestClockScheduler()
+        self.clock1 = TestClock()
+        self.clock2 = TestClock()
+        self.clock1.register_default_handler(self.handler.append)
+        self.clock2.register_default_handler(self.handler.append)
+        self.scheduler.attach(self.clock1)
+        self.scheduler.attach(self.clock2)
+
+    def test_set_time_sets_shared_time_for_attached_clocks(self):
+        # Arrange, Act
+        self.scheduler.set_time(1_000)
+
+        # Assert
+        assert self.scheduler.ts_now == 1_000
+        assert self.clock1.timestamp_ns() == 1_000
+        assert self.clock2.timestamp_ns() == 1_000
+
+    def test_set_time_on_attached_clock_sets_shared_time(self):
+        # Arrange, Act
+        self.clock1.set_time(2_000)
+
+        # Assert
+        assert self.scheduler.ts_now == 2_000
+        assert self.clock2.timestamp_ns() == 2_000
+
+    def test_next_time_ns_with_no_timers_returns_zero(self):
+        # Arrange, Act, Assert
+        assert self.scheduler.next_time_ns() == 0
+
+    def test_due_clocks_returns_only_clocks_with_expired_timers(self):
+        # Arrange
+        self.clock1.set_time_alert_ns("ALERT1", 100)
+        self.clock2.set_time_alert_ns("ALERT2", 200)
+
+        # Act
+        due = self.scheduler.due_clocks(150)
+
+        # Assert
+        assert self.scheduler.next_time_ns() == 200
+        assert due == [self.clock1]
+
+    def test_due_clocks_returns_clocks_in_attachment_order(self):
+        # Arrange
+        self.clock2.set_time_alert_ns("ALERT2", 100)
+        self.clock1.set_time_alert_ns("ALERT1", 200)
+
+        # Act
+        due = self.scheduler.due_clocks(200)
+
+        # Assert
+        assert due == [self.clock1, self.clock2]
+
+    def test_cancel_timer_removes_clock_from_schedule(self):
+        # Arrange
+        self.clock1.set_time_alert_ns("ALERT1", 100)
+        self.clock1.cancel_timer("ALERT1")
+
+        # Act
+        due = self.scheduler.due_clocks(150)
+
+        # Assert
+        assert due == []
+        assert self.scheduler.next_time_ns() == 0
+
+    def test_advancing_due_clock_reschedules_next_timer(self):
+        # Arrange
+        self.clock1.set_timer_ns("TIMER1", 100, 0, 0)
+
+        # Act
+        for clock in self.scheduler.due_clocks(250):
+            clock.advance_time(250)
+
+        # Assert
+        assert len(self.handler) == 0  # Events returned to the caller
+        assert self.scheduler.ts_now == 250
+        assert self.scheduler.next_time_ns() == 300
+
+    def test_time_alert_set_after_shared_time_moved_fires_at_alert_time(self):
+        # Arrange
+        self.scheduler.set_time(1_000)
+        self.clock2.set_time_alert_ns("ALERT2", 1_500)
+
+        # Act
+        due = self.scheduler.due_clocks(2_000)
+        events = self.clock2.advance_time(2_000)
+
+        # Assert
+        assert due == [self.clock2]
+        assert len(events) == 1
+        assert events[0].event.ts_event == 1_500
+
+    def test_detach_keeps_clock_time(self):
+        # Arrange
+        self.scheduler.set_time(1_000)
+
+        # Act
+        self.scheduler.detach(self.clock1)
+        self.scheduler.set_time(2_000)
+
+        # Assert
+        assert self.scheduler.clocks == [self.clock2]
+        assert self.clock1.timestamp_ns() == 1_000
+        assert self.clock2.timestamp_ns() == 2_000
+
+    def test_attach_clock_to_another_scheduler_raises_value_error(self):
+        # Arrange
+        other = TestClockScheduler()
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            other.attach(self.clock1)
+
+
 class TestLiveClock:
     def setup(self):
         # Fixture Setup
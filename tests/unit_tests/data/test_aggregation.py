@@ -22,9 +22,11 @@ import pytest
 
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.data.aggregation import BarAggregatorGroup
 from nautilus_trader.data.aggregation import BarBuilder
 from nautilus_trader.data.aggregation import TickBarAggregator
 from nautilus_trader.data.aggregation import TimeBarAggregator
+from nautilus_trader.data.aggregation import TimeBarScheduler
 from nautilus_trader.data.aggregation import ValueBarAggregator
 from nautilus_trader.data.aggregation import VolumeBarAggregator
 from nautilus_trader.model.data import Bar
@@ -2064,3 +2066,153 @@ class TestTimeBarAggregator:
         assert len(handler) == 2
         assert handler[0].ts_event == ts_event1
         assert handler[1].ts_event == ts_event2
+
+
+class TestBarAggregatorGroup:
+    def test_handle_quote_tick_updates_all_aggregators(self):
+        # Arrange
+        handler: list[Bar] = []
+        group = BarAggregatorGroup()
+        bid_bar_type = BarType(AUDUSD_SIM.id, BarSpecification(1, BarAggregation.TICK, PriceType.BID))
+        ask_bar_type = BarType(AUDUSD_SIM.id, BarSpecification(2, BarAggregation.TICK, PriceType.ASK))
+        group.add(TickBarAggregator(AUDUSD_SIM, bid_bar_type, handler.append))
+        group.add(TickBarAggregator(AUDUSD_SIM, ask_bar_type, handler.append))
+
+        tick = TestDataStubs.quote_tick(AUDUSD_SIM, bid_price=1.00001, ask_price=1.00004)
+
+        # Act
+        group.handle_quote_tick(tick)
+        group.handle_quote_tick(tick)
+
+        # Assert
+        assert len(group) == 2
+        assert [bar.bar_type for bar in handler] == [bid_bar_type, bid_bar_type, ask_bar_type]
+        assert handler[2].close == Price.from_str("1.00004")
+
+    def test_remove_aggregator_stops_updates(self):
+        # Arrange
+        handler: list[Bar] = []
+        group = BarAggregatorGroup()
+        bar_type = BarType(AUDUSD_SIM.id, BarSpecification(1, BarAggregation.TICK, PriceType.LAST))
+        aggregator = TickBarAggregator(AUDUSD_SIM, bar_type, handler.append)
+        group.add(aggregator)
+
+        # Act
+        group.remove(aggregator)
+        group.handle_trade_tick(TestDataStubs.trade_tick(AUDUSD_SIM))
+
+        # Assert
+        assert group.is_empty()
+        assert handler == []
+
+
+class TestTimeBarScheduler:
+    def test_aggregators_with_same_interval_share_a_single_timer(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+        handler: list[Bar] = []
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+
+        # Act
+        for instrument in (AUDUSD_SIM, ETHUSDT_BITMEX):
+            TimeBarAggregator(
+                instrument,
+                BarType(instrument.id, bar_spec),
+                handler.append,
+                clock,
+                scheduler=scheduler,
+            )
+        TimeBarAggregator(
+            AUDUSD_SIM,
+            BarType(AUDUSD_SIM.id, BarSpecification(5, BarAggregation.MINUTE, PriceType.MID)),
+            handler.append,
+            clock,
+            scheduler=scheduler,
+        )
+
+        # Assert
+        assert len(clock.timer_names) == 2
+        assert sorted(scheduler.timer_names()) == sorted(clock.timer_names)
+
+    def test_shared_timer_builds_bars_for_all_aggregators(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+        handler: list[Bar] = []
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+        aggregators = [
+            TimeBarAggregator(
+                instrument,
+                BarType(instrument.id, bar_spec),
+                handler.append,
+                clock,
+                scheduler=scheduler,
+            )
+            for instrument in (AUDUSD_SIM, ETHUSDT_BITMEX)
+        ]
+        aggregators[0].handle_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM))
+        aggregators[1].handle_quote_tick(TestDataStubs.quote_tick(ETHUSDT_BITMEX))
+
+        # Act
+        events = clock.advance_time(dt_to_unix_nanos(UNIX_EPOCH + timedelta(minutes=2)))
+        for event in events:
+            event.handle()
+
+        # Assert
+        assert len(events) == 2
+        assert [bar.bar_type.instrument_id for bar in handler] == [
+            AUDUSD_SIM.id,
+            ETHUSDT_BITMEX.id,
+            AUDUSD_SIM.id,
+            ETHUSDT_BITMEX.id,
+        ]
+        assert handler[2].ts_event == 120_000_000_000
+        assert aggregators[0].next_close_ns == 180_000_000_000
+
+    def test_stop_last_aggregator_cancels_timer(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+        aggregators = [
+            TimeBarAggregator(
+                instrument,
+                BarType(instrument.id, bar_spec),
+                [].append,
+                clock,
+                scheduler=scheduler,
+            )
+            for instrument in (AUDUSD_SIM, ETHUSDT_BITMEX)
+        ]
+
+        # Act
+        aggregators[0].stop()
+        timer_names_after_first_stop = clock.timer_names
+        aggregators[1].stop()
+
+        # Assert
+        assert len(timer_names_after_first_stop) == 1
+        assert clock.timer_names == []
+        assert scheduler.timer_names() == []
+
+    def test_reset_cancels_timers_and_clears_schedules(self):
+        # Arrange
+        clock = TestClock()
+        scheduler = TimeBarScheduler(clock)
+        bar_spec = BarSpecification(1, BarAggregation.MINUTE, PriceType.MID)
+        for instrument in (AUDUSD_SIM, ETHUSDT_BITMEX):
+            TimeBarAggregator(
+                instrument,
+                BarType(instrument.id, bar_spec),
+                [].append,
+                clock,
+                scheduler=scheduler,
+            )
+
+        # Act
+        scheduler.reset()
+
+        # Assert
+        assert clock.timer_names == []
+        assert scheduler.timer_names() == []
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.bollinger_bands import BollingerBands
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -144,3 +146,42 @@ class TestBollingerBands:
         assert indicator.upper == 0
         assert indicator.middle == 0
         assert indicator.lower == 0
+
+    def test_update_raw_batch_leaves_same_state_as_sequential_updates(self):
+        # Arrange
+        rng = np.random.default_rng(42)
+        close = rng.normal(1.0, 0.01, size=30)
+        high = close + 0.001
+        low = close - 0.001
+        indicator = BollingerBands(20, 2.0)
+        sequential = BollingerBands(20, 2.0)
+
+        # Act
+        expected = []
+        for i in range(len(close)):
+            sequential.update_raw(high[i], low[i], close[i])
+            expected.append((sequential.upper, sequential.middle, sequential.lower))
+        upper, middle, lower = indicator.update_raw_batch(high, low, close)
+
+        # Assert
+        assert list(zip(upper.tolist(), middle.tolist(), lower.tolist())) == expected
+        assert indicator.upper == sequential.upper
+        assert indicator.middle == sequential.middle
+        assert indicator.lower == sequential.lower
+        assert indicator.initialized
+        indicator.update_raw(1.0, 1.0, 1.0)
+        sequential.update_raw(1.0, 1.0, 1.0)
+        assert indicator.upper == sequential.upper
+
+    def test_handle_bars_updates_indicator(self):
+        # Arrange
+        indicator = BollingerBands(20, 2.0)
+
+        bar = TestDataStubs.bar_5decimal()
+
+        # Act
+        indicator.handle_bars([bar])
+
+        # Assert
+        assert indicator.has_inputs
+        assert indicator.middle == 1.0000266666666666
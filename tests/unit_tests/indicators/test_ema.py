@@ -15,6 +15,7 @@
 
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
 from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
@@ -138,3 +139,22 @@ class TestExponentialMovingAverage:
         # Assert
         assert not self.ema.initialized
         assert self.ema.value == 0.0
+
+    def test_update_raw_batch_leaves_same_state_as_sequential_updates(self):
+        # Arrange
+        values = np.random.default_rng(42).normal(1.0, 0.01, size=25)
+        indicator = ExponentialMovingAverage(10)
+        sequential = ExponentialMovingAverage(10)
+
+        # Act
+        expected = []
+        for value in values:
+            sequential.update_raw(value)
+            expected.append(sequential.value)
+        result = indicator.update_raw_batch(values)
+
+        # Assert
+        assert result.tolist() == expected
+        assert indicator.value == sequential.value
+        assert indicator.count == sequential.count == 25
+        assert indicator.initialized
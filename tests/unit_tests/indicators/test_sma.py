@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.average.sma import SimpleMovingAverage
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -174,3 +176,47 @@ class TestSimpleMovingAverage:
         # Assert
         assert not self.sma.initialized
         assert self.sma.value == 0
+
+    def test_update_raw_batch_leaves_same_state_as_sequential_updates(self):
+        # Arrange
+        values = np.random.default_rng(42).normal(1.0, 0.01, size=25)
+        sequential = SimpleMovingAverage(10)
+        self.sma.update_raw(1.0)  # Prior state carried into the batch
+        sequential.update_raw(1.0)
+
+        # Act
+        expected = []
+        for value in values:
+            sequential.update_raw(value)
+            expected.append(sequential.value)
+        result = self.sma.update_raw_batch(values)
+
+        # Assert
+        assert result.tolist() == expected
+        assert self.sma.value == sequential.value
+        assert self.sma.count == sequential.count == 26
+        assert self.sma.initialized
+        self.sma.update_raw(2.0)
+        sequential.update_raw(2.0)
+        assert self.sma.value == sequential.value
+
+    def test_update_raw_batch_with_fewer_values_than_period(self):
+        # Arrange, Act
+        result = self.sma.update_raw_batch(np.array([1.0, 2.0, 3.0]))
+
+        # Assert
+        assert result.tolist() == [1.0, 1.5, 2.0]
+        assert self.sma.has_inputs
+        assert not self.sma.initialized
+
+    def test_handle_bars_updates_indicator(self):
+        # Arrange
+        bar = TestDataStubs.bar_5decimal()
+
+        # Act
+        self.sma.handle_bars([bar, bar])
+
+        # Assert
+        assert self.sma.has_inputs
+        assert self.sma.count == 2
+        assert self.sma.value == bar.close.as_double()
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
 import pytest
 
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
@@ -170,3 +171,22 @@ class TestWeightedMovingAverage:
         # Assert
         assert not self.wma.initialized
         assert self.wma.value == 0
+
+    def test_update_raw_batch_leaves_same_state_as_sequential_updates(self):
+        # Arrange
+        values = np.random.default_rng(42).normal(1.0, 0.01, size=25)
+        indicator = WeightedMovingAverage(10)
+        sequential = WeightedMovingAverage(10)
+
+        # Act
+        expected = []
+        for value in values:
+            sequential.update_raw(value)
+            expected.append(sequential.value)
+        result = indicator.update_raw_batch(values)
+
+        # Assert
+        assert result.tolist() == expected
+        assert indicator.value == sequential.value
+        assert indicator.count == sequential.count
+        assert indicator.initialized
@@ -26,6 +26,7 @@ from nautilus_trader.data.messages import DataRequest
 from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.data.messages import Subscribe
 from nautilus_trader.live.data_engine import LiveDataEngine
+from nautilus_trader.model.data import CustomData
 from nautilus_trader.model.data import DataType
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.identifiers import ClientId
@@ -35,10 +36,13 @@ from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.portfolio.portfolio import Portfolio
 from nautilus_trader.test_kit.functions import ensure_all_tasks_completed
 from nautilus_trader.test_kit.functions import eventually
+from nautilus_trader.test_kit.mocks.data import NewsEventData
+from nautilus_trader.test_kit.mocks.data import setup_catalog
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.component import TestComponentStubs
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+from nautilus_trader.test_kit.stubs.persistence import TestPersistenceStubs
 
 
 BITMEX = Venue("BITMEX")
@@ -311,6 +315,108 @@ class TestLiveDataEngine:
         # Tear Down
         self.engine.stop()
 
+    @pytest.mark.asyncio
+    async def test_request_when_catalog_registered_streams_chunked_responses(self, tmp_path):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=LiveDataEngineConfig(catalog_chunk_size=10),
+        )
+
+        catalog = setup_catalog(protocol="file", path=tmp_path / "catalog")
+        ticks = [
+            TestDataStubs.quote_tick(instrument=ETHUSDT_BINANCE, ts_event=i, ts_init=i)
+            for i in range(25)
+        ]
+        catalog.write_data(ticks)
+        self.engine.register_catalog(catalog)
+        self.engine.start()
+
+        handler: list[DataResponse] = []
+        request = DataRequest(
+            client_id=None,
+            venue=BINANCE,
+            data_type=DataType(
+                QuoteTick,
+                metadata={
+                    "instrument_id": ETHUSDT_BINANCE.id,
+                    "start": None,
+                    "end": None,
+                },
+            ),
+            callback=handler.append,
+            request_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.msgbus.request(endpoint="DataEngine.request", request=request)
+
+        # Assert
+        await eventually(lambda: handler and handler[-1].is_final)
+        assert [len(r.data) for r in handler] == [10, 10, 5]
+        assert [r.is_final for r in handler] == [False, False, True]
+        assert all(r.correlation_id == request.id for r in handler)
+        assert [t.ts_init for r in handler for t in r.data] == list(range(25))
+        assert self.engine.response_count == 3
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_request_custom_data_from_catalog_keeps_metadata(self, tmp_path):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            config=LiveDataEngineConfig(catalog_chunk_size=1_000),
+        )
+
+        catalog = setup_catalog(protocol="file", path=tmp_path / "catalog")
+        events = TestPersistenceStubs.news_events()
+        catalog.write_data(events)
+        self.engine.register_catalog(catalog)
+        self.engine.start()
+
+        handler: list[DataResponse] = []
+        metadata = {"instrument_id": ETHUSDT_BINANCE.id, "start": None, "end": None}
+        request = DataRequest(
+            client_id=None,
+            venue=BINANCE,
+            data_type=DataType(NewsEventData, metadata=metadata),
+            callback=handler.append,
+            request_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.msgbus.request(endpoint="DataEngine.request", request=request)
+
+        # Assert
+        await eventually(lambda: handler and handler[-1].is_final)
+        data = [d for r in handler for d in r.data]
+        assert len(data) == len(events)
+        assert all(isinstance(d, CustomData) for d in data)
+        assert all(d.data_type.metadata == metadata for d in data)
+
+        # Tear Down
+        self.engine.stop()
+
     @pytest.mark.asyncio
     async def test_receive_response_processes_message(self):
         # Arrange
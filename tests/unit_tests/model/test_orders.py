@@ -2222,3 +2222,119 @@ class TestOrders:
         # Assert
         assert order.order_type == OrderType.MARKET
         assert order.ts_init == 0  # Retains original order `ts_init`
+
+    def test_apply_events_matches_sequential_apply(self) -> None:
+        # Arrange
+        order1 = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        order2 = LimitOrder.create(order1.init_event)
+        order1.apply(TestEventStubs.order_submitted(order1))
+        order1.apply(TestEventStubs.order_accepted(order1))
+        fills = [
+            TestEventStubs.order_filled(
+                order1,
+                instrument=AUDUSD_SIM,
+                trade_id=TradeId(f"E-{i}"),
+                last_qty=Quantity.from_int(10_000),
+                last_px=Price.from_str(f"1.0000{i}"),
+            )
+            for i in range(3)
+        ]
+        events = order1.events[1:] + fills
+
+        # Act
+        for fill in fills:
+            order1.apply(fill)
+        order2.apply_events(events)
+
+        # Assert
+        assert order2.events == order1.events
+        assert order2.status == order1.status == OrderStatus.PARTIALLY_FILLED
+        assert order2.filled_qty == order1.filled_qty == Quantity.from_int(30_000)
+        assert order2.avg_px == order1.avg_px
+        assert order2.has_trade_id(TradeId("E-2"))
+        assert not order2.has_trade_id(TradeId("E-3"))
+        assert order2.has_event(fills[0].id)
+
+    def test_apply_fill_with_duplicate_trade_id_raises_key_error(self) -> None:
+        # Arrange
+        order = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+        order.apply(
+            TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                trade_id=TradeId("E-1"),
+                last_qty=Quantity.from_int(10_000),
+            ),
+        )
+
+        # Act, Assert
+        with pytest.raises(KeyError):
+            order.apply(
+                TestEventStubs.order_filled(
+                    order,
+                    instrument=AUDUSD_SIM,
+                    trade_id=TradeId("E-1"),
+                    last_qty=Quantity.from_int(10_000),
+                ),
+            )
+
+    def test_set_event_capacity_with_invalid_capacity_raises_value_error(self) -> None:
+        # Arrange
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            order.set_event_capacity(1)
+
+    def test_event_compaction_retains_init_and_last_events(self) -> None:
+        # Arrange
+        order = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        order.set_event_capacity(3)
+        order.apply(TestEventStubs.order_submitted(order))
+        order.apply(TestEventStubs.order_accepted(order))
+        fills = [
+            TestEventStubs.order_filled(
+                order,
+                instrument=AUDUSD_SIM,
+                trade_id=TradeId(f"E-{i}"),
+                last_qty=Quantity.from_int(10_000),
+                last_px=Price.from_str(f"1.0000{i}"),
+            )
+            for i in range(4)
+        ]
+
+        # Act
+        order.apply_events(fills)
+
+        # Assert
+        assert order.events == [order.init_event, fills[-2], fills[-1]]
+        assert order.event_count == 7
+        assert order.last_event == fills[-1]
+        assert order.filled_qty == Quantity.from_int(40_000)
+        assert order.avg_px == pytest.approx(1.000015)
+        assert order.has_event(fills[-1].id)
+        assert not order.has_event(fills[0].id)
+        assert order.trade_ids == [TradeId("E-1"), TradeId("E-2"), TradeId("E-3")]
+        assert order.has_trade_id(TradeId("E-3"))
+        assert not order.has_trade_id(TradeId("E-0"))
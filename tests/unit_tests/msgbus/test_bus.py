@@ -440,6 +440,54 @@ class TestMessageBus:
         assert handler1 == ["message1"]
         assert handler2 == ["message1", "message2", "message3"]
 
+    def test_subscribe_wildcard_after_publish_then_receives_message_on_topic(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+        handler3 = []
+
+        self.msgbus.subscribe(topic="data.quotes.SIM.AUDUSD", handler=handler1.append)
+        self.msgbus.publish("data.quotes.SIM.AUDUSD", "message1")  # Resolves topic
+
+        # Act
+        self.msgbus.subscribe(topic="data.quotes.*", handler=handler2.append)
+        self.msgbus.subscribe(topic="data.trades.*", handler=handler3.append)
+        self.msgbus.publish("data.quotes.SIM.AUDUSD", "message2")
+
+        # Assert
+        assert handler1 == ["message1", "message2"]
+        assert handler2 == ["message2"]
+        assert handler3 == []
+
+    def test_publish_with_equal_priorities_sends_in_subscription_order(self):
+        # Arrange
+        received = []
+
+        self.msgbus.subscribe(topic="data.*", handler=lambda m: received.append(1))
+        self.msgbus.subscribe(topic="data.bars", handler=lambda m: received.append(2))
+        self.msgbus.subscribe(topic="*", handler=lambda m: received.append(3), priority=10)
+
+        # Act
+        self.msgbus.publish("data.bars", "message")
+
+        # Assert
+        assert received == [3, 1, 2]
+
+    def test_unsubscribe_wildcard_then_stops_receiving_on_new_topics(self):
+        # Arrange
+        handler = []
+        self.msgbus.subscribe(topic="data.*", handler=handler.append)
+        self.msgbus.publish("data.quotes", "message1")
+
+        # Act
+        self.msgbus.unsubscribe(topic="data.*", handler=handler.append)
+        self.msgbus.publish("data.quotes", "message2")
+        self.msgbus.publish("data.trades", "message3")
+
+        # Assert
+        assert handler == ["message1"]
+        assert not self.msgbus.has_subscribers("data.*")
+
     def test_msgbus_for_system_events_using_component_id(self):
         # Arrange
         subscriber = []
@@ -469,6 +517,13 @@ class TestMessageBus:
         ["data.quotes.BINANCE", "data.*.BINANCE", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.*", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.ETH*", True],
+        ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.BTC*", False],
+        ["data.quotes.BINANCE", "data.quotes.BINANC?", True],
+        ["data.quotes.BINANCE", "data.quotes.BINANCE?", False],
+        ["data.quotes.BINANCE", "data.*.*", True],
+        ["data.quotes", "data.quotes.*", False],
+        ["data", "data*", True],
+        ["", "*", True],
     ],
 )
 def test_is_matching_given_various_topic_pattern_combos(topic, pattern, expected):
@@ -20,6 +20,7 @@ from decimal import Decimal
 import pandas as pd
 import pyarrow.dataset as ds
 import pytest
+from click.testing import CliRunner
 
 from nautilus_trader.adapters.betfair.constants import BETFAIR_PRICE_PRECISION
 from nautilus_trader.core import nautilus_pyo3
@@ -27,6 +28,7 @@ from nautilus_trader.core.rust.model import AggressorSide
 from nautilus_trader.core.rust.model import BookAction
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.data import CustomData
+from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import InstrumentId
@@ -38,9 +40,11 @@ from nautilus_trader.model.instruments import Equity
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.persistence.wranglers_v2 import QuoteTickDataWranglerV2
 from nautilus_trader.persistence.wranglers_v2 import TradeTickDataWranglerV2
 from nautilus_trader.test_kit.mocks.data import NewsEventData
+from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.rust.data_pyo3 import TestDataProviderPyo3
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -246,6 +250,280 @@ def test_catalog_custom_data(catalog: ParquetDataCatalog) -> None:
     assert isinstance(data[0], CustomData)
 
 
+def test_catalog_query_chunks_bounds_rows_per_chunk(
+    catalog_betfair: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    deltas = catalog_betfair.order_book_deltas()
+
+    # Act
+    chunks = list(catalog_betfair.query_chunks(data_cls=OrderBookDelta, chunk_size=500))
+
+    # Assert
+    ts_inits = [delta.ts_init for chunk in chunks for delta in chunk]
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    assert len(ts_inits) == len(deltas) == 2384
+    assert ts_inits == sorted(ts_inits)
+
+
+def test_catalog_query_chunks_merges_files_with_memory_filesystem(
+    catalog_memory: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    quotes = [TestDataStubs.quote_tick(audusd, ts_event=i, ts_init=i) for i in range(0, 100, 2)]
+    quotes += [TestDataStubs.quote_tick(usdjpy, ts_event=i, ts_init=i) for i in range(1, 100, 2)]
+    catalog_memory.write_data(quotes)
+
+    # Act
+    chunks = list(catalog_memory.query_chunks(data_cls=QuoteTick, chunk_size=16))
+    audusd_chunks = list(
+        catalog_memory.query_chunks(
+            data_cls=QuoteTick,
+            instrument_ids=[audusd.id.value],
+            start=10,
+            chunk_size=16,
+        ),
+    )
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [16, 16, 16, 16, 16, 16, 4]
+    assert [quote.ts_init for chunk in chunks for quote in chunk] == list(range(100))
+    assert [len(chunk) for chunk in audusd_chunks] == [16, 16, 13]
+    assert all(quote.instrument_id == audusd.id for chunk in audusd_chunks for quote in chunk)
+
+
+def test_catalog_query_chunks_custom_data(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    TestPersistenceStubs.setup_news_event_persistence()
+    data = TestPersistenceStubs.news_events()
+    catalog.write_data(data)
+
+    # Act
+    chunks = list(catalog.query_chunks(data_cls=NewsEventData, chunk_size=5_000))
+
+    # Assert
+    assert all(len(chunk) <= 5_000 for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == len(data)
+    assert isinstance(chunks[0][0], CustomData)
+
+
+def _write_quotes_for_index(catalog: ParquetDataCatalog) -> None:
+    audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    catalog.max_rows_per_group = 10
+    catalog.write_data(
+        [TestDataStubs.quote_tick(audusd, ts_event=i, ts_init=i) for i in range(100)]
+        + [TestDataStubs.quote_tick(usdjpy, ts_event=i, ts_init=i) for i in range(100, 200)],
+    )
+
+
+def test_catalog_write_data_maintains_index(catalog_memory: ParquetDataCatalog) -> None:
+    # Arrange
+    _write_quotes_for_index(catalog_memory)
+
+    # Act
+    index = catalog_memory._read_index("quote_tick")
+
+    # Assert
+    assert index is not None
+    assert index.num_rows == 20  # Row groups
+    assert sum(index["num_rows"].to_pylist()) == 200
+    assert set(index["key"].to_pylist()) == {"AUDUSD.SIM", "USDJPY.SIM"}
+    assert min(index["ts_init_min"].to_pylist()) == 0
+    assert max(index["ts_init_max"].to_pylist()) == 199
+
+
+def test_catalog_query_index_prunes_files_and_row_groups(
+    catalog_memory: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    _write_quotes_for_index(catalog_memory)
+
+    # Act
+    by_time = catalog_memory._query_index(QuoteTick, start=25, end=41)
+    by_instrument = catalog_memory._query_index(QuoteTick, instrument_ids=["USD/JPY.SIM"])
+    quotes = catalog_memory.quote_ticks(start=25, end=41)
+
+    # Assert
+    assert by_time == {"data/quote_tick/AUDUSD.SIM/part-0.parquet": [2, 3, 4]}
+    assert by_instrument == {"data/quote_tick/USDJPY.SIM/part-0.parquet": None}
+    assert [q.ts_init for q in quotes] == list(range(25, 42))
+
+
+def test_catalog_query_chunks_reads_row_groups_in_time_order(
+    catalog_memory: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    _write_quotes_for_index(catalog_memory)
+    dataset = ds.dataset(
+        f"{catalog_memory.path}/data/quote_tick",
+        filesystem=catalog_memory.fs,
+        format="parquet",
+    )
+
+    # Act
+    row_groups = catalog_memory._sorted_row_groups(dataset)
+    chunks = list(catalog_memory.query_chunks(QuoteTick, chunk_size=15))
+
+    # Assert
+    assert [ts_min for ts_min, _ in row_groups] == list(range(0, 200, 10))
+    assert [len(chunk) for chunk in chunks] == [15] * 13 + [5]
+    assert [q.ts_init for chunk in chunks for q in chunk] == list(range(200))
+
+
+def test_catalog_query_when_index_prunes_all_files_returns_empty(
+    catalog_memory: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    _write_quotes_for_index(catalog_memory)
+
+    # Act
+    table = catalog_memory.query_table(QuoteTick, start=1_000, end=2_000)
+    chunks = list(catalog_memory.query_chunks(QuoteTick, start=1_000, end=2_000))
+
+    # Assert
+    assert catalog_memory._query_index(QuoteTick, start=1_000, end=2_000) == {}
+    assert table is None
+    assert chunks == []
+
+
+def test_catalog_write_data_appends_index_deltas(catalog_memory: ParquetDataCatalog) -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+    # Act
+    for i in range(5):
+        catalog_memory.write_data(
+            [TestDataStubs.quote_tick(instrument, ts_event=i, ts_init=i)],
+            basename_template=f"part-{i}",
+        )
+
+    # Assert
+    index = catalog_memory._read_index("quote_tick")
+    assert len(catalog_memory._index_deltas("quote_tick")) == 4
+    assert index.num_rows == 5
+    assert sorted(index["ts_init_min"].to_pylist()) == [0, 1, 2, 3, 4]
+    assert [q.ts_init for q in catalog_memory.quote_ticks(start=2, end=3)] == [2, 3]
+
+
+def test_catalog_query_index_is_cached_until_index_changes(
+    catalog_memory: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    _write_quotes_for_index(catalog_memory)
+    instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    other = ParquetDataCatalog(catalog_memory.path, fs_protocol="memory")
+    reads: list[str] = []
+    read_index = catalog_memory._read_index
+
+    def counting_read_index(file_prefix: str):
+        reads.append(file_prefix)
+        return read_index(file_prefix)
+
+    catalog_memory._read_index = counting_read_index  # type: ignore
+
+    # Act
+    catalog_memory.quote_ticks()
+    catalog_memory.quote_ticks()
+    reads_cached = len(reads)
+    catalog_memory.write_data(
+        [TestDataStubs.quote_tick(instrument, ts_event=500, ts_init=500)],
+        basename_template="part-1",
+    )
+    quotes_written = catalog_memory.quote_ticks()
+    other.write_data(
+        [TestDataStubs.quote_tick(instrument, ts_event=600, ts_init=600)],
+        basename_template="part-2",
+    )
+    quotes_written_by_other = catalog_memory.quote_ticks()
+
+    # Assert
+    assert reads_cached == 1
+    assert len(quotes_written) == 201
+    assert len(quotes_written_by_other) == 202
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+def test_catalog_query_matches_instrument_on_directory_name(
+    catalog: ParquetDataCatalog,
+    indexed: bool,
+) -> None:
+    # Arrange
+    audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    audusd_simx = TestInstrumentProvider.default_fx_ccy("AUD/USD", venue=Venue("SIMX"))
+    catalog.write_data(
+        [TestDataStubs.quote_tick(audusd, ts_event=i, ts_init=i) for i in range(10)]
+        + [TestDataStubs.quote_tick(audusd_simx, ts_event=i, ts_init=i) for i in range(10, 15)],
+    )
+    if not indexed:
+        catalog.fs.rm(catalog._index_path("quote_tick"))
+
+    # Act
+    quotes = catalog.quote_ticks(instrument_ids=["AUD/USD.SIM"])
+
+    # Assert
+    assert catalog.index_exists("quote_tick") == indexed
+    assert len(quotes) == 10
+    assert {q.instrument_id for q in quotes} == {audusd.id}
+
+
+def test_catalog_write_data_does_not_index_existing_unindexed_data(
+    catalog: ParquetDataCatalog,
+) -> None:
+    # Arrange
+    audusd = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    catalog.write_data([TestDataStubs.quote_tick(audusd)])
+    catalog.fs.rm(catalog._index_path("quote_tick"))
+
+    # Act
+    catalog.write_data([TestDataStubs.quote_tick(usdjpy)])
+
+    # Assert
+    assert catalog._read_index("quote_tick") is None
+    assert len(catalog.quote_ticks()) == 2
+
+
+def test_catalog_rebuild_index(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    _write_quotes_for_index(catalog)
+    expected = catalog._read_index("quote_tick")
+    catalog.fs.rm(catalog._index_path("quote_tick"))
+
+    # Act
+    catalog.rebuild_index()
+
+    # Assert
+    assert catalog._read_index("quote_tick") == expected
+    assert len(catalog.quote_ticks(instrument_ids=["AUD/USD.SIM"], start=25, end=41)) == 17
+
+
+def test_catalog_rebuild_index_cli(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    from nautilus_trader.persistence.catalog.__main__ import main
+
+    _write_quotes_for_index(catalog)
+    catalog.fs.rm(catalog._index_path("quote_tick"))
+
+    # Act
+    result = CliRunner().invoke(
+        main,
+        [
+            "rebuild-index",
+            "--uri",
+            catalog.path,
+            "--data-cls",
+            "nautilus_trader.model.data:QuoteTick",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert catalog._read_index("quote_tick").num_rows == 20
+
+
 def test_catalog_bars_querying_by_bar_type(catalog: ParquetDataCatalog) -> None:
     # Arrange
     bar_type = TestDataStubs.bartype_adabtc_binance_1min_last()
@@ -357,6 +635,37 @@ def test_catalog_write_pyo3_trade_ticks(catalog: ParquetDataCatalog) -> None:
     assert len(all_trades) == 69_806
 
 
+def test_catalog_write_table(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    wrangler = QuoteTickDataWrangler(instrument)
+    bid_data = TestDataProvider().read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:100]
+    ask_data = TestDataProvider().read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")[:100]
+    table = wrangler.process_bar_data_arrow(bid_data=bid_data, ask_data=ask_data)
+
+    # Act
+    catalog.write_table(table, QuoteTick)
+
+    # Assert
+    quotes = catalog.quote_ticks(instrument_ids=[instrument.id.value])
+    assert len(quotes) == 400
+    assert quotes[0].instrument_id == instrument.id
+    assert catalog._read_index("quote_tick").num_rows == 1
+
+
+def test_catalog_write_table_unsorted_raises(catalog: ParquetDataCatalog) -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    wrangler = QuoteTickDataWrangler(instrument)
+    bid_data = TestDataProvider().read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:100]
+    ask_data = TestDataProvider().read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")[:100]
+    table = wrangler.process_bar_data_arrow(bid_data=bid_data, ask_data=ask_data, sort_data=False)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        catalog.write_table(table, QuoteTick)
+
+
 def test_catalog_multiple_bar_types(catalog: ParquetDataCatalog) -> None:
     # Arrange
     bar_type1 = TestDataStubs.bartype_adabtc_binance_1min_last()
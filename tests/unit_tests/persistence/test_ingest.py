@@ -0,0 +1,213 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import gzip
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from nautilus_trader.adapters.databento.loaders import DatabentoDataLoader
+from nautilus_trader.adapters.databento.loaders import DatabentoIngestLoader
+from nautilus_trader.adapters.tardis.loaders import TardisIngestLoader
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.ingest import CatalogIngester
+from nautilus_trader.test_kit.mocks.data import setup_catalog
+from tests import TEST_DATA_DIR
+
+
+DATABENTO_TEST_DATA_DIR = TEST_DATA_DIR / "databento"
+
+
+class _FailingCopyLoader(DatabentoIngestLoader):
+    # Module level so the loader can be pickled for the worker processes
+    def load(self, path: str) -> list:
+        if "-copy" in path:
+            raise RuntimeError("Failed to load copy")
+        return super().load(path)
+
+
+@pytest.fixture(name="source_dir")
+def fixture_source_dir(tmp_path):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    shutil.copy(DATABENTO_TEST_DATA_DIR / "trades.dbn.zst", source_dir / "trades.dbn.zst")
+    shutil.copy(DATABENTO_TEST_DATA_DIR / "mbo.dbn.zst", source_dir / "mbo.dbn.zst")
+    return source_dir
+
+
+def test_ingest_directory_writes_data_and_index(
+    catalog: ParquetDataCatalog,
+    source_dir,
+) -> None:
+    # Arrange
+    ingester = CatalogIngester(catalog, DatabentoIngestLoader(), max_workers=2)
+    expected = DatabentoDataLoader().from_dbn_file(DATABENTO_TEST_DATA_DIR / "trades.dbn.zst")
+
+    # Act
+    results = ingester.ingest([source_dir])
+
+    # Assert
+    assert len(results) == 2
+    assert all(result.num_rows > 0 for result in results)
+    assert catalog.index_exists("trade_tick")
+    assert catalog.index_exists("order_book_delta")
+    trades = catalog.query(TradeTick)
+    assert len(trades) == len(expected)
+    assert [t.ts_init for t in trades] == sorted(t.ts_init for t in expected)
+
+
+def test_ingest_again_skips_ingested_files(
+    catalog: ParquetDataCatalog,
+    source_dir,
+) -> None:
+    # Arrange
+    CatalogIngester(catalog, DatabentoIngestLoader(), max_workers=2).ingest([source_dir])
+    ingester = CatalogIngester(catalog, DatabentoIngestLoader(), max_workers=2)
+
+    # Act
+    results = ingester.ingest([source_dir])
+
+    # Assert
+    assert results == []
+    assert len(catalog.query(TradeTick)) == len(
+        DatabentoDataLoader().from_dbn_file(DATABENTO_TEST_DATA_DIR / "trades.dbn.zst"),
+    )
+
+
+def test_ingest_skips_duplicate_file_content(
+    catalog: ParquetDataCatalog,
+    source_dir,
+) -> None:
+    # Arrange
+    shutil.copy(source_dir / "trades.dbn.zst", source_dir / "trades-copy.dbn.zst")
+    ingester = CatalogIngester(catalog, DatabentoIngestLoader(), max_workers=2)
+
+    # Act
+    results = ingester.ingest([source_dir])
+
+    # Assert
+    duplicates = [result for result in results if result.duplicate_of is not None]
+    assert len(results) == 3
+    assert len(duplicates) == 1
+    assert duplicates[0].num_rows == 0
+    assert len(catalog.query(TradeTick)) == len(
+        DatabentoDataLoader().from_dbn_file(DATABENTO_TEST_DATA_DIR / "trades.dbn.zst"),
+    )
+
+
+def test_ingest_when_original_fails_leaves_duplicate_pending(
+    catalog: ParquetDataCatalog,
+    source_dir,
+) -> None:
+    # Arrange
+    shutil.copy(source_dir / "trades.dbn.zst", source_dir / "trades-copy.dbn.zst")
+    CatalogIngester(catalog, _FailingCopyLoader(), max_workers=2).ingest([source_dir])
+    ingester = CatalogIngester(catalog, DatabentoIngestLoader(), max_workers=2)
+
+    # Act
+    results = ingester.ingest([source_dir])
+
+    # Assert
+    duplicates = [result for result in results if result.duplicate_of is not None]
+    assert len(results) == 2
+    assert len(duplicates) == 1
+    assert len(catalog.query(TradeTick)) == len(
+        DatabentoDataLoader().from_dbn_file(DATABENTO_TEST_DATA_DIR / "trades.dbn.zst"),
+    )
+
+
+def test_ingest_cli(catalog: ParquetDataCatalog, source_dir) -> None:
+    # Arrange
+    from nautilus_trader.persistence.catalog.__main__ import main
+
+    # Act
+    result = CliRunner().invoke(
+        main,
+        [
+            "ingest",
+            "--uri",
+            catalog.path,
+            "--source",
+            str(source_dir / "trades.dbn.zst"),
+            "--format",
+            "databento",
+            "--max-workers",
+            "1",
+        ],
+    )
+
+    # Assert
+    assert result.exit_code == 0
+    assert len(catalog.query(TradeTick)) == len(
+        DatabentoDataLoader().from_dbn_file(DATABENTO_TEST_DATA_DIR / "trades.dbn.zst"),
+    )
+
+
+def test_ingest_into_memory_catalog_raises() -> None:
+    # Arrange
+    catalog = setup_catalog(protocol="memory")
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        CatalogIngester(catalog, DatabentoIngestLoader())
+
+
+def test_tardis_ingest_loader_with_unsupported_data_type_raises() -> None:
+    # Act, Assert
+    with pytest.raises(ValueError):
+        TardisIngestLoader("derivative_ticker", price_precision=1, size_precision=0)
+
+
+def test_ingest_with_small_batch_size_writes_all_records(
+    catalog: ParquetDataCatalog,
+    source_dir,
+) -> None:
+    # Arrange
+    ingester = CatalogIngester(catalog, DatabentoIngestLoader(), batch_size=3)
+    expected = DatabentoDataLoader().from_dbn_file(DATABENTO_TEST_DATA_DIR / "trades.dbn.zst")
+
+    # Act
+    ingester.ingest([source_dir / "trades.dbn.zst"])
+
+    # Assert
+    trades = catalog.query(TradeTick)
+    assert len(trades) == len(expected)
+    assert [t.ts_init for t in trades] == sorted(t.ts_init for t in expected)
+
+
+def test_tardis_ingest_loader_load_chunks_splits_on_timestamp_changes(tmp_path) -> None:
+    # Arrange
+    path = tmp_path / "trades.csv.gz"
+    rows = [
+        "exchange,symbol,timestamp,local_timestamp,id,side,price,amount",
+        "bitmex,XBTUSD,1000,1001,t1,buy,7000.5,10",
+        "bitmex,XBTUSD,2000,2001,t2,sell,7000.0,20",
+        "bitmex,XBTUSD,2000,2002,t3,sell,7000.0,30",
+        "bitmex,XBTUSD,3000,3001,t4,buy,7001.0,40",
+        "bitmex,XBTUSD,4000,4001,t5,buy,7001.5,50",
+    ]
+    with gzip.open(path, "wt") as f:
+        f.write("\n".join(rows) + "\n")
+    loader = TardisIngestLoader("trades", price_precision=1, size_precision=0)
+
+    # Act
+    chunks = list(loader.load_chunks(str(path), chunk_size=2))
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [3, 2]
+    expected = loader.load(str(path))
+    assert [t.trade_id for chunk in chunks for t in chunk] == [t.trade_id for t in expected]
@@ -14,8 +14,13 @@
 # -------------------------------------------------------------------------------------------------
 
 import copy
+import threading
+import time
 from collections import Counter
 
+import pyarrow as pa
+import pytest
+
 from nautilus_trader.backtest.node import BacktestNode
 from nautilus_trader.backtest.results import BacktestResult
 from nautilus_trader.common.signal import generate_signal_class
@@ -32,7 +37,12 @@ from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.writer import StreamingFeatherWriter
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from nautilus_trader.test_kit.mocks.data import NewsEventData
+from nautilus_trader.test_kit.mocks.data import setup_catalog
 from nautilus_trader.test_kit.stubs.persistence import TestPersistenceStubs
 from tests.integration_tests.adapters.betfair.test_kit import BetfairTestStubs
 
@@ -433,3 +443,137 @@ class TestPersistenceStreaming:
             "TradeTick": 179,
         }
         assert counts == expected
+
+    def test_feather_writer_background_writer(self) -> None:
+        # Arrange
+        catalog = setup_catalog(protocol="memory", path="/catalog")
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        cache = TestComponentStubs.cache()
+        cache.add_instrument(instrument)
+        writer = StreamingFeatherWriter(
+            path=catalog.path,
+            cache=cache,
+            clock=TestComponentStubs.clock(),
+            fs_protocol=catalog.fs_protocol,
+            background_writer=True,
+            buffer_size=100,
+            batch_size=10,
+        )
+        quotes = [
+            TestDataStubs.quote_tick(instrument, ts_event=i, ts_init=i) for i in range(1_000)
+        ]
+
+        # Act
+        for quote in quotes:
+            writer.write(quote)
+        writer.close()
+
+        # Assert
+        stats = writer.get_buffer_stats()
+        assert stats["enqueued"] == 1_000
+        assert stats["written"] == 1_000
+        assert stats["pending"] == 0
+        assert stats["max_pending"] <= 100
+        assert stats["batches"] >= 100
+        assert writer.is_closed
+        feather_files = catalog.fs.glob(f"{catalog.path}/quote_tick/*.feather")
+        assert len(feather_files) == 1
+        with catalog.fs.open(feather_files[0], "rb") as f:
+            table = pa.ipc.open_stream(f).read_all()
+        assert table["ts_init"].to_pylist() == list(range(1_000))
+
+    def test_feather_writer_background_writer_raises_writer_error_on_flush(self) -> None:
+        # Arrange
+        catalog = setup_catalog(protocol="memory", path="/catalog")
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        cache = TestComponentStubs.cache()
+        cache.add_instrument(instrument)
+        writer = StreamingFeatherWriter(
+            path=catalog.path,
+            cache=cache,
+            clock=TestComponentStubs.clock(),
+            fs_protocol=catalog.fs_protocol,
+            flush_interval_ms=60_000,
+            background_writer=True,
+        )
+        flush_streams = writer._flush_streams
+        calls: list[int] = []
+
+        def failing_flush_streams() -> None:
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("flush failed")
+            flush_streams()
+
+        writer._flush_streams = failing_flush_streams  # type: ignore
+
+        # Act
+        writer.write(TestDataStubs.quote_tick(instrument, ts_event=0, ts_init=0))
+        with pytest.raises(RuntimeError, match="flush failed"):
+            writer.flush()
+        writer.write(TestDataStubs.quote_tick(instrument, ts_event=1, ts_init=1))
+        writer.flush()
+        writer.close()
+
+        # Assert
+        assert writer.get_buffer_stats()["written"] == 2
+        assert writer.is_closed
+
+    def test_feather_writer_background_writer_drains_writes_made_while_closing(self) -> None:
+        # Arrange
+        catalog = setup_catalog(protocol="memory", path="/catalog")
+        instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        cache = TestComponentStubs.cache()
+        cache.add_instrument(instrument)
+        writer = StreamingFeatherWriter(
+            path=catalog.path,
+            cache=cache,
+            clock=TestComponentStubs.clock(),
+            fs_protocol=catalog.fs_protocol,
+            background_writer=True,
+        )
+        write_batch = writer._write_batch
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_write_batch(batch: list) -> None:
+            started.set()
+            release.wait()
+            write_batch(batch)
+
+        writer._write_batch = blocking_write_batch  # type: ignore
+
+        # Act
+        writer.write(TestDataStubs.quote_tick(instrument, ts_event=0, ts_init=0))
+        started.wait()
+        closer = threading.Thread(target=writer.close)
+        closer.start()
+        while not writer._stopping:
+            time.sleep(0.001)
+        writer.write(TestDataStubs.quote_tick(instrument, ts_event=1, ts_init=1))
+        release.set()
+        closer.join()
+
+        # Assert
+        assert writer.get_buffer_stats()["written"] == 2
+        assert writer.is_closed
+
+    def test_feather_writer_background_writer_flush(self) -> None:
+        # Arrange
+        catalog = setup_catalog(protocol="memory", path="/catalog")
+        writer = StreamingFeatherWriter(
+            path=catalog.path,
+            cache=TestComponentStubs.cache(),
+            clock=TestComponentStubs.clock(),
+            fs_protocol=catalog.fs_protocol,
+            background_writer=True,
+        )
+        writer.write(TestDataStubs.quote_tick())  # No instrument in cache
+
+        # Act
+        writer.flush()
+
+        # Assert
+        assert writer.get_buffer_stats()["written"] == 1
+        writer.close()
+        assert writer.is_closed
@@ -15,15 +15,24 @@
 import pandas as pd
 import pytest
 
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.enums import BookAction
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import RecordFlag
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
 from nautilus_trader.persistence.loaders import BinanceOrderBookDeltaDataLoader
+from nautilus_trader.persistence.wranglers import BarDataWrangler
 from nautilus_trader.persistence.wranglers import OrderBookDeltaDataWrangler
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from tests import TEST_DATA_DIR
 
 
@@ -166,3 +175,108 @@ def test_trade_bar_data_wrangler_size_precision(is_raw: bool) -> None:
     # Assert
     for tick in ticks:
         assert tick.size.raw == expected_size
+
+
+def test_quote_tick_wrangler_process_arrow() -> None:
+    # Arrange
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+    index = pd.DatetimeIndex(
+        [pd.Timestamp("2024-01-01 00:00:00", tz="UTC"), pd.Timestamp("2024-01-01 00:00:01", tz="UTC")],
+        name="timestamp",
+    )
+    data = pd.DataFrame({"bid": [110.1234, 110.125], "ask": [110.127, 110.129]}, index=index)
+
+    # Act
+    table = wrangler.process_arrow(data, default_volume=1_000_000.0, ts_init_delta=500)
+
+    # Assert
+    assert table.schema.metadata[b"instrument_id"] == b"USD/JPY.SIM"
+    assert table["bid_price"].to_pylist() == [
+        Price.from_str("110.123").raw,
+        Price.from_str("110.125").raw,
+    ]
+    assert table["ask_price"].to_pylist() == [
+        Price.from_str("110.127").raw,
+        Price.from_str("110.129").raw,
+    ]
+    assert table["bid_size"].to_pylist() == [Quantity.from_int(1_000_000).raw] * 2
+    assert table["ts_event"].to_pylist() == [1704067200000000000, 1704067201000000000]
+    assert table["ts_init"].to_pylist() == [1704067200000000500, 1704067201000000500]
+
+
+def test_trade_tick_wrangler_process_arrow() -> None:
+    # Arrange
+    ethusdt = TestInstrumentProvider.ethusdt_binance()
+    wrangler = TradeTickDataWrangler(instrument=ethusdt)
+    data = TestDataProvider().read_csv_ticks("binance/ethusdt-trades.csv")[:100]
+
+    # Act
+    table = wrangler.process_arrow(data)
+
+    # Assert
+    assert table.num_rows == 100
+    assert table["price"][0].as_py() == Price.from_str("423.760").raw
+    assert table["size"][0].as_py() == Quantity.from_str("2.67900").raw
+    assert table["aggressor_side"][0].as_py() == AggressorSide.SELLER.value
+    assert table["trade_id"][0].as_py() == "148568980"
+    assert table["ts_event"][0].as_py() == 1597399200223000000
+    assert table["aggressor_side"].to_pylist() == [
+        tick.aggressor_side.value for tick in wrangler.process(data)
+    ]
+
+
+def test_bar_wrangler_process_arrow_matches_serialized_bars() -> None:
+    # Arrange
+    instrument = TestInstrumentProvider.default_fx_ccy("GBP/USD")
+    bar_type = TestDataStubs.bartype_gbpusd_1min_bid()
+    wrangler = BarDataWrangler(bar_type=bar_type, instrument=instrument)
+    data = TestDataProvider().read_csv_bars("fxcm/gbpusd-m1-bid-2012.csv")[:1000]
+    expected = ArrowSerializer.serialize_batch(wrangler.process(data.copy()), data_cls=Bar)
+
+    # Act
+    table = wrangler.process_arrow(data)
+
+    # Assert
+    assert table.schema.metadata[b"bar_type"] == str(bar_type).encode()
+    assert table.equals(expected)
+
+
+@pytest.mark.parametrize("random_seed", [None, 42])
+def test_quote_bar_data_wrangler_arrow_matches_objects(random_seed: int | None) -> None:
+    # Arrange
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+    provider = TestDataProvider()
+    ticks = wrangler.process_bar_data(
+        bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:100],
+        ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")[:100],
+        random_seed=random_seed,
+    )
+
+    # Act
+    table = wrangler.process_bar_data_arrow(
+        bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:100],
+        ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv")[:100],
+        random_seed=random_seed,
+    )
+
+    # Assert
+    assert table.num_rows == 400
+    assert table.equals(ArrowSerializer.serialize_batch(ticks, data_cls=QuoteTick))
+
+
+def test_trade_bar_data_wrangler_arrow_matches_objects() -> None:
+    # Arrange
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    wrangler = TradeTickDataWrangler(instrument=usdjpy)
+    data = TestDataProvider().read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:100]
+    data.loc[:, "volume"] = 100_0000
+    ticks = wrangler.process_bar_data(data=data.copy(), random_seed=42)
+
+    # Act
+    table = wrangler.process_bar_data_arrow(data=data, random_seed=42)
+
+    # Assert
+    assert table.num_rows == 400
+    assert table.equals(ArrowSerializer.serialize_batch(ticks, data_cls=TradeTick))
@@ -1105,6 +1105,119 @@ class TestPortfolio:
         assert not self.portfolio.is_flat(AUDUSD_SIM.id)
         assert not self.portfolio.is_completely_flat()
 
+    def test_new_quote_updates_venue_net_exposures_and_unrealized_pnls(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        last_audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80501"),
+            ask_price=Price.from_str("0.80505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        last_gbpusd = QuoteTick(
+            instrument_id=GBPUSD_SIM.id,
+            bid_price=Price.from_str("1.30315"),
+            ask_price=Price.from_str("1.30317"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last_audusd)
+        self.cache.add_quote_tick(last_gbpusd)
+        self.portfolio.update_quote_tick(last_audusd)
+        self.portfolio.update_quote_tick(last_gbpusd)
+
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        order2 = self.order_factory.market(
+            GBPUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-1"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=GBPUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-2"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position1 = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position2 = Position(instrument=GBPUSD_SIM, fill=fill2)
+
+        self.cache.add_position(position1, OmsType.HEDGING)
+        self.cache.add_position(position2, OmsType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position1))
+        self.portfolio.update_position(TestEventStubs.position_opened(position2))
+
+        # Prime the venue aggregates
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(210816.00, USD)}
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(10816.00, USD)}
+
+        new_audusd = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.81501"),
+            ask_price=Price.from_str("0.81505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        # Act
+        self.cache.add_quote_tick(new_audusd)
+        self.portfolio.update_quote_tick(new_audusd)
+
+        # Assert
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(211816.00, USD)}
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(11816.00, USD)}
+        assert self.portfolio.net_exposure(AUDUSD_SIM.id) == Money(81501.00, USD)
+        assert self.portfolio.unrealized_pnl(AUDUSD_SIM.id) == Money(-18499.00, USD)
+
     def test_modifying_position_updates_portfolio(self):
         # Arrange
         AccountFactory.register_calculated_account("SIM")
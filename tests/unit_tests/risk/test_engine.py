@@ -1104,6 +1104,179 @@ class TestRiskEngineWithCashAccount:
         assert order2.status == OrderStatus.DENIED
         assert self.exec_engine.command_count == 0  # <-- Command never reaches engine
 
+    def test_submit_order_list_when_invalid_order_then_denies_all_orders(self):
+        # Arrange
+        self.exec_engine.start()
+
+        strategy = Strategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        order1 = strategy.order_factory.limit(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+
+        order2 = strategy.order_factory.limit(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.000001"),  # <-- Excessive price precision
+        )
+
+        order3 = strategy.order_factory.limit(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+
+        order_list = OrderList(
+            order_list_id=OrderListId("1"),
+            orders=[order1, order2, order3],
+        )
+
+        submit_order = SubmitOrderList(
+            self.trader_id,
+            strategy.id,
+            order_list,
+            UUID4(),
+            self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.risk_engine.execute(submit_order)
+
+        # Assert
+        assert order1.status == OrderStatus.DENIED
+        assert order2.status == OrderStatus.DENIED
+        assert order3.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 0  # <-- Command never reaches engine
+
+    def test_submit_order_after_max_notional_changed_then_uses_new_setting(self):
+        # Arrange
+        quote = TestDataStubs.quote_tick(_AUDUSD_SIM)
+        self.cache.add_quote_tick(quote)
+
+        self.exec_engine.start()
+
+        strategy = Strategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        order1 = strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        order2 = strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        self.risk_engine.execute(
+            SubmitOrder(
+                trader_id=self.trader_id,
+                strategy_id=strategy.id,
+                position_id=None,
+                order=order1,
+                command_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+            ),
+        )
+
+        # Act
+        self.risk_engine.set_max_notional_per_order(_AUDUSD_SIM.id, 50_000)
+        self.risk_engine.execute(
+            SubmitOrder(
+                trader_id=self.trader_id,
+                strategy_id=strategy.id,
+                position_id=None,
+                order=order2,
+                command_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+            ),
+        )
+
+        # Assert
+        assert order1.status == OrderStatus.INITIALIZED
+        assert order2.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 1
+
+    def test_submit_order_after_quote_updated_in_cache_then_uses_new_price(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(_AUDUSD_SIM.id, 150_000)
+
+        quote1 = TestDataStubs.quote_tick(_AUDUSD_SIM)
+        self.cache.add_quote_tick(quote1)
+
+        self.exec_engine.start()
+
+        strategy = Strategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+        order1 = strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        order2 = strategy.order_factory.market(
+            _AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        self.risk_engine.execute(
+            SubmitOrder(
+                trader_id=self.trader_id,
+                strategy_id=strategy.id,
+                position_id=None,
+                order=order1,
+                command_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+            ),
+        )
+
+        # Act
+        quote2 = TestDataStubs.quote_tick(_AUDUSD_SIM, bid_price=1.9, ask_price=2.0)
+        self.cache.add_quote_tick(quote2)  # Not published on the message bus
+        self.risk_engine.execute(
+            SubmitOrder(
+                trader_id=self.trader_id,
+                strategy_id=strategy.id,
+                position_id=None,
+                order=order2,
+                command_id=UUID4(),
+                ts_init=self.clock.timestamp_ns(),
+            ),
+        )
+
+        # Assert
+        assert order1.status == OrderStatus.INITIALIZED
+        assert order2.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 1
+
     def test_submit_order_list_sells_when_over_free_balance_then_denies(self):
         # Arrange - Initialize market
         quote = TestDataStubs.quote_tick(_AUDUSD_SIM)
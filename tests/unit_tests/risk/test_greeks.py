@@ -0,0 +1,243 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.core.nautilus_pyo3 import black_scholes_greeks
+from nautilus_trader.core.nautilus_pyo3 import imply_vol_and_greeks
+from nautilus_trader.model.greeks import OptionChainGreeks
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AssetClass
+from nautilus_trader.model.enums import OptionKind
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import Symbol
+from nautilus_trader.model.instruments import OptionsContract
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.risk.greeks import GreeksCalculator
+from nautilus_trader.risk.greeks import GreeksCalculatorConfig
+from nautilus_trader.risk.greeks import black_scholes_greeks_array
+from nautilus_trader.risk.greeks import imply_vol_and_greeks_array
+from nautilus_trader.risk.greeks import imply_vol_array
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_black_scholes_greeks_array_matches_scalar(is_call):
+    # Arrange
+    s = 100.0
+    r = 0.01
+    b = 0.0
+    strikes = np.array([80.0, 95.0, 100.1, 110.0, 130.0])
+    vols = np.array([0.3, 0.25, 0.2, 0.22, 0.35])
+    t = 0.5
+
+    # Act
+    result = black_scholes_greeks_array(s, r, b, vols, is_call, strikes, t, 50.0)
+
+    # Assert
+    for i, (k, sigma) in enumerate(zip(strikes, vols)):
+        expected = black_scholes_greeks(s, r, b, sigma, is_call, k, t, 50.0)
+        assert result["price"][i] == pytest.approx(expected.price, rel=1e-9)
+        assert result["delta"][i] == pytest.approx(expected.delta, rel=1e-9)
+        assert result["gamma"][i] == pytest.approx(expected.gamma, rel=1e-9)
+        assert result["vega"][i] == pytest.approx(expected.vega, rel=1e-9)
+        assert result["theta"][i] == pytest.approx(expected.theta, rel=1e-9)
+
+
+def test_imply_vol_array_recovers_vols_for_chain():
+    # Arrange
+    s = 5000.0
+    r = 0.04
+    strikes = np.linspace(4500.0, 5500.0, 81)
+    is_call = np.arange(len(strikes)) % 2 == 0
+    t = np.linspace(0.1, 1.5, len(strikes))
+    vols = np.linspace(0.1, 0.6, len(strikes))
+    prices = black_scholes_greeks_array(s, r, 0.0, vols, is_call, strikes, t, 1.0)["price"]
+
+    # Act
+    result = imply_vol_array(s, r, 0.0, is_call, strikes, t, prices)
+
+    # Assert
+    np.testing.assert_allclose(result, vols, atol=1e-8)
+
+
+def test_imply_vol_array_with_prices_outside_bounds_returns_nan():
+    # Arrange, Act
+    result = imply_vol_array(100.0, 0.0, 0.0, True, 90.0, 1.0, np.array([5.0, 10.0, 100.0, 15.0]))
+
+    # Assert
+    assert np.isnan(result[0])  # Below intrinsic
+    assert np.isnan(result[1])  # At intrinsic
+    assert np.isnan(result[2])  # At upper bound
+    assert not np.isnan(result[3])
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_imply_vol_and_greeks_array_matches_scalar(is_call):
+    # Arrange
+    s = 100.0
+    k = 100.1
+    t = 1.0
+    r = 0.01
+    b = 0.005
+    sigma = 0.2
+    price = black_scholes_greeks(s, r, b, sigma, is_call, k, t, 1.0).price
+
+    # Act
+    result = imply_vol_and_greeks_array(s, r, b, is_call, k, t, price, 1.0)
+    expected = imply_vol_and_greeks(s, r, b, is_call, k, t, price, 1.0)
+
+    # Assert
+    tolerance = 1e-5
+    assert abs(result["vol"] - expected.vol) < tolerance
+    assert abs(result["price"] - expected.price) < tolerance
+    assert abs(result["delta"] - expected.delta) < tolerance
+    assert abs(result["gamma"] - expected.gamma) < tolerance
+    assert abs(result["vega"] - expected.vega) < tolerance
+    assert abs(result["theta"] - expected.theta) < tolerance
+
+
+class TestOptionChainGreeks:
+    def setup(self):
+        # Fixture Setup
+        self.call_id = InstrumentId.from_str("ESZ4 C5000.GLBX")
+        self.put_id = InstrumentId.from_str("ESZ4 P5000.GLBX")
+        self.chain = OptionChainGreeks(
+            1,
+            2,
+            "ESZ4",
+            5000.0,
+            np.array([self.call_id, self.put_id], dtype=object),
+            np.array([True, False]),
+            np.array([5000.0, 5000.0]),
+            np.array([20241220, 20241220], dtype=np.int64),
+            np.array([0.25, 0.25]),
+            np.array([0.05, 0.05]),
+            np.array([0.2, 0.2]),
+            np.array([10.0, 9.0]),
+            np.array([0.5, -0.5]),
+            np.array([0.01, 0.01]),
+            np.array([0.2, 0.2]),
+            np.array([-0.1, -0.1]),
+            np.array([0.5, 0.5]),
+        )
+
+    def test_greeks_for_option_in_chain(self):
+        # Arrange, Act
+        result = self.chain.greeks(self.put_id)
+
+        # Assert
+        assert len(self.chain) == 2
+        assert result.instrument_id == self.put_id
+        assert not result.is_call
+        assert result.delta == -0.5
+        assert result.underlying_price == 5000.0
+        assert result.ts_event == 1
+
+    def test_greeks_for_option_not_in_chain_returns_none(self):
+        # Arrange, Act, Assert
+        assert self.chain.greeks(InstrumentId.from_str("ESZ4 C5100.GLBX")) is None
+
+    def test_portfolio_greeks_aggregates_quantities(self):
+        # Arrange, Act
+        result = self.chain.portfolio_greeks({self.call_id: 2.0, self.put_id: 1.0})
+
+        # Assert
+        assert result.delta == pytest.approx(0.5)
+        assert result.gamma == pytest.approx(0.03)
+        assert result.theta == pytest.approx(-0.3)
+
+    def test_to_bytes_and_from_bytes_round_trip(self):
+        # Arrange, Act
+        result = OptionChainGreeks.from_bytes(self.chain.to_bytes())
+
+        # Assert
+        assert result.underlying == "ESZ4"
+        assert list(result.instrument_ids) == [self.call_id, self.put_id]
+        np.testing.assert_array_equal(result.is_call, self.chain.is_call)
+        np.testing.assert_array_equal(result.expiry, self.chain.expiry)
+        np.testing.assert_array_equal(result.delta, self.chain.delta)
+        assert result.ts_init == 2
+
+
+def _es_option(symbol: str, strike: str) -> OptionsContract:
+    return OptionsContract(
+        instrument_id=InstrumentId.from_str(f"{symbol}.GLBX"),
+        raw_symbol=Symbol(symbol),
+        asset_class=AssetClass.INDEX,
+        exchange="XCME",
+        currency=USD,
+        price_precision=2,
+        price_increment=Price.from_str("0.25"),
+        multiplier=Quantity.from_int(50),
+        lot_size=Quantity.from_int(1),
+        underlying="ESZ4",
+        option_kind=OptionKind.CALL,
+        strike_price=Price.from_str(strike),
+        activation_ns=pd.Timestamp("2024-09-20", tz="UTC").value,
+        expiration_ns=pd.Timestamp("2024-12-20", tz="UTC").value,
+        ts_event=0,
+        ts_init=0,
+    )
+
+
+class TestGreeksCalculator:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.msgbus = MessageBus(trader_id=TestIdStubs.trader_id(), clock=self.clock)
+        self.cache = TestComponentStubs.cache()
+        self.portfolio = Portfolio(msgbus=self.msgbus, cache=self.cache, clock=self.clock)
+        self.calculator = GreeksCalculator(GreeksCalculatorConfig())
+        self.calculator.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+        )
+
+    def test_option_chain_when_unchanged_returns_cached_arrays(self):
+        # Arrange
+        self.cache.add_instrument(_es_option("ESZ4 C5000", "5000.00"))
+        expected = self.calculator._option_chain("ESZ4")
+
+        # Act
+        result = self.calculator._option_chain("ESZ4")
+
+        # Assert
+        assert result is expected
+
+    def test_option_chain_when_options_added_rebuilds_arrays(self):
+        # Arrange
+        self.cache.add_instrument(_es_option("ESZ4 C5000", "5000.00"))
+        self.calculator._option_chain("ESZ4")
+        self.cache.add_instrument(_es_option("ESZ4 C5100", "5100.00"))
+
+        # Act
+        result = self.calculator._option_chain("ESZ4")
+
+        # Assert
+        assert sorted(x.value for x in result["instrument_ids"]) == [
+            "ESZ4 C5000.GLBX",
+            "ESZ4 C5100.GLBX",
+        ]
+        np.testing.assert_array_equal(np.sort(result["strike"]), [5000.0, 5100.0])